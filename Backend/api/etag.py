@@ -0,0 +1,32 @@
+import hashlib
+from typing import Optional
+from fastapi import Response, status
+
+def user_etag(user) -> str:
+    """ETag forte de um usuário: versão da linha mais um hash da representação.
+    
+    Sem AUTOINCREMENT o SQLite reaproveita o id do maior usuário removido, e a
+    versão do novo recomeça em 1; o hash (nome, email, filme, criado_em) impede
+    que ele herde a ETag do anterior. Aceita a linha (dict) ou o modelo.
+    """
+    get = user.get if isinstance(user, dict) else lambda campo: getattr(user, campo)
+    conteudo = "\x1f".join(str(get(campo)) for campo in ("nome", "email", "filme_favorito", "criado_em"))
+    digest = hashlib.blake2b(conteudo.encode("utf-8"), digest_size=8).hexdigest()
+    return f'"u{get("id")}-v{get("versao")}-{digest}"'
+
+def list_etag(table_version: int, limit: int, cursor: Optional[str]) -> str:
+    """ETag forte de uma página da listagem, derivada da versão da tabela"""
+    return f'"l{table_version}-{limit}-{cursor or ""}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compara o cabeçalho If-None-Match (lista ou *) com a ETag atual"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in (candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates)
+
+def not_modified(etag: str) -> Response:
+    """Resposta 304 sem corpo"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
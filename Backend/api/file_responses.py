@@ -0,0 +1,68 @@
+import asyncio
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse
+from api.etag import etag_matches, not_modified
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """(início, fim inclusivo) de um Range de intervalo único.
+    
+    Retorna None quando o cabeçalho deve ser ignorado (sintaxe desconhecida ou
+    vários intervalos: responde-se 200 com o arquivo inteiro) e levanta ValueError
+    quando o intervalo não pode ser satisfeito (416).
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Sufixo: os últimos N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+def read_slice(path: Path, start: int, end: int) -> bytes:
+    with open(path, "rb") as file:
+        file.seek(start)
+        return file.read(end - start + 1)
+
+async def cached_file_response(request: Request, path: Path, etag: str, media_type: str, max_age: int) -> Response:
+    """Arquivo imutável com cache HTTP: 304 por If-None-Match, 206/416 por Range (com If-Range)"""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}", "Accept-Ranges": "bytes"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        response = not_modified(etag)
+        response.headers["Cache-Control"] = headers["Cache-Control"]
+        return response
+    
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # If-Range com outra ETag (ou data): o cliente tem uma versão antiga, manda o arquivo inteiro
+    if range_header and (if_range is None or if_range.strip() == etag):
+        size = (await asyncio.to_thread(path.stat)).st_size
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"}
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            return Response(
+                content=await asyncio.to_thread(read_slice, path, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}"}
+            )
+    
+    return FileResponse(path, media_type=media_type, headers=headers)
@@ -0,0 +1,64 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from infra.metrics import registry, request_sql_time
+
+http_requests_in_flight = registry.gauge(
+    "bookshelf_http_requests_in_flight",
+    "Requisições HTTP em andamento"
+)
+http_requests_total = registry.counter(
+    "bookshelf_http_requests_total",
+    "Requisições HTTP concluídas por rota e status",
+    ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "bookshelf_http_request_duration_seconds",
+    "Latência das requisições HTTP por rota",
+    ("method", "route")
+)
+http_request_sql_seconds = registry.histogram(
+    "bookshelf_http_request_sql_seconds",
+    "Tempo gasto em SQL dentro de cada requisição, por rota",
+    ("method", "route")
+)
+
+class MetricsMiddleware:
+    """Middleware ASGI puro que registra latência, status e requisições em andamento.
+    
+    A rota é o template do FastAPI (ex.: /api/users/{user_id}), lido do scope
+    depois do roteamento, para não explodir a cardinalidade com IDs. O tempo de
+    SQL da requisição é somado pelos hooks de cursor via contextvar.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        sql_time = [0.0]
+        token = request_sql_time.set(sql_time)
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            request_sql_time.reset(token)
+            route = scope.get("route")
+            path = route.path if route is not None else "unmatched"
+            method = scope["method"]
+            http_request_duration_seconds.observe(elapsed, method, path)
+            http_request_sql_seconds.observe(sql_time[0], method, path)
+            http_requests_total.inc(method, path, str(status_code))
@@ -0,0 +1,70 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+
+def _encode(key: list) -> str:
+    payload = json.dumps(key, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cursor inválido"
+    )
+
+def encode_cursor(criado_em: datetime, user_id: int) -> str:
+    """Gera um cursor opaco a partir da chave (criado_em, id) do último item"""
+    return _encode([criado_em.isoformat(), user_id])
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Decodifica um cursor opaco na chave (criado_em, id)"""
+    if not cursor:
+        return None
+    try:
+        criado_em, user_id = _decode(cursor)
+        return datetime.fromisoformat(criado_em), int(user_id)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+
+def encode_rank_cursor(score: float, item_id: int) -> str:
+    """Gera um cursor opaco para resultados ordenados por relevância (score, id).
+    
+    O score BM25 vai como texto repr (ida e volta exata do double): qualquer
+    arredondamento faria a próxima página pular ou repetir linhas. O BM25 depende
+    das estatísticas do índice inteiro, então o cursor só é estável enquanto não
+    houver escritas na tabela buscada; depois delas a paginação pode pular ou repetir.
+    """
+    return _encode([repr(float(score)), item_id])
+
+def decode_rank_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """Decodifica um cursor de relevância na chave (score, id)"""
+    if not cursor:
+        return None
+    try:
+        score, item_id = _decode(cursor)
+        score = float(score)
+        if score != score or score in (float("inf"), float("-inf")):
+            raise ValueError(score)
+        return score, int(item_id)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+
+def encode_id_cursor(item_id: int) -> str:
+    """Gera um cursor opaco para listagens ordenadas por id"""
+    return _encode([item_id])
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decodifica um cursor de listagem ordenada por id"""
+    if not cursor:
+        return None
+    try:
+        (item_id,) = _decode(cursor)
+        return int(item_id)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
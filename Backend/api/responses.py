@@ -0,0 +1,16 @@
+from typing import Any
+import orjson
+from fastapi.responses import Response
+
+class RawJSONResponse(Response):
+    """Resposta JSON serializada direto para bytes com orjson.
+    
+    Retornar esta resposta da rota faz o FastAPI pular a segunda validação
+    contra o response_model; o conteúdo deve já estar no formato do schema.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
@@ -1,4 +1,14 @@
 # API Routes
 from .user_routes import router as user_router
+from .async_user_routes import router as async_user_router
+from .user_bulk_routes import router as user_bulk_router
+from .user_search_routes import router as user_search_router
+from .book_routes import router as book_router
+from .recommendation_routes import router as recommendation_router
+from .progress_routes import router as progress_router
+from .shelf_routes import router as shelf_router
+from .rating_routes import router as rating_router
+from .cover_routes import router as cover_router
+from .health_routes import router as health_router
 
-__all__ = ["user_router"]
+__all__ = ["user_router", "async_user_router", "user_bulk_router", "user_search_router", "book_router", "recommendation_router", "progress_router", "shelf_router", "rating_router", "cover_router", "health_router"]
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from infra.database import get_async_db
+from core.services.async_user_service import AsyncUserService
+from config import settings
+from api.etag import etag_matches, list_etag, not_modified, user_etag
+from api.pagination import encode_cursor, decode_cursor
+from api.responses import RawJSONResponse
+from api.schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse, UserPageResponse
+
+router = APIRouter(prefix="/api/users", tags=["Users"])
+
+@router.get("/", response_model=UserPageResponse)
+async def get_users(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Retorna uma página de usuários (mais recentes primeiro)"""
+    service = AsyncUserService(db)
+    after = decode_cursor(cursor)
+    # Versão da tabela lida antes dos dados: a ETag nunca é mais nova que o conteúdo
+    etag = list_etag(await service.get_users_version(), limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    if settings.FAST_RESPONSES:
+        rows, has_more = await service.get_users_page_rows(limit, after)
+        next_cursor = encode_cursor(rows[-1]["criado_em"], rows[-1]["id"]) if has_more else None
+        return RawJSONResponse({"items": rows, "next_cursor": next_cursor}, headers={"ETag": etag})
+    
+    users, has_more = await service.get_users_page(limit, after)
+    next_cursor = encode_cursor(users[-1].criado_em, users[-1].id) if has_more else None
+    response.headers["ETag"] = etag
+    return UserPageResponse(
+        items=[UserListResponse.from_orm(user) for user in users],
+        next_cursor=next_cursor
+    )
+
+@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Cria um novo usuário"""
+    service = AsyncUserService(db)
+    created_user = await service.create_user(
+        nome=user.nome,
+        email=user.email,
+        filme_favorito=user.filme_favorito
+    )
+    return UserResponse.from_orm(created_user)
+
+@router.get("/{user_id}", response_model=UserResponse)
+async def get_user(
+    user_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Retorna um usuário específico"""
+    service = AsyncUserService(db)
+    if settings.FAST_RESPONSES:
+        row = await service.get_user_row_by_id(user_id)
+        etag = user_etag(row)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return RawJSONResponse(row, headers={"ETag": etag})
+    
+    user = await service.get_user_by_id(user_id)
+    etag = user_etag(user)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return UserResponse.from_orm(user)
+
+@router.put("/{user_id}", response_model=UserResponse)
+async def update_user(user_id: int, user: UserUpdate, db: AsyncSession = Depends(get_async_db)):
+    """Atualiza um usuário"""
+    service = AsyncUserService(db)
+    updated_user = await service.update_user(
+        user_id=user_id,
+        nome=user.nome,
+        email=user.email,
+        filme_favorito=user.filme_favorito
+    )
+    return UserResponse.from_orm(updated_user)
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Remove um usuário"""
+    service = AsyncUserService(db)
+    await service.delete_user(user_id)
+    return None
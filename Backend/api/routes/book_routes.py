@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from infra.database import get_db
+from core.services.book_service import BookService
+from core.services.rating_service import RatingService
+from config import settings
+from api.pagination import decode_id_cursor, decode_rank_cursor, encode_id_cursor, encode_rank_cursor
+from api.responses import RawJSONResponse
+from api.schemas.book import BookPageResponse, BookResponse, SimilarBooksResponse, TopBooksResponse
+
+router = APIRouter(prefix="/api/books", tags=["Books"])
+
+@router.get("/", response_model=BookPageResponse)
+def list_books(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    genero: Optional[str] = None,
+    classificacao: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Lista livros com paginação por cursor e filtros de gênero/classificação"""
+    service = BookService(db)
+    rows, has_more = service.get_books_page(limit, decode_id_cursor(cursor), genero, classificacao)
+    next_cursor = encode_id_cursor(rows[-1]["id"]) if has_more else None
+    return RawJSONResponse({"items": rows, "next_cursor": next_cursor})
+
+@router.get("/genres", response_model=List[str])
+def list_genres(db: Session = Depends(get_db)):
+    """Lista os gêneros disponíveis para filtro"""
+    return RawJSONResponse(BookService(db).get_genres())
+
+@router.get("/search", response_model=BookPageResponse)
+def search_books(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    genero: Optional[str] = None,
+    classificacao: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Busca livros por título/autores/descrição (prefixo, ordenado por relevância)"""
+    service = BookService(db)
+    rows, has_more = service.search_books(q, limit, decode_rank_cursor(cursor), genero, classificacao)
+    next_cursor = encode_rank_cursor(rows[-1]["score"], rows[-1]["id"]) if has_more else None
+    for row in rows:
+        del row["score"]
+    return RawJSONResponse({"items": rows, "next_cursor": next_cursor})
+
+@router.get("/top", response_model=TopBooksResponse)
+def top_books(
+    genero: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=settings.RANKING_SIZE),
+    min_avaliacoes: int = Query(settings.RANKING_MIN_AVALIACOES, ge=1),
+    db: Session = Depends(get_db)
+):
+    """Livros com maior média de notas, no geral ou por gênero (ranking em cache)"""
+    return RawJSONResponse({"items": RatingService(db).get_top_books(limit, min_avaliacoes, genero)})
+
+@router.get("/{book_id}", response_model=BookResponse)
+def get_book(book_id: int, db: Session = Depends(get_db)):
+    """Busca um livro por ID"""
+    return RawJSONResponse(BookService(db).get_book_row_by_id(book_id))
+
+@router.get("/{book_id}/similar", response_model=SimilarBooksResponse)
+def get_similar_books(
+    book_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """Livros parecidos (recomendação por conteúdo pré-calculada)"""
+    return RawJSONResponse({"items": BookService(db).get_similar_books(book_id, limit)})
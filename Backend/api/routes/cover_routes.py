@@ -0,0 +1,24 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from infra.database.async_database import get_async_db
+from core.services.cover_service import CoverService
+from api.file_responses import cached_file_response
+
+router = APIRouter(prefix="/api/books", tags=["Covers"])
+
+@router.get("/{book_id}/capa", responses={
+    200: {"content": {"image/*": {}}, "description": "Capa (ou miniatura JPEG) servida do cache local"},
+    206: {"description": "Intervalo pedido em Range"},
+    304: {"description": "A ETag em If-None-Match ainda é a atual"},
+})
+async def get_cover(
+    request: Request,
+    book_id: int,
+    largura: Optional[int] = Query(None, description="Largura da miniatura JPEG; sem ela, a capa original"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Capa do livro baixada uma vez da origem e servida do disco com ETag e Cache-Control longo"""
+    path, etag, media_type = await CoverService(db).get_cover(book_id, largura)
+    return await cached_file_response(request, path, etag, media_type, settings.COVER_CACHE_MAX_AGE_SECONDS)
@@ -0,0 +1,27 @@
+import os
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from infra.database.database import reader_engine
+from infra.database.migrations import MIGRATIONS, latest_version
+
+router = APIRouter(tags=["Health"])
+
+@router.get("/health")
+def health_check():
+    """Liveness: o processo responde"""
+    return {"status": "healthy"}
+
+@router.get("/health/ready")
+def readiness_check(request: Request):
+    """Readiness deste worker: startup concluído, banco acessível e esquema na última versão"""
+    worker = {"worker": os.environ.get("BOOKSHELF_WORKER_ID"), "pid": os.getpid()}
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse({"status": "not_ready", "motivo": "iniciando ou encerrando", **worker}, status_code=503)
+    try:
+        with reader_engine.connect() as conn:
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    except Exception as e:
+        return JSONResponse({"status": "not_ready", "motivo": f"banco indisponível: {e}", **worker}, status_code=503)
+    if version < latest_version(MIGRATIONS):
+        return JSONResponse({"status": "not_ready", "motivo": "migrações pendentes", **worker}, status_code=503)
+    return {"status": "ready", "schema_version": version, **worker}
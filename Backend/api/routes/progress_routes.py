@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from infra.database import get_db
+from core.services.progress_service import ProgressService
+from api.responses import RawJSONResponse
+from api.schemas.progress import ProgressResponse, ProgressUpdate
+
+router = APIRouter(prefix="/api/registros", tags=["Progress"])
+
+@router.post("/{registro_id}/progresso", response_model=ProgressResponse, status_code=status.HTTP_202_ACCEPTED)
+def record_progress(registro_id: int, progress: ProgressUpdate, db: Session = Depends(get_db)):
+    """Registra a página atual de uma leitura (gravação em lote, assíncrona)"""
+    service = ProgressService(db)
+    return RawJSONResponse(
+        service.record_progress(registro_id, progress.pagina_atual),
+        status_code=status.HTTP_202_ACCEPTED
+    )
+
+@router.get("/{registro_id}/progresso", response_model=ProgressResponse)
+def get_progress(registro_id: int, db: Session = Depends(get_db)):
+    """Página atual e percentual lido de um registro"""
+    return RawJSONResponse(ProgressService(db).get_progress(registro_id))
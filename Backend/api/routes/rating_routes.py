@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from infra.database import get_db
+from core.services.rating_service import RatingService
+from api.responses import RawJSONResponse
+from api.schemas.rating import RatingResponse, RatingUpdate
+
+router = APIRouter(prefix="/api/users", tags=["Ratings"])
+
+@router.put("/{user_id}/notas/{book_id}", response_model=RatingResponse)
+def rate_book(user_id: int, book_id: int, rating: RatingUpdate, db: Session = Depends(get_db)):
+    """Cria ou substitui a nota do usuário para um livro"""
+    return RawJSONResponse(RatingService(db).rate_book(user_id, book_id, rating.nota, rating.descricao))
+
+@router.delete("/{user_id}/notas/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_rating(user_id: int, book_id: int, db: Session = Depends(get_db)):
+    """Remove a nota do usuário para um livro"""
+    RatingService(db).delete_rating(user_id, book_id)
+    return None
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from infra.database import get_db
+from core.services.recommendation_service import RecommendationService
+from api.responses import RawJSONResponse
+from api.schemas.book import RecommendationsResponse
+
+router = APIRouter(prefix="/api/users", tags=["Recommendations"])
+
+@router.get("/{user_id}/recommendations", response_model=RecommendationsResponse)
+def get_user_recommendations(
+    user_id: int,
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """Livros recomendados ao usuário (filtragem colaborativa pré-calculada)"""
+    return RawJSONResponse({"items": RecommendationService(db).get_user_recommendations(user_id, limit)})
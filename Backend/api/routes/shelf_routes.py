@@ -0,0 +1,23 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from infra.database import get_db
+from core.services.shelf_service import ShelfService
+from api.pagination import decode_id_cursor, encode_id_cursor
+from api.responses import RawJSONResponse
+from api.schemas.shelf import ShelfPageResponse
+
+router = APIRouter(prefix="/api/users", tags=["Shelf"])
+
+@router.get("/{user_id}/shelf", response_model=ShelfPageResponse)
+def get_user_shelf(
+    user_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    tag: Optional[str] = Query(None, min_length=1, max_length=50),
+    db: Session = Depends(get_db)
+):
+    """Livros da estante do usuário com tags, nota e progresso atual (filtro opcional por tag)"""
+    rows, has_more = ShelfService(db).get_shelf(user_id, limit, decode_id_cursor(cursor), tag)
+    next_cursor = encode_id_cursor(rows[-1]["id"]) if has_more else None
+    return RawJSONResponse({"items": rows, "next_cursor": next_cursor})
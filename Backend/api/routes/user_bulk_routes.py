@@ -0,0 +1,89 @@
+import codecs
+from typing import Iterator, List, Literal, Optional
+from anyio import from_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from infra.database import get_db
+from infra.database.database import SessionLocal
+from core.services.user_bulk_service import UserBulkService
+from core.services.user_batch_service import UserBatchService
+from api.responses import RawJSONResponse
+from api.schemas.user import UserBatchGetResponse, UserBatchRequest, UserBatchResponse, UserImportResponse
+
+router = APIRouter(prefix="/api/users", tags=["Users"])
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def iter_lines(request: Request) -> Iterator[str]:
+    """Linhas do corpo lidas bloco a bloco de request.stream(), a partir da threadpool.
+    
+    Cada bloco recebido é decodificado de forma incremental; só a linha ainda
+    incompleta fica em memória entre um bloco e o seguinte.
+    """
+    stream = request.stream()
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while True:
+        try:
+            chunk = from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            break
+        try:
+            pending += decoder.decode(chunk)
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O arquivo deve estar em UTF-8"
+            )
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+@router.post("/import", response_model=UserImportResponse)
+async def import_users(
+    request: Request,
+    formato: Optional[Literal["ndjson", "csv"]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Importa usuários em lote a partir de NDJSON ou CSV"""
+    if formato is None:
+        formato = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    service = UserBulkService(db)
+    # Validação e inserção são síncronas; rodam fora do event loop, puxando o corpo em streaming
+    return await run_in_threadpool(service.import_users, iter_lines(request), formato)
+
+@router.get("/export")
+def export_users(formato: Literal["ndjson", "csv"] = Query("ndjson")):
+    """Exporta todos os usuários em streaming (NDJSON ou CSV)"""
+    def generate():
+        # Sessão própria: vive enquanto a resposta está sendo transmitida
+        with SessionLocal() as db:
+            yield from UserBulkService(db).export_users(formato)
+    
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="usuarios.{formato}"'}
+    )
+
+@router.get("/batch", response_model=UserBatchGetResponse)
+def get_users_batch(ids: List[int] = Query(..., min_length=1), db: Session = Depends(get_db)):
+    """Retorna vários usuários por id (?ids=1&ids=2...) com uma única consulta"""
+    return RawJSONResponse(UserBatchService(db).get_users(ids))
+
+@router.post(
+    "/batch",
+    response_model=UserBatchResponse,
+    responses={status.HTTP_409_CONFLICT: {"model": UserBatchResponse, "description": "Lote desfeito"}}
+)
+def apply_users_batch(batch: UserBatchRequest, db: Session = Depends(get_db)):
+    """Aplica criações, atualizações e remoções em uma única transação, com resultado por operação"""
+    operacoes = [operacao.model_dump(exclude_unset=True) for operacao in batch.operacoes]
+    result = UserBatchService(db).apply(operacoes)
+    status_code = status.HTTP_200_OK if result["aplicado"] else status.HTTP_409_CONFLICT
+    return RawJSONResponse(result, status_code=status_code)
@@ -1,18 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 from infra.database import get_db
 from core.services.user_service import UserService
-from api.schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse
+from config import settings
+from api.etag import etag_matches, list_etag, not_modified, user_etag
+from api.pagination import encode_cursor, decode_cursor
+from api.responses import RawJSONResponse
+from api.schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse, UserPageResponse
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
-@router.get("/", response_model=List[UserListResponse])
-def get_users(db: Session = Depends(get_db)):
-    """Retorna todos os usuários"""
+@router.get("/", response_model=UserPageResponse)
+def get_users(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Retorna uma página de usuários (mais recentes primeiro)"""
     service = UserService(db)
-    users = service.get_all_users()
-    return [UserListResponse.from_orm(user) for user in users]
+    after = decode_cursor(cursor)
+    # Versão da tabela lida antes dos dados: a ETag nunca é mais nova que o conteúdo
+    etag = list_etag(service.get_users_version(), limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    if settings.FAST_RESPONSES:
+        rows, has_more = service.get_users_page_rows(limit, after)
+        next_cursor = encode_cursor(rows[-1]["criado_em"], rows[-1]["id"]) if has_more else None
+        return RawJSONResponse({"items": rows, "next_cursor": next_cursor}, headers={"ETag": etag})
+    
+    users, has_more = service.get_users_page(limit, after)
+    next_cursor = encode_cursor(users[-1].criado_em, users[-1].id) if has_more else None
+    response.headers["ETag"] = etag
+    return UserPageResponse(
+        items=[UserListResponse.from_orm(user) for user in users],
+        next_cursor=next_cursor
+    )
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def create_user(user: UserCreate, db: Session = Depends(get_db)):
@@ -26,10 +52,26 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     return UserResponse.from_orm(created_user)
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(
+    user_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """Retorna um usuário específico"""
     service = UserService(db)
+    if settings.FAST_RESPONSES:
+        row = service.get_user_row_by_id(user_id)
+        etag = user_etag(row)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return RawJSONResponse(row, headers={"ETag": etag})
+    
     user = service.get_user_by_id(user_id)
+    etag = user_etag(user)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return UserResponse.from_orm(user)
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from infra.database import get_db
+from core.services.user_service import UserService
+from api.pagination import decode_rank_cursor, encode_rank_cursor
+from api.responses import RawJSONResponse
+from api.schemas.user import UserPageResponse
+
+router = APIRouter(prefix="/api/users", tags=["Users"])
+
+@router.get("/search", response_model=UserPageResponse)
+def search_users(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Busca usuários por nome/email (prefixo, ordenado por relevância)"""
+    service = UserService(db)
+    rows, has_more = service.search_users(q, limit, decode_rank_cursor(cursor))
+    next_cursor = encode_rank_cursor(rows[-1]["score"], rows[-1]["id"]) if has_more else None
+    for row in rows:
+        del row["score"]
+    return RawJSONResponse({"items": rows, "next_cursor": next_cursor})
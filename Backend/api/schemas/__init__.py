@@ -1,10 +1,45 @@
 # API Schemas
-from .user import UserBase, UserCreate, UserUpdate, UserResponse, UserListResponse
+from .user import (
+    UserBase, UserCreate, UserUpdate, UserResponse, UserListResponse, UserPageResponse,
+    UserImportError, UserImportResponse, UserBatchGetResponse, UserBatchOperation, UserBatchRequest,
+    UserBatchResult, UserBatchResponse
+)
+from .book import (
+    BookListResponse, BookResponse, BookPageResponse, SimilarBookResponse, SimilarBooksResponse,
+    RecommendedBookResponse, RecommendationsResponse, RatingSummaryResponse, TopBookResponse, TopBooksResponse
+)
+from .progress import ProgressUpdate, ProgressResponse
+from .shelf import ShelfItemResponse, ShelfPageResponse
+from .rating import RatingUpdate, RatingResponse
 
 __all__ = [
     "UserBase",
     "UserCreate", 
     "UserUpdate",
     "UserResponse",
-    "UserListResponse"
+    "UserListResponse",
+    "UserPageResponse",
+    "UserImportError",
+    "UserImportResponse",
+    "UserBatchGetResponse",
+    "UserBatchOperation",
+    "UserBatchRequest",
+    "UserBatchResult",
+    "UserBatchResponse",
+    "BookListResponse",
+    "BookResponse",
+    "BookPageResponse",
+    "SimilarBookResponse",
+    "SimilarBooksResponse",
+    "RecommendedBookResponse",
+    "RecommendationsResponse",
+    "RatingSummaryResponse",
+    "TopBookResponse",
+    "TopBooksResponse",
+    "ProgressUpdate",
+    "ProgressResponse",
+    "ShelfItemResponse",
+    "ShelfPageResponse",
+    "RatingUpdate",
+    "RatingResponse"
 ]
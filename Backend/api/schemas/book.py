@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+# Response schemas
+class BookListResponse(BaseModel):
+    id: int
+    volume_id: str
+    nome: str
+    autores: Optional[str] = None
+    data_publicacao: Optional[str] = None
+    classificacao_indicativa: str
+    url_imagem: Optional[str] = None
+    generos: List[str] = []
+
+class RatingSummaryResponse(BaseModel):
+    media: Optional[float] = None
+    quantidade: int
+    # Quantidade de notas por estrelas arredondadas: índice 0 a 5
+    histograma: List[int]
+
+class BookResponse(BookListResponse):
+    descricao: Optional[str] = None
+    public_domain: bool
+    avaliacao: RatingSummaryResponse
+
+class BookPageResponse(BaseModel):
+    items: List[BookListResponse]
+    next_cursor: Optional[str] = None
+
+class SimilarBookResponse(BookListResponse):
+    similaridade: float
+
+class SimilarBooksResponse(BaseModel):
+    items: List[SimilarBookResponse]
+
+class RecommendedBookResponse(BookListResponse):
+    score: float
+
+class RecommendationsResponse(BaseModel):
+    items: List[RecommendedBookResponse]
+
+class TopBookResponse(BookListResponse):
+    media: float
+    quantidade: int
+
+class TopBooksResponse(BaseModel):
+    items: List[TopBookResponse]
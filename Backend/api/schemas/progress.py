@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+# Request schemas
+class ProgressUpdate(BaseModel):
+    pagina_atual: int = Field(..., ge=0)
+
+# Response schemas
+class ProgressResponse(BaseModel):
+    registro_id: int
+    pagina_atual: Optional[int] = None
+    total_paginas: int
+    percentual: Optional[float] = None
+    atualizado_em: Optional[datetime] = None
+    # True enquanto o valor só existe no buffer write-behind
+    pendente: bool = False
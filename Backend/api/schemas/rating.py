@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+# Request schemas
+class RatingUpdate(BaseModel):
+    nota: float = Field(..., ge=0, le=5)
+    descricao: Optional[str] = Field(None, max_length=2000)
+
+# Response schemas
+class RatingResponse(BaseModel):
+    usuario_id: int
+    livro_id: int
+    nota: float
+    descricao: Optional[str] = None
+    criado_em: datetime
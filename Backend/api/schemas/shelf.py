@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from api.schemas.book import BookListResponse
+from api.schemas.progress import ProgressResponse
+
+# Response schemas
+class ShelfItemResponse(BookListResponse):
+    tags: List[str] = []
+    nota: Optional[float] = None
+    # Ausente quando o livro só tem tag ou nota, sem registro de leitura
+    progresso: Optional[ProgressResponse] = None
+
+class ShelfPageResponse(BaseModel):
+    items: List[ShelfItemResponse]
+    next_cursor: Optional[str] = None
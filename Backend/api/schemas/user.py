@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 # Base schema
@@ -21,6 +21,8 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     id: int
     criado_em: datetime
+    versao: int
+    atualizado_em: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -31,6 +33,46 @@ class UserListResponse(BaseModel):
     email: str
     filme_favorito: Optional[str]
     criado_em: datetime
+    versao: int
+    atualizado_em: Optional[datetime] = None
     
     class Config:
         from_attributes = True
+
+class UserPageResponse(BaseModel):
+    items: List[UserListResponse]
+    next_cursor: Optional[str] = None
+
+class UserImportError(BaseModel):
+    linha: int
+    email: Optional[str] = None
+    erro: str
+
+class UserImportResponse(BaseModel):
+    total: int
+    inseridos: int
+    erros: List[UserImportError]
+
+class UserBatchGetResponse(BaseModel):
+    items: List[UserListResponse]
+    nao_encontrados: List[int]
+
+class UserBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None
+    dados: Optional[UserUpdate] = None
+
+class UserBatchRequest(BaseModel):
+    operacoes: List[UserBatchOperation] = Field(..., min_length=1, max_length=100)
+
+class UserBatchResult(BaseModel):
+    indice: int
+    op: str
+    id: Optional[int] = None
+    status: int
+    usuario: Optional[UserListResponse] = None
+    erro: Optional[str] = None
+
+class UserBatchResponse(BaseModel):
+    aplicado: bool
+    resultados: List[UserBatchResult]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: gravação de progresso de leitura com um commit por atualização vs.
+buffer write-behind (coalescido por registro, gravado em lote).
+
+Uso (a partir de Backend/):
+    python -m benchmarks.bench_progress_ingestion --updates 20000 --registros 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Banco isolado antes de importar config/engines
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+from infra.database import migrate_database
+from infra.database.database import SessionLocal, engine
+from infra.ingestion import ProgressBuffer, utc_timestamp, write_progress_batch
+from infra.repositories.progress_repository import ProgressRepository
+
+def seed(registros: int) -> None:
+    """Cria um usuário, livros e registros sintéticos"""
+    migrate_database()
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO usuario (id, nome, email) VALUES (1, 'Bench', 'bench@email.com')"))
+        conn.execute(
+            text("INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) VALUES (:id, :v, 'Livro', 'L', 0)"),
+            [{"id": i, "v": f"vol{i}"} for i in range(1, registros + 1)]
+        )
+        conn.execute(
+            text("INSERT INTO registro (id, usuario_id, livro_id, total_paginas) VALUES (:id, 1, :id, 500)"),
+            [{"id": i} for i in range(1, registros + 1)]
+        )
+
+def write_through(updates) -> None:
+    """Um INSERT + commit (fsync) por atualização, como uma rota síncrona faria"""
+    for registro_id, pagina in updates:
+        with SessionLocal() as db:
+            ProgressRepository(db).insert_logs([(registro_id, pagina, utc_timestamp())])
+            db.commit()
+
+def write_behind(updates, max_pending: int) -> None:
+    """Buffer sem flusher: grava em lote a cada `max_pending` registros distintos"""
+    buffer = ProgressBuffer(write_progress_batch, max_pending=max_pending, interval=1)
+    for registro_id, pagina in updates:
+        buffer.add(registro_id, pagina)
+    buffer.flush()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=20000)
+    parser.add_argument("--registros", type=int, default=500)
+    parser.add_argument("--max-pending", type=int, default=1000)
+    args = parser.parse_args()
+    
+    seed(args.registros)
+    rng = random.Random(0)
+    updates = [(rng.randint(1, args.registros), rng.randint(0, 500)) for _ in range(args.updates)]
+    
+    print(f"{'modo':<16}{'atualizações/s':>18}")
+    rates = []
+    for name, run in [
+        ("write-through", lambda batch: write_through(batch)),
+        ("write-behind", lambda batch: write_behind(batch, args.max_pending)),
+    ]:
+        start = time.perf_counter()
+        run(updates)
+        rate = len(updates) / (time.perf_counter() - start)
+        rates.append(rate)
+        print(f"{name:<16}{rate:>18,.0f}")
+    print(f"ganho: {rates[1] / rates[0]:.1f}x")
+
+if __name__ == "__main__":
+    main()
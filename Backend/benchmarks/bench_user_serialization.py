@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: caminho ORM + from_orm + response_model vs. caminho rápido
+(tuplas de colunas + orjson) para GET /api/users e GET /api/users/{id}.
+
+Uso (a partir de Backend/):
+    python -m benchmarks.bench_user_serialization --users 10000 --limit 100
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+# Banco isolado antes de importar config/engines
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# from_orm é o caminho legado medido aqui; o aviso de depreciação só polui a saída
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+from infra.database import migrate_database
+from infra.database.database import SessionLocal, engine
+from infra.models.user import UserModel
+from core.services.user_service import UserService
+from api.schemas.user import UserListResponse, UserPageResponse, UserResponse
+
+def seed(total: int) -> None:
+    """Popula a tabela de usuários com registros sintéticos"""
+    migrate_database()
+    with engine.begin() as conn:
+        conn.execute(insert(UserModel), [
+            {"nome": f"Usuário {i}", "email": f"usuario{i}@email.com", "filme_favorito": "Matrix"}
+            for i in range(total)
+        ])
+
+def legacy_list(service: UserService, limit: int) -> bytes:
+    """ORM → from_orm → revalidação do response_model → JSON, como o FastAPI faz"""
+    users, _ = service.get_users_page(limit)
+    payload = UserPageResponse(items=[UserListResponse.from_orm(user) for user in users])
+    validated = UserPageResponse.model_validate(payload.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+def fast_list(service: UserService, limit: int) -> bytes:
+    """Tuplas de colunas → orjson"""
+    rows, _ = service.get_users_page_rows(limit)
+    return orjson.dumps({"items": rows, "next_cursor": None})
+
+def legacy_detail(service: UserService, user_id: int) -> bytes:
+    user = service.get_user_by_id(user_id)
+    validated = UserResponse.model_validate(UserResponse.from_orm(user).model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+def fast_detail(service: UserService, user_id: int) -> bytes:
+    return orjson.dumps(service.get_user_row_by_id(user_id))
+
+def measure(func, *args, repeat: int) -> float:
+    """Tempo médio de CPU por chamada, em microssegundos"""
+    func(*args)  # aquecimento
+    start = time.process_time()
+    for _ in range(repeat):
+        func(*args)
+    return (time.process_time() - start) / repeat * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+    
+    seed(args.users)
+    with SessionLocal() as db:
+        service = UserService(db)
+        cases = [
+            (f"GET /api/users?limit={args.limit}", legacy_list, fast_list, args.limit),
+            ("GET /api/users/{id}", legacy_detail, fast_detail, args.users // 2),
+        ]
+        print(f"{'rota':<28}{'legado (µs)':>14}{'rápido (µs)':>14}{'ganho':>8}")
+        for name, legacy, fast, arg in cases:
+            assert json.loads(legacy(service, arg)) == json.loads(fast(service, arg))
+            legacy_us = measure(legacy, service, arg, repeat=args.repeat)
+            fast_us = measure(fast, service, arg, repeat=args.repeat)
+            print(f"{name:<28}{legacy_us:>14.1f}{fast_us:>14.1f}{legacy_us / fast_us:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
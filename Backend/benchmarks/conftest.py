@@ -0,0 +1,146 @@
+"""
+Fixtures dos microbenchmarks (pytest-benchmark): bancos SQLite semeados em vários
+tamanhos e medição de alocações e consultas por chamada.
+
+Uso (a partir de Backend/):
+    python -m pytest benchmarks
+    python -m pytest benchmarks --bench-users 1000,100000,1000000 --benchmark-group-by=group,param:users
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Banco isolado antes de importar config/engines
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from infra.database.sqlite import configure_sqlite_engine
+from infra.models.user import Base, UserModel
+
+SEED_BATCH = 50000
+
+# Consultas e alocações por benchmark, exibidas ao fim da sessão
+PROFILES = []
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-users",
+        default=os.environ.get("BENCH_USERS", "1000,100000"),
+        help="Tamanhos dos bancos semeados, separados por vírgula (ex.: 1000,100000,1000000)"
+    )
+
+def pytest_configure(config):
+    # from_orm é um dos caminhos medidos; o aviso de depreciação só polui a saída
+    config.addinivalue_line("filterwarnings", "ignore::DeprecationWarning")
+
+def pytest_terminal_summary(terminalreporter):
+    if not PROFILES:
+        return
+    terminalreporter.section("consultas e alocações (uma chamada)")
+    terminalreporter.write_line(f"{'benchmark':<52}{'consultas':>10}{'pico KiB':>12}{'resultado KiB':>15}")
+    for name, info in PROFILES:
+        terminalreporter.write_line(
+            f"{name:<52}{info['queries']:>10}{info['alloc_peak_kib']:>12.1f}{info['alloc_result_kib']:>15.1f}"
+        )
+
+def pytest_generate_tests(metafunc):
+    if "users" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--bench-users").split(",")]
+        metafunc.parametrize("users", sizes, indirect=True, ids=lambda size: f"{size}")
+
+class QueryCounter:
+    """Conta as instruções SQL enviadas ao banco (PRAGMAs ignorados)"""
+    
+    def __init__(self):
+        self.count = 0
+    
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith("PRAGMA"):
+            self.count += 1
+
+def seed_users(engine, total: int) -> None:
+    """Cria a tabela de usuários e insere `total` registros em lotes de executemany"""
+    Base.metadata.create_all(engine, tables=[UserModel.__table__])
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, total, SEED_BATCH):
+            conn.execute(insert(UserModel), [
+                {
+                    "nome": f"Usuário {i}",
+                    "email": f"usuario{i}@email.com",
+                    "filme_favorito": "Matrix",
+                    "criado_em": start + timedelta(seconds=i),
+                    "atualizado_em": start + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + SEED_BATCH, total))
+            ])
+
+@pytest.fixture(scope="session")
+def user_engines(tmp_path_factory):
+    """Engines por tamanho, semeadas sob demanda e reaproveitadas na sessão"""
+    engines = {}
+    
+    def get(total: int):
+        if total not in engines:
+            engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('bench')}/users_{total}.db")
+            configure_sqlite_engine(engine)
+            seed_users(engine, total)
+            engines[total] = engine
+        return engines[total]
+    
+    yield get
+    for engine in engines.values():
+        engine.dispose()
+
+@pytest.fixture
+def users(request):
+    """Quantidade de usuários semeados (parametrizada por --bench-users)"""
+    return request.param
+
+@pytest.fixture
+def db(user_engines, users):
+    """Sessão sobre o banco semeado com `users` usuários"""
+    with Session(user_engines(users), expire_on_commit=False) as session:
+        yield session
+
+@pytest.fixture
+def profiled(benchmark):
+    """Mede uma chamada isolada (consultas, alocações) e depois cronometra com o benchmark.
+    
+    tracemalloc fica desligado durante a cronometragem, que assim não paga o custo
+    do rastreamento; alocações e consultas vão para o `extra_info` do relatório.
+    """
+    def run(func, *args, engine=None, **kwargs):
+        # Aquecimento: caches de compilação do SQLAlchemy/pydantic não entram na medição
+        func(*args, **kwargs)
+        counter = QueryCounter()
+        if engine is not None:
+            event.listen(engine, "before_cursor_execute", counter)
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            result = func(*args, **kwargs)
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            if engine is not None:
+                event.remove(engine, "before_cursor_execute", counter)
+        del result
+        
+        benchmark.extra_info.update({
+            "queries": counter.count,
+            "alloc_peak_kib": round((peak - before) / 1024, 1),
+            # Memória ainda viva após a chamada: essencialmente o próprio resultado
+            "alloc_result_kib": round((after - before) / 1024, 1),
+        })
+        PROFILES.append((benchmark.name, dict(benchmark.extra_info)))
+        return benchmark(func, *args, **kwargs)
+    
+    return run
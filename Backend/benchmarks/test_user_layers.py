@@ -0,0 +1,91 @@
+"""
+Microbenchmarks por camada do fluxo de usuários: repositório (ORM + SQLite),
+validação de domínio (User.__post_init__) e serialização (UserResponse.from_orm).
+
+Cada caso registra tempo (pytest-benchmark), consultas SQL e alocações
+(tracemalloc) de uma chamada; os casos de repositório rodam em cada tamanho
+de --bench-users.
+"""
+
+import pytest
+from datetime import datetime
+from core.domain.user import User
+from infra.models.user import UserModel
+from infra.repositories.user_repository import UserRepository
+from api.schemas.user import UserResponse
+
+def to_domain(model: UserModel) -> User:
+    return User(
+        id=model.id,
+        nome=model.nome,
+        email=model.email,
+        filme_favorito=model.filme_favorito,
+        criado_em=model.criado_em
+    )
+
+def sample_user() -> UserModel:
+    return UserModel(
+        id=1,
+        nome="Usuário 1",
+        email="usuario1@email.com",
+        filme_favorito="Matrix",
+        criado_em=datetime(2024, 1, 1),
+        versao=1,
+        atualizado_em=datetime(2024, 1, 1)
+    )
+
+# Repositório
+
+def test_repository_get_all(benchmark, profiled, db, users):
+    benchmark.group = "repository.get_all"
+    result = profiled(UserRepository(db).get_all, engine=db.get_bind())
+    assert len(result) == users
+
+def test_repository_get_by_id(benchmark, profiled, db, users):
+    benchmark.group = "repository.get_by_id"
+    repository = UserRepository(db)
+    
+    def lookup():
+        # Sem o identity map: cada chamada vai ao banco como numa requisição nova
+        db.expunge_all()
+        return repository.get_by_id(users // 2)
+    
+    assert profiled(lookup, engine=db.get_bind()).id == users // 2
+
+@pytest.mark.parametrize("hit", [True, False], ids=["existe", "ausente"])
+def test_repository_email_exists(benchmark, profiled, db, users, hit):
+    benchmark.group = "repository.email_exists"
+    repository = UserRepository(db)
+    email = f"usuario{users - 1}@email.com" if hit else "ninguem@email.com"
+    
+    def lookup():
+        db.expunge_all()
+        return repository.email_exists(email)
+    
+    assert profiled(lookup, engine=db.get_bind()) is hit
+
+# Domínio
+
+def test_domain_post_init(benchmark, profiled):
+    benchmark.group = "domain.User.__post_init__"
+    user = profiled(User, id=1, nome="Usuário 1", email="usuario1@email.com", filme_favorito="Matrix", criado_em=None)
+    assert user.nome == "Usuário 1"
+
+def test_domain_post_init_all(benchmark, profiled, db, users):
+    benchmark.group = "domain.User.__post_init__ (tabela)"
+    models = UserRepository(db).get_all()
+    result = profiled(lambda: [to_domain(model) for model in models])
+    assert len(result) == users
+
+# Serialização
+
+def test_schema_from_orm(benchmark, profiled):
+    benchmark.group = "schema.UserResponse.from_orm"
+    response = profiled(UserResponse.from_orm, sample_user())
+    assert response.id == 1
+
+def test_schema_from_orm_all(benchmark, profiled, db, users):
+    benchmark.group = "schema.UserResponse.from_orm (tabela)"
+    models = UserRepository(db).get_all()
+    result = profiled(lambda: [UserResponse.from_orm(model) for model in models])
+    assert len(result) == users
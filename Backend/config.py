@@ -5,6 +5,57 @@ class Settings(BaseSettings):
     
     # Configurações do banco de dados
     DATABASE_URL: str = "sqlite:///./infra/database/bookshelf.db"  # Mudou para data/
+    # Caminho assíncrono (aiosqlite); False volta às rotas síncronas com SessionLocal
+    USE_ASYNC_DB: bool = True
+    
+    # GET de usuários serializados direto de tuplas com orjson (sem revalidar o response_model)
+    FAST_RESPONSES: bool = True
+    
+    # Cache de leitura de usuários (LRU + TTL em processo; negativo para 404)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60
+    USER_CACHE_NEGATIVE_TTL_SECONDS: float = 5
+    
+    # Perfil de produção do SQLite: WAL, PRAGMAs por conexão e writer único
+    SQLITE_PRODUCTION_PROFILE: bool = True
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KIB: int = 65536
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_READER_POOL_SIZE: int = 8
+    
+    # Progresso de leitura write-behind: coalescido por registro e gravado em lote.
+    # Por processo (só um worker lê os próprios pendentes); serve.py o desliga com vários workers
+    PROGRESS_BUFFER_ENABLED: bool = True
+    PROGRESS_FLUSH_MAX_PENDING: int = 1000
+    PROGRESS_FLUSH_INTERVAL_SECONDS: float = 1.0
+    
+    # Rankings de livros por nota (GET /api/books/top), recalculados após escritas em notas
+    RANKING_SIZE: int = 100
+    RANKING_MIN_AVALIACOES: int = 3
+    RANKING_CACHE_TTL_SECONDS: float = 3600
+    
+    # Capas de livros baixadas uma vez e servidas do disco (GET /api/books/{id}/capa)
+    COVERS_DIR: str = "./infra/database/capas"
+    COVER_FETCH_CONCURRENCY: int = 8
+    COVER_FETCH_TIMEOUT_SECONDS: float = 10
+    COVER_MAX_BYTES: int = 5242880
+    COVER_WIDTHS: list = [128, 256, 512]
+    COVER_RESIZE_PROCESSES: int = 2
+    COVER_CACHE_MAX_AGE_SECONDS: int = 604800
+    COVER_NEGATIVE_TTL_SECONDS: float = 300
+    
+    # Métricas Prometheus em /metrics (latência por rota, SQL por instrução, espera no pool)
+    METRICS_ENABLED: bool = True
+    # Instruções acima deste tempo vão para o log "bookshelf.sql" (0 desliga)
+    SLOW_QUERY_MS: float = 200
+    # Diretório onde cada worker grava o snapshot das métricas; /metrics soma todos.
+    # Vazio: métricas só do processo (serve.py define um temporário com vários workers)
+    METRICS_MULTIPROC_DIR: str = ""
+    METRICS_SNAPSHOT_INTERVAL_SECONDS: float = 1.0
+    
+    # Artefatos de recomendação gerados em IA/ (python -m recomendacao.conteudo ...)
+    RECOMMENDATIONS_DIR: str = "../IA/modelos"
     
     # Configurações da API
     API_V1_STR: str = "/api"
@@ -18,6 +69,11 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-here"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """URL do banco com o driver assíncrono equivalente"""
+        return self.DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -22,26 +22,41 @@ class User:
         if not self.email or '@' not in self.email:
             raise ValueError("Email deve ser válido")
     
-    def update_nome(self, novo_nome: str) -> None:
-        """Atualiza o nome do usuário"""
+    @staticmethod
+    def normalizar_nome(novo_nome: str) -> str:
+        """Valida e normaliza um nome sem precisar do usuário carregado"""
         if not novo_nome or len(novo_nome.strip()) == 0:
             raise ValueError("Nome não pode estar vazio")
         
         if len(novo_nome) > 100:
             raise ValueError("Nome não pode ter mais de 100 caracteres")
         
-        self.nome = novo_nome.strip()
+        return novo_nome.strip()
     
-    def update_email(self, novo_email: str) -> None:
-        """Atualiza o email do usuário"""
+    @staticmethod
+    def normalizar_email(novo_email: str) -> str:
+        """Valida e normaliza um email sem precisar do usuário carregado"""
         if not novo_email or '@' not in novo_email:
             raise ValueError("Email deve ser válido")
         
-        self.email = novo_email.lower().strip()
+        return novo_email.lower().strip()
     
-    def update_filme_favorito(self, novo_filme: Optional[str]) -> None:
-        """Atualiza o filme favorito do usuário"""
+    @staticmethod
+    def normalizar_filme_favorito(novo_filme: Optional[str]) -> Optional[str]:
+        """Valida e normaliza o filme favorito sem precisar do usuário carregado"""
         if novo_filme and len(novo_filme) > 200:
             raise ValueError("Filme favorito não pode ter mais de 200 caracteres")
         
-        self.filme_favorito = novo_filme.strip() if novo_filme else None
+        return novo_filme.strip() if novo_filme else None
+    
+    def update_nome(self, novo_nome: str) -> None:
+        """Atualiza o nome do usuário"""
+        self.nome = self.normalizar_nome(novo_nome)
+    
+    def update_email(self, novo_email: str) -> None:
+        """Atualiza o email do usuário"""
+        self.email = self.normalizar_email(novo_email)
+    
+    def update_filme_favorito(self, novo_filme: Optional[str]) -> None:
+        """Atualiza o filme favorito do usuário"""
+        self.filme_favorito = self.normalizar_filme_favorito(novo_filme)
@@ -0,0 +1,160 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.domain.user import User
+from config import settings
+from infra.repositories.async_user_repository import AsyncUserRepository
+from infra.repositories.cached_user_repository import CachedAsyncUserRepository
+
+class AsyncUserService:
+    """Service assíncrono de usuário - mesmas regras de negócio do UserService"""
+    
+    def __init__(self, db: AsyncSession):
+        self.repository = CachedAsyncUserRepository(db) if settings.USER_CACHE_ENABLED else AsyncUserRepository(db)
+    
+    async def get_users_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> Tuple[List[User], bool]:
+        """Retorna uma página de usuários e se existem mais páginas"""
+        try:
+            users = await self.repository.get_page(limit + 1, after)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar usuários: {str(e)}"
+            )
+        return users[:limit], len(users) > limit
+    
+    async def get_users_version(self) -> int:
+        """Versão atual da tabela de usuários (base da ETag da listagem)"""
+        return await self.repository.get_version()
+    
+    async def get_users_page_rows(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> Tuple[List[dict], bool]:
+        """Retorna uma página de usuários como dicionários (caminho rápido)"""
+        try:
+            rows = await self.repository.get_page_rows(limit + 1, after)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar usuários: {str(e)}"
+            )
+        return rows[:limit], len(rows) > limit
+    
+    async def get_user_row_by_id(self, user_id: int) -> dict:
+        """Retorna um usuário como dicionário (caminho rápido)"""
+        row = await self.repository.get_row_by_id(user_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        return row
+    
+    async def get_user_by_id(self, user_id: int) -> User:
+        """Retorna um usuário específico"""
+        user = await self.repository.get_by_id(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        return user
+    
+    async def create_user(self, nome: str, email: str, filme_favorito: str = None) -> User:
+        """Cria um novo usuário"""
+        try:
+            # Criar entidade de domínio
+            domain_user = User(
+                id=None,
+                nome=nome,
+                email=email,
+                filme_favorito=filme_favorito,
+                criado_em=None
+            )
+            
+            # Salvar no banco; a restrição UNIQUE do email detecta duplicidade
+            created_user = await self.repository.create(domain_user)
+            
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao criar usuário: {str(e)}"
+            )
+        
+        if created_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email já está em uso"
+            )
+        return created_user
+    
+    async def update_user(self, user_id: int, nome: str = None, email: str = None, filme_favorito: str = None) -> User:
+        """Atualiza um usuário"""
+        try:
+            # Validar apenas os campos enviados, sem carregar o usuário
+            changes = {}
+            if nome is not None:
+                changes["nome"] = User.normalizar_nome(nome)
+            
+            if email is not None:
+                changes["email"] = User.normalizar_email(email)
+            
+            if filme_favorito is not None:
+                changes["filme_favorito"] = User.normalizar_filme_favorito(filme_favorito)
+            
+            # Atualizar no banco com um único UPDATE ... RETURNING
+            updated_user = await self.repository.update(user_id, changes)
+            
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email já está em uso"
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao atualizar usuário: {str(e)}"
+            )
+        
+        if updated_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        return updated_user
+    
+    async def delete_user(self, user_id: int) -> None:
+        """Remove um usuário"""
+        try:
+            removed = await self.repository.delete(user_id)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao remover usuário: {str(e)}"
+            )
+        
+        if not removed:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
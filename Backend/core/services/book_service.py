@@ -0,0 +1,115 @@
+from typing import List, Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from infra.models.book import CLASSIFICACOES, GENEROS
+from infra.recommendations import similar_books_index
+from infra.repositories.book_repository import BookRepository
+from infra.repositories.fts import prefix_match_query
+
+# Gêneros aceitos nos filtros, sem diferenciar maiúsculas/minúsculas
+_GENEROS_POR_CHAVE = {genero.casefold(): genero for genero in GENEROS}
+
+class BookService:
+    """Service do catálogo de livros - valida filtros e orquestra as consultas"""
+    
+    def __init__(self, db: Session):
+        self.repository = BookRepository(db)
+    
+    @staticmethod
+    def normalizar_filtros(genero: Optional[str], classificacoes: Optional[Sequence[str]]) -> Tuple[Optional[str], List[str]]:
+        """Valida e normaliza os filtros de gênero e classificação indicativa"""
+        if genero is not None:
+            nome = _GENEROS_POR_CHAVE.get(genero.strip().casefold())
+            if nome is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Gênero inválido. Use um de: {', '.join(GENEROS)}"
+                )
+            genero = nome
+        classificacoes = list(dict.fromkeys(classificacoes or ()))
+        invalidas = [c for c in classificacoes if c not in CLASSIFICACOES]
+        if invalidas:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Classificação inválida. Use uma de: {', '.join(CLASSIFICACOES)}"
+            )
+        return genero, classificacoes
+    
+    def get_books_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        genero: Optional[str] = None,
+        classificacoes: Optional[Sequence[str]] = None
+    ) -> Tuple[List[dict], bool]:
+        """Retorna uma página de livros e se existem mais páginas"""
+        genero, classificacoes = self.normalizar_filtros(genero, classificacoes)
+        try:
+            rows = self.repository.get_page_rows(limit + 1, after, genero, classificacoes)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar livros: {str(e)}"
+            )
+        return rows[:limit], len(rows) > limit
+    
+    def search_books(
+        self,
+        termo: str,
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        genero: Optional[str] = None,
+        classificacoes: Optional[Sequence[str]] = None
+    ) -> Tuple[List[dict], bool]:
+        """Busca livros por título/autores/descrição com prefixo, ordenados por relevância"""
+        query = prefix_match_query(termo)
+        if query is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos uma palavra para buscar"
+            )
+        genero, classificacoes = self.normalizar_filtros(genero, classificacoes)
+        try:
+            rows = self.repository.search(query, limit + 1, after, genero, classificacoes)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar livros: {str(e)}"
+            )
+        return rows[:limit], len(rows) > limit
+    
+    def get_book_row_by_id(self, book_id: int) -> dict:
+        """Retorna as colunas de um livro por ID"""
+        row = self.repository.get_row_by_id(book_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Livro não encontrado"
+            )
+        return row
+    
+    def get_similar_books(self, book_id: int, limit: int) -> List[dict]:
+        """Livros parecidos com um livro, lidos da tabela pré-calculada de vizinhos"""
+        volume_id = self.repository.get_volume_id(book_id)
+        if volume_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Livro não encontrado"
+            )
+        if not similar_books_index.available:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Recomendações ainda não foram geradas"
+            )
+        neighbors = similar_books_index.similar(volume_id, limit)
+        rows = {row["volume_id"]: row for row in self.repository.get_rows_by_volume_ids([v for v, _ in neighbors])}
+        similar = []
+        for neighbor, score in neighbors:
+            # Livros removidos do catálogo depois da construção são ignorados
+            if neighbor in rows:
+                similar.append({**rows[neighbor], "similaridade": round(score, 4)})
+        return similar
+    
+    def get_genres(self) -> List[str]:
+        """Retorna os gêneros cadastrados"""
+        return self.repository.get_genres()
@@ -0,0 +1,45 @@
+from pathlib import Path
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from infra.covers import CoverUnavailable, cover_cache
+from infra.repositories.async_book_repository import AsyncBookRepository
+
+class CoverService:
+    """Service de capas - a origem é consultada uma vez; depois tudo sai do disco local"""
+    
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncBookRepository(db)
+    
+    async def get_cover(self, book_id: int, largura: Optional[int] = None) -> Tuple[Path, str, str]:
+        """(arquivo, ETag, media type) da capa original ou da miniatura com a largura pedida"""
+        if largura is not None and largura not in settings.COVER_WIDTHS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Largura inválida; use uma de {', '.join(map(str, settings.COVER_WIDTHS))}"
+            )
+        row = await self.repository.get_cover_url(book_id)
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Livro não encontrado"
+            )
+        if not row[0]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Livro sem capa"
+            )
+        
+        try:
+            digest, content_type = await cover_cache.original(row[0])
+            if largura is None:
+                # O conteúdo define a ETag: a mesma capa tem a mesma ETag em qualquer livro e worker
+                return cover_cache.store.original_path(digest), f'"{digest}"', content_type
+            path = await cover_cache.variant(row[0], largura)
+        except CoverUnavailable as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND if e.not_found else status.HTTP_502_BAD_GATEWAY,
+                detail=str(e)
+            )
+        return path, f'"{digest}-{largura}"', "image/jpeg"
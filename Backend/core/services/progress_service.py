@@ -0,0 +1,75 @@
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from config import settings
+from infra.ingestion import progress_buffer, utc_timestamp
+from infra.repositories.progress_repository import ProgressRepository
+
+def percent_complete(pagina_atual: int, total_paginas: int) -> float:
+    """Percentual lido, com a mesma regra do trigger de registro_progresso"""
+    return round(min(pagina_atual * 100.0 / total_paginas, 100.0), 2)
+
+class ProgressService:
+    """Service de progresso de leitura - valida e enfileira no buffer write-behind"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = ProgressRepository(db)
+    
+    def _total_pages(self, registro_id: int) -> int:
+        total_paginas = self.repository.get_total_pages(registro_id)
+        if total_paginas is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Registro não encontrado"
+            )
+        return total_paginas
+    
+    def record_progress(self, registro_id: int, pagina_atual: int) -> dict:
+        """Registra a página atual; com o buffer ativo a gravação é adiada e coalescida"""
+        total_paginas = self._total_pages(registro_id)
+        if pagina_atual > total_paginas:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Página atual maior que o total de páginas ({total_paginas})"
+            )
+        data_registro = utc_timestamp()
+        if settings.PROGRESS_BUFFER_ENABLED:
+            progress_buffer.add(registro_id, pagina_atual, data_registro)
+        else:
+            try:
+                self.repository.insert_logs([(registro_id, pagina_atual, data_registro)])
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Erro ao registrar progresso: {str(e)}"
+                )
+        return {
+            "registro_id": registro_id,
+            "pagina_atual": pagina_atual,
+            "total_paginas": total_paginas,
+            "percentual": percent_complete(pagina_atual, total_paginas),
+            "atualizado_em": datetime.fromisoformat(data_registro),
+            "pendente": settings.PROGRESS_BUFFER_ENABLED
+        }
+    
+    def get_progress(self, registro_id: int) -> dict:
+        """Progresso atual de um registro, incluindo o que ainda está no buffer"""
+        progress = self.repository.get_progress(registro_id)
+        if progress is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Registro não encontrado"
+            )
+        pending = progress_buffer.pending(registro_id)
+        if pending is not None:
+            pagina_atual, data_registro = pending
+            progress.update(
+                pagina_atual=pagina_atual,
+                percentual=percent_complete(pagina_atual, progress["total_paginas"]),
+                atualizado_em=datetime.fromisoformat(data_registro)
+            )
+        progress["pendente"] = pending is not None
+        return progress
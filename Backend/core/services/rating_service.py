@@ -0,0 +1,69 @@
+from typing import List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from config import settings
+from core.services.book_service import BookService
+from infra.cache import MISSING, ranking_cache
+from infra.repositories.rating_repository import RatingRepository
+
+class RatingService:
+    """Service de notas - escritas mantêm o agregado por trigger; rankings saem do cache"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = RatingRepository(db)
+    
+    def rate_book(self, user_id: int, book_id: int, nota: float, descricao: Optional[str] = None) -> dict:
+        """Cria ou substitui a nota de um usuário para um livro"""
+        try:
+            rating = self.repository.upsert(user_id, book_id, nota, descricao.strip() if descricao else None)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário ou livro não encontrado"
+            )
+        except Exception as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao salvar nota: {str(e)}"
+            )
+        return rating
+    
+    def delete_rating(self, user_id: int, book_id: int) -> None:
+        """Remove a nota de um usuário para um livro"""
+        try:
+            removed = self.repository.delete(user_id, book_id)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao remover nota: {str(e)}"
+            )
+        
+        if not removed:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Nota não encontrada"
+            )
+    
+    def get_top_books(self, limit: int, min_avaliacoes: int, genero: Optional[str] = None) -> List[dict]:
+        """Livros mais bem avaliados (por gênero), recalculados só quando as notas do gênero mudam"""
+        genero, _ = BookService.normalizar_filtros(genero, None)
+        try:
+            # Versão lida antes do ranking: as linhas guardadas nunca são mais antigas que a versão
+            versao = self.repository.get_genre_version(genero) if genero else self.repository.get_version()
+            rows = ranking_cache.get(genero, min_avaliacoes, versao)
+            if rows is MISSING:
+                rows = self.repository.get_top_rows(settings.RANKING_SIZE, min_avaliacoes, genero)
+                ranking_cache.set(genero, min_avaliacoes, versao, rows)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar ranking: {str(e)}"
+            )
+        return [dict(row) for row in rows[:limit]]
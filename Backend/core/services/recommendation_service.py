@@ -0,0 +1,31 @@
+from typing import List
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from infra.repositories.recommendation_repository import RecommendationRepository
+from infra.repositories.user_repository import UserRepository
+
+class RecommendationService:
+    """Service de recomendações - serve candidatos pré-calculados, sem contas por requisição"""
+    
+    def __init__(self, db: Session):
+        self.repository = RecommendationRepository(db)
+        self.user_repository = UserRepository(db)
+    
+    def get_user_recommendations(self, user_id: int, limit: int) -> List[dict]:
+        """Retorna os livros recomendados a um usuário"""
+        try:
+            rows = self.repository.get_user_recommendations(user_id, limit)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar recomendações: {str(e)}"
+            )
+        # Lista vazia: confirma o usuário só quando não há candidatos
+        if not rows and self.user_repository.get_row_by_id(user_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        for row in rows:
+            row["score"] = round(row["score"], 4)
+        return rows
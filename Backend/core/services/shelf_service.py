@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from core.services.progress_service import percent_complete
+from infra.ingestion import progress_buffer
+from infra.repositories.shelf_repository import ShelfRepository
+from infra.repositories.user_repository import UserRepository
+
+PROGRESS_FIELDS = ("registro_id", "total_paginas", "pagina_atual", "percentual", "atualizado_em")
+
+class ShelfService:
+    """Service da estante do usuário - uma consulta por página, sem N+1 por livro"""
+    
+    def __init__(self, db: Session):
+        self.repository = ShelfRepository(db)
+        self.user_repository = UserRepository(db)
+    
+    def get_shelf(self, user_id: int, limit: int, after: Optional[int] = None, tag: Optional[str] = None) -> Tuple[List[dict], bool]:
+        """Retorna uma página da estante e se existem mais páginas"""
+        try:
+            rows = self.repository.get_shelf_rows(user_id, limit + 1, after, tag)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar estante: {str(e)}"
+            )
+        # Página vazia: confirma o usuário só quando não há livros
+        if not rows and self.user_repository.get_row_by_id(user_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        return [self._item(row) for row in rows[:limit]], len(rows) > limit
+    
+    def _item(self, row: dict) -> dict:
+        """Agrupa as colunas do registro em `progresso`, incluindo o que ainda está no buffer"""
+        progress = {field: row.pop(field) for field in PROGRESS_FIELDS}
+        if progress["registro_id"] is None:
+            row["progresso"] = None
+            return row
+        
+        pending = progress_buffer.pending(progress["registro_id"])
+        if pending is not None:
+            pagina_atual, data_registro = pending
+            progress.update(
+                pagina_atual=pagina_atual,
+                percentual=percent_complete(pagina_atual, progress["total_paginas"]),
+                atualizado_em=datetime.fromisoformat(data_registro)
+            )
+        progress["pendente"] = pending is not None
+        row["progresso"] = progress
+        return row
@@ -0,0 +1,147 @@
+from typing import List
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from core.domain.user import User
+from config import settings
+from infra.cache import user_cache
+from infra.repositories.user_repository import UserRepository
+from infra.repositories.cached_user_repository import CachedUserRepository
+
+# Limite de ids por leitura e de operações por lote
+MAX_BATCH_SIZE = 100
+NOT_APPLIED = "Operação não aplicada: outra operação do lote falhou"
+
+class BatchItemError(Exception):
+    """Falha de uma operação do lote, com o status HTTP que ela teria sozinha"""
+    
+    def __init__(self, status_code: int, erro: str):
+        super().__init__(erro)
+        self.status_code = status_code
+        self.erro = erro
+
+class UserBatchService:
+    """Service de leitura e escrita de vários usuários em uma requisição"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = CachedUserRepository(db) if settings.USER_CACHE_ENABLED else UserRepository(db)
+    
+    def get_users(self, user_ids: List[int]) -> dict:
+        """Retorna os usuários na ordem pedida (uma consulta IN) e os ids não encontrados"""
+        user_ids = list(dict.fromkeys(user_ids))
+        if len(user_ids) > MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Informe no máximo {MAX_BATCH_SIZE} ids"
+            )
+        try:
+            rows = {row["id"]: row for row in self.repository.get_rows_by_ids(user_ids)}
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar usuários: {str(e)}"
+            )
+        return {
+            "items": [rows[user_id] for user_id in user_ids if user_id in rows],
+            "nao_encontrados": [user_id for user_id in user_ids if user_id not in rows]
+        }
+    
+    def apply(self, operacoes: List[dict]) -> dict:
+        """Aplica criações/atualizações/remoções em uma única transação (tudo ou nada).
+        
+        Todas as operações são validadas antes de tocar o banco; na primeira que
+        falhar no banco a transação é desfeita e as demais são marcadas com 424.
+        """
+        resultados = [{"indice": indice, "op": op["op"], "id": op.get("id")} for indice, op in enumerate(operacoes)]
+        
+        valores = []
+        for resultado, op in zip(resultados, operacoes):
+            try:
+                valores.append(self._validate(op))
+            except BatchItemError as e:
+                resultado.update(status=e.status_code, erro=e.erro)
+        if any("erro" in resultado for resultado in resultados):
+            return self._failed(resultados)
+        
+        # Ids e emails tocados, invalidados no cache só depois do commit
+        afetados = []
+        try:
+            for resultado, op, values in zip(resultados, operacoes, valores):
+                try:
+                    self._execute(resultado, op, values)
+                except BatchItemError as e:
+                    self.db.rollback()
+                    resultado.update(status=e.status_code, erro=e.erro)
+                    return self._failed(resultados)
+                afetados.append((resultado["id"], values.get("email")))
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao aplicar lote de usuários: {str(e)}"
+            )
+        
+        for user_id, email in afetados:
+            user_cache.invalidate(user_id, email)
+        return {"aplicado": True, "resultados": resultados}
+    
+    def _validate(self, op: dict) -> dict:
+        """Valida a operação pelas regras de domínio e retorna os valores normalizados"""
+        dados = op.get("dados") or {}
+        if op["op"] != "create" and op.get("id") is None:
+            raise BatchItemError(status.HTTP_400_BAD_REQUEST, "Informe o id do usuário")
+        try:
+            if op["op"] == "create":
+                user = User(
+                    id=None,
+                    nome=User.normalizar_nome(dados.get("nome")),
+                    email=User.normalizar_email(dados.get("email")),
+                    filme_favorito=User.normalizar_filme_favorito(dados.get("filme_favorito")),
+                    criado_em=None
+                )
+                return {"nome": user.nome, "email": user.email, "filme_favorito": user.filme_favorito}
+            
+            if op["op"] == "update":
+                changes = {}
+                if dados.get("nome") is not None:
+                    changes["nome"] = User.normalizar_nome(dados["nome"])
+                if dados.get("email") is not None:
+                    changes["email"] = User.normalizar_email(dados["email"])
+                if dados.get("filme_favorito") is not None:
+                    changes["filme_favorito"] = User.normalizar_filme_favorito(dados["filme_favorito"])
+                return changes
+        except ValueError as e:
+            raise BatchItemError(status.HTTP_400_BAD_REQUEST, str(e))
+        return {}
+    
+    def _execute(self, resultado: dict, op: dict, values: dict) -> None:
+        """Executa uma operação validada (sem commit) e preenche o resultado"""
+        if op["op"] == "create":
+            row = self.repository.insert_row(values)
+            if row is None:
+                raise BatchItemError(status.HTTP_400_BAD_REQUEST, "Email já está em uso")
+            resultado.update(id=row["id"], status=status.HTTP_201_CREATED, usuario=row)
+        elif op["op"] == "update":
+            try:
+                row = self.repository.update_row(op["id"], values)
+            except IntegrityError:
+                raise BatchItemError(status.HTTP_400_BAD_REQUEST, "Email já está em uso")
+            if row is None:
+                raise BatchItemError(status.HTTP_404_NOT_FOUND, "Usuário não encontrado")
+            resultado.update(status=status.HTTP_200_OK, usuario=row)
+        else:
+            if not self.repository.delete_row(op["id"]):
+                raise BatchItemError(status.HTTP_404_NOT_FOUND, "Usuário não encontrado")
+            resultado.update(status=status.HTTP_204_NO_CONTENT)
+    
+    def _failed(self, resultados: List[dict]) -> dict:
+        """Resultado de um lote desfeito: as operações sem erro próprio recebem 424"""
+        for resultado in resultados:
+            if "erro" not in resultado:
+                resultado.pop("usuario", None)
+                if resultado["op"] == "create":
+                    resultado["id"] = None
+                resultado.update(status=status.HTTP_424_FAILED_DEPENDENCY, erro=NOT_APPLIED)
+        return {"aplicado": False, "resultados": resultados}
@@ -0,0 +1,149 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, List, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from core.domain.user import User
+from infra.cache import user_cache
+from infra.repositories.user_repository import UserRepository
+
+# Linhas por transação na importação e por bloco na exportação
+CHUNK_SIZE = 1000
+EXPORT_FIELDS = ["id", "nome", "email", "filme_favorito", "criado_em"]
+
+class UserBulkService:
+    """Service de importação e exportação de usuários em lote"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = UserRepository(db)
+    
+    def import_users(self, lines: Iterable[str], formato: str) -> dict:
+        """Importa usuários de NDJSON/CSV em transações por bloco, com erros por linha"""
+        result = {"total": 0, "inseridos": 0, "erros": []}
+        vistos = set()
+        chunk: List[Tuple[int, User]] = []
+        
+        for linha, data in self._parse(lines, formato):
+            result["total"] += 1
+            try:
+                if data is None:
+                    raise ValueError("JSON inválido")
+                if not isinstance(data, dict):
+                    raise ValueError("Registro deve ser um objeto com nome e email")
+                # Mesma normalização da criação unitária: "ANA@email.com" é o email de "ana@email.com"
+                user = User(
+                    id=None,
+                    nome=User.normalizar_nome(data.get("nome")),
+                    email=User.normalizar_email(data.get("email")),
+                    filme_favorito=User.normalizar_filme_favorito(data.get("filme_favorito") or None),
+                    criado_em=None
+                )
+            except (ValueError, TypeError, AttributeError) as e:
+                message = str(e) if isinstance(e, ValueError) else "Formato de campo inválido"
+                result["erros"].append({"linha": linha, "email": None, "erro": message})
+                continue
+            
+            if user.email in vistos:
+                result["erros"].append({"linha": linha, "email": user.email, "erro": "Email duplicado no arquivo"})
+                continue
+            vistos.add(user.email)
+            
+            chunk.append((linha, user))
+            if len(chunk) >= CHUNK_SIZE:
+                self._insert_chunk(chunk, result)
+                chunk = []
+        
+        self._insert_chunk(chunk, result)
+        if result["inseridos"]:
+            # Ids gerados pelo executemany não são conhecidos: descarta entradas negativas
+            user_cache.clear()
+        result["erros"].sort(key=lambda erro: erro["linha"])
+        return result
+    
+    def export_users(self, formato: str) -> Iterator[str]:
+        """Gera a exportação em blocos de texto, lendo os usuários pelo cursor"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if formato == "csv" else None
+        if writer:
+            writer.writerow(EXPORT_FIELDS)
+        
+        for count, row in enumerate(self.repository.stream_all(CHUNK_SIZE), start=1):
+            values = [row.id, row.nome, row.email, row.filme_favorito, row.criado_em.isoformat() if row.criado_em else None]
+            if writer:
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(EXPORT_FIELDS, values)), ensure_ascii=False))
+                buffer.write("\n")
+            
+            if count % CHUNK_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        
+        if buffer.tell():
+            yield buffer.getvalue()
+    
+    def _parse(self, lines: Iterable[str], formato: str) -> Iterator[Tuple[int, object]]:
+        """Converte as linhas de entrada em (número da linha, registro)"""
+        if formato == "csv":
+            reader = csv.DictReader(lines)
+            if not reader.fieldnames or not {"nome", "email"} <= set(reader.fieldnames):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="CSV deve ter cabeçalho com as colunas nome e email"
+                )
+            for row in reader:
+                yield reader.line_num, row
+            return
+        
+        for linha, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield linha, json.loads(line)
+            except json.JSONDecodeError:
+                yield linha, None
+    
+    def _insert_chunk(self, chunk: List[Tuple[int, User]], result: dict) -> None:
+        """Insere um bloco validado: uma consulta de emails, um executemany e um commit"""
+        if not chunk:
+            return
+        
+        try:
+            existentes = self.repository.existing_emails(user.email for _, user in chunk)
+            rows = []
+            for linha, user in chunk:
+                if user.email in existentes:
+                    result["erros"].append({"linha": linha, "email": user.email, "erro": "Email já está em uso"})
+                else:
+                    rows.append((linha, {
+                        "nome": user.nome,
+                        "email": user.email,
+                        "filme_favorito": user.filme_favorito
+                    }))
+            
+            try:
+                self.repository.bulk_insert([row for _, row in rows])
+                self.db.commit()
+                result["inseridos"] += len(rows)
+            except IntegrityError:
+                # Email cadastrado por outra requisição no meio da importação:
+                # refaz o bloco linha a linha para apontar quais falharam
+                self.db.rollback()
+                for linha, row in rows:
+                    try:
+                        self.repository.bulk_insert([row])
+                        self.db.commit()
+                        result["inseridos"] += 1
+                    except IntegrityError:
+                        self.db.rollback()
+                        result["erros"].append({"linha": linha, "email": row["email"], "erro": "Email já está em uso"})
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao importar usuários: {str(e)}"
+            )
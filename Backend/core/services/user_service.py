@@ -1,25 +1,91 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from core.domain.user import User
+from config import settings
 from infra.repositories.user_repository import UserRepository
+from infra.repositories.cached_user_repository import CachedUserRepository
+from infra.repositories.fts import prefix_match_query
 
 class UserService:
     """Service de usuário - orquestra casos de uso e regras de negócio"""
     
     def __init__(self, db: Session):
-        self.repository = UserRepository(db)
+        self.repository = CachedUserRepository(db) if settings.USER_CACHE_ENABLED else UserRepository(db)
     
     def get_all_users(self) -> List[User]:
         """Retorna todos os usuários"""
         try:
             return self.repository.get_all()
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Erro ao buscar usuários: {str(e)}"
             )
     
+    def get_users_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> Tuple[List[User], bool]:
+        """Retorna uma página de usuários e se existem mais páginas"""
+        try:
+            users = self.repository.get_page(limit + 1, after)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar usuários: {str(e)}"
+            )
+        return users[:limit], len(users) > limit
+    
+    def get_users_version(self) -> int:
+        """Versão atual da tabela de usuários (base da ETag da listagem)"""
+        return self.repository.get_version()
+    
+    def get_users_page_rows(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> Tuple[List[dict], bool]:
+        """Retorna uma página de usuários como dicionários (caminho rápido)"""
+        try:
+            rows = self.repository.get_page_rows(limit + 1, after)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar usuários: {str(e)}"
+            )
+        return rows[:limit], len(rows) > limit
+    
+    def get_user_row_by_id(self, user_id: int) -> dict:
+        """Retorna um usuário como dicionário (caminho rápido)"""
+        row = self.repository.get_row_by_id(user_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        return row
+    
+    def search_users(self, termo: str, limit: int, after: Optional[Tuple[float, int]] = None) -> Tuple[List[dict], bool]:
+        """Busca usuários por nome/email com prefixo, ordenados por relevância"""
+        query = prefix_match_query(termo)
+        if query is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos uma palavra para buscar"
+            )
+        try:
+            rows = self.repository.search(query, limit + 1, after)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro ao buscar usuários: {str(e)}"
+            )
+        return rows[:limit], len(rows) > limit
+    
     def get_user_by_id(self, user_id: int) -> User:
         """Retorna um usuário específico"""
         user = self.repository.get_by_id(user_id)
@@ -33,13 +99,6 @@ class UserService:
     def create_user(self, nome: str, email: str, filme_favorito: str = None) -> User:
         """Cria um novo usuário"""
         try:
-            # Verificar se email já existe
-            if self.repository.email_exists(email):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email já está em uso"
-                )
-            
             # Criar entidade de domínio
             domain_user = User(
                 id=None,
@@ -49,83 +108,85 @@ class UserService:
                 criado_em=None
             )
             
-            # Salvar no banco
-            return self.repository.create(domain_user)
+            # Salvar no banco; a restrição UNIQUE do email detecta duplicidade
+            created_user = self.repository.create(domain_user)
             
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Erro ao criar usuário: {str(e)}"
             )
+        
+        if created_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email já está em uso"
+            )
+        return created_user
     
     def update_user(self, user_id: int, nome: str = None, email: str = None, filme_favorito: str = None) -> User:
         """Atualiza um usuário"""
-        # Buscar usuário existente
-        db_user = self.repository.get_by_id(user_id)
-        if not db_user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Usuário não encontrado"
-            )
-        
         try:
-            # Criar entidade de domínio com dados existentes
-            domain_user = User(
-                id=db_user.id,
-                nome=db_user.nome,
-                email=db_user.email,
-                filme_favorito=db_user.filme_favorito,
-                criado_em=db_user.criado_em
-            )
-            
-            # Aplicar atualizações
+            # Validar apenas os campos enviados, sem carregar o usuário
+            changes = {}
             if nome is not None:
-                domain_user.update_nome(nome)
+                changes["nome"] = User.normalizar_nome(nome)
             
             if email is not None:
-                # Verificar se novo email já existe (se diferente do atual)
-                if email != db_user.email and self.repository.email_exists(email):
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Email já está em uso"
-                    )
-                domain_user.update_email(email)
+                changes["email"] = User.normalizar_email(email)
             
             if filme_favorito is not None:
-                domain_user.update_filme_favorito(filme_favorito)
+                changes["filme_favorito"] = User.normalizar_filme_favorito(filme_favorito)
             
-            # Atualizar no banco
-            return self.repository.update(user_id, domain_user)
+            # Atualizar no banco com um único UPDATE ... RETURNING
+            updated_user = self.repository.update(user_id, changes)
             
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email já está em uso"
+            )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Erro ao atualizar usuário: {str(e)}"
             )
-    
-    def delete_user(self, user_id: int) -> None:
-        """Remove um usuário"""
-        user = self.repository.get_by_id(user_id)
-        if not user:
+        
+        if updated_user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Usuário não encontrado"
             )
-        
+        return updated_user
+    
+    def delete_user(self, user_id: int) -> None:
+        """Remove um usuário"""
         try:
-            self.repository.delete(user_id)
+            removed = self.repository.delete(user_id)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Erro ao remover usuário: {str(e)}"
             )
+        
+        if not removed:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
@@ -0,0 +1,7 @@
+# Cache
+from .base import MISSING, CacheBackend
+from .memory import InMemoryLRUCache
+from .user_cache import UserCache, user_cache
+from .ranking_cache import RankingCache, ranking_cache
+
+__all__ = ["MISSING", "CacheBackend", "InMemoryLRUCache", "UserCache", "user_cache", "RankingCache", "ranking_cache"]
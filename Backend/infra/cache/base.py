@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+# Sentinela para "chave ausente", distinta de um valor None armazenado
+# (None é usado no cache negativo para registros inexistentes)
+MISSING = object()
+
+class CacheBackend(ABC):
+    """Interface de cache chave/valor; um backend compartilhado (ex.: Redis) implementa a mesma API"""
+    
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Retorna o valor armazenado ou MISSING"""
+    
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Armazena um valor; ttl em segundos (None usa o padrão do backend)"""
+    
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """Remove as chaves informadas"""
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove todas as chaves"""
+    
+    @abstractmethod
+    def stats(self) -> dict:
+        """Contadores de acertos, faltas e remoções"""
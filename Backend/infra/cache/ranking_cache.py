@@ -0,0 +1,39 @@
+from typing import Any, List, Optional
+from config import settings
+from infra.cache.base import MISSING, CacheBackend
+from infra.cache.memory import InMemoryLRUCache
+
+class RankingCache:
+    """Rankings de livros por nota sobre um CacheBackend, válidos para uma versão das notas.
+    
+    `ranking:<gênero>:<mínimo>` guarda (versão, linhas); a versão vem de
+    versao_ranking_genero (ou de versao_tabela para o ranking geral), incrementada
+    pelos triggers de notas, então uma escrita feita por qualquer processo torna
+    obsoletos só os rankings dos gêneros do livro, sem invalidação explícita.
+    """
+    
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+    
+    @staticmethod
+    def _key(genero: Optional[str], min_avaliacoes: int) -> str:
+        return f"ranking:{genero or '*'}:{min_avaliacoes}"
+    
+    def get(self, genero: Optional[str], min_avaliacoes: int, versao: int) -> Any:
+        """Linhas do ranking calculado nesta versão, ou MISSING"""
+        entry = self.backend.get(self._key(genero, min_avaliacoes))
+        if entry is MISSING or entry[0] != versao:
+            return MISSING
+        return entry[1]
+    
+    def set(self, genero: Optional[str], min_avaliacoes: int, versao: int, rows: List[dict]) -> None:
+        self.backend.set(self._key(genero, min_avaliacoes), (versao, rows))
+    
+    def clear(self) -> None:
+        self.backend.clear()
+    
+    def stats(self) -> dict:
+        return self.backend.stats()
+
+# Instância do processo; poucas chaves (gêneros x mínimos de avaliações)
+ranking_cache = RankingCache(InMemoryLRUCache(max_size=256, ttl=settings.RANKING_CACHE_TTL_SECONDS))
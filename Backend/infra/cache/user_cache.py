@@ -0,0 +1,53 @@
+from typing import Any, Optional
+from config import settings
+from infra.cache.base import MISSING, CacheBackend
+from infra.cache.memory import InMemoryLRUCache
+
+class UserCache:
+    """Chaves e regras de cache de usuários sobre um CacheBackend.
+    
+    `user:<id>` guarda as colunas do usuário (ou None, cache negativo) e
+    `email:<email>` guarda apenas o id, resolvido depois por `user:<id>`;
+    assim uma atualização invalida só a chave do id.
+    """
+    
+    def __init__(self, backend: CacheBackend, negative_ttl: float):
+        self.backend = backend
+        self.negative_ttl = negative_ttl
+    
+    def get_row(self, user_id: int) -> Any:
+        """Colunas do usuário, None (inexistente em cache) ou MISSING"""
+        return self.backend.get(f"user:{user_id}")
+    
+    def set_row(self, user_id: int, row: Optional[dict]) -> None:
+        self.backend.set(f"user:{user_id}", row, None if row is not None else self.negative_ttl)
+    
+    def get_email_id(self, email: str) -> Any:
+        """Id do dono do email, None (inexistente em cache) ou MISSING"""
+        return self.backend.get(f"email:{email}")
+    
+    def set_email_id(self, email: str, user_id: Optional[int]) -> None:
+        self.backend.set(f"email:{email}", user_id, None if user_id is not None else self.negative_ttl)
+    
+    def invalidate(self, user_id: Optional[int] = None, email: Optional[str] = None) -> None:
+        keys = []
+        if user_id is not None:
+            keys.append(f"user:{user_id}")
+        if email is not None:
+            keys.append(f"email:{email}")
+        self.backend.delete(*keys)
+    
+    def clear(self) -> None:
+        self.backend.clear()
+    
+    def stats(self) -> dict:
+        return self.backend.stats()
+
+# Instância do processo; um backend compartilhado pode ser injetado aqui
+user_cache = UserCache(
+    InMemoryLRUCache(
+        max_size=settings.USER_CACHE_MAX_SIZE,
+        ttl=settings.USER_CACHE_TTL_SECONDS
+    ),
+    negative_ttl=settings.USER_CACHE_NEGATIVE_TTL_SECONDS
+)
@@ -0,0 +1,5 @@
+# Capas de livros
+from .store import CoverStore
+from .cache import CoverCache, CoverUnavailable, cover_cache
+
+__all__ = ["CoverStore", "CoverCache", "CoverUnavailable", "cover_cache"]
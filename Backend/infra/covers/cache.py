@@ -0,0 +1,191 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple
+import httpx
+from config import settings
+from infra.cache import MISSING, CacheBackend, InMemoryLRUCache
+from infra.covers.resize import resize_cover
+from infra.covers.store import CoverStore
+
+logger = logging.getLogger("bookshelf.covers")
+
+class CoverUnavailable(Exception):
+    """A origem não entregou uma imagem; `not_found` separa 404 de falhas transitórias"""
+    
+    def __init__(self, motivo: str, not_found: bool = False):
+        super().__init__(motivo)
+        self.not_found = not_found
+
+class CoverCache:
+    """Baixa cada capa uma vez, guarda em disco e gera miniaturas em um pool de processos.
+    
+    Downloads passam por um semáforo (concorrência limitada com a origem) e são
+    deduplicados: requisições simultâneas pela mesma URL ou variante aguardam a
+    mesma tarefa. Falhas ficam em cache negativo por um tempo, para um catálogo
+    com capas quebradas não repetir o download a cada rolagem.
+    """
+    
+    def __init__(
+        self,
+        store: CoverStore,
+        negative: CacheBackend,
+        widths: Sequence[int],
+        concurrency: int,
+        timeout: float,
+        max_bytes: int,
+        processes: int
+    ):
+        self.store = store
+        self.negative = negative
+        self.widths = tuple(widths)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.processes = processes
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+    
+    async def original(self, url: str) -> Tuple[str, str]:
+        """(sha, content-type) da capa original, baixando na primeira vez"""
+        found = self.store.lookup(url)
+        if found is not None:
+            return found
+        motivo = self.negative.get(url)
+        if motivo is not MISSING:
+            raise CoverUnavailable(*motivo)
+        return await self._once(("url", url), lambda: self._download(url))
+    
+    async def variant(self, url: str, largura: int) -> Path:
+        """Caminho da miniatura JPEG com a largura pedida (uma das larguras configuradas)"""
+        digest, _ = await self.original(url)
+        path = self.store.variant_path(digest, largura)
+        if not path.exists():
+            motivo = self.negative.get(f"variante:{digest}:{largura}")
+            if motivo is not MISSING:
+                raise CoverUnavailable(*motivo)
+            await self._once(("variante", digest, largura), lambda: self._resize(digest, largura))
+        return path
+    
+    async def _once(self, key: tuple, factory: Callable[[], Awaitable]):
+        """Executa factory() uma vez por chave; chamadas concorrentes recebem o mesmo resultado"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: o cancelamento de uma requisição não derruba o download das outras
+        return await asyncio.shield(future)
+    
+    async def _download(self, url: str) -> Tuple[str, str]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        
+        async with self._semaphore:
+            try:
+                data, content_type = await self._fetch(url)
+            except CoverUnavailable as e:
+                self.negative.set(url, (str(e), e.not_found))
+                raise
+            except httpx.HTTPError as e:
+                logger.warning("Falha ao baixar capa %s: %s", url, e)
+                self.negative.set(url, ("Falha ao baixar a capa", False))
+                raise CoverUnavailable("Falha ao baixar a capa")
+        
+        digest = await asyncio.to_thread(self.store.put, url, data, content_type)
+        return digest, content_type
+    
+    async def _fetch(self, url: str) -> Tuple[bytes, str]:
+        async with self._client.stream("GET", url) as response:
+            if response.status_code == 404:
+                raise CoverUnavailable("Capa não encontrada na origem", not_found=True)
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+            if not content_type.startswith("image/"):
+                raise CoverUnavailable("A origem não retornou uma imagem", not_found=True)
+            
+            chunks, total = [], 0
+            async for chunk in response.aiter_bytes():
+                total += len(chunk)
+                if total > self.max_bytes:
+                    raise CoverUnavailable("Capa maior que o limite", not_found=True)
+                chunks.append(chunk)
+        return b"".join(chunks), content_type
+    
+    async def _resize(self, digest: str, largura: int) -> None:
+        data = await asyncio.to_thread(self.store.original_path(digest).read_bytes)
+        key = f"variante:{digest}:{largura}"
+        try:
+            try:
+                resized = await self._run_resize(data, largura)
+            except BrokenProcessPool:
+                # Um worker morreu (OOM, sinal): o pool não aceita mais tarefas; recria e tenta de novo
+                logger.warning("Pool de redução quebrado; recriando")
+                self._discard_pool()
+                resized = await self._run_resize(data, largura)
+        except (OSError, ValueError) as e:
+            # Pillow não reconhece o arquivo (UnidentifiedImageError é um OSError)
+            logger.warning("Falha ao reduzir capa %s: %s", digest, e)
+            self.negative.set(key, ("A capa na origem não é uma imagem válida", True))
+            raise CoverUnavailable("A capa na origem não é uma imagem válida", not_found=True)
+        except BrokenProcessPool:
+            # Quebrou de novo com esta imagem: o pool é recriado na próxima chamada
+            logger.warning("Falha ao reduzir capa %s: pool de processos quebrado", digest)
+            self._discard_pool()
+            self.negative.set(key, ("Falha ao reduzir a capa", False))
+            raise CoverUnavailable("Falha ao reduzir a capa")
+        await asyncio.to_thread(self.store.write_atomic, self.store.variant_path(digest, largura), resized)
+    
+    async def _run_resize(self, data: bytes, largura: int) -> bytes:
+        if self._pool is None:
+            # Criado sob demanda em cada worker (nunca no mestre, antes do fork)
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, resize_cover, data, largura)
+    
+    def _discard_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    async def prefetch(self, urls: Sequence[str], variants: bool = True) -> Dict[str, int]:
+        """Baixa (e reduz) várias capas com a mesma concorrência limitada; retorna contadores"""
+        counts = {"baixadas": 0, "falhas": 0}
+        
+        async def one(url: str) -> None:
+            try:
+                await self.original(url)
+                if variants:
+                    for largura in self.widths:
+                        await self.variant(url, largura)
+                counts["baixadas"] += 1
+            except CoverUnavailable:
+                counts["falhas"] += 1
+        
+        await asyncio.gather(*(one(url) for url in dict.fromkeys(urls)))
+        return counts
+    
+    async def close(self) -> None:
+        """Fecha o cliente HTTP e o pool de processos (shutdown do lifespan)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._discard_pool()
+        self._semaphore = None
+
+# Instância global; o cliente HTTP e o pool de processos nascem no primeiro uso, já no worker
+cover_cache = CoverCache(
+    CoverStore(Path(settings.COVERS_DIR)),
+    InMemoryLRUCache(max_size=10000, ttl=settings.COVER_NEGATIVE_TTL_SECONDS),
+    widths=settings.COVER_WIDTHS,
+    concurrency=settings.COVER_FETCH_CONCURRENCY,
+    timeout=settings.COVER_FETCH_TIMEOUT_SECONDS,
+    max_bytes=settings.COVER_MAX_BYTES,
+    processes=settings.COVER_RESIZE_PROCESSES
+)
@@ -0,0 +1,25 @@
+import io
+from PIL import Image, ImageOps
+
+def resize_cover(data: bytes, largura: int, quality: int = 82) -> bytes:
+    """Miniatura JPEG com a largura pedida (proporção mantida, nunca amplia).
+    
+    Roda no pool de processos: função de módulo, recebe e devolve bytes.
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        # JPEG: decodifica já reduzido (DCT em escala) quando a origem é bem maior
+        image.draft("RGB", (largura, largura * 4))
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+        if image.width > largura:
+            altura = max(1, round(image.height * largura / image.width))
+            image = image.resize((largura, altura), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=quality, optimize=True, progressive=True)
+        return output.getvalue()
@@ -0,0 +1,63 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+class CoverStore:
+    """Capas em disco endereçadas pelo conteúdo (SHA-256).
+    
+    `originais/ab/<sha>` guarda os bytes baixados e `variantes/ab/<sha>-<largura>.jpg`
+    as miniaturas; `urls/cd/<sha da url>` aponta a URL de origem para o conteúdo
+    ("<sha> <content-type>"). Capas idênticas (ex.: o "sem imagem" do Google) ocupam
+    um arquivo só. Toda escrita é temporário + os.replace: leitores (e outros
+    workers) nunca enxergam um arquivo pela metade.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = Path(root)
+    
+    @staticmethod
+    def _sharded(base: Path, name: str) -> Path:
+        return base / name[:2] / name
+    
+    def original_path(self, digest: str) -> Path:
+        return self._sharded(self.root / "originais", digest)
+    
+    def variant_path(self, digest: str, largura: int) -> Path:
+        return self._sharded(self.root / "variantes", f"{digest}-{largura}.jpg")
+    
+    def _url_path(self, url: str) -> Path:
+        return self._sharded(self.root / "urls", sha256_hex(url.encode("utf-8")))
+    
+    def lookup(self, url: str) -> Optional[Tuple[str, str]]:
+        """(sha do conteúdo, content-type) de uma URL já baixada, ou None"""
+        try:
+            digest, content_type = self._url_path(url).read_text(encoding="ascii").split(" ", 1)
+        except (FileNotFoundError, ValueError):
+            return None
+        return (digest, content_type) if self.original_path(digest).exists() else None
+    
+    def put(self, url: str, data: bytes, content_type: str) -> str:
+        """Grava o conteúdo (se ainda não existir) e aponta a URL para ele"""
+        digest = sha256_hex(data)
+        path = self.original_path(digest)
+        if not path.exists():
+            self.write_atomic(path, data)
+        self.write_atomic(self._url_path(url), f"{digest} {content_type}".encode("ascii"))
+        return digest
+    
+    @staticmethod
+    def write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
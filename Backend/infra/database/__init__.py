@@ -1,4 +1,5 @@
 # Database configuration
-from .database import get_db, create_tables, drop_tables
+from .database import get_db, migrate_database, drop_tables
+from .async_database import get_async_db
 
-__all__ = ["get_db", "create_tables", "drop_tables"]
+__all__ = ["get_db", "get_async_db", "migrate_database", "drop_tables"]
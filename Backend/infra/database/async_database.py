@@ -0,0 +1,59 @@
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from config import settings
+from infra.database.sqlite import RoutingSession, configure_sqlite_engine
+from infra.metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+
+if settings.SQLITE_PRODUCTION_PROFILE:
+    # Writer único assíncrono; checkouts concorrentes aguardam sem bloquear o loop
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},  # Necessário para SQLite
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name="async_writer",
+        pool_size=1,
+        max_overflow=0
+    )
+    async_reader_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name="async_reader",
+        pool_size=settings.SQLITE_READER_POOL_SIZE,
+        max_overflow=settings.SQLITE_READER_POOL_SIZE
+    )
+    configure_sqlite_engine(async_engine.sync_engine)
+    configure_sqlite_engine(async_reader_engine.sync_engine, read_only=True)
+    instrument_engine(async_engine.sync_engine)
+    instrument_engine(async_reader_engine.sync_engine)
+    
+    # Criar sessão assíncrona com roteamento leitura/escrita;
+    # expire_on_commit=False evita lazy loads após o commit
+    AsyncSessionLocal = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        writer=async_engine.sync_engine,
+        reader=async_reader_engine.sync_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+else:
+    # Criar engine assíncrona (aiosqlite executa o I/O fora do event loop)
+    async_engine = async_reader_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False}  # Necessário para SQLite
+    )
+    instrument_engine(async_engine.sync_engine)
+    
+    # Criar sessão assíncrona; expire_on_commit=False evita lazy loads após o commit
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency para obter sessão assíncrona do banco de dados"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,7 +1,8 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from config import settings
-import os
+from infra.database.sqlite import RoutingSession, configure_sqlite_engine
+from infra.metrics import TimedQueuePool, instrument_engine
 from pathlib import Path
 
 # Criar diretório do banco se não existir
@@ -11,14 +12,49 @@ def ensure_database_directory():
     db_dir = db_path.parent
     db_dir.mkdir(parents=True, exist_ok=True)
 
-# Criar engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Necessário para SQLite
-)
-
-# Criar sessão
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if settings.SQLITE_PRODUCTION_PROFILE:
+    # Writer único: o pool de uma conexão serializa as escritas
+    engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},  # Necessário para SQLite
+        poolclass=TimedQueuePool,
+        pool_logging_name="writer",
+        pool_size=1,
+        max_overflow=0
+    )
+    # Leitores em WAL continuam atendendo enquanto o writer faz commit
+    reader_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=TimedQueuePool,
+        pool_logging_name="reader",
+        pool_size=settings.SQLITE_READER_POOL_SIZE,
+        max_overflow=settings.SQLITE_READER_POOL_SIZE
+    )
+    configure_sqlite_engine(engine)
+    configure_sqlite_engine(reader_engine, read_only=True)
+    instrument_engine(engine)
+    instrument_engine(reader_engine)
+    
+    # Criar sessão com roteamento leitura/escrita
+    SessionLocal = sessionmaker(
+        class_=RoutingSession,
+        writer=engine,
+        reader=reader_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False  # Evita um SELECT extra ao ler o retorno após o commit
+    )
+else:
+    # Criar engine
+    engine = reader_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False}  # Necessário para SQLite
+    )
+    instrument_engine(engine)
+    
+    # Criar sessão
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 def get_db() -> Session:
     """Dependency para obter sessão do banco de dados"""
@@ -28,14 +64,23 @@ def get_db() -> Session:
     finally:
         db.close()
 
-def create_tables():
-    """Criar todas as tabelas"""
+def migrate_database() -> int:
+    """Aplica as migrações pendentes; com o banco em dia é só uma leitura de PRAGMA user_version"""
+    from infra.database.migrations import MIGRATIONS, migrate
     ensure_database_directory()
-    from infra.models.user import Base
-    Base.metadata.create_all(bind=engine)
+    return migrate(engine, MIGRATIONS)
 
 def drop_tables():
-    """Remover todas as tabelas"""
+    """Remover todas as tabelas, índices FTS e triggers, voltando o banco à versão 0"""
     ensure_database_directory()
-    from infra.models.user import Base
-    Base.metadata.drop_all(bind=engine)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        # Tabelas virtuais primeiro: levam junto as tabelas-sombra do FTS5
+        for query in (
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%'",
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'",
+        ):
+            for (name,) in conn.exec_driver_sql(query).all():
+                conn.exec_driver_sql(f'DROP TABLE IF EXISTS "{name}"')
+        conn.exec_driver_sql("PRAGMA user_version = 0")
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
@@ -0,0 +1,26 @@
+# Migrações de esquema versionadas por PRAGMA user_version
+from .runner import (
+    Migration,
+    backfill_in_batches,
+    create_index_online,
+    get_version,
+    index_columns,
+    latest_version,
+    migrate,
+    run_sql_file,
+    split_sql,
+)
+from .versions import MIGRATIONS
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "backfill_in_batches",
+    "create_index_online",
+    "get_version",
+    "index_columns",
+    "latest_version",
+    "migrate",
+    "run_sql_file",
+    "split_sql",
+]
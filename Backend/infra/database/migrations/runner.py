@@ -0,0 +1,164 @@
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger("bookshelf.migrations")
+
+SQL_DIR = Path(__file__).resolve().parent / "sql"
+
+@dataclass(frozen=True)
+class Migration:
+    """Passo de esquema numerado.
+    
+    Migrações comuns recebem uma Connection já dentro de BEGIN IMMEDIATE e são
+    aplicadas atomicamente junto com o novo PRAGMA user_version. Migrações
+    `online` recebem a Engine e fazem o próprio trabalho em lotes curtos (cada
+    um com seu commit), para não segurar o lock de escrita durante backfills
+    longos; precisam ser idempotentes, porque uma interrupção as repete do início.
+    """
+    version: int
+    descricao: str
+    upgrade: Callable
+    online: bool = False
+
+def split_sql(script: str) -> List[str]:
+    """Divide um script em instruções completas (respeita os ';' dentro de triggers)"""
+    statements, buffer = [], ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            if statement.rstrip(";").strip():
+                statements.append(statement)
+            buffer = ""
+    # Sobra sem ';' só é instrução se tiver algo além de comentários
+    if any(line.strip() and not line.strip().startswith("--") for line in buffer.splitlines()):
+        statements.append(buffer.strip())
+    return statements
+
+def run_sql_file(conn: Connection, name: str) -> None:
+    """Executa um arquivo de migrations/sql, instrução por instrução"""
+    for statement in split_sql((SQL_DIR / name).read_text(encoding="utf-8")):
+        conn.exec_driver_sql(statement)
+
+def _autocommit(engine: Engine) -> Connection:
+    return engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+def get_version(conn: Connection) -> int:
+    return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+def latest_version(migrations: Sequence[Migration]) -> int:
+    return migrations[-1].version if migrations else 0
+
+def _apply(conn: Connection, migration: Migration) -> bool:
+    """Aplica uma migração transacional; False se outro processo já a aplicou"""
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+    try:
+        # Confere de novo sob o lock: outro worker pode ter migrado enquanto esperávamos
+        if get_version(conn) >= migration.version:
+            conn.exec_driver_sql("ROLLBACK")
+            return False
+        migration.upgrade(conn)
+        conn.exec_driver_sql(f"PRAGMA user_version = {int(migration.version)}")
+        conn.exec_driver_sql("COMMIT")
+        return True
+    except BaseException:
+        conn.exec_driver_sql("ROLLBACK")
+        raise
+
+def _set_version(conn: Connection, version: int) -> None:
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+    try:
+        if get_version(conn) < version:
+            conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+        conn.exec_driver_sql("COMMIT")
+    except BaseException:
+        conn.exec_driver_sql("ROLLBACK")
+        raise
+
+def migrate(engine: Engine, migrations: Sequence[Migration], target: Optional[int] = None) -> int:
+    """Leva o banco até `target` (padrão: a última migração) e retorna a versão final.
+    
+    Com o banco em dia custa uma única leitura de PRAGMA user_version, sem
+    reflexão nem DDL. O pysqlite só abre transações antes de DML, então a
+    conexão fica em autocommit e cada migração controla BEGIN/COMMIT explicitamente,
+    o que torna o DDL (CREATE/ALTER/DROP) atômico com a troca de versão.
+    """
+    target = latest_version(migrations) if target is None else target
+    with _autocommit(engine) as conn:
+        version = get_version(conn)
+    if version >= target:
+        return version
+    
+    for migration in migrations:
+        if version >= migration.version or migration.version > target:
+            continue
+        logger.info("Aplicando migração %04d: %s", migration.version, migration.descricao)
+        # Uma conexão por passo: o writer de produção tem pool de uma conexão só,
+        # e migrações online pegam as suas próprias para cada lote
+        if migration.online:
+            migration.upgrade(engine)
+            with _autocommit(engine) as conn:
+                _set_version(conn, migration.version)
+        else:
+            with _autocommit(engine) as conn:
+                _apply(conn, migration)
+        version = migration.version
+    
+    with _autocommit(engine) as conn:
+        return get_version(conn)
+
+def backfill_in_batches(engine: Engine, table: str, statement: str, batch_size: int = 5000,
+                        key: str = "rowid") -> int:
+    """Executa `statement` em faixas de `key` de `batch_size` linhas, um commit por faixa.
+    
+    `statement` recebe os parâmetros :inicio e :fim (intervalo fechado de `key`).
+    Entre os lotes o lock de escrita é liberado, então leituras (WAL) e escritas
+    da aplicação continuam durante o backfill. Retorna o número de lotes.
+    """
+    with engine.connect() as conn:
+        bounds = conn.execute(text(f"SELECT min({key}), max({key}) FROM {table}")).first()
+    if bounds is None or bounds[0] is None:
+        return 0
+    start, end = bounds
+    batches = 0
+    while start <= end:
+        with engine.begin() as conn:
+            conn.execute(text(statement), {"inicio": start, "fim": start + batch_size - 1})
+        start += batch_size
+        batches += 1
+    return batches
+
+def index_columns(conn: Connection, name: str) -> List[str]:
+    """Colunas de um índice existente (lista vazia se ele não existe)"""
+    return [row[2] for row in conn.exec_driver_sql(f'PRAGMA index_info("{name}")')]
+
+def create_index_online(engine: Engine, name: str, table: str, columns: Sequence[str],
+                        unique: bool = False, where: Optional[str] = None) -> bool:
+    """Cria (ou recria, se as colunas mudaram) um índice fora da transação da migração.
+    
+    O SQLite não constrói índices de forma incremental: o CREATE INDEX segura o
+    lock de escrita enquanto ordena a tabela. Em WAL os leitores continuam; rodando
+    em transação própria, depois dos backfills, as escritas esperam só pela ordenação.
+    """
+    with _autocommit(engine) as conn:
+        current = index_columns(conn, name)
+        if current == list(columns):
+            return False
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            if current:
+                conn.exec_driver_sql(f'DROP INDEX "{name}"')
+            conn.exec_driver_sql(
+                f'CREATE {"UNIQUE " if unique else ""}INDEX "{name}" ON "{table}" ({", ".join(columns)})'
+                + (f" WHERE {where}" if where else "")
+            )
+            conn.exec_driver_sql("COMMIT")
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+    return True
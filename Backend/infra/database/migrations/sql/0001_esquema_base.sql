@@ -0,0 +1,232 @@
+-- Esquema base (migração 1). Aplicado por infra/database/migrations; não execute à mão:
+-- mudanças de esquema entram como novas migrações, nunca editando este arquivo.
+
+-- Usuários
+CREATE TABLE IF NOT EXISTS usuario (
+  id              INTEGER PRIMARY KEY,
+  nome            TEXT NOT NULL,
+  email           TEXT NOT NULL UNIQUE,
+  filme_favorito  TEXT,
+  criado_em       TEXT NOT NULL DEFAULT (datetime('now')),
+  versao          INTEGER NOT NULL DEFAULT 1,        -- versão da linha (ETag)
+  atualizado_em   TEXT DEFAULT (datetime('now'))
+) STRICT;
+
+-- Versão por tabela (ETag de listagens), mantida por triggers
+CREATE TABLE IF NOT EXISTS versao_tabela (
+  tabela          TEXT PRIMARY KEY,
+  versao          INTEGER NOT NULL DEFAULT 0
+) STRICT;
+
+INSERT INTO versao_tabela (tabela, versao) VALUES ('usuario', 0)
+ON CONFLICT(tabela) DO NOTHING;
+
+CREATE TRIGGER IF NOT EXISTS trg_usuario_versao_insert AFTER INSERT ON usuario
+BEGIN
+  UPDATE versao_tabela SET versao = versao + 1 WHERE tabela = 'usuario';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_usuario_versao_update AFTER UPDATE ON usuario
+BEGIN
+  UPDATE versao_tabela SET versao = versao + 1 WHERE tabela = 'usuario';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_usuario_versao_delete AFTER DELETE ON usuario
+BEGIN
+  UPDATE versao_tabela SET versao = versao + 1 WHERE tabela = 'usuario';
+END;
+
+-- Busca textual de usuários (FTS5, conteúdo externo sincronizado por triggers)
+CREATE VIRTUAL TABLE IF NOT EXISTS usuario_fts USING fts5(
+  nome, email,
+  content='usuario', content_rowid='id',
+  tokenize='unicode61 remove_diacritics 2',
+  prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_usuario_fts_insert AFTER INSERT ON usuario
+BEGIN
+  INSERT INTO usuario_fts (rowid, nome, email) VALUES (new.id, new.nome, new.email);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_usuario_fts_delete AFTER DELETE ON usuario
+BEGIN
+  INSERT INTO usuario_fts (usuario_fts, rowid, nome, email) VALUES ('delete', old.id, old.nome, old.email);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_usuario_fts_update AFTER UPDATE OF nome, email ON usuario
+BEGIN
+  INSERT INTO usuario_fts (usuario_fts, rowid, nome, email) VALUES ('delete', old.id, old.nome, old.email);
+  INSERT INTO usuario_fts (rowid, nome, email) VALUES (new.id, new.nome, new.email);
+END;
+
+-- Livros
+CREATE TABLE IF NOT EXISTS livro (
+  id                  INTEGER PRIMARY KEY,
+  volume_id           TEXT NOT NULL UNIQUE,          -- id do volume na Google Books API
+  nome                TEXT NOT NULL,
+  autores             TEXT,
+  descricao           TEXT,
+  data_publicacao     TEXT,                          -- YYYY-MM-DD
+  classificacao_indicativa TEXT NOT NULL
+    CHECK (classificacao_indicativa IN ('L','10','12','14','16','18')),
+  url_imagem          TEXT,
+  public_domain       INTEGER NOT NULL DEFAULT 0     -- 0 = não, 1 = sim
+    CHECK (public_domain IN (0,1)),
+  hash_conteudo       TEXT,                          -- recargas só reescrevem linhas alteradas
+  criado_em           TEXT NOT NULL DEFAULT (datetime('now'))
+) STRICT;
+
+-- Busca textual do catálogo (FTS5, conteúdo externo sincronizado por triggers)
+CREATE VIRTUAL TABLE IF NOT EXISTS livro_fts USING fts5(
+  nome, autores, descricao,
+  content='livro', content_rowid='id',
+  tokenize='unicode61 remove_diacritics 2',
+  prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_livro_fts_insert AFTER INSERT ON livro
+BEGIN
+  INSERT INTO livro_fts (rowid, nome, autores, descricao) VALUES (new.id, new.nome, new.autores, new.descricao);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_livro_fts_delete AFTER DELETE ON livro
+BEGIN
+  INSERT INTO livro_fts (livro_fts, rowid, nome, autores, descricao) VALUES ('delete', old.id, old.nome, old.autores, old.descricao);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_livro_fts_update AFTER UPDATE OF nome, autores, descricao ON livro
+BEGIN
+  INSERT INTO livro_fts (livro_fts, rowid, nome, autores, descricao) VALUES ('delete', old.id, old.nome, old.autores, old.descricao);
+  INSERT INTO livro_fts (rowid, nome, autores, descricao) VALUES (new.id, new.nome, new.autores, new.descricao);
+END;
+
+-- Gêneros
+CREATE TABLE IF NOT EXISTS genero (
+  id              INTEGER PRIMARY KEY,
+  genero          TEXT NOT NULL UNIQUE
+) STRICT;
+
+-- N:N Livro-Gênero
+CREATE TABLE IF NOT EXISTS livro_genero (
+  id              INTEGER PRIMARY KEY,
+  livro_id        INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE,
+  genero_id       INTEGER NOT NULL REFERENCES genero(id) ON DELETE RESTRICT,
+  UNIQUE (livro_id, genero_id)
+) STRICT;
+
+-- Preferências de gêneros do usuário
+CREATE TABLE IF NOT EXISTS user_preferencias (
+  id              INTEGER PRIMARY KEY,
+  usuario_id      INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE,
+  genero_id       INTEGER NOT NULL REFERENCES genero(id) ON DELETE RESTRICT,
+  UNIQUE (usuario_id, genero_id)
+) STRICT;
+
+-- Notas
+CREATE TABLE IF NOT EXISTS notas (
+  id              INTEGER PRIMARY KEY,
+  usuario_id      INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE,
+  livro_id        INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE,
+  nota            REAL NOT NULL CHECK (nota >= 0 AND nota <= 5),
+  descricao       TEXT,
+  criado_em       TEXT NOT NULL DEFAULT (datetime('now')),
+  UNIQUE (usuario_id, livro_id)
+) STRICT;
+
+-- Candidatos de recomendação pré-calculados (IA/recomendacao/colaborativo.py)
+CREATE TABLE IF NOT EXISTS recomendacao_usuario (
+  usuario_id      INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE,
+  posicao         INTEGER NOT NULL,
+  livro_id        INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE,
+  score           REAL NOT NULL,
+  PRIMARY KEY (usuario_id, posicao)
+) WITHOUT ROWID;
+
+-- Registro (um livro adicionado pelo usuário)
+CREATE TABLE IF NOT EXISTS registro (
+  id              INTEGER PRIMARY KEY,
+  usuario_id      INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE,
+  livro_id        INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE,
+  total_paginas   INTEGER NOT NULL CHECK (total_paginas > 0),
+  criado_em       TEXT NOT NULL DEFAULT (datetime('now')),
+  UNIQUE (usuario_id, livro_id)
+) STRICT;
+
+-- Registros (logs de progresso)
+CREATE TABLE IF NOT EXISTS registros (
+  id              INTEGER PRIMARY KEY,
+  registro_id     INTEGER NOT NULL REFERENCES registro(id) ON DELETE CASCADE,
+  pagina_atual    INTEGER NOT NULL CHECK (pagina_atual >= 0),
+  data_registro   TEXT NOT NULL DEFAULT (datetime('now'))
+) STRICT;
+
+-- Progresso atual por registro (pré-calculado pelo trigger abaixo)
+CREATE TABLE IF NOT EXISTS registro_progresso (
+  registro_id     INTEGER PRIMARY KEY REFERENCES registro(id) ON DELETE CASCADE,
+  pagina_atual    INTEGER NOT NULL,
+  percentual      REAL NOT NULL,
+  atualizado_em   TEXT NOT NULL
+) STRICT;
+
+CREATE TRIGGER IF NOT EXISTS trg_registros_progresso AFTER INSERT ON registros
+BEGIN
+  INSERT INTO registro_progresso (registro_id, pagina_atual, percentual, atualizado_em)
+  SELECT new.registro_id, new.pagina_atual,
+         round(min(new.pagina_atual * 100.0 / r.total_paginas, 100.0), 2), new.data_registro
+  FROM registro r WHERE r.id = new.registro_id
+  ON CONFLICT(registro_id) DO UPDATE SET
+    pagina_atual = excluded.pagina_atual,
+    percentual = excluded.percentual,
+    atualizado_em = excluded.atualizado_em
+  WHERE excluded.atualizado_em >= registro_progresso.atualizado_em;
+END;
+
+-- Tags
+CREATE TABLE IF NOT EXISTS tags (
+  id              INTEGER PRIMARY KEY,
+  tag             TEXT NOT NULL UNIQUE
+    CHECK (length(trim(tag)) > 0)
+) STRICT;
+
+-- Associação de tags a (usuario, livro)
+CREATE TABLE IF NOT EXISTS tag_usuario_livro (
+  id              INTEGER PRIMARY KEY,
+  usuario_id      INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE,
+  livro_id        INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE,
+  tag_id          INTEGER NOT NULL REFERENCES tags(id) ON DELETE RESTRICT,
+  criado_em       TEXT NOT NULL DEFAULT (datetime('now')),
+  UNIQUE (usuario_id, livro_id, tag_id)
+) STRICT;
+
+-- Índices úteis
+CREATE INDEX IF NOT EXISTS idx_usuario_criado_em_id ON usuario(criado_em, id);
+CREATE INDEX IF NOT EXISTS idx_livro_nome ON livro(nome);
+CREATE INDEX IF NOT EXISTS idx_livro_classificacao ON livro(classificacao_indicativa);
+CREATE INDEX IF NOT EXISTS idx_livro_genero_genero ON livro_genero(genero_id, livro_id);
+CREATE INDEX IF NOT EXISTS idx_pref_usuario ON user_preferencias(usuario_id);
+CREATE INDEX IF NOT EXISTS idx_notas_livro ON notas(livro_id);
+CREATE INDEX IF NOT EXISTS idx_registro_usuario ON registro(usuario_id);
+CREATE INDEX IF NOT EXISTS idx_registros_registro ON registros(registro_id);
+CREATE INDEX IF NOT EXISTS idx_tul_usuario_livro ON tag_usuario_livro(usuario_id, livro_id);
+
+-- Seeds: tags padrão
+INSERT INTO tags (tag) VALUES 
+  ('Lendo'),
+  ('Abandonado'),
+  ('Quero ler')
+ON CONFLICT(tag) DO NOTHING;
+
+-- Seeds: gêneros básicos
+INSERT INTO genero (genero) VALUES
+  ('Ficção'),
+  ('Fantasia'),
+  ('Romance'),
+  ('Terror'),
+  ('Suspense'),
+  ('Aventura'),
+  ('História'),
+  ('Ciência'),
+  ('Biografia'),
+  ('Autoajuda')
+ON CONFLICT(genero) DO NOTHING;
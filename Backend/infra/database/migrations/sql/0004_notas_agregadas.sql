@@ -0,0 +1,89 @@
+-- Agregado de notas por livro (migração 4). Mantido pelos triggers de notas, na mesma
+-- transação da escrita: a média (soma / quantidade) e o histograma saem da chave primária.
+
+CREATE TABLE IF NOT EXISTS livro_notas (
+  livro_id        INTEGER PRIMARY KEY REFERENCES livro(id) ON DELETE CASCADE,
+  soma            REAL NOT NULL DEFAULT 0,
+  quantidade      INTEGER NOT NULL DEFAULT 0,
+  -- Histograma: quantidade de notas por round(nota), de 0 a 5 estrelas
+  estrelas_0      INTEGER NOT NULL DEFAULT 0,
+  estrelas_1      INTEGER NOT NULL DEFAULT 0,
+  estrelas_2      INTEGER NOT NULL DEFAULT 0,
+  estrelas_3      INTEGER NOT NULL DEFAULT 0,
+  estrelas_4      INTEGER NOT NULL DEFAULT 0,
+  estrelas_5      INTEGER NOT NULL DEFAULT 0
+) STRICT;
+
+-- Versão das notas: chave dos rankings em cache (cada worker percebe escritas dos outros)
+INSERT INTO versao_tabela (tabela, versao) VALUES ('notas', 0)
+ON CONFLICT(tabela) DO NOTHING;
+
+CREATE TRIGGER IF NOT EXISTS trg_notas_agregado_insert AFTER INSERT ON notas
+BEGIN
+  INSERT INTO livro_notas (livro_id, soma, quantidade, estrelas_0, estrelas_1, estrelas_2, estrelas_3, estrelas_4, estrelas_5)
+  VALUES (new.livro_id, new.nota, 1,
+          CAST(round(new.nota) AS INTEGER) = 0,
+          CAST(round(new.nota) AS INTEGER) = 1,
+          CAST(round(new.nota) AS INTEGER) = 2,
+          CAST(round(new.nota) AS INTEGER) = 3,
+          CAST(round(new.nota) AS INTEGER) = 4,
+          CAST(round(new.nota) AS INTEGER) = 5)
+  ON CONFLICT(livro_id) DO UPDATE SET
+    soma = soma + excluded.soma,
+    quantidade = quantidade + 1,
+    estrelas_0 = estrelas_0 + excluded.estrelas_0,
+    estrelas_1 = estrelas_1 + excluded.estrelas_1,
+    estrelas_2 = estrelas_2 + excluded.estrelas_2,
+    estrelas_3 = estrelas_3 + excluded.estrelas_3,
+    estrelas_4 = estrelas_4 + excluded.estrelas_4,
+    estrelas_5 = estrelas_5 + excluded.estrelas_5;
+  UPDATE versao_tabela SET versao = versao + 1 WHERE tabela = 'notas';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_notas_agregado_delete AFTER DELETE ON notas
+BEGIN
+  UPDATE livro_notas SET
+    soma = soma - old.nota,
+    quantidade = quantidade - 1,
+    estrelas_0 = estrelas_0 - (CAST(round(old.nota) AS INTEGER) = 0),
+    estrelas_1 = estrelas_1 - (CAST(round(old.nota) AS INTEGER) = 1),
+    estrelas_2 = estrelas_2 - (CAST(round(old.nota) AS INTEGER) = 2),
+    estrelas_3 = estrelas_3 - (CAST(round(old.nota) AS INTEGER) = 3),
+    estrelas_4 = estrelas_4 - (CAST(round(old.nota) AS INTEGER) = 4),
+    estrelas_5 = estrelas_5 - (CAST(round(old.nota) AS INTEGER) = 5)
+  WHERE livro_id = old.livro_id;
+  UPDATE versao_tabela SET versao = versao + 1 WHERE tabela = 'notas';
+END;
+
+-- Também dispara no upsert (INSERT ... ON CONFLICT DO UPDATE) de uma nota existente
+CREATE TRIGGER IF NOT EXISTS trg_notas_agregado_update AFTER UPDATE OF nota, livro_id ON notas
+BEGIN
+  UPDATE livro_notas SET
+    soma = soma - old.nota,
+    quantidade = quantidade - 1,
+    estrelas_0 = estrelas_0 - (CAST(round(old.nota) AS INTEGER) = 0),
+    estrelas_1 = estrelas_1 - (CAST(round(old.nota) AS INTEGER) = 1),
+    estrelas_2 = estrelas_2 - (CAST(round(old.nota) AS INTEGER) = 2),
+    estrelas_3 = estrelas_3 - (CAST(round(old.nota) AS INTEGER) = 3),
+    estrelas_4 = estrelas_4 - (CAST(round(old.nota) AS INTEGER) = 4),
+    estrelas_5 = estrelas_5 - (CAST(round(old.nota) AS INTEGER) = 5)
+  WHERE livro_id = old.livro_id;
+  INSERT INTO livro_notas (livro_id, soma, quantidade, estrelas_0, estrelas_1, estrelas_2, estrelas_3, estrelas_4, estrelas_5)
+  VALUES (new.livro_id, new.nota, 1,
+          CAST(round(new.nota) AS INTEGER) = 0,
+          CAST(round(new.nota) AS INTEGER) = 1,
+          CAST(round(new.nota) AS INTEGER) = 2,
+          CAST(round(new.nota) AS INTEGER) = 3,
+          CAST(round(new.nota) AS INTEGER) = 4,
+          CAST(round(new.nota) AS INTEGER) = 5)
+  ON CONFLICT(livro_id) DO UPDATE SET
+    soma = soma + excluded.soma,
+    quantidade = quantidade + 1,
+    estrelas_0 = estrelas_0 + excluded.estrelas_0,
+    estrelas_1 = estrelas_1 + excluded.estrelas_1,
+    estrelas_2 = estrelas_2 + excluded.estrelas_2,
+    estrelas_3 = estrelas_3 + excluded.estrelas_3,
+    estrelas_4 = estrelas_4 + excluded.estrelas_4,
+    estrelas_5 = estrelas_5 + excluded.estrelas_5;
+  UPDATE versao_tabela SET versao = versao + 1 WHERE tabela = 'notas';
+END;
@@ -0,0 +1,53 @@
+-- Versão das notas por gênero (migração 6): chave dos rankings filtrados por gênero em cache.
+-- Uma nota só torna obsoletos os rankings dos gêneros do livro (via livro_genero); o
+-- ranking geral continua na versão global versao_tabela('notas').
+
+CREATE TABLE IF NOT EXISTS versao_ranking_genero (
+  genero_id       INTEGER PRIMARY KEY REFERENCES genero(id) ON DELETE CASCADE,
+  versao          INTEGER NOT NULL DEFAULT 0
+) STRICT;
+
+INSERT INTO versao_ranking_genero (genero_id) SELECT id FROM genero WHERE true
+ON CONFLICT(genero_id) DO NOTHING;
+
+CREATE TRIGGER IF NOT EXISTS trg_notas_versao_genero_insert AFTER INSERT ON notas
+BEGIN
+  INSERT INTO versao_ranking_genero (genero_id, versao)
+  SELECT genero_id, 1 FROM livro_genero WHERE livro_id = new.livro_id
+  ON CONFLICT(genero_id) DO UPDATE SET versao = versao + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_notas_versao_genero_delete AFTER DELETE ON notas
+BEGIN
+  INSERT INTO versao_ranking_genero (genero_id, versao)
+  SELECT genero_id, 1 FROM livro_genero WHERE livro_id = old.livro_id
+  ON CONFLICT(genero_id) DO UPDATE SET versao = versao + 1;
+END;
+
+-- Upsert de nota existente; livro_id pode mudar, então os dois livros contam
+CREATE TRIGGER IF NOT EXISTS trg_notas_versao_genero_update AFTER UPDATE OF nota, livro_id ON notas
+BEGIN
+  INSERT INTO versao_ranking_genero (genero_id, versao)
+  SELECT DISTINCT genero_id, 1 FROM livro_genero WHERE livro_id IN (old.livro_id, new.livro_id)
+  ON CONFLICT(genero_id) DO UPDATE SET versao = versao + 1;
+END;
+
+-- Livro que entra ou sai de um gênero muda o ranking daquele gênero
+CREATE TRIGGER IF NOT EXISTS trg_livro_genero_versao_insert AFTER INSERT ON livro_genero
+BEGIN
+  INSERT INTO versao_ranking_genero (genero_id, versao) VALUES (new.genero_id, 1)
+  ON CONFLICT(genero_id) DO UPDATE SET versao = versao + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_livro_genero_versao_delete AFTER DELETE ON livro_genero
+BEGIN
+  INSERT INTO versao_ranking_genero (genero_id, versao) VALUES (old.genero_id, 1)
+  ON CONFLICT(genero_id) DO UPDATE SET versao = versao + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_livro_genero_versao_update AFTER UPDATE OF livro_id, genero_id ON livro_genero
+BEGIN
+  INSERT INTO versao_ranking_genero (genero_id, versao)
+  SELECT DISTINCT id, 1 FROM genero WHERE id IN (old.genero_id, new.genero_id)
+  ON CONFLICT(genero_id) DO UPDATE SET versao = versao + 1;
+END;
@@ -0,0 +1,101 @@
+from sqlalchemy.engine import Connection, Engine
+from infra.database.migrations.runner import (
+    Migration,
+    backfill_in_batches,
+    create_index_online,
+    index_columns,
+    run_sql_file,
+)
+
+def esquema_base(conn: Connection) -> None:
+    """Esquema base; também adota bancos criados antes das migrações (user_version 0)"""
+    existing = {name for (name,) in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    
+    if "usuario" in existing:
+        # Bancos do create_all original não tinham as colunas de versão (ETag)
+        columns = {row[1] for row in conn.exec_driver_sql('PRAGMA table_info("usuario")')}
+        if "versao" not in columns:
+            conn.exec_driver_sql("ALTER TABLE usuario ADD COLUMN versao INTEGER NOT NULL DEFAULT 1")
+        if "atualizado_em" not in columns:
+            conn.exec_driver_sql("ALTER TABLE usuario ADD COLUMN atualizado_em DATETIME")
+        # Redundante com a chave primária
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_usuario_id")
+    if index_columns(conn, "idx_livro_genero_genero") not in ([], ["genero_id", "livro_id"]):
+        conn.exec_driver_sql("DROP INDEX idx_livro_genero_genero")
+    
+    run_sql_file(conn, "0001_esquema_base.sql")
+    
+    # Índices FTS criados agora sobre tabelas que já tinham linhas
+    for fts, source in (("usuario_fts", "usuario"), ("livro_fts", "livro")):
+        if fts not in existing and source in existing:
+            conn.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+# Upsert idempotente do último log de cada registro; só avança no tempo, como o trigger
+PROGRESSO_BACKFILL = """
+INSERT INTO registro_progresso (registro_id, pagina_atual, percentual, atualizado_em)
+SELECT l.registro_id, l.pagina_atual,
+       round(min(l.pagina_atual * 100.0 / r.total_paginas, 100.0), 2), l.data_registro
+FROM registros l
+JOIN registro r ON r.id = l.registro_id
+WHERE r.id BETWEEN :inicio AND :fim
+  AND l.id = (
+      SELECT id FROM registros ultimo WHERE ultimo.registro_id = l.registro_id
+      ORDER BY data_registro DESC, id DESC LIMIT 1
+  )
+ON CONFLICT(registro_id) DO UPDATE SET
+    pagina_atual = excluded.pagina_atual,
+    percentual = excluded.percentual,
+    atualizado_em = excluded.atualizado_em
+WHERE excluded.atualizado_em >= registro_progresso.atualizado_em
+"""
+
+def progresso_atual(engine: Engine) -> None:
+    """Preenche registro_progresso a partir do log existente, em lotes de registros"""
+    backfill_in_batches(engine, "registro", PROGRESSO_BACKFILL, key="id")
+
+def indice_estante_por_tag(engine: Engine) -> None:
+    """Estante filtrada por tag (GET /api/users/{id}/shelf?tag=): intervalo já em ordem de livro_id"""
+    create_index_online(engine, "idx_tul_usuario_tag_livro", "tag_usuario_livro", ("usuario_id", "tag_id", "livro_id"))
+
+def notas_agregadas(conn: Connection) -> None:
+    """Tabela livro_notas e os triggers que a mantêm a cada escrita em notas"""
+    run_sql_file(conn, "0004_notas_agregadas.sql")
+
+# Recontagem idempotente por faixa de livros; sobrescreve o que os triggers já somaram
+NOTAS_BACKFILL = """
+INSERT INTO livro_notas (livro_id, soma, quantidade, estrelas_0, estrelas_1, estrelas_2, estrelas_3, estrelas_4, estrelas_5)
+SELECT livro_id, sum(nota), count(*),
+       sum(CAST(round(nota) AS INTEGER) = 0), sum(CAST(round(nota) AS INTEGER) = 1),
+       sum(CAST(round(nota) AS INTEGER) = 2), sum(CAST(round(nota) AS INTEGER) = 3),
+       sum(CAST(round(nota) AS INTEGER) = 4), sum(CAST(round(nota) AS INTEGER) = 5)
+FROM notas
+WHERE livro_id BETWEEN :inicio AND :fim
+GROUP BY livro_id
+ON CONFLICT(livro_id) DO UPDATE SET
+    soma = excluded.soma,
+    quantidade = excluded.quantidade,
+    estrelas_0 = excluded.estrelas_0,
+    estrelas_1 = excluded.estrelas_1,
+    estrelas_2 = excluded.estrelas_2,
+    estrelas_3 = excluded.estrelas_3,
+    estrelas_4 = excluded.estrelas_4,
+    estrelas_5 = excluded.estrelas_5
+"""
+
+def notas_agregadas_backfill(engine: Engine) -> None:
+    """Preenche livro_notas a partir das notas existentes, em lotes de livros (idx_notas_livro)"""
+    backfill_in_batches(engine, "livro", NOTAS_BACKFILL, key="id")
+
+def versao_ranking_genero(conn: Connection) -> None:
+    """Versão das notas por gênero, mantida por triggers em notas e livro_genero"""
+    run_sql_file(conn, "0006_versao_ranking_genero.sql")
+
+# Em ordem; nunca renumere nem edite uma migração publicada, acrescente outra
+MIGRATIONS = [
+    Migration(1, "esquema base (tabelas STRICT, FTS5, triggers, seeds)", esquema_base),
+    Migration(2, "backfill de registro_progresso", progresso_atual, online=True),
+    Migration(3, "índice de cobertura da estante por tag", indice_estante_por_tag, online=True),
+    Migration(4, "agregado de notas por livro mantido por triggers", notas_agregadas),
+    Migration(5, "backfill de livro_notas", notas_agregadas_backfill, online=True),
+    Migration(6, "versão das notas por gênero (rankings em cache)", versao_ranking_genero),
+]
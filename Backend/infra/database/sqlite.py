@@ -0,0 +1,65 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from config import settings
+
+def production_pragmas() -> list:
+    """PRAGMAs do perfil de produção aplicados a cada nova conexão"""
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        # Valor negativo = tamanho em KiB, independente do page_size
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        "PRAGMA foreign_keys=ON",
+    ]
+
+def configure_sqlite_engine(engine: Engine, read_only: bool = False) -> None:
+    """Registra os PRAGMAs de produção no evento de conexão da engine"""
+    pragmas = production_pragmas()
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+def is_write(clause) -> bool:
+    """Indica se a instrução precisa da conexão de escrita"""
+    if isinstance(clause, UpdateBase):
+        return True
+    if isinstance(clause, TextClause):
+        return clause.text.lstrip().split(None, 1)[0].upper() not in ("SELECT", "WITH", "PRAGMA")
+    return False
+
+class RoutingSession(Session):
+    """Sessão que envia leituras ao pool de leitores e escritas ao writer único.
+    
+    Após a primeira escrita, o restante da transação continua no writer para
+    que a sessão enxergue as próprias alterações ainda não confirmadas.
+    """
+    
+    def __init__(self, writer: Engine, reader: Engine, **kw):
+        super().__init__(**kw)
+        self.writer = writer
+        self.reader = reader
+        self.writing = False
+    
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or is_write(clause):
+            self.writing = True
+        return self.writer if self.writing else self.reader
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def reset_routing(session, transaction):
+    """Volta a ler do pool de leitores ao fim da transação principal"""
+    if transaction.parent is None:
+        session.writing = False
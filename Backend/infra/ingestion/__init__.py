@@ -0,0 +1,20 @@
+# Ingestão write-behind
+from config import settings
+from infra.database.database import SessionLocal
+from infra.repositories.progress_repository import ProgressRepository
+from .progress_buffer import ProgressBuffer, utc_timestamp
+
+def write_progress_batch(entries) -> None:
+    """Grava um lote de progresso em uma única transação (um fsync por lote)"""
+    with SessionLocal() as db:
+        ProgressRepository(db).insert_logs(entries)
+        db.commit()
+
+# Instância do processo, iniciada e drenada pelo lifespan da aplicação
+progress_buffer = ProgressBuffer(
+    write_progress_batch,
+    max_pending=settings.PROGRESS_FLUSH_MAX_PENDING,
+    interval=settings.PROGRESS_FLUSH_INTERVAL_SECONDS
+)
+
+__all__ = ["ProgressBuffer", "progress_buffer", "utc_timestamp", "write_progress_batch"]
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (registro_id, pagina_atual, data_registro no formato de CURRENT_TIMESTAMP + microssegundos)
+ProgressEntry = Tuple[int, int, str]
+
+def utc_timestamp() -> str:
+    """Agora em UTC, no formato de CURRENT_TIMESTAMP do SQLite com microssegundos.
+    
+    O trigger de registro_progresso só avança quando data_registro >= a atual:
+    com resolução de 1 s, duas páginas no mesmo segundo ficariam sem ordem. O
+    texto continua comparável com valores antigos sem fração ('...:05' < '...:05.1').
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+class ProgressBuffer:
+    """Buffer write-behind de progresso de leitura.
+    
+    Atualizações são coalescidas por registro_id (vale a última) e gravadas em
+    lote por `writer` quando o buffer atinge `max_pending` registros ou a cada
+    `interval` segundos; `stop()` grava o que restar no desligamento.
+    Sem o flusher rodando (scripts, testes), o limite de tamanho grava na hora.
+    
+    O buffer é do processo: leituras no mesmo processo enxergam os pendentes
+    (`pending`), mas outro worker só vê a escrita depois do flush. Por isso é
+    para um único worker; serve.py o desliga com mais de um, salvo configuração
+    explícita de PROGRESS_BUFFER_ENABLED.
+    """
+    
+    def __init__(self, writer: Callable[[List[ProgressEntry]], None], max_pending: int, interval: float):
+        self.writer = writer
+        self.max_pending = max_pending
+        self.interval = interval
+        self._pending: Dict[int, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"recebidos": 0, "coalescidos": 0, "gravados": 0, "flushes": 0, "falhas": 0}
+    
+    def add(self, registro_id: int, pagina_atual: int, data_registro: Optional[str] = None) -> None:
+        """Enfileira o progresso de um registro, substituindo o pendente anterior"""
+        with self._lock:
+            if registro_id in self._pending:
+                self._stats["coalescidos"] += 1
+            self._pending[registro_id] = (pagina_atual, data_registro or utc_timestamp())
+            self._stats["recebidos"] += 1
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._request_flush()
+    
+    def pending(self, registro_id: int) -> Optional[Tuple[int, str]]:
+        """Progresso ainda não gravado de um registro (pagina_atual, data_registro)"""
+        with self._lock:
+            return self._pending.get(registro_id)
+    
+    def flush(self) -> int:
+        """Grava os pendentes em um lote; em falha eles voltam ao buffer"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            try:
+                self.writer([(registro_id, pagina, data) for registro_id, (pagina, data) in batch.items()])
+            except Exception:
+                with self._lock:
+                    # O que chegou durante o flush é mais novo e prevalece
+                    for registro_id, value in batch.items():
+                        self._pending.setdefault(registro_id, value)
+                    self._stats["falhas"] += 1
+                raise
+            with self._lock:
+                self._stats["gravados"] += len(batch)
+                self._stats["flushes"] += 1
+            return len(batch)
+    
+    def _request_flush(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._loop.call_soon_threadsafe(self._wake.set)
+        else:
+            self.flush()
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Falha ao gravar progresso de leitura; nova tentativa no próximo ciclo")
+    
+    async def start(self) -> None:
+        """Inicia o flusher periódico no event loop atual (lifespan)"""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Para o flusher e grava o que restar (desligamento gracioso)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "pendentes": len(self._pending)}
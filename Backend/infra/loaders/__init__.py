@@ -0,0 +1 @@
+# Data loaders (executados como módulos: python -m infra.loaders.<loader>)
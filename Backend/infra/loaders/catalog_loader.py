@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Carga idempotente do catálogo (IA/dataset/livros.csv) nas tabelas livro,
+genero e livro_genero.
+
+O CSV é lido em blocos; cada bloco é gravado em uma transação com upserts
+via executemany, e só as linhas cujo hash de conteúdo mudou são reescritas.
+Em cargas iniciais os índices secundários são removidos e recriados no fim.
+
+Uso (a partir de Backend/):
+    python -m infra.loaders.catalog_loader ../IA/dataset/livros.csv
+"""
+
+import argparse
+import ast
+import csv
+import hashlib
+import itertools
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from infra.database import migrate_database
+from infra.database.database import engine
+from infra.models.book import BookGenreModel, BookModel, GenreModel
+
+CHUNK_SIZE = 5000
+
+# Regras aplicadas em ordem sobre cada categoria (minúscula); o trecho
+# encontrado é consumido, então "science fiction" não vira também Ciência
+GENRE_RULES = [
+    ("nonfiction", None),
+    ("non-fiction", None),
+    ("science fiction", "Ficção"),
+    ("fantas", "Fantasia"),
+    ("romance", "Romance"),
+    ("love stor", "Romance"),
+    ("chick lit", "Romance"),
+    ("horror", "Terror"),
+    ("demonolog", "Terror"),
+    ("ghost", "Terror"),
+    ("thriller", "Suspense"),
+    ("suspense", "Suspense"),
+    ("mystery", "Suspense"),
+    ("detective", "Suspense"),
+    ("advent", "Aventura"),
+    ("action", "Aventura"),
+    ("histor", "História"),
+    ("scien", "Ciência"),
+    ("physics", "Ciência"),
+    ("biograph", "Biografia"),
+    ("self-help", "Autoajuda"),
+    ("fiction", "Ficção"),
+]
+
+MATURITY_RATINGS = {"NOT_MATURE": "L", "MATURE": "18"}
+
+BOOK_FIELDS = [
+    "volume_id",
+    "nome",
+    "autores",
+    "descricao",
+    "data_publicacao",
+    "classificacao_indicativa",
+    "url_imagem",
+    "public_domain",
+]
+
+def parse_categories(raw: str) -> List[str]:
+    """Converte a coluna categories (lista Python em texto) em lista"""
+    raw = (raw or "").strip()
+    if not raw:
+        return []
+    if raw.startswith("["):
+        try:
+            return [str(category) for category in ast.literal_eval(raw)]
+        except (ValueError, SyntaxError):
+            return []
+    return [raw]
+
+def map_genres(categories: Iterable[str]) -> List[str]:
+    """Normaliza categorias da Google Books API para os gêneros semeados"""
+    genres = set()
+    for category in categories:
+        text = category.lower()
+        for keyword, genre in GENRE_RULES:
+            if keyword in text:
+                if genre:
+                    genres.add(genre)
+                text = text.replace(keyword, " ")
+    return sorted(genres)
+
+@lru_cache(maxsize=8192)
+def genres_for(raw_categories: str) -> tuple:
+    """Gêneros de um valor bruto de categories (valores se repetem muito no catálogo)"""
+    return tuple(map_genres(parse_categories(raw_categories)))
+
+def normalize_row(row: dict) -> Optional[dict]:
+    """Converte uma linha do CSV no registro de livro; None se não for carregável"""
+    volume_id = (row.get("id") or "").strip()
+    nome = (row.get("title") or "").strip()
+    if not volume_id or not nome:
+        return None
+    
+    record = {
+        "volume_id": volume_id,
+        "nome": nome,
+        "autores": row.get("authors") or None,
+        "descricao": row.get("description") or None,
+        "data_publicacao": (row.get("published_date") or "")[:10] or None,
+        "classificacao_indicativa": MATURITY_RATINGS.get(row.get("maturity_rating"), "L"),
+        "url_imagem": row.get("image_links") or None,
+        "public_domain": 1 if str(row.get("public_domain")).lower() == "true" else 0,
+        "generos": genres_for(row.get("categories") or ""),
+    }
+    content = "\x1f".join(map(str, [record[field] for field in BOOK_FIELDS] + list(record["generos"])))
+    record["hash_conteudo"] = hashlib.md5(content.encode()).hexdigest()
+    return record
+
+def read_chunks(path: str, chunk_size: int) -> Iterator[List[dict]]:
+    """Lê o CSV em blocos de linhas, sem carregar o arquivo inteiro"""
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+def secondary_indexes() -> list:
+    """Índices não únicos que podem ser adiados durante a carga"""
+    return [
+        index
+        for table in (BookModel.__table__, BookGenreModel.__table__)
+        for index in table.indexes
+        if not index.unique
+    ]
+
+def load_chunk(conn: Connection, records: List[dict], genre_ids: Dict[str, int], stats: dict) -> None:
+    """Grava um bloco: compara hashes, faz upsert dos alterados e refaz seus gêneros"""
+    by_volume = {record["volume_id"]: record for record in records}
+    stats["duplicados"] += len(records) - len(by_volume)
+    existing = dict(conn.execute(
+        select(BookModel.volume_id, BookModel.hash_conteudo)
+        .where(BookModel.volume_id.in_(list(by_volume)))
+    ).all())
+    
+    changed = [record for volume_id, record in by_volume.items() if existing.get(volume_id) != record["hash_conteudo"]]
+    stats["inalterados"] += len(by_volume) - len(changed)
+    if not changed:
+        return
+    
+    upsert = sqlite_insert(BookModel)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[BookModel.volume_id],
+        set_={field: upsert.excluded[field] for field in BOOK_FIELDS[1:] + ["hash_conteudo"]},
+        where=BookModel.hash_conteudo.is_distinct_from(upsert.excluded.hash_conteudo)
+    )
+    conn.execute(upsert, [
+        {field: record[field] for field in BOOK_FIELDS + ["hash_conteudo"]}
+        for record in changed
+    ])
+    for record in changed:
+        stats["atualizados" if record["volume_id"] in existing else "inseridos"] += 1
+    
+    book_ids = dict(conn.execute(
+        select(BookModel.volume_id, BookModel.id)
+        .where(BookModel.volume_id.in_([record["volume_id"] for record in changed]))
+    ).all())
+    updated_ids = [book_ids[volume_id] for volume_id in existing if volume_id in book_ids]
+    if updated_ids:
+        conn.execute(delete(BookGenreModel).where(BookGenreModel.livro_id.in_(updated_ids)))
+    
+    links = [
+        {"livro_id": book_ids[record["volume_id"]], "genero_id": genre_ids[genre]}
+        for record in changed
+        for genre in record["generos"]
+        if genre in genre_ids
+    ]
+    if links:
+        conn.execute(sqlite_insert(BookGenreModel).on_conflict_do_nothing(), links)
+
+def load_catalog(path: str, chunk_size: int = CHUNK_SIZE, defer_indexes: Optional[bool] = None) -> dict:
+    """Carrega o CSV do catálogo; retorna contadores da carga"""
+    migrate_database()
+    stats = {"lidos": 0, "ignorados": 0, "duplicados": 0, "inseridos": 0, "atualizados": 0, "inalterados": 0}
+    
+    with engine.connect() as conn:
+        with conn.begin():
+            genre_ids = dict(conn.execute(select(GenreModel.genero, GenreModel.id)).all())
+            if defer_indexes is None:
+                # Adiar índices compensa quando a tabela está vazia (carga inicial)
+                defer_indexes = not conn.scalar(select(func.count()).select_from(BookModel))
+            
+            indexes = secondary_indexes() if defer_indexes else []
+            for index in indexes:
+                index.drop(conn, checkfirst=True)
+        
+        try:
+            for chunk in read_chunks(path, chunk_size):
+                stats["lidos"] += len(chunk)
+                records = [record for record in map(normalize_row, chunk) if record]
+                stats["ignorados"] += len(chunk) - len(records)
+                with conn.begin():
+                    load_chunk(conn, records, genre_ids, stats)
+        finally:
+            with conn.begin():
+                for index in indexes:
+                    index.create(conn, checkfirst=True)
+    
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("csv", help="Caminho do livros.csv")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--defer-indexes", action=argparse.BooleanOptionalAction, default=None,
+                        help="Remove índices secundários durante a carga (padrão: só com a tabela vazia)")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    stats = load_catalog(args.csv, args.chunk_size, args.defer_indexes)
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{key}: {value}" for key, value in stats.items()) + f" ({elapsed:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
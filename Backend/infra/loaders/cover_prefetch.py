@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Pré-carga das capas do catálogo no cache local (COVERS_DIR).
+
+Baixa a url_imagem de cada livro uma vez, com a mesma concorrência limitada
+do servidor, e gera as miniaturas em COVER_WIDTHS. URLs já baixadas são
+puladas, então a pré-carga pode ser interrompida e rodada de novo.
+
+Uso (a partir de Backend/):
+    python -m infra.loaders.cover_prefetch
+    python -m infra.loaders.cover_prefetch --sem-variantes
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from sqlalchemy import select
+from infra.covers import cover_cache
+from infra.database import migrate_database
+from infra.database.database import engine
+from infra.models.book import BookModel
+
+async def prefetch(variants: bool) -> dict:
+    migrate_database()
+    with engine.connect() as conn:
+        urls = conn.scalars(select(BookModel.url_imagem).where(BookModel.url_imagem.is_not(None))).all()
+    try:
+        return await cover_cache.prefetch(urls, variants)
+    finally:
+        await cover_cache.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sem-variantes", action="store_true", help="Baixa só as originais, sem gerar miniaturas")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    stats = asyncio.run(prefetch(not args.sem_variantes))
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{key}: {value}" for key, value in stats.items()) + f" ({elapsed:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
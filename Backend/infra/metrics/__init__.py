@@ -0,0 +1,53 @@
+# Métricas no formato Prometheus
+from sqlalchemy.engine import Engine
+from config import settings
+from .loop import LoopLagMonitor
+from .multiprocess import MultiprocessCollector
+from .registry import Counter, Gauge, Histogram, Registry, registry
+from .sql import (
+    StatementTimer,
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    normalize_sql,
+    request_sql_time,
+)
+
+# Cronômetro de instruções do processo, compartilhado por todas as engines
+statement_timer = StatementTimer(slow_ms=settings.SLOW_QUERY_MS)
+loop_monitor = LoopLagMonitor()
+# Com vários workers (serve.py), /metrics soma os snapshots de todos via METRICS_MULTIPROC_DIR
+multiprocess_collector = (
+    MultiprocessCollector(settings.METRICS_MULTIPROC_DIR, registry, settings.METRICS_SNAPSHOT_INTERVAL_SECONDS)
+    if settings.METRICS_MULTIPROC_DIR else None
+)
+
+def render_metrics() -> str:
+    """Exposição Prometheus: deste processo ou, com o diretório compartilhado, de todos os workers"""
+    if multiprocess_collector is not None:
+        return multiprocess_collector.render()
+    return registry.render()
+
+def instrument_engine(engine: Engine) -> None:
+    """Registra os hooks de cronometragem de SQL na engine (se as métricas estiverem ligadas)"""
+    if settings.METRICS_ENABLED:
+        statement_timer.instrument(engine)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LoopLagMonitor",
+    "MultiprocessCollector",
+    "Registry",
+    "StatementTimer",
+    "TimedAsyncAdaptedQueuePool",
+    "TimedQueuePool",
+    "instrument_engine",
+    "loop_monitor",
+    "multiprocess_collector",
+    "normalize_sql",
+    "registry",
+    "render_metrics",
+    "request_sql_time",
+    "statement_timer",
+]
@@ -0,0 +1,39 @@
+import asyncio
+import time
+from typing import Optional
+from infra.metrics.registry import registry
+
+event_loop_lag_seconds = registry.histogram(
+    "bookshelf_event_loop_lag_seconds",
+    "Atraso do event loop: quanto um sleep acordou depois do previsto"
+)
+
+class LoopLagMonitor:
+    """Tarefa que dorme `interval` segundos e registra o atraso ao acordar.
+    
+    Atrasos altos indicam trabalho síncrono bloqueando o loop (CPU, I/O fora
+    do threadpool), o que não aparece nos tempos de SQL.
+    """
+    
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            event_loop_lag_seconds.observe(max(0.0, time.perf_counter() - start - self.interval))
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
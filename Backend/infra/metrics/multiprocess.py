@@ -0,0 +1,94 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+from infra.metrics.registry import Registry
+
+logger = logging.getLogger("bookshelf.metrics")
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class MultiprocessCollector:
+    """Agrega as métricas dos workers pré-fork através de um diretório compartilhado.
+    
+    Cada worker grava periodicamente (e ao sair) o snapshot do próprio registro em
+    `<dir>/<pid>.json`; o worker que atende GET /metrics soma os arquivos dos demais
+    aos seus valores ao vivo. Contadores e histogramas de workers que já saíram
+    continuam somados (a série nunca volta atrás num reinício gradual); gauges só
+    contam de workers vivos.
+    """
+    
+    def __init__(self, directory: str, registry: Registry, interval: float = 1.0):
+        self.directory = Path(directory)
+        self.registry = registry
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def path(self) -> Path:
+        # Resolvido a cada uso: o pid muda depois do fork
+        return self.directory / f"{os.getpid()}.json"
+    
+    def write(self) -> None:
+        """Grava o snapshot deste processo (temporário + os.replace)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(self.registry.snapshot(), file)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    
+    def others(self) -> List[Dict[str, dict]]:
+        """Snapshots dos outros processos; gauges de processos mortos são descartados"""
+        snapshots = []
+        for path in self.directory.glob("*.json"):
+            pid = int(path.stem)
+            if pid == os.getpid():
+                continue
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            if not _alive(pid):
+                snapshot = {name: metric for name, metric in snapshot.items() if metric["kind"] != "gauge"}
+            snapshots.append(snapshot)
+        return snapshots
+    
+    def render(self) -> str:
+        return self.registry.render(self.others())
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.write)
+            except OSError as e:
+                logger.warning("Falha ao gravar snapshot de métricas: %s", e)
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Snapshot final: os contadores deste worker sobrevivem à saída dele
+        self.write()
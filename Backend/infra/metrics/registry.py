@@ -0,0 +1,171 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Limites (segundos) pensados para requisições e consultas de um SQLite local
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    """Base das métricas: nome, ajuda e valores por combinação de labels"""
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def render(self, values: dict = None) -> List[str]:
+        """Linhas da exposição; `values` (de merged()) substitui os valores do processo"""
+        values = self.merged(()) if values is None else values
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"] + self._samples(values)
+    
+    def snapshot(self) -> list:
+        """Valores do processo como lista JSON: [[labels, estado], ...]"""
+        with self._lock:
+            return [[list(labels), self._copy_state(state)] for labels, state in self._values.items()]
+    
+    def merged(self, snapshots: Iterable[list]) -> dict:
+        """Valores do processo somados aos snapshots de outros processos"""
+        with self._lock:
+            values = {labels: self._copy_state(state) for labels, state in self._values.items()}
+        for snapshot in snapshots:
+            for labels, state in snapshot:
+                labels = tuple(labels)
+                values[labels] = self._add_state(values[labels], state) if labels in values else self._copy_state(state)
+        return values
+    
+    @staticmethod
+    def _copy_state(state):
+        return state
+    
+    @staticmethod
+    def _add_state(state, other):
+        return state + other
+    
+    def _samples(self, values: dict) -> List[str]:
+        raise NotImplementedError
+
+class Counter(Metric):
+    """Contador monotônico por combinação de labels"""
+    kind = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+    
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+    
+    def _samples(self, values: dict) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in values.items()]
+
+class Gauge(Counter):
+    """Valor que sobe e desce (ex.: requisições em andamento)"""
+    kind = "gauge"
+    
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+    
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+class Histogram(Metric):
+    """Histograma de buckets fixos; observe() custa um bisect e um lock"""
+    kind = "histogram"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Por labels: [contagem por bucket (+Inf no fim), soma]
+        self._values: Dict[Tuple[str, ...], list] = {}
+    
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+    
+    def count(self, *labels: str) -> int:
+        state = self._values.get(labels)
+        return sum(state[0]) if state else 0
+    
+    @staticmethod
+    def _copy_state(state):
+        return [list(state[0]), state[1]]
+    
+    @staticmethod
+    def _add_state(state, other):
+        return [[a + b for a, b in zip(state[0], other[0])], state[1] + other[1]]
+    
+    def _samples(self, values: dict) -> List[str]:
+        lines = []
+        for labels, (counts, total) in values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+class Registry:
+    """Coleção de métricas do processo, renderizada no formato texto do Prometheus"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+    
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Métrica já registrada: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+    
+    def snapshot(self) -> Dict[str, dict]:
+        """Estado de todas as métricas, serializável em JSON (agregação entre processos)"""
+        return {name: {"kind": metric.kind, "values": metric.snapshot()} for name, metric in self._metrics.items()}
+    
+    def render(self, snapshots: Sequence[Dict[str, dict]] = ()) -> str:
+        """Exposição do processo, somada aos snapshots de outros processos (se houver)"""
+        lines = []
+        for name, metric in self._metrics.items():
+            others = [snapshot[name]["values"] for snapshot in snapshots if name in snapshot]
+            lines.extend(metric.render(metric.merged(others)))
+        return "\n".join(lines) + "\n"
+
+# Registro do processo, exposto em GET /metrics
+registry = Registry()
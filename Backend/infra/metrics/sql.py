@@ -0,0 +1,111 @@
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from infra.metrics.registry import Histogram, registry
+
+logger = logging.getLogger("bookshelf.sql")
+
+# Acumulador de tempo de SQL da requisição corrente (definido pelo middleware)
+request_sql_time: ContextVar[Optional[list]] = ContextVar("request_sql_time", default=None)
+
+sql_statement_seconds = registry.histogram(
+    "bookshelf_sql_statement_seconds",
+    "Duração de cada instrução SQL no cursor, por SQL normalizado",
+    ("statement",)
+)
+pool_checkout_wait_seconds = registry.histogram(
+    "bookshelf_db_pool_checkout_wait_seconds",
+    "Espera por uma conexão livre no pool (inclui abrir conexões novas)",
+    ("pool",)
+)
+
+MAX_STATEMENT_LABELS = 500
+MAX_STATEMENT_LENGTH = 300
+OTHER_STATEMENT = "other"
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LISTS = re.compile(r"(VALUES\s*\(\?\))(?:\s*,\s*\(\?\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+@lru_cache(maxsize=4096)
+def normalize_sql(statement: str) -> str:
+    """Forma canônica de uma instrução: literais viram ?, listas IN (?, ?, ...) viram (?)"""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _LITERALS.sub("?", normalized)
+    normalized = _PLACEHOLDER_LISTS.sub("(?)", normalized)
+    return _VALUES_LISTS.sub(r"\1", normalized)[:MAX_STATEMENT_LENGTH]
+
+class StatementTimer:
+    """Hooks de cursor que cronometram cada instrução, agrupada por SQL normalizado.
+    
+    O início vai para `conn.info`, indexado pelo cursor (instruções aninhadas usam
+    cursores distintos), e a duração alimenta o histograma; acima de `slow_ms` a
+    instrução é logada. Instruções que falham não chegam a after_cursor_execute:
+    handle_error descarta o início delas.
+    """
+    
+    def __init__(self, slow_ms: float = 0, histogram: Histogram = sql_statement_seconds):
+        self.histogram = histogram
+        self.slow_ms = slow_ms
+        self._labels = set()
+    
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self.before)
+        event.listen(engine, "after_cursor_execute", self.after)
+        event.listen(engine, "handle_error", self.error)
+    
+    def before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_start", {})[id(cursor)] = time.perf_counter()
+    
+    def error(self, exception_context):
+        # O cursor vem do contexto de execução (ExceptionContext.cursor não é preenchido no 2.0)
+        cursor = getattr(exception_context.execution_context, "cursor", None)
+        if exception_context.connection is not None and cursor is not None:
+            exception_context.connection.info.get("metrics_start", {}).pop(id(cursor), None)
+    
+    def after(self, conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.get("metrics_start", {}).pop(id(cursor), None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        label = normalize_sql(statement)
+        if label not in self._labels:
+            # Limita a cardinalidade: SQL dinâmico demais cai em "other"
+            if len(self._labels) >= MAX_STATEMENT_LABELS:
+                label = OTHER_STATEMENT
+            else:
+                self._labels.add(label)
+        self.histogram.observe(elapsed, label)
+        
+        accumulator = request_sql_time.get()
+        if accumulator is not None:
+            accumulator[0] += elapsed
+        if self.slow_ms and elapsed * 1000 >= self.slow_ms:
+            logger.warning("Consulta lenta (%.1f ms): %s", elapsed * 1000, _WHITESPACE.sub(" ", statement).strip())
+
+class TimedQueuePool(QueuePool):
+    """QueuePool que mede quanto cada checkout espera por uma conexão livre"""
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait_seconds.observe(time.perf_counter() - start, self.logging_name or "default")
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Versão assíncrona do TimedQueuePool (checkouts aguardam sem bloquear o loop)"""
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait_seconds.observe(time.perf_counter() - start, self.logging_name or "default")
@@ -0,0 +1,67 @@
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from infra.models.user import Base, SQLiteTimestamp
+
+# Gêneros semeados pela migração base (migrations/sql/0001_esquema_base.sql); o catálogo é normalizado para estes nomes
+GENEROS = [
+    "Ficção",
+    "Fantasia",
+    "Romance",
+    "Terror",
+    "Suspense",
+    "Aventura",
+    "História",
+    "Ciência",
+    "Biografia",
+    "Autoajuda",
+]
+
+CLASSIFICACOES = ("L", "10", "12", "14", "16", "18")
+
+class BookModel(Base):
+    """Modelo SQLAlchemy para a tabela de livros"""
+    __tablename__ = "livro"
+    __table_args__ = (
+        CheckConstraint(
+            "classificacao_indicativa IN ('L','10','12','14','16','18')",
+            name="ck_livro_classificacao"
+        ),
+        CheckConstraint("public_domain IN (0,1)", name="ck_livro_public_domain"),
+        Index("idx_livro_nome", "nome"),
+        # Filtro por classificação já sai em ordem de id (rowid implícito no índice)
+        Index("idx_livro_classificacao", "classificacao_indicativa"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    # Id do volume na Google Books API: chave natural para cargas idempotentes
+    volume_id = Column(String(32), nullable=False, unique=True)
+    nome = Column(Text, nullable=False)
+    autores = Column(Text)
+    descricao = Column(Text)
+    data_publicacao = Column(String(10))
+    classificacao_indicativa = Column(String(2), nullable=False, default="L")
+    url_imagem = Column(Text)
+    public_domain = Column(Integer, nullable=False, default=0)
+    # Hash do conteúdo carregado; recargas só reescrevem linhas alteradas
+    hash_conteudo = Column(String(32))
+    criado_em = Column(SQLiteTimestamp, default=func.now())
+
+class GenreModel(Base):
+    """Modelo SQLAlchemy para a tabela de gêneros"""
+    __tablename__ = "genero"
+    
+    id = Column(Integer, primary_key=True)
+    genero = Column(String(100), nullable=False, unique=True)
+
+class BookGenreModel(Base):
+    """Modelo SQLAlchemy para a associação N:N livro-gênero"""
+    __tablename__ = "livro_genero"
+    __table_args__ = (
+        UniqueConstraint("livro_id", "genero_id"),
+        # Cobre o filtro por gênero: busca por genero_id já devolve livro_id em ordem
+        Index("idx_livro_genero_genero", "genero_id", "livro_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    livro_id = Column(Integer, ForeignKey("livro.id", ondelete="CASCADE"), nullable=False)
+    genero_id = Column(Integer, ForeignKey("genero.id", ondelete="RESTRICT"), nullable=False)
@@ -0,0 +1,34 @@
+from sqlalchemy import CheckConstraint, Column, Float, ForeignKey, Index, Integer, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from infra.models.user import Base, SQLiteTimestamp
+
+class RatingModel(Base):
+    """Modelo SQLAlchemy para a tabela de notas (avaliação de um livro por um usuário)"""
+    __tablename__ = "notas"
+    __table_args__ = (
+        CheckConstraint("nota >= 0 AND nota <= 5", name="ck_notas_nota"),
+        UniqueConstraint("usuario_id", "livro_id"),
+        Index("idx_notas_livro", "livro_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    usuario_id = Column(Integer, ForeignKey("usuario.id", ondelete="CASCADE"), nullable=False)
+    livro_id = Column(Integer, ForeignKey("livro.id", ondelete="CASCADE"), nullable=False)
+    nota = Column(Float, nullable=False)
+    descricao = Column(Text)
+    criado_em = Column(SQLiteTimestamp, default=func.now())
+
+class BookRatingSummaryModel(Base):
+    """Agregado das notas de um livro (soma, quantidade e histograma), mantido por triggers em notas"""
+    __tablename__ = "livro_notas"
+    
+    livro_id = Column(Integer, ForeignKey("livro.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    soma = Column(Float, nullable=False, default=0)
+    quantidade = Column(Integer, nullable=False, default=0)
+    # Quantidade de notas por round(nota), de 0 a 5 estrelas
+    estrelas_0 = Column(Integer, nullable=False, default=0)
+    estrelas_1 = Column(Integer, nullable=False, default=0)
+    estrelas_2 = Column(Integer, nullable=False, default=0)
+    estrelas_3 = Column(Integer, nullable=False, default=0)
+    estrelas_4 = Column(Integer, nullable=False, default=0)
+    estrelas_5 = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,40 @@
+from sqlalchemy import CheckConstraint, Column, Float, ForeignKey, Index, Integer, UniqueConstraint
+from sqlalchemy.sql import func
+from infra.models.user import Base, SQLiteTimestamp
+
+class ReadingModel(Base):
+    """Modelo SQLAlchemy para a tabela registro (um livro adicionado pelo usuário)"""
+    __tablename__ = "registro"
+    __table_args__ = (
+        CheckConstraint("total_paginas > 0", name="ck_registro_total_paginas"),
+        UniqueConstraint("usuario_id", "livro_id"),
+        Index("idx_registro_usuario", "usuario_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    usuario_id = Column(Integer, ForeignKey("usuario.id", ondelete="CASCADE"), nullable=False)
+    livro_id = Column(Integer, ForeignKey("livro.id", ondelete="CASCADE"), nullable=False)
+    total_paginas = Column(Integer, nullable=False)
+    criado_em = Column(SQLiteTimestamp, default=func.now())
+
+class ProgressLogModel(Base):
+    """Modelo SQLAlchemy para a tabela registros (log de progresso de leitura)"""
+    __tablename__ = "registros"
+    __table_args__ = (
+        CheckConstraint("pagina_atual >= 0", name="ck_registros_pagina_atual"),
+        Index("idx_registros_registro", "registro_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    registro_id = Column(Integer, ForeignKey("registro.id", ondelete="CASCADE"), nullable=False)
+    pagina_atual = Column(Integer, nullable=False)
+    data_registro = Column(SQLiteTimestamp, default=func.now())
+
+class ReadingProgressModel(Base):
+    """Progresso atual de cada registro, mantido por trigger a cada linha em registros"""
+    __tablename__ = "registro_progresso"
+    
+    registro_id = Column(Integer, ForeignKey("registro.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    pagina_atual = Column(Integer, nullable=False)
+    percentual = Column(Float, nullable=False)
+    atualizado_em = Column(SQLiteTimestamp, nullable=False)
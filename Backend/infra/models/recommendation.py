@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Float, ForeignKey, Integer
+from infra.models.user import Base
+
+class UserRecommendationModel(Base):
+    """Candidatos pré-calculados por usuário (gravados por IA/recomendacao/colaborativo.py)"""
+    __tablename__ = "recomendacao_usuario"
+    # Sem rowid: as linhas de um usuário ficam contíguas na chave primária
+    __table_args__ = {"sqlite_with_rowid": False}
+    
+    usuario_id = Column(Integer, ForeignKey("usuario.id", ondelete="CASCADE"), primary_key=True)
+    posicao = Column(Integer, primary_key=True)
+    livro_id = Column(Integer, ForeignKey("livro.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
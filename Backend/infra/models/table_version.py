@@ -0,0 +1,16 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+from infra.models.user import Base
+
+class TableVersionModel(Base):
+    """Versão por tabela, incrementada por triggers a cada INSERT/UPDATE/DELETE"""
+    __tablename__ = "versao_tabela"
+    
+    tabela = Column(String(64), primary_key=True)
+    versao = Column(Integer, nullable=False, default=0)
+
+class GenreRankingVersionModel(Base):
+    """Versão das notas por gênero, incrementada por triggers em notas e livro_genero"""
+    __tablename__ = "versao_ranking_genero"
+    
+    genero_id = Column(Integer, ForeignKey("genero.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    versao = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,32 @@
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from infra.models.user import Base, SQLiteTimestamp
+
+# Tags semeadas pela migração base
+TAGS = ["Lendo", "Abandonado", "Quero ler"]
+
+class TagModel(Base):
+    """Modelo SQLAlchemy para a tabela de tags da estante"""
+    __tablename__ = "tags"
+    __table_args__ = (
+        CheckConstraint("length(trim(tag)) > 0", name="ck_tags_tag"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    tag = Column(Text, nullable=False, unique=True)
+
+class UserBookTagModel(Base):
+    """Modelo SQLAlchemy para a associação de tags a (usuário, livro)"""
+    __tablename__ = "tag_usuario_livro"
+    __table_args__ = (
+        UniqueConstraint("usuario_id", "livro_id", "tag_id"),
+        Index("idx_tul_usuario_livro", "usuario_id", "livro_id"),
+        # Estante filtrada por tag: intervalo em (usuario_id, tag_id) já em ordem de livro_id
+        Index("idx_tul_usuario_tag_livro", "usuario_id", "tag_id", "livro_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    usuario_id = Column(Integer, ForeignKey("usuario.id", ondelete="CASCADE"), nullable=False)
+    livro_id = Column(Integer, ForeignKey("livro.id", ondelete="CASCADE"), nullable=False)
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="RESTRICT"), nullable=False)
+    criado_em = Column(SQLiteTimestamp, default=func.now())
@@ -1,15 +1,32 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# Mesmo formato de CURRENT_TIMESTAMP no SQLite, para que os parâmetros de
+# cursor sejam comparados com os valores gravados sem divergência de texto
+SQLiteTimestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite"
+)
+
 class UserModel(Base):
     """Modelo SQLAlchemy para a tabela de usuários"""
     __tablename__ = "usuario"
+    __table_args__ = (
+        # Índice composto usado pela paginação por cursor (criado_em, id)
+        Index("idx_usuario_criado_em_id", "criado_em", "id"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     nome = Column(String(100), nullable=False)
-    email = Column(String(255), nullable=False, unique=True, index=True)
+    email = Column(String(255), nullable=False, unique=True)
     filme_favorito = Column(String(200))
-    criado_em = Column(DateTime, default=func.now())
+    criado_em = Column(SQLiteTimestamp, default=func.now())
+    # Versão da linha (ETag); incrementada a cada UPDATE
+    versao = Column(Integer, nullable=False, default=1, server_default="1")
+    atualizado_em = Column(SQLiteTimestamp, default=func.now(), onupdate=func.now())
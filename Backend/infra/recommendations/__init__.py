@@ -0,0 +1,8 @@
+# Recomendações (artefatos gerados em IA/ e servidos pelo Backend)
+from pathlib import Path
+from config import settings
+from .similar_books import SimilarBooksIndex
+
+similar_books_index = SimilarBooksIndex(Path(settings.RECOMMENDATIONS_DIR) / "conteudo")
+
+__all__ = ["SimilarBooksIndex", "similar_books_index"]
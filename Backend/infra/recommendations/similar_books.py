@@ -0,0 +1,72 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+class SimilarBooksIndex:
+    """Tabela de livros similares gerada por IA/recomendacao/conteudo.py.
+    
+    As matrizes são abertas como memmap (sem carregar o arquivo na memória) e a
+    consulta é uma leitura de linha: O(k) por requisição. Uma nova construção é
+    detectada pelo manifest.json e recarregada na próxima consulta; o diretório é
+    um symlink trocado atomicamente, então todos os arquivos vêm da mesma versão.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._loaded = None
+        self._neighbors = None
+        self._scores = None
+        self._volume_ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+    
+    def _current(self) -> Optional[Tuple[Path, float]]:
+        """Versão publicada: diretório real (symlink resolvido) e mtime do manifest"""
+        directory = self.directory.resolve()
+        try:
+            return directory, (directory / "manifest.json").stat().st_mtime
+        except FileNotFoundError:
+            return None
+    
+    def _ensure_loaded(self) -> bool:
+        current = self._current()
+        if current is None:
+            return False
+        if current != self._loaded:
+            with self._lock:
+                if current != self._loaded:
+                    directory = current[0]
+                    volume_ids = (directory / "volume_ids.txt").read_text(encoding="utf-8").split()
+                    self._neighbors = np.load(directory / "vizinhos.npy", mmap_mode="r")
+                    self._scores = np.load(directory / "similaridades.npy", mmap_mode="r")
+                    self._volume_ids = volume_ids
+                    self._positions = {volume_id: i for i, volume_id in enumerate(volume_ids)}
+                    self._loaded = current
+        return True
+    
+    @property
+    def available(self) -> bool:
+        """Indica se há uma tabela construída no diretório configurado"""
+        return self._ensure_loaded()
+    
+    def similar(self, volume_id: str, limit: int) -> List[Tuple[str, float]]:
+        """Vizinhos de um livro como (volume_id, similaridade), do mais parecido ao menos"""
+        if not self._ensure_loaded():
+            return []
+        position = self._positions.get(volume_id)
+        if position is None:
+            return []
+        neighbors = self._neighbors[position, :limit]
+        scores = self._scores[position, :limit]
+        return [
+            (self._volume_ids[neighbor], float(score))
+            for neighbor, score in zip(neighbors.tolist(), scores.tolist())
+            if neighbor >= 0
+        ]
+    
+    def manifest(self) -> Optional[dict]:
+        """Parâmetros da construção atual (ou None se não houver)"""
+        path = self.directory / "manifest.json"
+        return json.loads(path.read_text()) if path.exists() else None
@@ -0,0 +1,15 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+from infra.models.book import BookModel
+
+class AsyncBookRepository:
+    """Repository assíncrono para leituras pontuais do catálogo de livros"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_cover_url(self, book_id: int) -> Optional[Tuple[Optional[str]]]:
+        """(url_imagem,) do livro pela chave primária, ou None se o livro não existe"""
+        result = await self.db.execute(select(BookModel.url_imagem).where(BookModel.id == book_id))
+        return result.first()
@@ -0,0 +1,96 @@
+from datetime import datetime
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from infra.models.table_version import TableVersionModel
+from infra.models.user import UserModel
+from infra.repositories.user_repository import USER_COLUMNS, page_statement
+from core.domain.user import User
+
+class AsyncUserRepository:
+    """Repository assíncrono para operações de banco de dados relacionadas a usuários"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_all(self) -> List[UserModel]:
+        """Retorna todos os usuários ordenados por data de criação"""
+        result = await self.db.scalars(select(UserModel).order_by(UserModel.criado_em.desc()))
+        return result.all()
+    
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[UserModel]:
+        """Retorna uma página de usuários por keyset em (criado_em, id) decrescente"""
+        result = await self.db.scalars(page_statement(limit, after))
+        return result.all()
+    
+    async def get_page_rows(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[dict]:
+        """Retorna uma página como dicionários de colunas, sem objetos ORM"""
+        result = await self.db.execute(page_statement(limit, after, USER_COLUMNS))
+        return [dict(row) for row in result.mappings()]
+    
+    async def get_row_by_id(self, user_id: int) -> Optional[dict]:
+        """Retorna as colunas de um usuário por ID, sem objeto ORM"""
+        result = await self.db.execute(select(*USER_COLUMNS).where(UserModel.id == user_id))
+        row = result.mappings().first()
+        return dict(row) if row else None
+    
+    async def get_version(self) -> int:
+        """Versão da tabela de usuários (muda a cada escrita), lida por chave primária"""
+        return await self.db.scalar(
+            select(TableVersionModel.versao).where(TableVersionModel.tabela == UserModel.__tablename__)
+        ) or 0
+    
+    async def get_by_id(self, user_id: int) -> Optional[UserModel]:
+        """Retorna um usuário por ID"""
+        return await self.db.get(UserModel, user_id)
+    
+    async def get_by_email(self, email: str) -> Optional[UserModel]:
+        """Retorna um usuário por email"""
+        return await self.db.scalar(select(UserModel).where(UserModel.email == email))
+    
+    async def create(self, user: User) -> Optional[UserModel]:
+        """Cria um usuário com um único INSERT ... RETURNING (None se o email existe)"""
+        stmt = (
+            sqlite_insert(UserModel)
+            .values(nome=user.nome, email=user.email, filme_favorito=user.filme_favorito)
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel)
+        )
+        db_user = (await self.db.scalars(stmt)).first()
+        await self.db.commit()
+        return db_user
+    
+    async def update(self, user_id: int, changes: dict) -> Optional[UserModel]:
+        """Atualiza campos com um único UPDATE ... RETURNING (None se não existe)"""
+        if not changes:
+            return await self.get_by_id(user_id)
+        
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**changes, versao=UserModel.versao + 1)
+            .returning(UserModel)
+        )
+        try:
+            db_user = (await self.db.scalars(stmt)).first()
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        return db_user
+    
+    async def delete(self, user_id: int) -> bool:
+        """Remove um usuário com um único DELETE"""
+        result = await self.db.execute(delete(UserModel).where(UserModel.id == user_id))
+        await self.db.commit()
+        return result.rowcount > 0
+    
+    async def email_exists(self, email: str) -> bool:
+        """Verifica se um email já existe no banco"""
+        return await self.get_by_email(email) is not None
+    
+    async def count_users(self) -> int:
+        """Retorna o total de usuários cadastrados"""
+        return await self.db.scalar(select(func.count()).select_from(UserModel))
@@ -0,0 +1,186 @@
+from sqlalchemy import Integer, Select, column, exists, func, literal, literal_column, select, table, tuple_
+from sqlalchemy.orm import Session
+from typing import List, Optional, Sequence, Tuple
+from infra.models.book import BookGenreModel, BookModel, GenreModel
+from infra.models.rating import BookRatingSummaryModel
+
+# Tabela virtual FTS5 (conteúdo externo em livro), mantida por triggers
+LIVRO_FTS = table("livro_fts", column("rowid", Integer))
+
+def genres_column():
+    """Gêneros do livro concatenados, lidos pelo índice único (livro_id, genero_id)"""
+    return (
+        select(func.group_concat(GenreModel.genero, "|"))
+        .select_from(BookGenreModel)
+        .join(GenreModel, GenreModel.id == BookGenreModel.genero_id)
+        .where(BookGenreModel.livro_id == BookModel.id)
+        .scalar_subquery()
+        .label("generos")
+    )
+
+# Colunas da listagem (sem a descrição, que é o campo mais pesado)
+BOOK_SUMMARY_COLUMNS = (
+    BookModel.id,
+    BookModel.volume_id,
+    BookModel.nome,
+    BookModel.autores,
+    BookModel.data_publicacao,
+    BookModel.classificacao_indicativa,
+    BookModel.url_imagem,
+)
+
+BOOK_DETAIL_COLUMNS = BOOK_SUMMARY_COLUMNS + (
+    BookModel.descricao,
+    BookModel.public_domain,
+)
+
+# Agregado de notas (livro_notas), lido pela chave primária
+RATING_SUMMARY_COLUMNS = (
+    BookRatingSummaryModel.soma,
+    BookRatingSummaryModel.quantidade,
+    BookRatingSummaryModel.estrelas_0,
+    BookRatingSummaryModel.estrelas_1,
+    BookRatingSummaryModel.estrelas_2,
+    BookRatingSummaryModel.estrelas_3,
+    BookRatingSummaryModel.estrelas_4,
+    BookRatingSummaryModel.estrelas_5,
+)
+
+def pop_rating_summary(item: dict) -> dict:
+    """Troca as colunas de livro_notas por média, quantidade e histograma (0 a 5 estrelas)"""
+    soma = item.pop("soma") or 0.0
+    quantidade = item.pop("quantidade") or 0
+    histograma = [item.pop(f"estrelas_{estrelas}") or 0 for estrelas in range(6)]
+    return {
+        "media": round(soma / quantidade, 2) if quantidade else None,
+        "quantidade": quantidade,
+        "histograma": histograma
+    }
+
+def genre_id(genero: str):
+    """Id do gênero como subconsulta escalar (chave única em genero.genero)"""
+    return select(GenreModel.id).where(GenreModel.genero == genero).scalar_subquery()
+
+def page_statement(
+    limit: int,
+    after: Optional[int] = None,
+    genero: Optional[str] = None,
+    classificacoes: Sequence[str] = ()
+) -> Select:
+    """Monta a consulta keyset por id, com filtros opcionais.
+    
+    Com gênero, a varredura parte de idx_livro_genero_genero (genero_id, livro_id),
+    que já entrega os livros em ordem de id; cada linha de livro é lida pela chave primária.
+    """
+    stmt = select(*BOOK_SUMMARY_COLUMNS, genres_column())
+    if genero is not None:
+        key = BookGenreModel.livro_id
+        stmt = (
+            stmt.select_from(BookGenreModel)
+            .join(BookModel, BookModel.id == BookGenreModel.livro_id)
+            .where(BookGenreModel.genero_id == genre_id(genero))
+        )
+    else:
+        key = BookModel.id
+    if classificacoes:
+        stmt = stmt.where(BookModel.classificacao_indicativa.in_(classificacoes))
+    if after is not None:
+        stmt = stmt.where(key > after)
+    # Em todos os ramos a chave é o id do livro, único: com o IN de várias
+    # classificações o plano pode mudar, mas a ordem (e o keyset) não
+    return stmt.order_by(key).limit(limit)
+
+def split_genres(row) -> dict:
+    """Converte a linha em dicionário com a lista de gêneros"""
+    item = dict(row)
+    item["generos"] = item["generos"].split("|") if item["generos"] else []
+    return item
+
+class BookRepository:
+    """Repository para consultas ao catálogo de livros"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_page_rows(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        genero: Optional[str] = None,
+        classificacoes: Sequence[str] = ()
+    ) -> List[dict]:
+        """Retorna uma página de livros como dicionários de colunas"""
+        result = self.db.execute(page_statement(limit, after, genero, classificacoes))
+        return [split_genres(row) for row in result.mappings()]
+    
+    def get_row_by_id(self, book_id: int) -> Optional[dict]:
+        """Retorna as colunas de um livro por ID, com seus gêneros e o agregado de notas"""
+        row = self.db.execute(
+            select(*BOOK_DETAIL_COLUMNS, genres_column(), *RATING_SUMMARY_COLUMNS)
+            .outerjoin(BookRatingSummaryModel, BookRatingSummaryModel.livro_id == BookModel.id)
+            .where(BookModel.id == book_id)
+        ).mappings().first()
+        if row is None:
+            return None
+        item = split_genres(row)
+        item["public_domain"] = bool(item["public_domain"])
+        item["avaliacao"] = pop_rating_summary(item)
+        return item
+    
+    def get_volume_id(self, book_id: int) -> Optional[str]:
+        """Retorna o volume_id de um livro (chave dos artefatos de recomendação)"""
+        return self.db.scalar(select(BookModel.volume_id).where(BookModel.id == book_id))
+    
+    def get_rows_by_volume_ids(self, volume_ids: Sequence[str]) -> List[dict]:
+        """Retorna livros por volume_id com um único IN (índice único), em qualquer ordem"""
+        if not volume_ids:
+            return []
+        result = self.db.execute(
+            select(*BOOK_SUMMARY_COLUMNS, genres_column()).where(BookModel.volume_id.in_(volume_ids))
+        )
+        return [split_genres(row) for row in result.mappings()]
+    
+    def get_genres(self) -> List[str]:
+        """Retorna os nomes dos gêneros cadastrados"""
+        return list(self.db.scalars(select(GenreModel.genero).order_by(GenreModel.genero)))
+    
+    def search(
+        self,
+        query: str,
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        genero: Optional[str] = None,
+        classificacoes: Sequence[str] = ()
+    ) -> List[dict]:
+        """Busca textual (FTS5) em nome/autores/descrição, ordenada por relevância BM25.
+        
+        `query` já deve estar na sintaxe FTS5; a paginação é por keyset em (score, id).
+        Os filtros são consultas pontuais por rowid (índice único (livro_id, genero_id)
+        e chave primária de livro).
+        """
+        score = func.bm25(literal_column("livro_fts"), 10.0, 5.0, 1.0)
+        matches = select(LIVRO_FTS.c.rowid.label("id"), score.label("score")).where(
+            literal_column("livro_fts").op("MATCH")(query)
+        )
+        if genero is not None:
+            matches = matches.where(exists().where(
+                BookGenreModel.livro_id == LIVRO_FTS.c.rowid,
+                BookGenreModel.genero_id == genre_id(genero)
+            ))
+        if classificacoes:
+            matches = matches.where(exists().where(
+                BookModel.id == LIVRO_FTS.c.rowid,
+                BookModel.classificacao_indicativa.in_(classificacoes)
+            ))
+        if after is not None:
+            last_score, book_id = after
+            matches = matches.where(tuple_(score, LIVRO_FTS.c.rowid) > tuple_(literal(last_score), literal(book_id)))
+        # Ranqueia e limita dentro do índice; só as linhas da página são lidas em livro
+        matches = matches.order_by(score, LIVRO_FTS.c.rowid).limit(limit).subquery("matches")
+        
+        stmt = (
+            select(*BOOK_SUMMARY_COLUMNS, genres_column(), matches.c.score)
+            .join(matches, matches.c.id == BookModel.id)
+            .order_by(matches.c.score, matches.c.id)
+        )
+        return [split_genres(row) for row in self.db.execute(stmt).mappings()]
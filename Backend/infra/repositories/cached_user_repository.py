@@ -0,0 +1,142 @@
+from typing import Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from infra.cache import MISSING, UserCache, user_cache
+from infra.models.user import UserModel
+from infra.repositories.user_repository import USER_COLUMNS, UserRepository
+from infra.repositories.async_user_repository import AsyncUserRepository
+from core.domain.user import User
+
+def row_of(db_user: UserModel) -> dict:
+    """Colunas de resposta de um UserModel, no formato armazenado em cache"""
+    return {column.key: getattr(db_user, column.key) for column in USER_COLUMNS}
+
+class CachedUserRepository(UserRepository):
+    """UserRepository com cache de leitura em get_by_id/get_by_email e invalidação nas escritas"""
+    
+    def __init__(self, db: Session, cache: UserCache = user_cache):
+        super().__init__(db)
+        self.cache = cache
+    
+    def get_row_by_id(self, user_id: int) -> Optional[dict]:
+        row = self.cache.get_row(user_id)
+        if row is MISSING:
+            row = super().get_row_by_id(user_id)
+            self.cache.set_row(user_id, row)
+        return dict(row) if row is not None else None
+    
+    def get_rows_by_ids(self, user_ids: Iterable[int]) -> List[dict]:
+        rows, misses = [], []
+        for user_id in user_ids:
+            row = self.cache.get_row(user_id)
+            if row is MISSING:
+                misses.append(user_id)
+            elif row is not None:
+                rows.append(dict(row))
+        if misses:
+            # Uma consulta IN só para o que faltou no cache
+            found = {row["id"]: row for row in super().get_rows_by_ids(misses)}
+            for user_id in misses:
+                self.cache.set_row(user_id, found.get(user_id))
+            rows.extend(dict(row) for row in found.values())
+        return rows
+    
+    def get_by_id(self, user_id: int) -> Optional[UserModel]:
+        row = self.get_row_by_id(user_id)
+        return UserModel(**row) if row is not None else None
+    
+    def get_by_email(self, email: str) -> Optional[UserModel]:
+        user_id = self.cache.get_email_id(email)
+        if user_id is None:
+            return None
+        if user_id is not MISSING:
+            row = self.get_row_by_id(user_id)
+            # O email pode ter mudado desde que a chave foi gravada
+            if row is not None and row["email"] == email:
+                return UserModel(**row)
+        
+        db_user = super().get_by_email(email)
+        if db_user is None:
+            self.cache.set_email_id(email, None)
+            return None
+        self.cache.set_row(db_user.id, row_of(db_user))
+        self.cache.set_email_id(email, db_user.id)
+        return db_user
+    
+    def email_exists(self, email: str) -> bool:
+        return self.get_by_email(email) is not None
+    
+    def create(self, user: User) -> Optional[UserModel]:
+        db_user = super().create(user)
+        if db_user is not None:
+            # Descarta entradas negativas do novo id/email
+            self.cache.invalidate(db_user.id, db_user.email)
+        return db_user
+    
+    def update(self, user_id: int, changes: dict) -> Optional[UserModel]:
+        try:
+            return super().update(user_id, changes)
+        finally:
+            self.cache.invalidate(user_id, changes.get("email"))
+    
+    def delete(self, user_id: int) -> bool:
+        try:
+            return super().delete(user_id)
+        finally:
+            self.cache.invalidate(user_id)
+
+class CachedAsyncUserRepository(AsyncUserRepository):
+    """AsyncUserRepository com o mesmo cache de leitura e invalidação"""
+    
+    def __init__(self, db: AsyncSession, cache: UserCache = user_cache):
+        super().__init__(db)
+        self.cache = cache
+    
+    async def get_row_by_id(self, user_id: int) -> Optional[dict]:
+        row = self.cache.get_row(user_id)
+        if row is MISSING:
+            row = await super().get_row_by_id(user_id)
+            self.cache.set_row(user_id, row)
+        return dict(row) if row is not None else None
+    
+    async def get_by_id(self, user_id: int) -> Optional[UserModel]:
+        row = await self.get_row_by_id(user_id)
+        return UserModel(**row) if row is not None else None
+    
+    async def get_by_email(self, email: str) -> Optional[UserModel]:
+        user_id = self.cache.get_email_id(email)
+        if user_id is None:
+            return None
+        if user_id is not MISSING:
+            row = await self.get_row_by_id(user_id)
+            if row is not None and row["email"] == email:
+                return UserModel(**row)
+        
+        db_user = await super().get_by_email(email)
+        if db_user is None:
+            self.cache.set_email_id(email, None)
+            return None
+        self.cache.set_row(db_user.id, row_of(db_user))
+        self.cache.set_email_id(email, db_user.id)
+        return db_user
+    
+    async def email_exists(self, email: str) -> bool:
+        return await self.get_by_email(email) is not None
+    
+    async def create(self, user: User) -> Optional[UserModel]:
+        db_user = await super().create(user)
+        if db_user is not None:
+            self.cache.invalidate(db_user.id, db_user.email)
+        return db_user
+    
+    async def update(self, user_id: int, changes: dict) -> Optional[UserModel]:
+        try:
+            return await super().update(user_id, changes)
+        finally:
+            self.cache.invalidate(user_id, changes.get("email"))
+    
+    async def delete(self, user_id: int) -> bool:
+        try:
+            return await super().delete(user_id)
+        finally:
+            self.cache.invalidate(user_id)
@@ -0,0 +1,16 @@
+import re
+from typing import Optional
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+def prefix_match_query(termo: str) -> Optional[str]:
+    """Converte o texto digitado em uma consulta FTS5 segura com prefixo.
+    
+    Cada palavra vira um termo entre aspas com `*` (todas obrigatórias), o que
+    neutraliza operadores FTS5 e permite busca enquanto o usuário digita.
+    Retorna None quando não há palavras pesquisáveis.
+    """
+    tokens = _TOKEN.findall(termo)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
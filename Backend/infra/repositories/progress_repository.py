@@ -0,0 +1,46 @@
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from infra.models.reading import ReadingModel, ReadingProgressModel
+
+# Ignora registros removidos entre o enfileiramento e o flush
+INSERT_LOG = text(
+    "INSERT INTO registros (registro_id, pagina_atual, data_registro) "
+    "SELECT :registro_id, :pagina_atual, :data_registro "
+    "WHERE EXISTS (SELECT 1 FROM registro WHERE id = :registro_id)"
+)
+
+class ProgressRepository:
+    """Repository para o log de progresso de leitura (registros) e o progresso atual"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_total_pages(self, registro_id: int) -> Optional[int]:
+        """Total de páginas de um registro (None se não existir)"""
+        return self.db.scalar(select(ReadingModel.total_paginas).where(ReadingModel.id == registro_id))
+    
+    def get_progress(self, registro_id: int) -> Optional[dict]:
+        """Progresso atual pré-calculado de um registro, lido por chave primária"""
+        row = self.db.execute(
+            select(
+                ReadingModel.id.label("registro_id"),
+                ReadingModel.total_paginas,
+                ReadingProgressModel.pagina_atual,
+                ReadingProgressModel.percentual,
+                ReadingProgressModel.atualizado_em
+            )
+            .outerjoin(ReadingProgressModel, ReadingProgressModel.registro_id == ReadingModel.id)
+            .where(ReadingModel.id == registro_id)
+        ).mappings().first()
+        return dict(row) if row else None
+    
+    def insert_logs(self, entries: List[tuple]) -> None:
+        """Grava um lote de (registro_id, pagina_atual, data_registro) com um executemany.
+        
+        O trigger trg_registros_progresso atualiza registro_progresso na mesma transação.
+        """
+        self.db.execute(INSERT_LOG, [
+            {"registro_id": registro_id, "pagina_atual": pagina_atual, "data_registro": data_registro}
+            for registro_id, pagina_atual, data_registro in entries
+        ])
@@ -0,0 +1,83 @@
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from infra.models.book import BookGenreModel, BookModel
+from infra.models.rating import BookRatingSummaryModel, RatingModel
+from infra.models.table_version import GenreRankingVersionModel, TableVersionModel
+from infra.repositories.book_repository import BOOK_SUMMARY_COLUMNS, genre_id, genres_column, split_genres
+
+RATING_COLUMNS = (
+    RatingModel.usuario_id,
+    RatingModel.livro_id,
+    RatingModel.nota,
+    RatingModel.descricao,
+    RatingModel.criado_em,
+)
+
+class RatingRepository:
+    """Repository para as notas dos usuários e o agregado por livro (livro_notas)"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def upsert(self, user_id: int, book_id: int, nota: float, descricao: Optional[str]) -> dict:
+        """Cria ou substitui a nota com um único INSERT ... ON CONFLICT ... RETURNING (sem commit).
+        
+        Os triggers de notas atualizam livro_notas e a versão das notas na mesma
+        transação; usuário ou livro inexistente propaga IntegrityError da chave estrangeira.
+        """
+        stmt = sqlite_insert(RatingModel).values(usuario_id=user_id, livro_id=book_id, nota=nota, descricao=descricao)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RatingModel.usuario_id, RatingModel.livro_id],
+            set_={"nota": stmt.excluded.nota, "descricao": stmt.excluded.descricao}
+        ).returning(*RATING_COLUMNS)
+        return dict(self.db.execute(stmt).mappings().one())
+    
+    def delete(self, user_id: int, book_id: int) -> bool:
+        """Remove a nota com um único DELETE (sem commit)"""
+        result = self.db.execute(
+            delete(RatingModel).where(RatingModel.usuario_id == user_id, RatingModel.livro_id == book_id)
+        )
+        return result.rowcount > 0
+    
+    def get_version(self) -> int:
+        """Versão das notas (muda a cada escrita), lida por chave primária"""
+        return self.db.scalar(
+            select(TableVersionModel.versao).where(TableVersionModel.tabela == RatingModel.__tablename__)
+        ) or 0
+    
+    def get_genre_version(self, genero: str) -> int:
+        """Versão das notas dos livros de um gênero (muda só com escritas que o afetam)"""
+        return self.db.scalar(
+            select(GenreRankingVersionModel.versao).where(GenreRankingVersionModel.genero_id == genre_id(genero))
+        ) or 0
+    
+    def get_top_rows(self, limit: int, min_avaliacoes: int, genero: Optional[str] = None) -> List[dict]:
+        """Livros com maior média, a partir do agregado pré-calculado.
+        
+        Com gênero, percorre idx_livro_genero_genero e lê livro_notas e livro pela
+        chave primária; sem gênero, varre só livro_notas. Nenhuma linha de notas é lida.
+        """
+        media = (BookRatingSummaryModel.soma / BookRatingSummaryModel.quantidade).label("media")
+        stmt = select(*BOOK_SUMMARY_COLUMNS, genres_column(), media, BookRatingSummaryModel.quantidade)
+        if genero is not None:
+            stmt = (
+                stmt.select_from(BookGenreModel)
+                .join(BookRatingSummaryModel, BookRatingSummaryModel.livro_id == BookGenreModel.livro_id)
+                .where(BookGenreModel.genero_id == genre_id(genero))
+            )
+        else:
+            stmt = stmt.select_from(BookRatingSummaryModel)
+        stmt = (
+            stmt.join(BookModel, BookModel.id == BookRatingSummaryModel.livro_id)
+            .where(BookRatingSummaryModel.quantidade >= min_avaliacoes)
+            .order_by(media.desc(), BookRatingSummaryModel.quantidade.desc(), BookRatingSummaryModel.livro_id)
+            .limit(limit)
+        )
+        rows = []
+        for row in self.db.execute(stmt).mappings():
+            item = split_genres(row)
+            item["media"] = round(item["media"], 2)
+            rows.append(item)
+        return rows
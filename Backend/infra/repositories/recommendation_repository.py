@@ -0,0 +1,26 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List
+from infra.models.book import BookModel
+from infra.models.recommendation import UserRecommendationModel
+from infra.repositories.book_repository import BOOK_SUMMARY_COLUMNS, genres_column, split_genres
+
+class RecommendationRepository:
+    """Repository para os candidatos de recomendação pré-calculados"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_user_recommendations(self, user_id: int, limit: int) -> List[dict]:
+        """Retorna os livros recomendados a um usuário, na ordem pré-calculada.
+        
+        Intervalo na chave primária (usuario_id, posicao) e leitura de cada livro por id.
+        """
+        stmt = (
+            select(*BOOK_SUMMARY_COLUMNS, genres_column(), UserRecommendationModel.score)
+            .join(BookModel, BookModel.id == UserRecommendationModel.livro_id)
+            .where(UserRecommendationModel.usuario_id == user_id)
+            .order_by(UserRecommendationModel.posicao)
+            .limit(limit)
+        )
+        return [split_genres(row) for row in self.db.execute(stmt).mappings()]
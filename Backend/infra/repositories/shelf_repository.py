@@ -0,0 +1,82 @@
+from sqlalchemy import Select, and_, func, select, union
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from infra.models.book import BookModel
+from infra.models.rating import RatingModel
+from infra.models.reading import ReadingModel, ReadingProgressModel
+from infra.models.tag import TagModel, UserBookTagModel
+from infra.repositories.book_repository import BOOK_SUMMARY_COLUMNS, genres_column, split_genres
+
+def tags_column(user_id: int):
+    """Tags do usuário para o livro, lidas pelo índice único (usuario_id, livro_id, tag_id)"""
+    return (
+        select(func.group_concat(TagModel.tag, "|"))
+        .select_from(UserBookTagModel)
+        .join(TagModel, TagModel.id == UserBookTagModel.tag_id)
+        .where(UserBookTagModel.usuario_id == user_id, UserBookTagModel.livro_id == BookModel.id)
+        .scalar_subquery()
+        .label("tags")
+    )
+
+def shelf_books(user_id: int, limit: int, after: Optional[int] = None, tag: Optional[str] = None) -> Select:
+    """Ids dos livros da página da estante: com registro, tag ou nota do usuário.
+    
+    Cada ramo é um intervalo em um índice que começa por (usuario_id, livro_id); o
+    UNION com ORDER BY/LIMIT intercala os ramos já ordenados e para no limite.
+    """
+    if tag is not None:
+        stmt = select(UserBookTagModel.livro_id).where(
+            UserBookTagModel.usuario_id == user_id,
+            UserBookTagModel.tag_id == select(TagModel.id).where(TagModel.tag == tag).scalar_subquery()
+        )
+        if after is not None:
+            stmt = stmt.where(UserBookTagModel.livro_id > after)
+        return stmt.order_by(UserBookTagModel.livro_id).limit(limit)
+    
+    branches = []
+    for model in (ReadingModel, UserBookTagModel, RatingModel):
+        branch = select(model.livro_id).where(model.usuario_id == user_id)
+        if after is not None:
+            branch = branch.where(model.livro_id > after)
+        branches.append(branch)
+    return union(*branches).order_by("livro_id").limit(limit)
+
+class ShelfRepository:
+    """Repository para a estante do usuário (registros, tags e notas por livro)"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_shelf_rows(self, user_id: int, limit: int, after: Optional[int] = None, tag: Optional[str] = None) -> List[dict]:
+        """Página da estante em uma única consulta, por keyset em livro_id.
+        
+        Só as linhas da página são completadas: livro e progresso atual
+        (registro_progresso) pela chave primária, nota e registro pelas chaves
+        únicas (usuario_id, livro_id), tags e gêneros por subconsultas em índices únicos.
+        """
+        estante = shelf_books(user_id, limit, after, tag).subquery("estante")
+        stmt = (
+            select(
+                *BOOK_SUMMARY_COLUMNS,
+                genres_column(),
+                tags_column(user_id),
+                RatingModel.nota,
+                ReadingModel.id.label("registro_id"),
+                ReadingModel.total_paginas,
+                ReadingProgressModel.pagina_atual,
+                ReadingProgressModel.percentual,
+                ReadingProgressModel.atualizado_em
+            )
+            .select_from(estante)
+            .join(BookModel, BookModel.id == estante.c.livro_id)
+            .outerjoin(RatingModel, and_(RatingModel.usuario_id == user_id, RatingModel.livro_id == estante.c.livro_id))
+            .outerjoin(ReadingModel, and_(ReadingModel.usuario_id == user_id, ReadingModel.livro_id == estante.c.livro_id))
+            .outerjoin(ReadingProgressModel, ReadingProgressModel.registro_id == ReadingModel.id)
+            .order_by(estante.c.livro_id)
+        )
+        rows = []
+        for row in self.db.execute(stmt).mappings():
+            item = split_genres(row)
+            item["tags"] = item["tags"].split("|") if item["tags"] else []
+            rows.append(item)
+        return rows
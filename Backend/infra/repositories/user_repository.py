@@ -1,8 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Float, Integer, Row, Select, delete, insert, literal, select, text, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from infra.models.table_version import TableVersionModel
 from infra.models.user import UserModel
 from core.domain.user import User
 
+# Colunas da resposta, selecionadas como tuplas sem montar objetos ORM
+USER_COLUMNS = (
+    UserModel.id,
+    UserModel.nome,
+    UserModel.email,
+    UserModel.filme_favorito,
+    UserModel.criado_em,
+    UserModel.versao,
+    UserModel.atualizado_em
+)
+
+def page_statement(limit: int, after: Optional[Tuple[datetime, int]] = None, columns: tuple = ()) -> Select:
+    """Monta a consulta keyset em (criado_em, id) decrescente"""
+    stmt = select(*columns) if columns else select(UserModel)
+    if after is not None:
+        criado_em, user_id = after
+        stmt = stmt.where(
+            tuple_(UserModel.criado_em, UserModel.id)
+            < tuple_(literal(criado_em, UserModel.criado_em.type), literal(user_id))
+        )
+    return stmt.order_by(UserModel.criado_em.desc(), UserModel.id.desc()).limit(limit)
+
 class UserRepository:
     """Repository para operações de banco de dados relacionadas a usuários"""
     
@@ -13,6 +40,34 @@ class UserRepository:
         """Retorna todos os usuários ordenados por data de criação"""
         return self.db.query(UserModel).order_by(UserModel.criado_em.desc()).all()
     
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[UserModel]:
+        """Retorna uma página de usuários por keyset em (criado_em, id) decrescente"""
+        return self.db.scalars(page_statement(limit, after)).all()
+    
+    def get_page_rows(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[dict]:
+        """Retorna uma página como dicionários de colunas, sem objetos ORM"""
+        result = self.db.execute(page_statement(limit, after, USER_COLUMNS))
+        return [dict(row) for row in result.mappings()]
+    
+    def get_row_by_id(self, user_id: int) -> Optional[dict]:
+        """Retorna as colunas de um usuário por ID, sem objeto ORM"""
+        row = self.db.execute(select(*USER_COLUMNS).where(UserModel.id == user_id)).mappings().first()
+        return dict(row) if row else None
+    
+    def get_rows_by_ids(self, user_ids: Iterable[int]) -> List[dict]:
+        """Retorna as colunas de vários usuários com uma única consulta IN (ordem não garantida)"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return []
+        result = self.db.execute(select(*USER_COLUMNS).where(UserModel.id.in_(user_ids)))
+        return [dict(row) for row in result.mappings()]
+    
+    def get_version(self) -> int:
+        """Versão da tabela de usuários (muda a cada escrita), lida por chave primária"""
+        return self.db.scalar(
+            select(TableVersionModel.versao).where(TableVersionModel.tabela == UserModel.__tablename__)
+        ) or 0
+    
     def get_by_id(self, user_id: int) -> Optional[UserModel]:
         """Retorna um usuário por ID"""
         return self.db.query(UserModel).filter(UserModel.id == user_id).first()
@@ -21,52 +76,119 @@ class UserRepository:
         """Retorna um usuário por email"""
         return self.db.query(UserModel).filter(UserModel.email == email).first()
     
-    def create(self, user: User) -> UserModel:
-        """Cria um novo usuário no banco de dados"""
-        db_user = UserModel(
-            nome=user.nome,
-            email=user.email,
-            filme_favorito=user.filme_favorito
+    def create(self, user: User) -> Optional[UserModel]:
+        """Cria um usuário com um único INSERT ... RETURNING.
+        
+        Retorna None quando o email já existe (ON CONFLICT DO NOTHING).
+        """
+        stmt = (
+            sqlite_insert(UserModel)
+            .values(nome=user.nome, email=user.email, filme_favorito=user.filme_favorito)
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel)
         )
-        self.db.add(db_user)
+        db_user = self.db.scalars(stmt).first()
         self.db.commit()
-        self.db.refresh(db_user)
         return db_user
     
-    def update(self, user_id: int, user: User) -> UserModel:
-        """Atualiza um usuário no banco de dados"""
-        db_user = self.get_by_id(user_id)
-        if not db_user:
-            raise ValueError("Usuário não encontrado")
+    def update(self, user_id: int, changes: dict) -> Optional[UserModel]:
+        """Atualiza campos com um único UPDATE ... RETURNING.
         
-        # Atualizar campos
-        db_user.nome = user.nome
-        db_user.email = user.email
-        db_user.filme_favorito = user.filme_favorito
+        Retorna None quando o usuário não existe; email duplicado propaga
+        IntegrityError da restrição UNIQUE.
+        """
+        if not changes:
+            return self.get_by_id(user_id)
         
-        self.db.commit()
-        self.db.refresh(db_user)
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**changes, versao=UserModel.versao + 1)
+            .returning(UserModel)
+        )
+        try:
+            db_user = self.db.scalars(stmt).first()
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
         return db_user
     
     def delete(self, user_id: int) -> bool:
-        """Remove um usuário do banco de dados"""
-        db_user = self.get_by_id(user_id)
-        if not db_user:
-            return False
-        
-        self.db.delete(db_user)
+        """Remove um usuário com um único DELETE"""
+        result = self.db.execute(delete(UserModel).where(UserModel.id == user_id))
         self.db.commit()
-        return True
+        return result.rowcount > 0
+    
+    def insert_row(self, values: dict) -> Optional[dict]:
+        """INSERT ... RETURNING sem commit; None quando o email já existe"""
+        stmt = (
+            sqlite_insert(UserModel)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(*USER_COLUMNS)
+        )
+        row = self.db.execute(stmt).mappings().first()
+        return dict(row) if row else None
+    
+    def update_row(self, user_id: int, changes: dict) -> Optional[dict]:
+        """UPDATE ... RETURNING sem commit; None quando o usuário não existe.
+        
+        Email duplicado propaga IntegrityError; o SQLite desfaz só a instrução,
+        a transação continua aberta.
+        """
+        if not changes:
+            return self.get_row_by_id(user_id)
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**changes, versao=UserModel.versao + 1)
+            .returning(*USER_COLUMNS)
+        )
+        row = self.db.execute(stmt).mappings().first()
+        return dict(row) if row else None
+    
+    def delete_row(self, user_id: int) -> bool:
+        """DELETE sem commit; indica se o usuário existia"""
+        return self.db.execute(delete(UserModel).where(UserModel.id == user_id)).rowcount > 0
     
     def email_exists(self, email: str) -> bool:
         """Verifica se um email já existe no banco"""
         return self.db.query(UserModel).filter(UserModel.email == email).first() is not None
     
-    def search_by_name(self, name: str) -> List[UserModel]:
-        """Busca usuários por nome (case insensitive)"""
-        return self.db.query(UserModel).filter(
-            UserModel.nome.ilike(f"%{name}%")
-        ).all()
+    def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Retorna, em uma única consulta, quais emails já estão cadastrados"""
+        emails = list(emails)
+        if not emails:
+            return set()
+        return set(self.db.scalars(select(UserModel.email).where(UserModel.email.in_(emails))))
+    
+    def bulk_insert(self, rows: List[dict]) -> None:
+        """Insere vários usuários com um único executemany (sem commit)"""
+        if rows:
+            self.db.execute(insert(UserModel), rows)
+    
+    def stream_all(self, batch_size: int = 1000) -> Iterator[Row]:
+        """Percorre todos os usuários pelo cursor, sem materializar a tabela"""
+        stmt = select(*USER_COLUMNS).order_by(UserModel.id).execution_options(stream_results=True, yield_per=batch_size)
+        yield from self.db.execute(stmt)
+    
+    def search(self, query: str, limit: int, after: Optional[Tuple[float, int]] = None) -> List[dict]:
+        """Busca textual (FTS5) em nome/email, ordenada por relevância BM25.
+        
+        `query` já deve estar na sintaxe FTS5; a paginação é por keyset em (score, id).
+        """
+        matches = text(
+            "SELECT rowid AS id, bm25(usuario_fts, 10.0, 1.0) AS score "
+            "FROM usuario_fts WHERE usuario_fts MATCH :query"
+        ).bindparams(query=query).columns(id=Integer, score=Float).subquery("matches")
+        
+        stmt = select(*USER_COLUMNS, matches.c.score).join(matches, matches.c.id == UserModel.id)
+        if after is not None:
+            score, user_id = after
+            stmt = stmt.where(tuple_(matches.c.score, matches.c.id) > tuple_(literal(score), literal(user_id)))
+        stmt = stmt.order_by(matches.c.score, matches.c.id).limit(limit)
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
     
     def count_users(self) -> int:
         """Retorna o total de usuários cadastrados"""
@@ -0,0 +1 @@
+# Testes de carga: servidor uvicorn em processo, carga mista em RPS fixo e baselines de latência
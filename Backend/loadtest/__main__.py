@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Teste de carga: sobe a API com uvicorn no próprio processo, aplica um mix de
+leituras, criações, atualizações e buscas em RPS fixo e reporta vazão e
+p50/p95/p99 por rota. Com uma baseline JSON, falha (código 1) em regressões e
+recusa (código 2) baselines gravadas com outra configuração de carga.
+
+Uso (a partir de Backend/):
+    python -m loadtest --mix misto --rps 100 --duration 20
+    python -m loadtest --mix misto --rps 100 --duration 20 --update-baseline
+    python -m loadtest --url http://localhost:8000 --rps 500   # servidor já rodando
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Banco isolado antes de importar config/engines (a menos que DATABASE_URL já esteja definido)
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/loadtest.db")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loadtest.baseline import (
+    compare,
+    config_mismatches,
+    environment,
+    environment_mismatches,
+    load_baseline,
+    save_baseline,
+)
+from loadtest.runner import format_report, run_load
+from loadtest.workload import MIXES
+
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mix", choices=sorted(MIXES), default="misto")
+    parser.add_argument("--rps", type=float, default=100)
+    parser.add_argument("--duration", type=float, default=20, help="Segundos de carga")
+    parser.add_argument("--warmup", type=float, default=2, help="Segundos de aquecimento (descartados)")
+    parser.add_argument("--users", type=int, default=10000, help="Usuários semeados")
+    parser.add_argument("--books", type=int, default=20000, help="Livros semeados")
+    parser.add_argument("--url", help="Usa um servidor já rodando em vez de subir um em processo")
+    parser.add_argument("--baseline", type=Path, help="JSON de baseline (padrão: loadtest/baselines/<mix>.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Grava o resultado como nova baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Piora relativa tolerada em p95/p99")
+    parser.add_argument("--json", type=Path, help="Também grava o resultado neste arquivo")
+    args = parser.parse_args()
+    
+    baseline_path = args.baseline or BASELINES_DIR / f"{args.mix}.json"
+    
+    async def drive(url: str) -> dict:
+        if args.warmup:
+            await run_load(url, args.mix, args.rps, args.warmup, args.users, seed=1)
+        return await run_load(url, args.mix, args.rps, args.duration, args.users)
+    
+    if args.url:
+        result = asyncio.run(drive(args.url))
+    else:
+        from infra.database import migrate_database
+        from infra.database.database import engine
+        from loadtest.server import InProcessServer
+        from loadtest.workload import seed
+        from main import app
+        
+        migrate_database()
+        seed(engine, args.users, args.books)
+        with InProcessServer(app) as server:
+            result = asyncio.run(drive(server.url))
+    
+    result["ambiente"] = environment(args.url)
+    print(format_report(result))
+    if args.json:
+        save_baseline(args.json, result)
+    
+    if args.update_baseline:
+        save_baseline(baseline_path, result)
+        print(f"\nBaseline gravada em {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"\nSem baseline em {baseline_path}; use --update-baseline para criar uma")
+        return 0
+    
+    baseline = load_baseline(baseline_path)
+    mismatches = config_mismatches(baseline, result)
+    if mismatches:
+        # Outra carga (rps, duração, usuários ou mix): percentis e vazão não são comparáveis
+        print(f"\n❌ Baseline {baseline_path} gravada com outra configuração; nada foi comparado:")
+        for mismatch in mismatches:
+            print(f"  - {mismatch}")
+        return 2
+    warnings = environment_mismatches(baseline, result)
+    if warnings:
+        print(f"\n⚠️  ATENÇÃO: baseline {baseline_path} gravada em outro ambiente; regressões podem ser falsas:")
+        for warning in warnings:
+            print(f"  - {warning}")
+    
+    regressions = compare(baseline, result, args.threshold)
+    if regressions:
+        print("\n❌ Regressões de latência:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("\n✅ Sem regressões frente à baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import json
+import os
+import platform
+import sqlite3
+from pathlib import Path
+from typing import List, Optional
+
+# Parâmetros da carga que precisam bater para a comparação fazer sentido
+CONFIG_KEYS = ("mix", "rps", "duracao", "usuarios")
+# Máquina: latências de outro host/CPU não são comparáveis
+ENVIRONMENT_KEYS = ("host", "cpu", "cpus", "servidor")
+
+def cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+def environment(url: Optional[str] = None) -> dict:
+    """Ambiente em que a carga rodou, gravado junto com o resultado"""
+    return {
+        "host": platform.node(),
+        "cpu": cpu_model(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "servidor": url or "em processo",
+    }
+
+def save_baseline(path: Path, result: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+def load_baseline(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+def config_mismatches(baseline: dict, result: dict) -> List[str]:
+    """Parâmetros de carga diferentes dos da baseline (lista vazia = comparável)"""
+    return [
+        f"{key}: baseline {baseline['config'].get(key)!r}, execução {result['config'].get(key)!r}"
+        for key in CONFIG_KEYS
+        if baseline["config"].get(key) != result["config"].get(key)
+    ]
+
+def environment_mismatches(baseline: dict, result: dict) -> List[str]:
+    """Diferenças de máquina entre a baseline e a execução"""
+    if "ambiente" not in baseline:
+        return ["baseline sem ambiente registrado (regrave com --update-baseline)"]
+    return [
+        f"{key}: baseline {baseline['ambiente'].get(key)!r}, execução {result.get('ambiente', {}).get(key)!r}"
+        for key in ENVIRONMENT_KEYS
+        if baseline["ambiente"].get(key) != result.get("ambiente", {}).get(key)
+    ]
+
+def compare(baseline: dict, result: dict, threshold: float = 0.25, min_delta_ms: float = 2.0,
+            max_error_rate: float = 0.01) -> List[str]:
+    """Regressões do resultado frente à baseline (lista vazia = ok).
+    
+    Uma rota regride quando p95 ou p99 passa de (1 + threshold) × baseline e a
+    diferença absoluta passa de `min_delta_ms` (evita falso alarme em rotas de
+    poucos milissegundos), ou quando a taxa de erros passa de `max_error_rate`.
+    """
+    regressions = []
+    for route, current in result["rotas"].items():
+        if current["requisicoes"] and current["erros"] / current["requisicoes"] > max_error_rate:
+            regressions.append(f"{route}: {current['erros']} erros em {current['requisicoes']} requisições")
+        previous = baseline["rotas"].get(route)
+        if previous is None:
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            before, after = previous[metric], current[metric]
+            if after > before * (1 + threshold) and after - before > min_delta_ms:
+                regressions.append(f"{route}: {metric} {before:.2f} -> {after:.2f} ms (+{(after / before - 1) * 100:.0f}%)")
+    config = result["config"]
+    expected = config["rps"] * config["duracao"]
+    if result["total"]["requisicoes"] < expected * 0.95:
+        regressions.append(f"vazão: {result['total']['requisicoes']} de {expected:.0f} requisições concluídas")
+    return regressions
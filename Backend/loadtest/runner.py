@@ -0,0 +1,82 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List
+import httpx
+import numpy as np
+from loadtest.workload import pick_operations
+
+async def run_load(base_url: str, mix: str, rps: float, duration: float, users: int,
+                   max_in_flight: int = 256, seed: int = 0) -> dict:
+    """Carga em malha aberta: requisições agendadas em RPS fixo, independente das respostas.
+    
+    A latência conta a partir do horário agendado (não do envio), então filas no
+    servidor ou no cliente aparecem nos percentis em vez de reduzir a carga.
+    """
+    rng = random.Random(seed)
+    operations, weights = pick_operations(mix)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    total = int(rps * duration)
+    semaphore = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+    
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def send(operation, scheduled: float):
+            method, path, body = operation.build(rng, users)
+            async with semaphore:
+                try:
+                    response = await client.request(method, path, json=body)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+            latencies[operation.route].append(time.perf_counter() - scheduled)
+            if failed:
+                errors[operation.route] += 1
+        
+        tasks = []
+        start = time.perf_counter()
+        for i in range(total):
+            scheduled = start + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            operation = rng.choices(operations, weights)[0]
+            tasks.append(asyncio.create_task(send(operation, scheduled)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+    
+    return summarize(latencies, errors, elapsed, {"mix": mix, "rps": rps, "duracao": duration, "usuarios": users})
+
+def summarize(latencies: Dict[str, List[float]], errors: Dict[str, int], elapsed: float, config: dict) -> dict:
+    """Vazão e p50/p95/p99 (ms) por rota e no total"""
+    def stats(samples: List[float], route_errors: int) -> dict:
+        values = np.array(samples) * 1000
+        p50, p95, p99 = np.percentile(values, [50, 95, 99]) if len(values) else (0.0, 0.0, 0.0)
+        return {
+            "requisicoes": len(values),
+            "erros": route_errors,
+            "rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+        }
+    
+    routes = {route: stats(samples, errors.get(route, 0)) for route, samples in sorted(latencies.items())}
+    every = [sample for samples in latencies.values() for sample in samples]
+    return {
+        "config": config,
+        "total": stats(every, sum(errors.values())),
+        "rotas": routes,
+    }
+
+def format_report(result: dict) -> str:
+    """Tabela de texto com os resultados por rota"""
+    lines = [f"{'rota':<26}{'req':>7}{'erros':>7}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for route, stats in list(result["rotas"].items()) + [("TOTAL", result["total"])]:
+        lines.append(
+            f"{route:<26}{stats['requisicoes']:>7}{stats['erros']:>7}{stats['rps']:>9.1f}"
+            f"{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
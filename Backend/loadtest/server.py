@@ -0,0 +1,38 @@
+import socket
+import threading
+import time
+import uvicorn
+
+def free_port() -> int:
+    """Porta TCP livre em 127.0.0.1"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class InProcessServer:
+    """Sobe a aplicação com uvicorn em uma thread do próprio processo"""
+    
+    def __init__(self, app, port: int = 0):
+        self.port = port or free_port()
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning", access_log=False)
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 30
+        while not self.server.started:
+            if not self.thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Servidor uvicorn não iniciou")
+            time.sleep(0.01)
+        return self
+    
+    def __exit__(self, *exc):
+        # Dispara o shutdown do lifespan (drena buffers, fecha engines)
+        self.server.should_exit = True
+        self.thread.join(timeout=30)
@@ -0,0 +1,88 @@
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from infra.repositories.user_repository import UserRepository
+
+@dataclass
+class Operation:
+    """Uma rota do mix de carga; `build` gera (método, caminho, corpo) de cada requisição"""
+    route: str
+    weight: int
+    build: Callable[[random.Random, int], Tuple[str, str, Optional[dict]]]
+
+TERMOS_USUARIO = ["ana", "joao", "maria", "silva", "souza", "pedro", "lima"]
+TERMOS_LIVRO = ["dragon", "love", "history", "war", "magic", "space"]
+GENEROS = ["Fantasia", "Romance", "Terror", "Ficção"]
+
+def _user_id(rng: random.Random, users: int) -> int:
+    return rng.randint(1, users)
+
+OPERATIONS: List[Operation] = [
+    Operation("GET /api/users", 15, lambda rng, n: ("GET", "/api/users/?limit=20", None)),
+    Operation("GET /api/users/{id}", 30, lambda rng, n: ("GET", f"/api/users/{_user_id(rng, n)}", None)),
+    Operation("GET /api/users/search", 10, lambda rng, n: (
+        "GET", f"/api/users/search?q={rng.choice(TERMOS_USUARIO)}&limit=20", None
+    )),
+    Operation("POST /api/users", 10, lambda rng, n: (
+        "POST", "/api/users/", {"nome": "Carga", "email": f"carga-{uuid.uuid4().hex}@email.com"}
+    )),
+    Operation("PUT /api/users/{id}", 10, lambda rng, n: (
+        "PUT", f"/api/users/{_user_id(rng, n)}", {"filme_favorito": f"Filme {rng.randint(1, 1000)}"}
+    )),
+    Operation("GET /api/books", 15, lambda rng, n: (
+        "GET", f"/api/books/?limit=20&genero={rng.choice(GENEROS)}", None
+    )),
+    Operation("GET /api/books/search", 10, lambda rng, n: (
+        "GET", f"/api/books/search?q={rng.choice(TERMOS_LIVRO)}&limit=20", None
+    )),
+]
+
+MIXES: Dict[str, Dict[str, int]] = {
+    # Pesos por rota; "leitura" é o perfil do app móvel, "escrita" estressa o writer único
+    "misto": {operation.route: operation.weight for operation in OPERATIONS},
+    "leitura": {"GET /api/users/{id}": 40, "GET /api/books": 40, "GET /api/books/search": 20},
+    "escrita": {"POST /api/users": 50, "PUT /api/users/{id}": 50},
+}
+
+def pick_operations(mix: str) -> Tuple[List[Operation], List[int]]:
+    """Operações e pesos de um mix nomeado"""
+    weights = MIXES[mix]
+    operations = [operation for operation in OPERATIONS if operation.route in weights]
+    return operations, [weights[operation.route] for operation in operations]
+
+def seed(engine, users: int, books: int, seed: int = 0) -> None:
+    """Popula usuários, livros e gêneros sintéticos para as rotas de leitura"""
+    rng = random.Random(seed)
+    nomes = ["Ana", "João", "Maria", "Pedro", "Carla", "Lucas"]
+    sobrenomes = ["Silva", "Souza", "Lima", "Costa", "Pereira"]
+    palavras = TERMOS_LIVRO + [f"palavra{i}" for i in range(200)]
+    with Session(engine) as db:
+        UserRepository(db).bulk_insert([
+            {"nome": f"{rng.choice(nomes)} {rng.choice(sobrenomes)}", "email": f"usuario{i}@email.com", "filme_favorito": "Matrix"}
+            for i in range(users)
+        ])
+        db.commit()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO livro (volume_id, nome, autores, descricao, classificacao_indicativa, public_domain) "
+                "VALUES (:volume_id, :nome, :autores, :descricao, 'L', 0)"
+            ),
+            [
+                {
+                    "volume_id": f"carga{i}",
+                    "nome": " ".join(rng.choices(palavras, k=3)),
+                    "autores": f"Autor {rng.randint(1, 500)}",
+                    "descricao": " ".join(rng.choices(palavras, k=40)),
+                }
+                for i in range(books)
+            ]
+        )
+        conn.execute(text(
+            "INSERT INTO livro_genero (livro_id, genero_id) "
+            "SELECT l.id, g.id FROM livro l JOIN genero g ON g.id = 1 + (l.id % (SELECT count(*) FROM genero)) "
+            "WHERE l.volume_id LIKE 'carga%'"
+        ))
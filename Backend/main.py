@@ -1,17 +1,48 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from config import settings
-from infra.database import create_tables
+from infra.database import migrate_database
+from infra.cache import user_cache
+from infra.covers import cover_cache
+from infra.ingestion import progress_buffer
+from infra.metrics import loop_monitor, multiprocess_collector, render_metrics
+from infra.database.async_database import async_engine, async_reader_engine
 from api.routes.user_routes import router as user_router
+from api.routes.async_user_routes import router as async_user_router
+from api.routes.user_bulk_routes import router as user_bulk_router
+from api.routes.user_search_routes import router as user_search_router
+from api.routes.book_routes import router as book_router
+from api.routes.recommendation_routes import router as recommendation_router
+from api.routes.progress_routes import router as progress_router
+from api.routes.shelf_routes import router as shelf_router
+from api.routes.rating_routes import router as rating_router
+from api.routes.cover_routes import router as cover_router
+from api.routes.health_routes import router as health_router
+from api.middleware import MetricsMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events para a aplicação"""
     # Startup
-    create_tables()
+    migrate_database()
+    await progress_buffer.start()
+    if settings.METRICS_ENABLED:
+        loop_monitor.start()
+        if multiprocess_collector is not None:
+            multiprocess_collector.start()
+    app.state.ready = True
     yield
-    # Shutdown (se necessário)
+    # Shutdown: sai do balanceamento e grava o progresso pendente antes de fechar as conexões
+    app.state.ready = False
+    await loop_monitor.stop()
+    if multiprocess_collector is not None:
+        await multiprocess_collector.stop()
+    await progress_buffer.stop()
+    await cover_cache.close()
+    await async_engine.dispose()
+    await async_reader_engine.dispose()
 
 # Criar aplicação FastAPI
 app = FastAPI(
@@ -30,6 +61,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 @app.get("/")
 def home():
     return {
@@ -38,12 +72,28 @@ def home():
         "docs": "/docs"
     }
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+@app.get("/cache/stats")
+def cache_stats():
+    """Contadores do cache de usuários deste processo"""
+    return user_cache.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Métricas no formato texto do Prometheus (somadas entre workers com METRICS_MULTIPROC_DIR)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
-# Incluir routers
-app.include_router(user_router)
+# Incluir routers; rotas fixas antes de /api/users/{user_id}
+app.include_router(health_router)
+app.include_router(user_bulk_router)
+app.include_router(user_search_router)
+app.include_router(recommendation_router)
+app.include_router(shelf_router)
+app.include_router(rating_router)
+app.include_router(cover_router)
+# Rotas assíncronas por padrão; USE_ASYNC_DB=False volta ao caminho síncrono
+app.include_router(async_user_router if settings.USE_ASYNC_DB else user_router)
+app.include_router(book_router)
+app.include_router(progress_router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Servidor de produção pré-fork: um processo mestre aquece a aplicação e abre o
+socket, depois cria N workers uvicorn que aceitam conexões no mesmo socket.
+
+Uso (a partir de Backend/):
+    python serve.py                      # um worker por CPU em 0.0.0.0:8000
+    python serve.py --workers 4 --port 8080
+
+Sinais para o mestre:
+    SIGHUP          reinício gradual: troca um worker por vez, só derrubando o
+                    antigo depois que o novo estiver pronto
+    SIGTERM/SIGINT  desligamento gracioso de todos os workers
+
+Cada worker tem seu readiness em GET /health/ready.
+"""
+
+import argparse
+import logging
+import os
+import select
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+logger = logging.getLogger("bookshelf.serve")
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", 0)),
+        help="Quantidade de workers (padrão: WEB_CONCURRENCY ou um por CPU)"
+    )
+    parser.add_argument("--graceful-timeout", type=float, default=30, help="Segundos para um worker drenar ao sair")
+    parser.add_argument("--ready-timeout", type=float, default=60, help="Segundos para um worker novo ficar pronto")
+    parser.add_argument("--prime-mb", type=int, default=256, help="MiB do arquivo do banco lidos para o page cache (0 desliga)")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    args.workers = args.workers or os.cpu_count() or 1
+    return args
+
+def prime_page_cache(path: Path, limit_bytes: int) -> int:
+    """Lê o início do arquivo do banco para o page cache do SO, compartilhado por todos os workers"""
+    if limit_bytes <= 0 or not path.exists():
+        return 0
+    total = 0
+    with open(path, "rb", buffering=0) as file:
+        while total < limit_bytes:
+            chunk = file.read(min(1 << 20, limit_bytes - total))
+            if not chunk:
+                break
+            total += len(chunk)
+    return total
+
+def warmup(app, prime_bytes: int) -> None:
+    """Trabalho feito uma vez no mestre e herdado pelos workers via fork (copy-on-write)"""
+    from config import settings
+    from infra.database import migrate_database
+    from infra.recommendations import similar_books_index
+    
+    start = time.perf_counter()
+    version = migrate_database()
+    # Gera (e guarda em cache) o OpenAPI: monta os JSON schemas de todos os modelos pydantic
+    app.openapi()
+    # Abre os memmaps e o índice de posições dos livros similares, se construídos
+    similar_books_index.available
+    primed = prime_page_cache(Path(settings.DATABASE_URL.replace("sqlite:///", "")), prime_bytes)
+    dispose_engines(close=True)
+    logger.info(
+        "Aquecimento em %.2fs (esquema v%d, %.0f MiB no page cache)",
+        time.perf_counter() - start, version, primed / (1 << 20)
+    )
+
+def prepare_metrics_dir(workers: int) -> Optional[str]:
+    """Diretório compartilhado das métricas (cada scrape cai em um worker qualquer).
+    
+    Com mais de um worker e sem METRICS_MULTIPROC_DIR, cria um temporário e
+    retorna o caminho para ser removido ao encerrar; um diretório configurado tem
+    os snapshots de execuções anteriores apagados e é mantido.
+    """
+    configured = os.environ.get("METRICS_MULTIPROC_DIR")
+    if configured:
+        for stale in Path(configured).glob("*.json"):
+            stale.unlink()
+        return None
+    if workers <= 1:
+        return None
+    path = tempfile.mkdtemp(prefix="bookshelf-metrics-")
+    os.environ["METRICS_MULTIPROC_DIR"] = path
+    return path
+
+def dispose_engines(close: bool) -> None:
+    """Esvazia os pools; no filho (close=False) descarta sem fechar as conexões do pai"""
+    from infra.database.async_database import async_engine, async_reader_engine
+    from infra.database.database import engine, reader_engine
+    for target in {engine, reader_engine, async_engine.sync_engine, async_reader_engine.sync_engine}:
+        target.dispose(close=close)
+
+def run_worker(app, sock: socket.socket, worker_id: int, ready_fd: int, args: argparse.Namespace) -> None:
+    """Corpo do processo filho: pools novos, uvicorn no socket herdado e aviso de pronto ao mestre"""
+    import uvicorn
+    
+    os.environ["BOOKSHELF_WORKER_ID"] = str(worker_id)
+    for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+        signal.signal(signum, signal.SIG_DFL)
+    # Conexões SQLite não podem atravessar o fork: cada worker abre as suas
+    dispose_engines(close=False)
+    
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        log_level=args.log_level,
+        access_log=False,
+        timeout_graceful_shutdown=args.graceful_timeout
+    ))
+    
+    def notify_ready():
+        while not server.started and not server.should_exit:
+            time.sleep(0.01)
+        if server.started:
+            os.write(ready_fd, b"1")
+        os.close(ready_fd)
+    
+    threading.Thread(target=notify_ready, daemon=True).start()
+    server.run(sockets=[sock])
+
+class Arbiter:
+    """Mestre pré-fork: mantém N workers vivos e faz reinícios graduais"""
+    
+    # Espera entre tentativas de recriar um worker que não fica pronto (dobra a cada falha)
+    RESPAWN_BACKOFF = 1.0
+    RESPAWN_BACKOFF_MAX = 60.0
+    
+    def __init__(self, app, sock: socket.socket, args: argparse.Namespace):
+        self.app = app
+        self.sock = sock
+        self.args = args
+        self.workers: Dict[int, int] = {}  # worker_id -> pid
+        # Workers a recriar: worker_id -> (próxima tentativa em time.monotonic(), falhas seguidas)
+        self.pending: Dict[int, Tuple[float, int]] = {}
+        self.stopping = False
+        self.reload_requested = False
+    
+    def spawn(self, worker_id: int) -> Tuple[int, int]:
+        """Cria um worker e retorna (pid, descritor de leitura do aviso de pronto)"""
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            try:
+                run_worker(self.app, self.sock, worker_id, ready_w, self.args)
+            finally:
+                os._exit(0)
+        os.close(ready_w)
+        return pid, ready_r
+    
+    def wait_ready(self, pid: int, ready_r: int) -> bool:
+        try:
+            readable, _, _ = select.select([ready_r], [], [], self.args.ready_timeout)
+            return bool(readable) and os.read(ready_r, 1) == b"1"
+        finally:
+            os.close(ready_r)
+    
+    def stop_worker(self, pid: int) -> None:
+        """SIGTERM (uvicorn para de aceitar, drena e roda o shutdown do lifespan); SIGKILL no limite"""
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while time.monotonic() < deadline:
+            if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                return
+            time.sleep(0.05)
+        logger.warning("Worker %d não saiu a tempo; SIGKILL", pid)
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+    
+    def start_worker(self, worker_id: int) -> Optional[int]:
+        pid, ready_r = self.spawn(worker_id)
+        if self.wait_ready(pid, ready_r):
+            self.workers[worker_id] = pid
+            logger.info("Worker %d pronto (pid %d)", worker_id, pid)
+            return pid
+        logger.error("Worker %d (pid %d) não ficou pronto", worker_id, pid)
+        self.stop_worker(pid)
+        return None
+    
+    def respawn(self, worker_id: int) -> None:
+        """Tenta (re)criar um worker; se não ficar pronto, reagenda com espera exponencial"""
+        if self.start_worker(worker_id) is not None:
+            self.pending.pop(worker_id, None)
+            return
+        _, failures = self.pending.get(worker_id, (0.0, 0))
+        delay = min(self.RESPAWN_BACKOFF * 2 ** failures, self.RESPAWN_BACKOFF_MAX)
+        self.pending[worker_id] = (time.monotonic() + delay, failures + 1)
+        logger.warning("Worker %d será recriado em %.0fs (falha %d)", worker_id, delay, failures + 1)
+    
+    def respawn_pending(self) -> None:
+        """Recria os workers pendentes cujo tempo de espera já passou"""
+        now = time.monotonic()
+        for worker_id, (retry_at, _) in sorted(self.pending.items()):
+            if self.stopping:
+                return
+            if retry_at <= now:
+                self.respawn(worker_id)
+    
+    def rolling_restart(self) -> None:
+        """Troca um worker por vez; o antigo só sai depois que o substituto está pronto"""
+        logger.info("Reinício gradual de %d workers", len(self.workers))
+        for worker_id, old_pid in sorted(self.workers.items()):
+            if self.stopping:
+                return
+            if self.start_worker(worker_id) is None:
+                # Mantém o antigo atendendo e interrompe a rodada
+                self.workers[worker_id] = old_pid
+                logger.error("Reinício gradual interrompido no worker %d", worker_id)
+                return
+            self.stop_worker(old_pid)
+    
+    def reap(self) -> None:
+        """Agenda a recriação de workers que morreram inesperadamente"""
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            for worker_id, worker_pid in list(self.workers.items()):
+                if worker_pid == pid and not self.stopping:
+                    logger.warning("Worker %d (pid %d) saiu; recriando", worker_id, pid)
+                    del self.workers[worker_id]
+                    self.pending.setdefault(worker_id, (0.0, 0))
+    
+    def run(self) -> None:
+        signal.signal(signal.SIGHUP, lambda *_: setattr(self, "reload_requested", True))
+        signal.signal(signal.SIGTERM, lambda *_: setattr(self, "stopping", True))
+        signal.signal(signal.SIGINT, lambda *_: setattr(self, "stopping", True))
+        
+        for worker_id in range(self.args.workers):
+            self.respawn(worker_id)
+        logger.info("Atendendo em http://%s:%d com %d workers", self.args.host, self.args.port, len(self.workers))
+        
+        while not self.stopping:
+            if self.reload_requested:
+                self.reload_requested = False
+                self.rolling_restart()
+            self.reap()
+            self.respawn_pending()
+            time.sleep(0.2)
+        
+        logger.info("Encerrando %d workers", len(self.workers))
+        for pid in self.workers.values():
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.workers.values():
+            self.stop_worker(pid)
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s [%(process)d] %(levelname)s %(message)s")
+    # Pools com nome (writer/reader) logariam cada dispose/recriação em INFO
+    logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
+    if args.workers > 1:
+        # O cache de usuários é por processo: sem invalidação entre workers, fica
+        # desligado salvo configuração explícita (ex.: um backend compartilhado)
+        os.environ.setdefault("USER_CACHE_ENABLED", "False")
+        # O buffer de progresso também: outro worker não enxerga os pendentes e
+        # leria uma página anterior até o próximo flush
+        os.environ.setdefault("PROGRESS_BUFFER_ENABLED", "False")
+    metrics_dir = prepare_metrics_dir(args.workers)
+    
+    from main import app
+    
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((args.host, args.port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    
+    warmup(app, args.prime_mb << 20)
+    try:
+        Arbiter(app, sock, args).run()
+    finally:
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
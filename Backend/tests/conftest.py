@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Banco temporário antes de importar config/engines
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bookshelf_test.db")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from infra.cache import user_cache
+from infra.ingestion import progress_buffer
+from infra.database import migrate_database
+from infra.database.database import engine, reader_engine
+from infra.database.async_database import async_engine, async_reader_engine
+from api.routes.user_routes import router as user_router
+from api.routes.async_user_routes import router as async_user_router
+from api.routes.user_search_routes import router as user_search_router
+from api.routes.book_routes import router as book_router
+from api.routes.recommendation_routes import router as recommendation_router
+from api.routes.progress_routes import router as progress_router
+
+ENGINES = {engine, reader_engine, async_engine.sync_engine, async_reader_engine.sync_engine}
+
+class QueryCounter:
+    """Registra as instruções SQL emitidas pela aplicação (PRAGMAs ignorados)"""
+    
+    def __init__(self):
+        self.statements = []
+    
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith("PRAGMA"):
+            self.statements.append(statement)
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+    
+    def reset(self) -> None:
+        self.statements.clear()
+
+@pytest.fixture
+def queries():
+    counter = QueryCounter()
+    for target in ENGINES:
+        event.listen(target, "before_cursor_execute", counter)
+    yield counter
+    for target in ENGINES:
+        event.remove(target, "before_cursor_execute", counter)
+
+@pytest.fixture(autouse=True)
+def clean_database():
+    migrate_database()
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM registro_progresso"))
+        conn.execute(text("DELETE FROM registros"))
+        conn.execute(text("DELETE FROM registro"))
+        conn.execute(text("DELETE FROM recomendacao_usuario"))
+        conn.execute(text("DELETE FROM notas"))
+        conn.execute(text("DELETE FROM tag_usuario_livro"))
+        conn.execute(text("DELETE FROM usuario"))
+        conn.execute(text("DELETE FROM livro_genero"))
+        conn.execute(text("DELETE FROM livro"))
+    user_cache.clear()
+    yield
+
+@pytest.fixture(params=["async", "sync"])
+def client(request):
+    """Cliente HTTP para as rotas de usuário nos caminhos assíncrono e síncrono"""
+    app = FastAPI()
+    app.include_router(user_search_router)
+    app.include_router(async_user_router if request.param == "async" else user_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def book_client():
+    """Cliente HTTP para as rotas do catálogo de livros e recomendações"""
+    app = FastAPI()
+    app.include_router(book_router)
+    app.include_router(recommendation_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def progress_client():
+    """Cliente HTTP para as rotas de progresso, com o flusher do buffer rodando"""
+    @asynccontextmanager
+    async def lifespan(app):
+        await progress_buffer.start()
+        yield
+        await progress_buffer.stop()
+    
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(progress_router)
+    with TestClient(app) as test_client:
+        yield test_client
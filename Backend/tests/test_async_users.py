@@ -0,0 +1,50 @@
+"""Caminho assíncrono (AsyncSession + aiosqlite) e síncrono das rotas de usuário"""
+import inspect
+import pytest
+from fastapi import HTTPException, status
+from api.routes.async_user_routes import router as async_user_router
+from config import settings
+from infra.repositories.async_user_repository import AsyncUserRepository
+from infra.repositories.user_repository import UserRepository
+
+def test_async_routes_do_not_use_the_threadpool():
+    # Endpoints síncronos ocupariam uma thread do pool durante o I/O do SQLite
+    assert all(inspect.iscoroutinefunction(route.endpoint) for route in async_user_router.routes)
+
+def test_crud_round_trip(client):
+    created = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com", "filme_favorito": "Up"})
+    assert created.status_code == 201
+    user_id = created.json()["id"]
+    
+    assert client.get(f"/api/users/{user_id}").json()["filme_favorito"] == "Up"
+    assert client.put(f"/api/users/{user_id}", json={"nome": "Ana Maria"}).json()["nome"] == "Ana Maria"
+    assert client.delete(f"/api/users/{user_id}").status_code == 204
+    assert client.get(f"/api/users/{user_id}").status_code == 404
+
+def test_business_errors_keep_their_status(client):
+    client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"})
+    
+    assert client.post("/api/users/", json={"nome": "Bia", "email": "ana@email.com"}).status_code == 400
+    assert client.put("/api/users/999", json={"nome": "Bia"}).status_code == 404
+    assert client.delete("/api/users/999").status_code == 404
+
+def conflict(*args, **kwargs):
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Usuário em uso")
+
+async def async_conflict(*args, **kwargs):
+    conflict()
+
+@pytest.mark.parametrize("method", ["update", "delete"])
+def test_http_errors_raised_inside_the_service_are_not_turned_into_500(client, monkeypatch, method):
+    monkeypatch.setattr(settings, "USER_CACHE_ENABLED", False)
+    monkeypatch.setattr(UserRepository, method, conflict)
+    monkeypatch.setattr(AsyncUserRepository, method, async_conflict)
+    user_id = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()["id"]
+    
+    if method == "update":
+        response = client.put(f"/api/users/{user_id}", json={"nome": "Bia"})
+    else:
+        response = client.delete(f"/api/users/{user_id}")
+    
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Usuário em uso"
@@ -0,0 +1,144 @@
+"""Catálogo de livros: paginação keyset, filtros por gênero/classificação e busca FTS5"""
+from sqlalchemy import text
+from infra.database.database import engine
+
+BOOKS = [
+    # (id, nome, autores, descricao, classificacao, generos)
+    (1, "O Senhor dos Anéis", "J. R. R. Tolkien", "Uma jornada épica pela Terra-média.", "12", ["Fantasia", "Aventura"]),
+    (2, "Drácula", "Bram Stoker", "O conde vampiro da Transilvânia.", "16", ["Terror"]),
+    (3, "O Hobbit", "J. R. R. Tolkien", "Bilbo parte em uma aventura com anões.", "10", ["Fantasia"]),
+    (4, "Orgulho e Preconceito", "Jane Austen", "Romance clássico na Inglaterra rural.", "L", ["Romance"]),
+    (5, "It", "Stephen King", "Um palhaço aterroriza Derry; cita Tolkien de passagem.", "18", ["Terror", "Suspense"]),
+]
+
+def seed():
+    with engine.begin() as conn:
+        for book_id, nome, autores, descricao, classificacao, generos in BOOKS:
+            conn.execute(
+                text(
+                    "INSERT INTO livro (id, volume_id, nome, autores, descricao, classificacao_indicativa, public_domain) "
+                    "VALUES (:id, :volume_id, :nome, :autores, :descricao, :classificacao, 0)"
+                ),
+                {"id": book_id, "volume_id": f"vol{book_id}", "nome": nome, "autores": autores,
+                 "descricao": descricao, "classificacao": classificacao}
+            )
+            for genero in generos:
+                conn.execute(
+                    text("INSERT INTO livro_genero (livro_id, genero_id) SELECT :id, id FROM genero WHERE genero = :genero"),
+                    {"id": book_id, "genero": genero}
+                )
+
+def ids(response):
+    assert response.status_code == 200, response.text
+    return [book["id"] for book in response.json()["items"]]
+
+def test_list_paginates_by_id(book_client):
+    seed()
+    
+    first = book_client.get("/api/books/", params={"limit": 2}).json()
+    second = book_client.get("/api/books/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    third = book_client.get("/api/books/", params={"limit": 2, "cursor": second["next_cursor"]}).json()
+    
+    assert [book["id"] for book in first["items"] + second["items"] + third["items"]] == [1, 2, 3, 4, 5]
+    assert third["next_cursor"] is None
+    assert sorted(first["items"][0]["generos"]) == ["Aventura", "Fantasia"]
+    assert "descricao" not in first["items"][0]
+
+def test_list_filters_by_genre_and_rating(book_client):
+    seed()
+    
+    assert ids(book_client.get("/api/books/", params={"genero": "terror"})) == [2, 5]
+    assert ids(book_client.get("/api/books/", params={"classificacao": ["10", "12"]})) == [1, 3]
+    assert ids(book_client.get("/api/books/", params={"genero": "Fantasia", "classificacao": "10"})) == [3]
+    
+    page = book_client.get("/api/books/", params={"genero": "Terror", "limit": 1}).json()
+    rest = book_client.get("/api/books/", params={"genero": "Terror", "limit": 1, "cursor": page["next_cursor"]})
+    assert ids(rest) == [5]
+
+def test_invalid_filters_are_rejected(book_client):
+    assert book_client.get("/api/books/", params={"genero": "Culinária"}).status_code == 400
+    assert book_client.get("/api/books/", params={"classificacao": "21"}).status_code == 400
+    assert book_client.get("/api/books/", params={"cursor": "???"}).status_code == 400
+
+def test_genre_filter_uses_covering_index():
+    seed()
+    with engine.connect() as conn:
+        plan = " ".join(
+            row[-1] for row in conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT lg.livro_id FROM livro_genero lg "
+                "WHERE lg.genero_id = 1 AND lg.livro_id > 0 ORDER BY lg.livro_id"
+            ))
+        )
+    assert "COVERING INDEX idx_livro_genero_genero" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_search_ranks_title_and_authors_above_description(book_client):
+    seed()
+    
+    # Tolkien como autor pesa mais que a menção na descrição
+    assert ids(book_client.get("/api/books/search", params={"q": "tolk"}))[-1] == 5
+    assert ids(book_client.get("/api/books/search", params={"q": "tolkien", "genero": "Terror"})) == [5]
+    assert ids(book_client.get("/api/books/search", params={"q": "aneis"})) == [1]
+    
+    first = book_client.get("/api/books/search", params={"q": "tolkien", "limit": 2}).json()
+    rest = book_client.get("/api/books/search", params={"q": "tolkien", "limit": 2, "cursor": first["next_cursor"]})
+    assert len(first["items"]) == 2 and "score" not in first["items"][0]
+    assert ids(rest) == [5]
+
+def test_search_follows_catalog_updates():
+    seed()
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE livro SET nome = 'Nosferatu' WHERE id = 2"))
+        conn.execute(text("DELETE FROM livro WHERE id = 4"))
+        matches = lambda q: conn.execute(
+            text("SELECT rowid FROM livro_fts WHERE livro_fts MATCH :q"), {"q": q}
+        ).scalars().all()
+        assert matches("nosferatu") == [2]
+        assert matches("dracula") == []
+        assert matches("austen") == []
+
+def test_get_book_detail(book_client):
+    seed()
+    
+    response = book_client.get("/api/books/2")
+    assert response.status_code == 200
+    book = response.json()
+    assert book["nome"] == "Drácula"
+    assert book["descricao"] == "O conde vampiro da Transilvânia."
+    assert book["public_domain"] is False
+    assert book["generos"] == ["Terror"]
+    assert book_client.get("/api/books/999").status_code == 404
+    assert "Terror" in book_client.get("/api/books/genres").json()
+
+def walk(book_client, path, params):
+    items, cursor = [], None
+    while True:
+        page = book_client.get(path, params={**params, "limit": 1, **({"cursor": cursor} if cursor else {})}).json()
+        items += [book["id"] for book in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+def test_multi_value_rating_filter_pages_in_a_stable_order(book_client):
+    seed()
+    classificacoes = {"classificacao": ["18", "10", "12"]}
+    
+    assert walk(book_client, "/api/books/", classificacoes) == [1, 3, 5]
+    assert walk(book_client, "/api/books/", {**classificacoes, "genero": "Fantasia"}) == [1, 3]
+    search = {**classificacoes, "q": "tolkien"}
+    assert sorted(walk(book_client, "/api/books/search", search)) == [1, 3, 5]
+    assert walk(book_client, "/api/books/search", search) == ids(book_client.get("/api/books/search", params=search))
+
+def test_search_ties_are_broken_by_id(book_client):
+    with engine.begin() as conn:
+        for book_id in (7, 6, 8):
+            conn.execute(
+                text(
+                    "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) "
+                    "VALUES (:id, :volume_id, 'Mesmo Título', 'L', 0)"
+                ),
+                {"id": book_id, "volume_id": f"vol{book_id}"}
+            )
+    
+    # Mesmo texto, mesmo score BM25: a ordem (e o cursor) vêm do id
+    assert walk(book_client, "/api/books/search", {"q": "mesmo", "classificacao": ["L", "10"]}) == [6, 7, 8]
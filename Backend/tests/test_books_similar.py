@@ -0,0 +1,85 @@
+"""Livros similares servidos da tabela pré-calculada (memmap) gerada em IA/"""
+import json
+import os
+import numpy as np
+import pytest
+from sqlalchemy import text
+import core.services.book_service as book_service
+from infra.database.database import engine
+from infra.recommendations import SimilarBooksIndex
+
+def seed(n=4):
+    with engine.begin() as conn:
+        for book_id in range(1, n + 1):
+            conn.execute(
+                text(
+                    "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) "
+                    "VALUES (:id, :volume_id, :nome, 'L', 0)"
+                ),
+                {"id": book_id, "volume_id": f"vol{book_id}", "nome": f"Livro {book_id}"}
+            )
+
+def write_index(directory, volume_ids, neighbors, scores):
+    directory.mkdir(parents=True, exist_ok=True)
+    np.save(directory / "vizinhos.npy", np.array(neighbors, dtype=np.int32))
+    np.save(directory / "similaridades.npy", np.array(scores, dtype=np.float32))
+    (directory / "volume_ids.txt").write_text("\n".join(volume_ids) + "\n")
+    (directory / "manifest.json").write_text(json.dumps({"livros": len(volume_ids), "k": len(neighbors[0])}))
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    similar_index = SimilarBooksIndex(tmp_path / "conteudo")
+    monkeypatch.setattr(book_service, "similar_books_index", similar_index)
+    return similar_index
+
+def test_similar_books_follow_neighbour_order(book_client, index):
+    seed()
+    # vol9 não está no catálogo (removido depois da construção)
+    write_index(
+        index.directory,
+        ["vol1", "vol2", "vol3", "vol9", "vol4"],
+        [[2, 3, 4], [0, -1, -1], [0, 1, -1], [0, -1, -1], [2, 0, -1]],
+        [[0.9, 0.5, 0.2], [0.7, 0, 0], [0.9, 0.6, 0], [0.4, 0, 0], [0.3, 0.2, 0]]
+    )
+    
+    response = book_client.get("/api/books/1/similar")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [3, 4]
+    assert items[0]["similaridade"] == pytest.approx(0.9)
+    assert items[0]["nome"] == "Livro 3"
+    
+    assert [item["id"] for item in book_client.get("/api/books/3/similar", params={"limit": 1}).json()["items"]] == [1]
+
+def test_similar_books_errors(book_client, index):
+    seed()
+    
+    assert book_client.get("/api/books/1/similar").status_code == 503
+    write_index(index.directory, ["vol1"], [[-1]], [[0]])
+    assert book_client.get("/api/books/999/similar").status_code == 404
+    # Livro que entrou no catálogo depois da construção
+    assert book_client.get("/api/books/2/similar").json()["items"] == []
+
+def test_index_reloads_after_rebuild(index):
+    write_index(index.directory, ["vol1", "vol2"], [[1], [0]], [[0.5], [0.5]])
+    assert index.similar("vol1", 5) == [("vol2", 0.5)]
+    
+    write_index(index.directory, ["vol1", "vol3"], [[1], [0]], [[0.25], [0.25]])
+    # Garante mtime diferente mesmo em sistemas de arquivos com resolução baixa
+    manifest = index.directory / "manifest.json"
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert index.similar("vol1", 5) == [("vol3", 0.25)]
+
+def test_index_follows_the_published_symlink(index, tmp_path):
+    # Publicação do IA/: cada construção em um diretório versionado, trocado via symlink
+    for version, (other, score) in enumerate([("vol2", 0.5), ("vol3", 0.25)]):
+        directory = tmp_path / f"conteudo.v{version}"
+        write_index(directory, ["vol1", other], [[1], [0]], [[score], [score]])
+        # Mesmo mtime nas duas versões: a troca é detectada pelo diretório resolvido
+        os.utime(directory / "manifest.json", ns=(0, 0))
+        link = tmp_path / ".conteudo.link"
+        link.symlink_to(directory.name, target_is_directory=True)
+        os.replace(link, index.directory)
+        
+        assert index.similar("vol1", 5) == [(other, score)]
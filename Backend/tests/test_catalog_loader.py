@@ -0,0 +1,109 @@
+"""Carga do catálogo: categorias → gêneros, upserts só do que mudou e índices recriados ao final"""
+import csv
+import pytest
+from sqlalchemy import text
+from infra.database.database import engine
+from infra.loaders import catalog_loader
+from infra.loaders.catalog_loader import load_catalog, map_genres, parse_categories
+
+FIELDS = ["id", "title", "authors", "published_date", "description", "categories",
+          "maturity_rating", "public_domain", "image_links"]
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({field: row.get(field, "") for field in FIELDS})
+    return str(path)
+
+ROWS = [
+    {"id": "v1", "title": "Duna", "categories": "['Fiction', 'Science Fiction']", "maturity_rating": "NOT_MATURE"},
+    {"id": "v2", "title": "It", "categories": "['Horror']", "maturity_rating": "MATURE", "public_domain": "True"},
+    {"id": "v3", "title": "Sapiens", "categories": "['History']", "published_date": "2015-02-10T00:00:00"},
+    {"id": "", "title": "Sem id"},
+]
+# A mesma linha repetida em outro bloco: o hash bate e ela não é regravada
+ROWS.append(dict(ROWS[0]))
+
+def genres_by_volume():
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT l.volume_id, g.genero FROM livro l JOIN livro_genero lg ON lg.livro_id = l.id "
+            "JOIN genero g ON g.id = lg.genero_id ORDER BY l.volume_id, g.genero"
+        )).all()
+    result = {}
+    for volume_id, genero in rows:
+        result.setdefault(volume_id, []).append(genero)
+    return result
+
+@pytest.mark.parametrize("raw, expected", [
+    ("['Fiction', 'Horror']", ["Fiction", "Horror"]),
+    ("Fiction", ["Fiction"]),
+    ("", []),
+    (None, []),
+    ("['quebrado'", []),
+])
+def test_parse_categories(raw, expected):
+    assert parse_categories(raw) == expected
+
+def test_map_genres_consumes_matched_keywords():
+    # "science fiction" vira só Ficção (não Ciência); "nonfiction" não vira Ficção
+    assert map_genres(["Science Fiction"]) == ["Ficção"]
+    assert map_genres(["Juvenile Nonfiction / Science"]) == ["Ciência"]
+    assert map_genres(["Fiction / Fantasy / Epic", "Horror"]) == ["Fantasia", "Ficção", "Terror"]
+    assert map_genres(["Cooking"]) == []
+
+def test_load_maps_rows_and_counts(tmp_path):
+    stats = load_catalog(write_csv(tmp_path / "livros.csv", ROWS), chunk_size=2)
+    
+    assert stats == {"lidos": 5, "ignorados": 1, "duplicados": 0, "inseridos": 3, "atualizados": 0, "inalterados": 1}
+    assert genres_by_volume() == {"v1": ["Ficção"], "v2": ["Terror"], "v3": ["História"]}
+    with engine.connect() as conn:
+        rows = {row.volume_id: row for row in conn.execute(text(
+            "SELECT volume_id, classificacao_indicativa, public_domain, data_publicacao FROM livro"
+        ))}
+    assert rows["v2"].classificacao_indicativa == "18" and rows["v2"].public_domain == 1
+    assert rows["v3"].data_publicacao == "2015-02-10"
+
+def test_unchanged_file_writes_nothing(tmp_path, queries):
+    path = write_csv(tmp_path / "livros.csv", ROWS[:3])
+    load_catalog(path)
+    queries.reset()
+    
+    stats = load_catalog(path)
+    
+    assert stats["inalterados"] == 3 and stats["inseridos"] == stats["atualizados"] == 0
+    assert not [statement for statement in queries.statements
+                if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE", "DROP", "CREATE"))]
+
+def test_changed_row_is_rewritten_with_its_genres(tmp_path):
+    load_catalog(write_csv(tmp_path / "livros.csv", ROWS[:3]))
+    changed = [dict(ROWS[0], categories="['Fantasy']"), *ROWS[1:3]]
+    
+    stats = load_catalog(write_csv(tmp_path / "livros.csv", changed))
+    
+    assert (stats["atualizados"], stats["inalterados"]) == (1, 2)
+    assert genres_by_volume()["v1"] == ["Fantasia"]
+
+def test_initial_load_defers_secondary_indexes(tmp_path, monkeypatch):
+    names = {index.name for index in catalog_loader.secondary_indexes()}
+    present_during_load = []
+    original = catalog_loader.load_chunk
+    
+    def spy(conn, *args):
+        present_during_load.append({row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")} & names)
+        return original(conn, *args)
+    
+    monkeypatch.setattr(catalog_loader, "load_chunk", spy)
+    load_catalog(write_csv(tmp_path / "livros.csv", ROWS[:3]), chunk_size=1)
+    
+    assert present_during_load == [set(), set(), set()]
+    with engine.connect() as conn:
+        after = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert names <= after
+    
+    # Com livros já carregados, os índices ficam no lugar
+    present_during_load.clear()
+    load_catalog(write_csv(tmp_path / "livros.csv", ROWS[:1]))
+    assert present_during_load == [names]
@@ -0,0 +1,236 @@
+"""Capas baixadas uma vez de uma origem local, guardadas por conteúdo e servidas com cache HTTP"""
+import asyncio
+import io
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+from sqlalchemy import text
+from infra.cache import InMemoryLRUCache
+from infra.covers import CoverCache, CoverStore
+from infra.database.database import engine
+from api.routes.cover_routes import router as cover_router
+
+def png(width=600, height=900, color=(200, 30, 30)) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(output, "PNG")
+    return output.getvalue()
+
+class StubOrigin:
+    """Origem de imagens em 127.0.0.1 que conta as requisições por caminho"""
+    
+    def __init__(self):
+        self.files = {}
+        self.hits = Counter()
+        self.delay = 0.0
+        origin = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                origin.hits[self.path] += 1
+                time.sleep(origin.delay)
+                if self.path not in origin.files:
+                    self.send_error(404)
+                    return
+                content_type, body = origin.files[self.path]
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+@pytest.fixture
+def origin():
+    stub = StubOrigin()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+@pytest.fixture
+def covers(tmp_path):
+    return CoverCache(
+        CoverStore(tmp_path / "capas"),
+        InMemoryLRUCache(max_size=100, ttl=60),
+        widths=[128, 256, 512],
+        concurrency=2,
+        timeout=5,
+        max_bytes=1 << 20,
+        processes=1
+    )
+
+@pytest.fixture
+def cover_client(covers, monkeypatch):
+    monkeypatch.setattr("core.services.cover_service.cover_cache", covers)
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await covers.close()
+    
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(cover_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+def add_book(book_id, url_imagem):
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain, url_imagem) "
+                "VALUES (:id, :volume_id, :nome, 'L', 0, :url)"
+            ),
+            {"id": book_id, "volume_id": f"vol{book_id}", "nome": f"Livro {book_id}", "url": url_imagem}
+        )
+
+def test_cover_is_fetched_once_and_served_from_disk(cover_client, origin):
+    origin.files["/capa.png"] = ("image/png", png())
+    add_book(1, origin.url("/capa.png"))
+    
+    first = cover_client.get("/api/books/1/capa")
+    second = cover_client.get("/api/books/1/capa")
+    
+    assert first.status_code == second.status_code == 200
+    assert first.content == origin.files["/capa.png"][1]
+    assert first.headers["content-type"] == "image/png"
+    assert first.headers["cache-control"] == "public, max-age=604800"
+    assert first.headers["accept-ranges"] == "bytes"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert origin.hits["/capa.png"] == 1
+
+def test_concurrent_requests_share_one_download(covers, origin):
+    origin.files["/capa.png"] = ("image/png", png())
+    origin.delay = 0.2
+    url = origin.url("/capa.png")
+    
+    async def run():
+        try:
+            return await asyncio.gather(*(covers.original(url) for _ in range(10)))
+        finally:
+            await covers.close()
+    
+    results = asyncio.run(run())
+    
+    assert len(set(results)) == 1
+    assert origin.hits["/capa.png"] == 1
+
+def test_identical_covers_are_stored_once(covers, origin):
+    origin.files["/a.png"] = origin.files["/b.png"] = ("image/png", png())
+    
+    async def run():
+        try:
+            return await covers.prefetch([origin.url("/a.png"), origin.url("/b.png")], variants=False)
+        finally:
+            await covers.close()
+    
+    assert asyncio.run(run()) == {"baixadas": 2, "falhas": 0}
+    assert len(list((covers.store.root / "originais").rglob("*"))) == 2  # um shard + um arquivo
+
+def test_variant_is_resized_jpeg(cover_client, origin):
+    origin.files["/capa.png"] = ("image/png", png(600, 900))
+    add_book(1, origin.url("/capa.png"))
+    
+    response = cover_client.get("/api/books/1/capa", params={"largura": 128})
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["etag"].endswith('-128"')
+    with Image.open(io.BytesIO(response.content)) as image:
+        assert image.format == "JPEG"
+        assert image.size == (128, 192)
+    assert cover_client.get("/api/books/1/capa", params={"largura": 100}).status_code == 400
+
+def test_conditional_and_range_requests(cover_client, origin):
+    body = png()
+    origin.files["/capa.png"] = ("image/png", body)
+    add_book(1, origin.url("/capa.png"))
+    etag = cover_client.get("/api/books/1/capa").headers["etag"]
+    
+    not_modified = cover_client.get("/api/books/1/capa", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    
+    partial = cover_client.get("/api/books/1/capa", headers={"Range": "bytes=0-99"})
+    assert partial.status_code == 206
+    assert partial.content == body[:100]
+    assert partial.headers["content-range"] == f"bytes 0-99/{len(body)}"
+    
+    suffix = cover_client.get("/api/books/1/capa", headers={"Range": "bytes=-10"})
+    assert suffix.content == body[-10:]
+    
+    stale = cover_client.get("/api/books/1/capa", headers={"Range": "bytes=0-99", "If-Range": '"outra"'})
+    assert stale.status_code == 200
+    assert stale.content == body
+    
+    unsatisfiable = cover_client.get("/api/books/1/capa", headers={"Range": f"bytes={len(body)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(body)}"
+
+def test_missing_covers(cover_client, origin):
+    origin.files["/pagina.html"] = ("text/html", b"<html></html>")
+    add_book(1, None)
+    add_book(2, origin.url("/sumiu.png"))
+    add_book(3, origin.url("/pagina.html"))
+    
+    assert cover_client.get("/api/books/999/capa").json()["detail"] == "Livro não encontrado"
+    assert cover_client.get("/api/books/1/capa").json()["detail"] == "Livro sem capa"
+    assert cover_client.get("/api/books/2/capa").status_code == 404
+    assert cover_client.get("/api/books/3/capa").status_code == 404
+    # Falhas ficam no cache negativo: a origem não é consultada de novo
+    assert cover_client.get("/api/books/2/capa").status_code == 404
+    assert origin.hits["/sumiu.png"] == 1
+
+def test_invalid_image_is_resized_once(cover_client, covers, origin, monkeypatch):
+    origin.files["/capa.png"] = ("image/png", b"isto n\xe3o \xe9 um png")
+    add_book(1, origin.url("/capa.png"))
+    
+    assert cover_client.get("/api/books/1/capa", params={"largura": 128}).status_code == 404
+    
+    async def resize_again(*args):
+        raise AssertionError("a falha deveria estar no cache negativo")
+    
+    monkeypatch.setattr(covers, "_resize", resize_again)
+    response = cover_client.get("/api/books/1/capa", params={"largura": 128})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "A capa na origem não é uma imagem válida"
+
+class BrokenPool:
+    """Pool cujo worker morreu: toda tarefa falha com BrokenProcessPool"""
+    
+    def __init__(self):
+        self.closed = False
+    
+    def submit(self, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker morto"))
+        return future
+    
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.closed = True
+
+def test_broken_pool_is_recreated(cover_client, covers, origin):
+    origin.files["/capa.png"] = ("image/png", png())
+    add_book(1, origin.url("/capa.png"))
+    broken = BrokenPool()
+    covers._pool = broken
+    
+    response = cover_client.get("/api/books/1/capa", params={"largura": 128})
+    
+    assert response.status_code == 200
+    assert broken.closed
+    assert covers._pool is not broken
@@ -0,0 +1,33 @@
+"""Liveness, readiness por worker e aquecimento do servidor pré-fork"""
+
+from fastapi.testclient import TestClient
+from infra.database.migrations import MIGRATIONS, latest_version
+from serve import prime_page_cache
+
+def test_readiness_reports_worker_and_schema_after_startup():
+    from main import app
+    with TestClient(app) as client:
+        assert client.get("/health").json() == {"status": "healthy"}
+        response = client.get("/health/ready")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["schema_version"] == latest_version(MIGRATIONS)
+
+def test_readiness_fails_outside_the_lifespan():
+    from main import app
+    with TestClient(app) as client:
+        pass
+    # Depois do shutdown o worker sai do balanceamento
+    response = TestClient(app).get("/health/ready")
+    
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+
+def test_prime_page_cache_reads_up_to_the_limit(tmp_path):
+    path = tmp_path / "banco.db"
+    path.write_bytes(b"x" * (3 << 20))
+    
+    assert prime_page_cache(path, 2 << 20) == 2 << 20
+    assert prime_page_cache(path, 0) == 0
+    assert prime_page_cache(tmp_path / "inexistente.db", 1 << 20) == 0
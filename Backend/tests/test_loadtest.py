@@ -0,0 +1,71 @@
+"""Suíte de carga: comparação com baseline e uma rodada curta contra o servidor em processo"""
+
+import asyncio
+from infra.database.database import engine
+from loadtest.baseline import compare, config_mismatches, environment, environment_mismatches
+from loadtest.runner import run_load, summarize
+from loadtest.server import InProcessServer
+from loadtest.workload import seed
+
+def result(p95: float, p99: float, requisicoes: int = 100, erros: int = 0) -> dict:
+    stats = {"requisicoes": requisicoes, "erros": erros, "rps": 10.0, "p50_ms": 1.0, "p95_ms": p95, "p99_ms": p99}
+    return {
+        "config": {"mix": "misto", "rps": 10, "duracao": 10, "usuarios": 10},
+        "total": stats,
+        "rotas": {"GET /api/users/{id}": stats},
+    }
+
+def test_compare_flags_latency_regressions_beyond_threshold():
+    baseline = result(p95=10.0, p99=20.0)
+    
+    assert compare(baseline, result(p95=12.0, p99=24.0)) == []
+    regressions = compare(baseline, result(p95=20.0, p99=24.0))
+    assert len(regressions) == 1 and "p95_ms" in regressions[0]
+
+def test_compare_ignores_small_absolute_deltas():
+    # +100% em uma rota de 1 ms ainda fica abaixo do delta mínimo
+    assert compare(result(p95=1.0, p99=1.0), result(p95=2.0, p99=2.0)) == []
+
+def test_compare_flags_errors_and_missing_throughput():
+    baseline = result(p95=10.0, p99=20.0)
+    
+    assert any("erros" in r for r in compare(baseline, result(p95=10.0, p99=20.0, erros=5)))
+    assert any("vazão" in r for r in compare(baseline, result(p95=10.0, p99=20.0, requisicoes=50)))
+
+def test_summarize_reports_percentiles_per_route():
+    summary = summarize({"GET /x": [i / 1000 for i in range(1, 101)]}, {}, 1.0, {})
+    
+    assert summary["rotas"]["GET /x"]["requisicoes"] == 100
+    assert summary["rotas"]["GET /x"]["p50_ms"] == 50.5
+    assert summary["rotas"]["GET /x"]["p99_ms"] == 99.01
+
+def test_mixed_load_against_in_process_server():
+    from main import app
+    
+    seed(engine, users=50, books=50)
+    with InProcessServer(app) as server:
+        summary = asyncio.run(run_load(server.url, "misto", rps=50, duration=1, users=50))
+    
+    # Rodada aberta de 1 s contra um servidor real: o número de envios é exato, a latência
+    # não; um ou outro erro (timeout, conexão recusada sob carga) é tolerado
+    assert summary["total"]["requisicoes"] == 50
+    assert summary["total"]["erros"] <= 5
+
+def test_baseline_with_other_load_is_not_comparable():
+    baseline = result(p95=10.0, p99=20.0)
+    current = result(p95=10.0, p99=20.0)
+    current["config"]["rps"] = 50
+    
+    assert config_mismatches(baseline, result(p95=10.0, p99=20.0)) == []
+    assert config_mismatches(baseline, current) == ["rps: baseline 10, execução 50"]
+
+def test_baseline_from_other_machine_is_flagged():
+    baseline = result(p95=10.0, p99=20.0)
+    current = result(p95=10.0, p99=20.0)
+    current["ambiente"] = environment()
+    
+    assert environment_mismatches(baseline, current) == ["baseline sem ambiente registrado (regrave com --update-baseline)"]
+    baseline["ambiente"] = dict(current["ambiente"])
+    assert environment_mismatches(baseline, current) == []
+    baseline["ambiente"]["cpu"] = "outra CPU"
+    assert len(environment_mismatches(baseline, current)) == 1
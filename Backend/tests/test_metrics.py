@@ -0,0 +1,122 @@
+"""Métricas Prometheus: formato do registro, SQL normalizado, middleware e log de consultas lentas"""
+
+import logging
+import pytest
+from fastapi.testclient import TestClient
+from infra.metrics import Registry, StatementTimer, normalize_sql, statement_timer
+
+@pytest.fixture
+def metrics_client():
+    from main import app
+    with TestClient(app) as test_client:
+        yield test_client
+
+def sample(text: str, prefix: str) -> float:
+    """Valor da primeira linha da exposição que começa com `prefix`"""
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"amostra ausente: {prefix}")
+
+def test_registry_renders_prometheus_text_format():
+    registry = Registry()
+    requests = registry.counter("app_requests_total", "Requisições", ("route",))
+    latency = registry.histogram("app_latency_seconds", "Latência", buckets=(0.1, 1.0))
+    requests.inc('/a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5.0)
+    
+    text = registry.render()
+    
+    assert "# TYPE app_requests_total counter" in text
+    assert 'app_requests_total{route="/a\\"b"} 1' in text
+    assert 'app_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'app_latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'app_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "app_latency_seconds_count 3" in text
+    assert sample(text, "app_latency_seconds_sum") == pytest.approx(5.55)
+
+def test_normalize_sql_groups_literals_and_in_lists():
+    assert normalize_sql("SELECT *\n  FROM usuario WHERE id IN (?, ?, ?) AND nome = 'Ana'") == \
+        "SELECT * FROM usuario WHERE id IN (?) AND nome = ?"
+    assert normalize_sql("INSERT INTO t (a) VALUES (?), (?), (?)") == "INSERT INTO t (a) VALUES (?)"
+    assert normalize_sql("SELECT 1 LIMIT 10") == normalize_sql("SELECT 2 LIMIT 20")
+
+def test_metrics_endpoint_reports_routes_status_sql_and_pool(metrics_client):
+    user = metrics_client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()
+    metrics_client.get(f"/api/users/{user['id']}")
+    metrics_client.get("/api/users/999999")
+    
+    response = metrics_client.get("/metrics")
+    text = response.text
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    # Template da rota, não o caminho com o ID
+    assert sample(text, 'bookshelf_http_requests_total{method="GET",route="/api/users/{user_id}",status="200"}') >= 1
+    assert sample(text, 'bookshelf_http_requests_total{method="GET",route="/api/users/{user_id}",status="404"}') >= 1
+    assert sample(text, 'bookshelf_http_request_duration_seconds_count{method="POST",route="/api/users/"}') >= 1
+    assert sample(text, 'bookshelf_http_request_sql_seconds_sum{method="POST",route="/api/users/"}') > 0
+    assert sample(text, "bookshelf_http_requests_in_flight") == 1  # a própria requisição de /metrics
+    assert 'bookshelf_sql_statement_seconds_count{statement="INSERT INTO usuario' in text
+    assert "bookshelf_db_pool_checkout_wait_seconds_count{pool=" in text
+
+def test_slow_queries_are_logged_above_threshold(metrics_client, caplog, monkeypatch):
+    monkeypatch.setattr(statement_timer, "slow_ms", 1e-6)
+    
+    with caplog.at_level(logging.WARNING, logger="bookshelf.sql"):
+        metrics_client.get("/api/users/1")
+    
+    assert any("Consulta lenta" in record.getMessage() and "FROM usuario" in record.getMessage() for record in caplog.records)
+
+def test_failed_statements_do_not_leak_start_times():
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import OperationalError
+    histogram = Registry().histogram("sql_seconds", "SQL", ("statement",))
+    engine = create_engine("sqlite://")
+    StatementTimer(histogram=histogram).instrument(engine)
+    
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM tabela_inexistente"))
+        conn.execute(text("SELECT 1"))
+        
+        assert conn.connection.info["metrics_start"] == {}
+    text_ = "\n".join(histogram.render())
+    assert 'sql_seconds_count{statement="SELECT ?"} 1' in text_
+    assert "tabela_inexistente" not in text_
+
+def test_multiprocess_collector_sums_workers(tmp_path):
+    import json
+    import os
+    import subprocess
+    import sys
+    from infra.metrics import MultiprocessCollector
+    
+    def worker_registry(requests, in_flight, latency):
+        registry = Registry()
+        registry.counter("req_total", "Requisições", ("route",)).inc("/a", amount=requests)
+        registry.gauge("in_flight", "Em andamento").set(value=in_flight)
+        registry.histogram("lat_seconds", "Latência", buckets=(0.1, 1.0)).observe(latency)
+        return registry
+    
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    # Outro worker vivo (o pai do pytest) e um que já saiu
+    (tmp_path / f"{os.getppid()}.json").write_text(json.dumps(worker_registry(2, 3, 0.5).snapshot()))
+    (tmp_path / f"{dead.pid}.json").write_text(json.dumps(worker_registry(5, 7, 0.05).snapshot()))
+    
+    collector = MultiprocessCollector(str(tmp_path), worker_registry(1, 1, 5.0))
+    collector.write()
+    text = collector.render()
+    
+    assert sample(text, 'req_total{route="/a"}') == 8
+    assert sample(text, "in_flight") == 4  # o gauge do worker morto não conta
+    assert sample(text, 'lat_seconds_bucket{le="0.1"}') == 1
+    assert sample(text, 'lat_seconds_bucket{le="1.0"}') == 2
+    assert sample(text, "lat_seconds_count") == 3
+    assert sample(text, "lat_seconds_sum") == pytest.approx(5.55)
+    # O próprio arquivo não é somado de novo aos valores ao vivo
+    assert (tmp_path / f"{os.getpid()}.json").exists()
@@ -0,0 +1,110 @@
+"""Migrações: versão em PRAGMA user_version, no-op quando em dia, adoção de bancos antigos e backfill em lotes"""
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from infra.database.migrations import (
+    MIGRATIONS,
+    Migration,
+    backfill_in_batches,
+    create_index_online,
+    index_columns,
+    latest_version,
+    migrate,
+    split_sql,
+)
+from infra.database.sqlite import configure_sqlite_engine
+from infra.models.user import Base
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/migracoes.db")
+    configure_sqlite_engine(engine)
+    yield engine
+    engine.dispose()
+
+def version(engine) -> int:
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+def test_migrate_builds_schema_and_is_a_single_statement_when_current(fresh_engine):
+    assert migrate(fresh_engine, MIGRATIONS) == latest_version(MIGRATIONS)
+    
+    statements = []
+    event.listen(fresh_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    assert migrate(fresh_engine, MIGRATIONS) == latest_version(MIGRATIONS)
+    
+    assert statements == ["PRAGMA user_version"]
+
+def test_migrated_schema_matches_models(fresh_engine):
+    migrate(fresh_engine, MIGRATIONS)
+    import infra.models.table_version, infra.models.book, infra.models.rating  # noqa: F401,E401
+    import infra.models.recommendation, infra.models.reading, infra.models.tag  # noqa: F401,E401
+    inspector = inspect(fresh_engine)
+    
+    for table in Base.metadata.sorted_tables:
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        assert {column.name for column in table.columns} <= columns, table.name
+        with fresh_engine.connect() as conn:
+            for index in table.indexes:
+                assert index_columns(conn, index.name) == [column.name for column in index.columns], index.name
+
+def test_legacy_database_is_adopted(fresh_engine):
+    # Esquema do create_all original, sem colunas de versão nem FTS
+    with fresh_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE usuario (id INTEGER NOT NULL, nome VARCHAR(100) NOT NULL, email VARCHAR(255) NOT NULL, "
+            "filme_favorito VARCHAR(200), criado_em DATETIME, PRIMARY KEY (id))"
+        )
+        conn.exec_driver_sql("CREATE INDEX ix_usuario_id ON usuario (id)")
+        conn.exec_driver_sql("CREATE UNIQUE INDEX ix_usuario_email ON usuario (email)")
+        conn.exec_driver_sql("INSERT INTO usuario (nome, email) VALUES ('João Silva', 'joao@email.com')")
+    
+    migrate(fresh_engine, MIGRATIONS)
+    
+    with fresh_engine.connect() as conn:
+        row = conn.execute(text("SELECT versao FROM usuario")).one()
+        found = conn.execute(text("SELECT rowid FROM usuario_fts WHERE usuario_fts MATCH 'joao'")).all()
+        generos = conn.execute(text("SELECT count(*) FROM genero")).scalar()
+        assert index_columns(conn, "ix_usuario_id") == []
+    assert row.versao == 1
+    assert len(found) == 1
+    assert generos == 10
+    assert version(fresh_engine) == latest_version(MIGRATIONS)
+
+def test_failed_migration_rolls_back_ddl_and_version(fresh_engine):
+    def broken(conn):
+        conn.exec_driver_sql("CREATE TABLE parcial (id INTEGER PRIMARY KEY)")
+        raise RuntimeError("falhou no meio")
+    
+    with pytest.raises(RuntimeError):
+        migrate(fresh_engine, [Migration(1, "quebrada", broken)])
+    
+    assert version(fresh_engine) == 0
+    assert "parcial" not in inspect(fresh_engine).get_table_names()
+
+def test_online_backfill_runs_in_batches(fresh_engine):
+    with fresh_engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE item (id INTEGER PRIMARY KEY, valor INTEGER, dobro INTEGER)")
+        conn.execute(text("INSERT INTO item (valor) VALUES (:v)"), [{"v": i} for i in range(25)])
+    
+    def add_column(conn):
+        conn.exec_driver_sql("ALTER TABLE item ADD COLUMN triplo INTEGER")
+    
+    def fill(engine):
+        fill.batches = backfill_in_batches(
+            engine, "item", "UPDATE item SET triplo = valor * 3 WHERE id BETWEEN :inicio AND :fim", batch_size=10
+        )
+        create_index_online(engine, "idx_item_triplo", "item", ["triplo"])
+    
+    migrate(fresh_engine, [Migration(1, "coluna", add_column), Migration(2, "backfill", fill, online=True)])
+    
+    with fresh_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM item WHERE triplo = valor * 3")).scalar() == 25
+        assert index_columns(conn, "idx_item_triplo") == ["triplo"]
+    assert fill.batches == 3
+    assert version(fresh_engine) == 2
+
+def test_split_sql_keeps_trigger_bodies_together():
+    script = "CREATE TABLE a (x);\nCREATE TRIGGER t AFTER INSERT ON a\nBEGIN\n  SELECT 1;\n  SELECT 2;\nEND;\n-- fim\n"
+    
+    assert len(split_sql(script)) == 2
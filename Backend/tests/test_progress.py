@@ -0,0 +1,131 @@
+"""Progresso de leitura: buffer write-behind, coalescência e progresso pré-calculado"""
+import time
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from infra.database.database import engine
+from infra.ingestion import ProgressBuffer, progress_buffer, utc_timestamp
+
+def seed():
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO usuario (id, nome, email) VALUES (1, 'Ana', 'ana@email.com')"))
+        conn.execute(text(
+            "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) "
+            "VALUES (1, 'vol1', 'Livro 1', 'L', 0), (2, 'vol2', 'Livro 2', 'L', 0)"
+        ))
+        conn.execute(text(
+            "INSERT INTO registro (id, usuario_id, livro_id, total_paginas) VALUES (1, 1, 1, 200), (2, 1, 2, 50)"
+        ))
+
+def logs():
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT registro_id, pagina_atual FROM registros ORDER BY id")).all()
+
+@pytest.fixture(autouse=True)
+def large_buffer(monkeypatch):
+    # Só o flush explícito (ou o desligamento) grava nos testes
+    monkeypatch.setattr(progress_buffer, "max_pending", 10_000)
+    monkeypatch.setattr(progress_buffer, "interval", 3600)
+    yield
+    progress_buffer.flush()
+
+def test_updates_are_coalesced_per_registro(progress_client, queries):
+    seed()
+    
+    queries.reset()
+    for pagina in (10, 20, 30):
+        response = progress_client.post("/api/registros/1/progresso", json={"pagina_atual": pagina})
+        assert response.status_code == 202
+        assert response.json()["pendente"] is True
+    progress_client.post("/api/registros/2/progresso", json={"pagina_atual": 25})
+    
+    # Só leituras por chave primária até o flush
+    assert all(statement.lstrip().upper().startswith("SELECT") for statement in queries.statements)
+    assert logs() == []
+    
+    # Leitura enxerga o pendente
+    pending = progress_client.get("/api/registros/1/progresso").json()
+    assert pending["pagina_atual"] == 30 and pending["percentual"] == 15.0 and pending["pendente"] is True
+    
+    assert progress_buffer.flush() == 2
+    assert logs() == [(1, 30), (2, 25)]
+    stored = progress_client.get("/api/registros/2/progresso").json()
+    assert stored["pagina_atual"] == 25
+    assert stored["percentual"] == 50.0
+    assert stored["pendente"] is False
+
+def test_shutdown_flushes_pending_progress():
+    from main import app
+    seed()
+    
+    # Saída do `with` executa o shutdown do lifespan da aplicação
+    with TestClient(app) as client:
+        client.post("/api/registros/1/progresso", json={"pagina_atual": 199})
+        assert logs() == []
+    
+    assert logs() == [(1, 199)]
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT percentual FROM registro_progresso WHERE registro_id = 1")).scalar() == 99.5
+
+def test_size_threshold_triggers_flush(progress_client, monkeypatch):
+    seed()
+    monkeypatch.setattr(progress_buffer, "max_pending", 2)
+    
+    progress_client.post("/api/registros/1/progresso", json={"pagina_atual": 5})
+    progress_client.post("/api/registros/2/progresso", json={"pagina_atual": 5})
+    
+    deadline = time.monotonic() + 5
+    while not logs() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(logs()) == [(1, 5), (2, 5)]
+
+def test_progress_validation(progress_client):
+    seed()
+    
+    assert progress_client.post("/api/registros/99/progresso", json={"pagina_atual": 1}).status_code == 404
+    assert progress_client.post("/api/registros/2/progresso", json={"pagina_atual": 51}).status_code == 400
+    assert progress_client.post("/api/registros/2/progresso", json={"pagina_atual": -1}).status_code == 422
+    assert progress_client.get("/api/registros/99/progresso").status_code == 404
+    
+    empty = progress_client.get("/api/registros/1/progresso").json()
+    assert empty["pagina_atual"] is None and empty["total_paginas"] == 200
+
+def test_failed_flush_keeps_newer_entries():
+    calls = []
+    
+    def failing_writer(entries):
+        calls.append(entries)
+        buffer.add(1, 99, "2026-01-01 00:00:02")  # chegou durante o flush
+        raise RuntimeError("disco cheio")
+    
+    buffer = ProgressBuffer(failing_writer, max_pending=100, interval=1)
+    buffer.add(1, 10, "2026-01-01 00:00:00")
+    buffer.add(2, 20, "2026-01-01 00:00:00")
+    with pytest.raises(RuntimeError):
+        buffer.flush()
+    
+    assert buffer.pending(1) == (99, "2026-01-01 00:00:02")
+    assert buffer.pending(2) == (20, "2026-01-01 00:00:00")
+    assert buffer.stats()["falhas"] == 1
+
+def test_progress_never_moves_back_in_time():
+    seed()
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO registros (registro_id, pagina_atual, data_registro) VALUES (1, 100, '2026-01-01 10:00:00')"))
+        conn.execute(text("INSERT INTO registros (registro_id, pagina_atual, data_registro) VALUES (1, 40, '2026-01-01 09:00:00')"))
+        assert conn.execute(text("SELECT pagina_atual FROM registro_progresso WHERE registro_id = 1")).scalar() == 100
+
+def test_updates_within_the_same_second_keep_their_order():
+    seed()
+    with engine.begin() as conn:
+        for pagina, data in ((60, "2026-01-01 10:00:00.200000"), (50, "2026-01-01 10:00:00.100000")):
+            conn.execute(
+                text("INSERT INTO registros (registro_id, pagina_atual, data_registro) VALUES (1, :pagina, :data)"),
+                {"pagina": pagina, "data": data}
+            )
+        # A mais antiga chegou depois, no mesmo segundo: não sobrescreve
+        assert conn.execute(text("SELECT pagina_atual FROM registro_progresso WHERE registro_id = 1")).scalar() == 60
+    
+    # O buffer grava com microssegundos, e a fração ordena depois do segundo inteiro
+    assert len(utc_timestamp()) == len("2026-01-01 10:00:00.000000")
+    assert "2026-01-01 10:00:00" < "2026-01-01 10:00:00.000001"
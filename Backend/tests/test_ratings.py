@@ -0,0 +1,137 @@
+"""Notas: agregado por livro mantido por triggers e rankings por gênero em cache"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from infra.database.database import engine
+from api.routes.book_routes import router as book_router
+from api.routes.rating_routes import router as rating_router
+
+@pytest.fixture
+def rating_client():
+    app = FastAPI()
+    app.include_router(book_router)
+    app.include_router(rating_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+def seed():
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO usuario (id, nome, email) VALUES "
+            "(1, 'Ana', 'ana@email.com'), (2, 'Bia', 'bia@email.com'), (3, 'Caio', 'caio@email.com')"
+        ))
+        for book_id, genero in ((1, "Fantasia"), (2, "Fantasia"), (3, "Terror")):
+            conn.execute(
+                text(
+                    "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) "
+                    "VALUES (:id, :volume_id, :nome, 'L', 0)"
+                ),
+                {"id": book_id, "volume_id": f"vol{book_id}", "nome": f"Livro {book_id}"}
+            )
+            conn.execute(
+                text("INSERT INTO livro_genero (livro_id, genero_id) SELECT :id, id FROM genero WHERE genero = :genero"),
+                {"id": book_id, "genero": genero}
+            )
+
+def rate(client, user_id, book_id, nota):
+    response = client.put(f"/api/users/{user_id}/notas/{book_id}", json={"nota": nota})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_aggregate_follows_inserts_updates_and_deletes(rating_client, queries):
+    seed()
+    rate(rating_client, 1, 1, 4.5)
+    rate(rating_client, 2, 1, 2)
+    rate(rating_client, 1, 1, 1)
+    rate(rating_client, 3, 1, 3)
+    assert rating_client.delete("/api/users/3/notas/1").status_code == 204
+    
+    queries.reset()
+    avaliacao = rating_client.get("/api/books/1").json()["avaliacao"]
+    
+    assert queries.count == 1
+    assert avaliacao == {"media": 1.5, "quantidade": 2, "histograma": [0, 1, 1, 0, 0, 0]}
+    assert rating_client.get("/api/books/2").json()["avaliacao"] == {"media": None, "quantidade": 0, "histograma": [0] * 6}
+
+def test_rating_write_is_single_statement(rating_client, queries):
+    seed()
+    
+    queries.reset()
+    rating = rate(rating_client, 1, 1, 4)
+    
+    assert rating["nota"] == 4 and rating["livro_id"] == 1
+    assert queries.count == 1
+    assert queries.statements[0].lstrip().startswith("INSERT")
+
+def test_rating_missing_user_book_or_rating(rating_client):
+    seed()
+    
+    assert rating_client.put("/api/users/999/notas/1", json={"nota": 3}).status_code == 404
+    assert rating_client.put("/api/users/1/notas/999", json={"nota": 3}).status_code == 404
+    assert rating_client.put("/api/users/1/notas/1", json={"nota": 6}).status_code == 422
+    assert rating_client.delete("/api/users/1/notas/1").status_code == 404
+
+def test_top_books_by_genre(rating_client):
+    seed()
+    for user_id, book_id, nota in ((1, 1, 3), (2, 1, 4), (1, 2, 5), (2, 2, 5), (1, 3, 5), (2, 3, 5)):
+        rate(rating_client, user_id, book_id, nota)
+    
+    fantasia = rating_client.get("/api/books/top", params={"genero": "fantasia", "min_avaliacoes": 2}).json()["items"]
+    geral = rating_client.get("/api/books/top", params={"min_avaliacoes": 2, "limit": 2}).json()["items"]
+    
+    assert [(item["id"], item["media"], item["quantidade"]) for item in fantasia] == [(2, 5.0, 2), (1, 3.5, 2)]
+    assert fantasia[0]["generos"] == ["Fantasia"]
+    assert [item["id"] for item in geral] == [2, 3]
+    assert rating_client.get("/api/books/top", params={"min_avaliacoes": 3}).json()["items"] == []
+    assert rating_client.get("/api/books/top", params={"genero": "Poesia"}).status_code == 400
+
+def test_top_books_cached_until_ratings_change(rating_client, queries):
+    seed()
+    rate(rating_client, 1, 1, 3)
+    rate(rating_client, 1, 2, 4)
+    params = {"genero": "Fantasia", "min_avaliacoes": 1}
+    assert [item["id"] for item in rating_client.get("/api/books/top", params=params).json()["items"]] == [2, 1]
+    
+    queries.reset()
+    rating_client.get("/api/books/top", params=params)
+    # Só a leitura da versão das notas
+    assert queries.count == 1
+    
+    rate(rating_client, 2, 1, 5)
+    assert [item["id"] for item in rating_client.get("/api/books/top", params=params).json()["items"]] == [1, 2]
+
+def test_rating_only_invalidates_the_genres_of_the_book(rating_client, queries):
+    seed()
+    rate(rating_client, 1, 1, 3)
+    rate(rating_client, 1, 3, 4)
+    fantasia = {"genero": "Fantasia", "min_avaliacoes": 1}
+    terror = {"genero": "Terror", "min_avaliacoes": 1}
+    rating_client.get("/api/books/top", params=fantasia)
+    rating_client.get("/api/books/top", params=terror)
+    
+    # Nota em livro de Terror: o ranking de Fantasia continua em cache
+    rate(rating_client, 2, 3, 2)
+    queries.reset()
+    rating_client.get("/api/books/top", params=fantasia)
+    assert queries.count == 1
+    
+    queries.reset()
+    assert rating_client.get("/api/books/top", params=terror).json()["items"][0]["media"] == 3.0
+    assert queries.count == 2
+
+def test_genre_change_invalidates_both_rankings(rating_client):
+    seed()
+    rate(rating_client, 1, 1, 3)
+    fantasia = {"genero": "Fantasia", "min_avaliacoes": 1}
+    terror = {"genero": "Terror", "min_avaliacoes": 1}
+    assert [item["id"] for item in rating_client.get("/api/books/top", params=fantasia).json()["items"]] == [1]
+    assert rating_client.get("/api/books/top", params=terror).json()["items"] == []
+    
+    with engine.begin() as conn:
+        conn.execute(text(
+            "UPDATE livro_genero SET genero_id = (SELECT id FROM genero WHERE genero = 'Terror') WHERE livro_id = 1"
+        ))
+    
+    assert rating_client.get("/api/books/top", params=fantasia).json()["items"] == []
+    assert [item["id"] for item in rating_client.get("/api/books/top", params=terror).json()["items"]] == [1]
@@ -0,0 +1,45 @@
+"""Recomendações por usuário servidas da tabela de candidatos pré-calculados"""
+from sqlalchemy import text
+from infra.database.database import engine
+
+def seed():
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO usuario (id, nome, email) VALUES (1, 'Ana', 'ana@email.com'), (2, 'Bia', 'bia@email.com')"))
+        for book_id in (10, 11, 12):
+            conn.execute(
+                text(
+                    "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) "
+                    "VALUES (:id, :volume_id, :nome, 'L', 0)"
+                ),
+                {"id": book_id, "volume_id": f"vol{book_id}", "nome": f"Livro {book_id}"}
+            )
+        conn.execute(text(
+            "INSERT INTO recomendacao_usuario (usuario_id, posicao, livro_id, score) "
+            "VALUES (1, 0, 12, 0.91), (1, 1, 10, 0.5), (1, 2, 11, 0.123456)"
+        ))
+
+def test_recommendations_follow_precomputed_order(book_client, queries):
+    seed()
+    
+    queries.reset()
+    response = book_client.get("/api/users/1/recommendations", params={"limit": 2})
+    
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [12, 10]
+    assert items[0]["score"] == 0.91
+    assert items[0]["nome"] == "Livro 12"
+    assert queries.count == 1
+
+def test_recommendations_empty_or_missing_user(book_client):
+    seed()
+    
+    assert book_client.get("/api/users/2/recommendations").json()["items"] == []
+    assert book_client.get("/api/users/999/recommendations").status_code == 404
+
+def test_recommendations_disappear_with_deleted_books(book_client):
+    seed()
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM livro WHERE id = 12"))
+    
+    assert [item["id"] for item in book_client.get("/api/users/1/recommendations").json()["items"]] == [10, 11]
@@ -0,0 +1,169 @@
+"""Mestre pré-fork (serve.Arbiter): criação de workers, readiness, SIGHUP e recriação com espera"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+import urllib.request
+from pathlib import Path
+import pytest
+import serve
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+# App ASGI mínimo: cada worker marca `estado/<worker>-<pid>` no startup e o remove no shutdown;
+# com o arquivo `falhar` presente o startup falha (o worker nunca fica pronto)
+SCRIPT = textwrap.dedent("""
+    import argparse, os, socket, sys
+    sys.path.insert(0, {backend!r})
+    import serve
+    
+    STATE = {state!r}
+    
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                marker = os.path.join(STATE, f"{{os.environ['BOOKSHELF_WORKER_ID']}}-{{os.getpid()}}")
+                if message["type"] == "lifespan.startup":
+                    if os.path.exists(os.path.join(STATE, "falhar")):
+                        with open(os.path.join(STATE, "falhas"), "a") as file:
+                            file.write("x")
+                        await send({{"type": "lifespan.startup.failed", "message": "falhar"}})
+                        return
+                    open(marker, "w").close()
+                    await send({{"type": "lifespan.startup.complete"}})
+                else:
+                    os.unlink(marker)
+                    await send({{"type": "lifespan.shutdown.complete"}})
+                    return
+        await send({{"type": "http.response.start", "status": 200, "headers": []}})
+        await send({{"type": "http.response.body", "body": str(os.getpid()).encode()}})
+    
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(64)
+    sock.set_inheritable(True)
+    print(sock.getsockname()[1], flush=True)
+    serve.Arbiter.RESPAWN_BACKOFF = 0.2
+    args = argparse.Namespace(host="127.0.0.1", port=0, workers=2, graceful_timeout=2, ready_timeout=10, log_level="warning")
+    serve.Arbiter(app, sock, args).run()
+""")
+
+def wait_for(condition, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = condition()
+        if result:
+            return result
+        time.sleep(0.05)
+    raise AssertionError("condição não atingida a tempo")
+
+def alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # Zumbi ainda não colhido pelo mestre conta como morto
+    return Path(f"/proc/{pid}/stat").read_text().split()[2] != "Z"
+
+class Master:
+    def __init__(self, tmp_path: Path):
+        self.state = tmp_path / "estado"
+        self.state.mkdir()
+        script = tmp_path / "master.py"
+        script.write_text(SCRIPT.format(backend=str(BACKEND), state=str(self.state)))
+        self.process = subprocess.Popen([sys.executable, str(script)], stdout=subprocess.PIPE, text=True)
+        self.port = int(self.process.stdout.readline())
+    
+    def workers(self) -> dict:
+        """worker_id -> pid dos workers vivos que concluíram o startup"""
+        current = {}
+        for marker in self.state.glob("*-*"):
+            worker_id, pid = map(int, marker.name.split("-"))
+            if alive(pid):
+                current[worker_id] = pid
+        return current
+    
+    def get(self) -> int:
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/", timeout=5) as response:
+            return int(response.read())
+
+@pytest.fixture
+def master(tmp_path):
+    master = Master(tmp_path)
+    yield master
+    if master.process.poll() is None:
+        master.process.terminate()
+        master.process.wait(timeout=20)
+
+def test_workers_start_ready_and_serve(master):
+    workers = wait_for(lambda: len(master.workers()) == 2 and master.workers())
+    
+    assert set(workers) == {0, 1}
+    assert master.get() in workers.values()
+    
+    master.process.send_signal(signal.SIGTERM)
+    assert master.process.wait(timeout=20) == 0
+    # Shutdown gracioso: o lifespan de cada worker rodou
+    assert not list(master.state.glob("*-*"))
+
+def test_sighup_replaces_every_worker(master):
+    before = wait_for(lambda: len(master.workers()) == 2 and master.workers())
+    
+    master.process.send_signal(signal.SIGHUP)
+    after = wait_for(lambda: (
+        len(workers := master.workers()) == 2
+        and not set(workers.values()) & set(before.values())
+        and not any(alive(pid) for pid in before.values())
+        and workers
+    ))
+    
+    assert set(after) == {0, 1}
+    assert master.get() in after.values()
+
+def test_dead_worker_is_respawned_until_it_becomes_ready(master):
+    before = wait_for(lambda: len(master.workers()) == 2 and master.workers())
+    (master.state / "falhar").touch()
+    
+    os.kill(before[0], signal.SIGKILL)
+    # A reposição falha várias vezes; o mestre continua tentando em vez de desistir do worker
+    wait_for(lambda: (master.state / "falhas").exists() and len((master.state / "falhas").read_text()) >= 3)
+    assert set(master.workers()) == {1}
+    
+    (master.state / "falhar").unlink()
+    after = wait_for(lambda: 0 in master.workers() and master.workers())
+    
+    assert after[0] != before[0]
+    assert after[1] == before[1]
+
+def test_respawn_backoff_doubles_and_resets(monkeypatch):
+    args = argparse.Namespace(workers=1, graceful_timeout=1, ready_timeout=1)
+    arbiter = serve.Arbiter(None, None, args)
+    results = iter([None, None, None, 4242])
+    
+    def start_worker(worker_id):
+        pid = next(results)
+        if pid is not None:
+            arbiter.workers[worker_id] = pid
+        return pid
+    
+    monkeypatch.setattr(arbiter, "start_worker", start_worker)
+    delays = []
+    for _ in range(3):
+        start = time.monotonic()
+        arbiter.respawn(0)
+        delays.append(round(arbiter.pending[0][0] - start))
+    
+    assert delays == [1, 2, 4]
+    assert arbiter.pending[0][1] == 3
+    # Ainda não chegou a hora: respawn_pending não tenta de novo
+    arbiter.respawn_pending()
+    assert 0 not in arbiter.workers
+    
+    arbiter.pending[0] = (0.0, 3)
+    arbiter.respawn_pending()
+    assert arbiter.workers == {0: 4242}
+    assert arbiter.pending == {}
@@ -0,0 +1,97 @@
+"""Estante do usuário: uma consulta por página com tags, nota e progresso atual"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from infra.database.database import engine
+from infra.ingestion import progress_buffer
+from api.routes.shelf_routes import router as shelf_router
+
+@pytest.fixture
+def shelf_client():
+    app = FastAPI()
+    app.include_router(shelf_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+def seed():
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO usuario (id, nome, email) VALUES (1, 'Ana', 'ana@email.com'), (2, 'Bia', 'bia@email.com')"))
+        for book_id in (10, 11, 12, 13, 14):
+            conn.execute(
+                text(
+                    "INSERT INTO livro (id, volume_id, nome, classificacao_indicativa, public_domain) "
+                    "VALUES (:id, :volume_id, :nome, 'L', 0)"
+                ),
+                {"id": book_id, "volume_id": f"vol{book_id}", "nome": f"Livro {book_id}"}
+            )
+        conn.execute(text("INSERT INTO registro (id, usuario_id, livro_id, total_paginas) VALUES (1, 1, 10, 200), (2, 1, 12, 100)"))
+        conn.execute(text(
+            "INSERT INTO registros (registro_id, pagina_atual, data_registro) "
+            "VALUES (1, 20, '2024-01-01 10:00:00'), (1, 50, '2024-01-02 10:00:00'), (2, 10, '2024-01-01 10:00:00')"
+        ))
+        conn.execute(text("INSERT INTO notas (usuario_id, livro_id, nota) VALUES (1, 11, 4.5), (1, 12, 3), (2, 14, 5)"))
+        conn.execute(text(
+            "INSERT INTO tag_usuario_livro (usuario_id, livro_id, tag_id) "
+            "SELECT 1, livro_id, id FROM tags, (SELECT 12 AS livro_id UNION ALL SELECT 13) "
+            "WHERE tag IN ('Lendo', 'Quero ler') AND NOT (livro_id = 13 AND tag = 'Lendo')"
+        ))
+
+def test_shelf_is_a_single_query(shelf_client, queries):
+    seed()
+    
+    queries.reset()
+    response = shelf_client.get("/api/users/1/shelf")
+    
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert queries.count == 1
+    assert [item["id"] for item in items] == [10, 11, 12, 13]
+    
+    lendo = items[0]
+    assert lendo["tags"] == [] and lendo["nota"] is None
+    assert lendo["progresso"]["pagina_atual"] == 50
+    assert lendo["progresso"]["percentual"] == 25.0
+    assert lendo["progresso"]["pendente"] is False
+    assert items[1]["nota"] == 4.5 and items[1]["progresso"] is None
+    assert sorted(items[2]["tags"]) == ["Lendo", "Quero ler"]
+    assert items[2]["nota"] == 3 and items[2]["progresso"]["registro_id"] == 2
+    assert items[3]["tags"] == ["Quero ler"]
+
+def test_shelf_keyset_pagination(shelf_client):
+    seed()
+    
+    first = shelf_client.get("/api/users/1/shelf", params={"limit": 3}).json()
+    second = shelf_client.get("/api/users/1/shelf", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    
+    assert [item["id"] for item in first["items"]] == [10, 11, 12]
+    assert [item["id"] for item in second["items"]] == [13]
+    assert second["next_cursor"] is None
+
+def test_shelf_filtered_by_tag(shelf_client):
+    seed()
+    
+    response = shelf_client.get("/api/users/1/shelf", params={"tag": "Quero ler"})
+    
+    assert [item["id"] for item in response.json()["items"]] == [12, 13]
+    assert shelf_client.get("/api/users/1/shelf", params={"tag": "Abandonado"}).json()["items"] == []
+
+def test_shelf_shows_buffered_progress(shelf_client, monkeypatch):
+    seed()
+    monkeypatch.setattr(progress_buffer, "max_pending", 10_000)
+    progress_buffer.add(2, 80, "2024-01-03T10:00:00")
+    try:
+        items = shelf_client.get("/api/users/1/shelf").json()["items"]
+    finally:
+        progress_buffer.flush()
+    
+    assert items[2]["progresso"]["pagina_atual"] == 80
+    assert items[2]["progresso"]["pendente"] is True
+
+def test_shelf_empty_or_missing_user(shelf_client):
+    seed()
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO usuario (id, nome, email) VALUES (3, 'Caio', 'caio@email.com')"))
+    
+    assert shelf_client.get("/api/users/3/shelf").json() == {"items": [], "next_cursor": None}
+    assert shelf_client.get("/api/users/999/shelf").status_code == 404
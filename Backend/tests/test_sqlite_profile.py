@@ -0,0 +1,149 @@
+"""Perfil de produção do SQLite: PRAGMAs em cada conexão e roteamento leitura/escrita da sessão"""
+import asyncio
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from config import settings
+from infra.database.database import SessionLocal, engine, reader_engine
+from infra.database.sqlite import RoutingSession, configure_sqlite_engine
+from infra.models.user import UserModel
+
+pytestmark = pytest.mark.skipif(not settings.SQLITE_PRODUCTION_PROFILE, reason="perfil de produção desligado")
+
+def pragmas(conn) -> dict:
+    return {
+        name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+        for name in ("journal_mode", "synchronous", "busy_timeout", "foreign_keys", "query_only")
+    }
+
+def async_engines():
+    """Writer e leitores assíncronos configurados como em async_database.
+    
+    As conexões aiosqlite ficam presas ao loop de cada asyncio.run, então os
+    testes usam engines próprias em vez de descartar as globais da aplicação.
+    """
+    writer = create_async_engine(settings.ASYNC_DATABASE_URL, poolclass=AsyncAdaptedQueuePool,
+                                 pool_size=1, max_overflow=0)
+    reader = create_async_engine(settings.ASYNC_DATABASE_URL, poolclass=AsyncAdaptedQueuePool)
+    configure_sqlite_engine(writer.sync_engine)
+    configure_sqlite_engine(reader.sync_engine, read_only=True)
+    return writer, reader
+
+def record_routing(log: list, writer, reader) -> list:
+    """Registra em qual engine (writer/reader) cada instrução foi executada"""
+    listeners = []
+    for label, target in (("writer", writer), ("reader", reader)):
+        def listener(conn, cursor, statement, parameters, context, executemany, label=label):
+            if not statement.lstrip().upper().startswith("PRAGMA"):
+                log.append((label, statement.split(None, 1)[0].upper()))
+        event.listen(target, "before_cursor_execute", listener)
+        listeners.append((target, listener))
+    return listeners
+
+@pytest.fixture
+def routed():
+    log = []
+    listeners = record_routing(log, engine, reader_engine)
+    yield log
+    for target, listener in listeners:
+        event.remove(target, "before_cursor_execute", listener)
+
+EXPECTED = {
+    "journal_mode": "wal",
+    "synchronous": 1,  # NORMAL
+    "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    "foreign_keys": 1,
+}
+
+@pytest.mark.parametrize("target, read_only", [(engine, False), (reader_engine, True)])
+def test_every_connection_gets_the_production_pragmas(target, read_only):
+    target.dispose()
+    # Duas conexões simultâneas: o PRAGMA vale por conexão, não por engine
+    connections = [target.connect() for _ in range(2 if read_only else 1)]
+    try:
+        for conn in connections:
+            assert pragmas(conn) == {**EXPECTED, "query_only": int(read_only)}
+    finally:
+        for conn in connections:
+            conn.close()
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_every_async_connection_gets_the_production_pragmas(read_only):
+    async def run():
+        writer, reader = async_engines()
+        target = reader if read_only else writer
+        connections = [await target.connect() for _ in range(2 if read_only else 1)]
+        try:
+            return [await conn.run_sync(pragmas) for conn in connections]
+        finally:
+            for conn in connections:
+                await conn.close()
+            await writer.dispose()
+            await reader.dispose()
+    
+    for values in asyncio.run(run()):
+        assert values == {**EXPECTED, "query_only": int(read_only)}
+
+def test_reader_connections_reject_writes():
+    with reader_engine.connect() as conn:
+        with pytest.raises(Exception, match="readonly|read-only|query_only"):
+            conn.exec_driver_sql("INSERT INTO usuario (nome, email) VALUES ('Ana', 'ana@email.com')")
+
+def test_session_routes_reads_to_reader_and_writes_to_writer(routed):
+    with SessionLocal() as db:
+        db.execute(select(UserModel.id)).all()
+        db.execute(text("SELECT count(*) FROM usuario")).scalar()
+        assert routed == [("reader", "SELECT"), ("reader", "SELECT")]
+        routed.clear()
+        
+        db.add(UserModel(nome="Ana", email="ana@email.com"))
+        db.flush()
+        # Depois da escrita a transação fica no writer: enxerga a linha ainda não confirmada
+        assert db.scalar(select(UserModel.email)) == "ana@email.com"
+        db.execute(text("UPDATE usuario SET nome = 'Ana Maria'"))
+        db.commit()
+        assert {label for label, _ in routed} == {"writer"}
+        assert [statement for _, statement in routed] == ["INSERT", "SELECT", "UPDATE"]
+        routed.clear()
+        
+        # Nova transação volta ao pool de leitores e vê o commit
+        assert db.scalar(select(UserModel.nome)) == "Ana Maria"
+        assert routed == [("reader", "SELECT")]
+
+def test_rollback_also_returns_session_to_reader(routed):
+    with SessionLocal() as db:
+        db.execute(text("DELETE FROM usuario WHERE id = -1"))
+        db.rollback()
+        db.execute(select(UserModel.id)).all()
+    
+    assert routed == [("writer", "DELETE"), ("reader", "SELECT")]
+
+def test_async_session_routes_like_the_sync_one():
+    log = []
+    
+    async def run():
+        writer, reader = async_engines()
+        record_routing(log, writer.sync_engine, reader.sync_engine)
+        session_factory = async_sessionmaker(
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            writer=writer.sync_engine,
+            reader=reader.sync_engine,
+            expire_on_commit=False
+        )
+        try:
+            async with session_factory() as db:
+                await db.execute(select(UserModel.id))
+                db.add(UserModel(nome="Ana", email="ana@email.com"))
+                await db.flush()
+                await db.execute(select(UserModel.id))
+                await db.commit()
+                await db.execute(select(UserModel.id))
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+    
+    asyncio.run(run())
+    
+    assert log == [("reader", "SELECT"), ("writer", "INSERT"), ("writer", "SELECT"), ("reader", "SELECT")]
@@ -0,0 +1,103 @@
+"""Leitura de vários usuários com uma consulta e lote atômico de escritas"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from api.routes.user_bulk_routes import router as user_bulk_router
+from api.routes.user_routes import router as user_router
+
+@pytest.fixture
+def batch_client():
+    app = FastAPI()
+    app.include_router(user_bulk_router)
+    app.include_router(user_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+def create(client, email, nome="Ana"):
+    response = client.post("/api/users/", json={"nome": nome, "email": email})
+    assert response.status_code == 201
+    return response.json()
+
+def test_get_batch_is_single_in_query_in_request_order(batch_client, queries):
+    ana = create(batch_client, "ana@email.com")
+    bia = create(batch_client, "bia@email.com", "Bia")
+    queries.reset()
+    
+    response = batch_client.get("/api/users/batch", params={"ids": [bia["id"], 999, ana["id"], bia["id"]]})
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert [user["email"] for user in body["items"]] == ["bia@email.com", "ana@email.com"]
+    assert body["nao_encontrados"] == [999]
+    assert queries.count == 1
+    assert " IN " in queries.statements[0]
+
+def test_get_batch_rejects_too_many_ids(batch_client):
+    response = batch_client.get("/api/users/batch", params={"ids": list(range(1, 102))})
+    
+    assert response.status_code == 400
+
+def test_apply_batch_commits_all_operations(batch_client):
+    ana = create(batch_client, "ana@email.com")
+    bia = create(batch_client, "bia@email.com", "Bia")
+    
+    response = batch_client.post("/api/users/batch", json={"operacoes": [
+        {"op": "create", "dados": {"nome": " Caio ", "email": "CAIO@email.com"}},
+        {"op": "update", "id": ana["id"], "dados": {"nome": "Ana Maria"}},
+        {"op": "delete", "id": bia["id"]},
+    ]})
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert body["aplicado"] is True
+    assert [item["status"] for item in body["resultados"]] == [201, 200, 204]
+    assert body["resultados"][0]["usuario"]["email"] == "caio@email.com"
+    assert body["resultados"][1]["usuario"]["versao"] == ana["versao"] + 1
+    assert batch_client.get(f"/api/users/{bia['id']}").status_code == 404
+    assert batch_client.get(f"/api/users/{ana['id']}").json()["nome"] == "Ana Maria"
+
+def test_apply_batch_rolls_back_on_database_failure(batch_client):
+    ana = create(batch_client, "ana@email.com")
+    create(batch_client, "bia@email.com", "Bia")
+    
+    response = batch_client.post("/api/users/batch", json={"operacoes": [
+        {"op": "create", "dados": {"nome": "Caio", "email": "caio@email.com"}},
+        {"op": "update", "id": ana["id"], "dados": {"email": "bia@email.com"}},
+        {"op": "delete", "id": ana["id"]},
+    ]})
+    
+    assert response.status_code == 409
+    body = response.json()
+    assert body["aplicado"] is False
+    assert [item["status"] for item in body["resultados"]] == [424, 400, 424]
+    assert body["resultados"][0]["id"] is None
+    assert body["resultados"][1]["erro"] == "Email já está em uso"
+    listed = batch_client.get("/api/users/").json()["items"]
+    assert sorted(user["email"] for user in listed) == ["ana@email.com", "bia@email.com"]
+
+def test_apply_batch_validates_before_touching_database(batch_client, queries):
+    response = batch_client.post("/api/users/batch", json={"operacoes": [
+        {"op": "create", "dados": {"nome": "Caio"}},
+        {"op": "delete"},
+        {"op": "delete", "id": 999},
+    ]})
+    
+    assert response.status_code == 409
+    resultados = response.json()["resultados"]
+    assert [item["status"] for item in resultados] == [400, 400, 424]
+    assert resultados[1]["erro"] == "Informe o id do usuário"
+    assert queries.count == 0
+
+def test_apply_batch_invalidates_user_cache(batch_client, monkeypatch):
+    from config import settings
+    monkeypatch.setattr(settings, "USER_CACHE_ENABLED", True)
+    ana = create(batch_client, "ana@email.com")
+    assert batch_client.get("/api/users/batch", params={"ids": [ana["id"]]}).json()["items"][0]["nome"] == "Ana"
+    
+    response = batch_client.post("/api/users/batch", json={"operacoes": [
+        {"op": "update", "id": ana["id"], "dados": {"nome": "Ana Maria"}},
+    ]})
+    
+    assert response.status_code == 200
+    assert batch_client.get("/api/users/batch", params={"ids": [ana["id"]]}).json()["items"][0]["nome"] == "Ana Maria"
@@ -0,0 +1,103 @@
+"""Importação (corpo lido em streaming) e exportação de usuários em NDJSON e CSV"""
+import csv
+import io
+import json
+from types import SimpleNamespace
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from core.services.user_bulk_service import UserBulkService
+from infra.repositories.user_repository import UserRepository
+from api.routes.user_bulk_routes import router as user_bulk_router
+
+@pytest.fixture
+def bulk_client():
+    app = FastAPI()
+    app.include_router(user_bulk_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+def chunked(data: bytes, size: int = 7):
+    """Corpo enviado em pedaços pequenos, cortando linhas e caracteres multibyte ao meio"""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+def export(client, formato):
+    response = client.get("/api/users/export", params={"formato": formato})
+    assert response.status_code == 200
+    return response.text
+
+def test_ndjson_round_trip(bulk_client):
+    body = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in [
+        {"nome": "Ana", "email": "ana@email.com", "filme_favorito": "Amélie"},
+        {"nome": "Bia", "email": "bia@email.com"},
+    ]).encode("utf-8")
+    
+    response = bulk_client.post("/api/users/import?formato=ndjson", content=chunked(body))
+    
+    assert response.status_code == 200
+    assert response.json() == {"total": 2, "inseridos": 2, "erros": []}
+    rows = [json.loads(line) for line in export(bulk_client, "ndjson").splitlines()]
+    assert [(row["nome"], row["email"], row["filme_favorito"]) for row in rows] == [
+        ("Ana", "ana@email.com", "Amélie"),
+        ("Bia", "bia@email.com", None),
+    ]
+    assert all(row["criado_em"] for row in rows)
+
+def test_csv_round_trip(bulk_client):
+    body = '﻿nome,email,filme_favorito\r\n"Ana, a primeira",ana@email.com,"O ""Poderoso"" Chefão"\r\nBia,bia@email.com,\r\n'
+    
+    response = bulk_client.post(
+        "/api/users/import", content=chunked(body.encode("utf-8")), headers={"Content-Type": "text/csv"}
+    )
+    
+    assert response.json()["inseridos"] == 2
+    exported = export(bulk_client, "csv")
+    rows = list(csv.DictReader(io.StringIO(exported)))
+    assert [(row["nome"], row["filme_favorito"]) for row in rows] == [
+        ("Ana, a primeira", 'O "Poderoso" Chefão'),
+        ("Bia", ""),
+    ]
+    
+    # O que foi exportado volta a ser importável (emails já cadastrados viram erros por linha)
+    again = bulk_client.post("/api/users/import?formato=csv", content=exported.encode("utf-8")).json()
+    assert again["inseridos"] == 0
+    assert [erro["erro"] for erro in again["erros"]] == ["Email já está em uso"] * 2
+
+def test_malformed_rows_are_reported_per_line(bulk_client):
+    body = "\n".join([
+        '{"nome": "Ana", "email": "ana@email.com"}',
+        "{nao é json",
+        "[1, 2]",
+        '{"nome": "Bia", "email": "sem-arroba"}',
+        '{"nome": "Ana 2", "email": "ANA@email.com"}',
+        "",
+        '{"nome": "Caio", "email": "caio@email.com"}',
+    ]).encode("utf-8")
+    
+    result = bulk_client.post("/api/users/import?formato=ndjson", content=body).json()
+    
+    assert result["total"] == 6
+    assert result["inseridos"] == 2
+    assert [erro["linha"] for erro in result["erros"]] == [2, 3, 4, 5]
+    assert result["erros"][0]["erro"] == "JSON inválido"
+    assert result["erros"][3]["erro"] == "Email duplicado no arquivo"
+
+def test_csv_without_required_header_is_rejected(bulk_client):
+    response = bulk_client.post("/api/users/import?formato=csv", content=b"nome\nAna\n")
+    
+    assert response.status_code == 400
+
+def test_invalid_utf8_is_rejected(bulk_client):
+    response = bulk_client.post("/api/users/import?formato=ndjson", content=b'{"nome": "\xff"}\n')
+    
+    assert response.status_code == 400
+
+def test_export_handles_null_criado_em(monkeypatch):
+    # Bancos criados antes das migrações têm criado_em anulável
+    row = SimpleNamespace(id=1, nome="Ana", email="ana@email.com", filme_favorito=None, criado_em=None)
+    monkeypatch.setattr(UserRepository, "stream_all", lambda self, batch_size: iter([row]))
+    service = UserBulkService(db=None)
+    
+    assert json.loads("".join(service.export_users("ndjson")))["criado_em"] is None
+    assert list(csv.DictReader(io.StringIO("".join(service.export_users("csv")))))[0]["criado_em"] == ""
@@ -0,0 +1,57 @@
+"""Cache de leitura de usuários: LRU/TTL, cache negativo e invalidação nas escritas"""
+import time
+from infra.cache import MISSING, InMemoryLRUCache, user_cache
+
+def test_lru_evicts_least_recently_used():
+    cache = InMemoryLRUCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_expires_entries():
+    cache = InMemoryLRUCache(max_size=10, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    
+    assert cache.get("a") is MISSING
+    assert cache.stats()["expirations"] == 1
+
+def test_repeated_get_is_served_from_cache(client, queries):
+    user_id = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()["id"]
+    client.get(f"/api/users/{user_id}")
+    queries.reset()
+    
+    response = client.get(f"/api/users/{user_id}")
+    
+    assert response.status_code == 200
+    assert queries.count == 0
+    assert user_cache.stats()["hits"] >= 1
+
+def test_missing_user_is_negatively_cached(client, queries):
+    assert client.get("/api/users/999").status_code == 404
+    queries.reset()
+    
+    assert client.get("/api/users/999").status_code == 404
+    assert queries.count == 0
+
+def test_update_and_delete_invalidate_cached_user(client):
+    user_id = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()["id"]
+    client.get(f"/api/users/{user_id}")
+    
+    client.put(f"/api/users/{user_id}", json={"nome": "Ana Maria"})
+    assert client.get(f"/api/users/{user_id}").json()["nome"] == "Ana Maria"
+    
+    client.delete(f"/api/users/{user_id}")
+    assert client.get(f"/api/users/{user_id}").status_code == 404
+
+def test_create_clears_negative_entry_for_new_id(client):
+    assert client.get("/api/users/1").status_code == 404
+    
+    user_id = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()["id"]
+    
+    assert client.get(f"/api/users/{user_id}").status_code == 200
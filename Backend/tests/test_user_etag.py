@@ -0,0 +1,50 @@
+"""ETags e GET condicional (If-None-Match → 304) nos endpoints de usuário"""
+
+def test_user_etag_changes_only_on_update(client):
+    user_id = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()["id"]
+    etag = client.get(f"/api/users/{user_id}").headers["ETag"]
+    
+    not_modified = client.get(f"/api/users/{user_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    
+    client.put(f"/api/users/{user_id}", json={"nome": "Ana Maria"})
+    response = client.get(f"/api/users/{user_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["versao"] == 2
+
+def test_list_returns_304_from_single_version_query(client, queries):
+    client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"})
+    etag = client.get("/api/users/").headers["ETag"]
+    queries.reset()
+    
+    response = client.get("/api/users/", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 304
+    assert queries.count == 1
+
+def test_list_etag_changes_after_any_write(client):
+    user_id = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()["id"]
+    etags = {client.get("/api/users/").headers["ETag"]}
+    
+    client.put(f"/api/users/{user_id}", json={"filme_favorito": "Matrix"})
+    etags.add(client.get("/api/users/").headers["ETag"])
+    client.delete(f"/api/users/{user_id}")
+    etags.add(client.get("/api/users/").headers["ETag"])
+    
+    assert len(etags) == 3
+
+def test_user_etag_is_not_inherited_by_reused_id(client):
+    first = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"}).json()
+    etag = client.get(f"/api/users/{first['id']}").headers["ETag"]
+    client.delete(f"/api/users/{first['id']}")
+    
+    # Sem AUTOINCREMENT o id do maior usuário removido volta a ser usado, com versao 1
+    second = client.post("/api/users/", json={"nome": "Bia", "email": "bia@email.com"}).json()
+    assert second["id"] == first["id"]
+    
+    response = client.get(f"/api/users/{second['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["email"] == "bia@email.com"
+    assert response.headers["ETag"] != etag
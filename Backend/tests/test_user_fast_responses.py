@@ -0,0 +1,22 @@
+"""O caminho rápido (tuplas + orjson) deve produzir o mesmo JSON do caminho ORM"""
+from config import settings
+
+def test_fast_responses_match_legacy_payload(client, monkeypatch):
+    for i in range(3):
+        client.post("/api/users/", json={"nome": f"Usuário {i}", "email": f"u{i}@email.com"})
+    
+    payloads = {}
+    for fast in (True, False):
+        monkeypatch.setattr(settings, "FAST_RESPONSES", fast)
+        first_page = client.get("/api/users/", params={"limit": 2}).json()
+        second_page = client.get("/api/users/", params={"limit": 2, "cursor": first_page["next_cursor"]}).json()
+        user_id = first_page["items"][0]["id"]
+        payloads[fast] = (first_page, second_page, client.get(f"/api/users/{user_id}").json())
+    
+    assert payloads[True] == payloads[False]
+    assert payloads[True][1]["next_cursor"] is None
+
+def test_fast_response_missing_user_returns_404(client, monkeypatch):
+    monkeypatch.setattr(settings, "FAST_RESPONSES", True)
+    
+    assert client.get("/api/users/999").status_code == 404
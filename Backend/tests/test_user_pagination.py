@@ -0,0 +1,58 @@
+"""Paginação por cursor (criado_em, id) em GET /api/users"""
+from datetime import datetime
+from sqlalchemy import text
+from infra.database.database import engine
+from infra.repositories.user_repository import page_statement
+
+def seed(client, total=5):
+    ids = [client.post("/api/users/", json={"nome": f"Usuário {i}", "email": f"u{i}@email.com"}).json()["id"]
+           for i in range(total)]
+    # Mesmo criado_em para todos: a ordem depende só do desempate por id
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE usuario SET criado_em = '2024-01-01 12:00:00'"))
+    return ids
+
+def walk(client, limit):
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/api/users/", params=params).json()
+        pages.append([user["id"] for user in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+def test_pages_cover_every_user_once_in_order(client):
+    ids = seed(client)
+    
+    pages = walk(client, limit=2)
+    
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [user_id for page in pages for user_id in page] == sorted(ids, reverse=True)
+
+def test_last_full_page_has_no_cursor(client):
+    seed(client, total=4)
+    
+    assert [len(page) for page in walk(client, limit=2)] == [2, 2]
+
+def test_newer_users_sort_first(client):
+    ids = seed(client, total=2)
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE usuario SET criado_em = '2024-06-01 12:00:00' WHERE id = :id"), {"id": ids[0]})
+    
+    assert walk(client, limit=10) == [[ids[0], ids[1]]]
+
+def test_invalid_cursor_and_limit_are_rejected(client):
+    assert client.get("/api/users/", params={"cursor": "não-é-cursor"}).status_code == 400
+    assert client.get("/api/users/", params={"limit": 0}).status_code == 422
+    assert client.get("/api/users/", params={"limit": 501}).status_code == 422
+
+def test_page_query_walks_the_composite_index():
+    stmt = page_statement(50, (datetime(2024, 1, 1), 10))
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+    
+    # Busca pelo índice, sem ordenar a tabela inteira: o custo da página não cresce com a profundidade
+    assert "idx_usuario_criado_em_id" in plan
+    assert "TEMP B-TREE" not in plan
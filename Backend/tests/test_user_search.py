@@ -0,0 +1,53 @@
+"""Busca FTS5 de usuários: prefixo, relevância, paginação e sincronização por triggers"""
+import base64
+from api.pagination import decode_rank_cursor, encode_rank_cursor
+
+def seed(client):
+    for nome, email in [
+        ("João Silva", "joao@email.com"),
+        ("Joana Souza", "joana@email.com"),
+        ("Maria Silva", "maria@silva.com"),
+    ]:
+        client.post("/api/users/", json={"nome": nome, "email": email})
+
+def names(response):
+    return [user["nome"] for user in response.json()["items"]]
+
+def test_prefix_search_ignores_accents(client):
+    seed(client)
+    
+    assert sorted(names(client.get("/api/users/search", params={"q": "jo"}))) == ["Joana Souza", "João Silva"]
+    assert names(client.get("/api/users/search", params={"q": "joao"})) == ["João Silva"]
+
+def test_search_ranks_and_paginates(client):
+    seed(client)
+    
+    first = client.get("/api/users/search", params={"q": "silva", "limit": 1}).json()
+    second = client.get("/api/users/search", params={"q": "silva", "limit": 1, "cursor": first["next_cursor"]}).json()
+    
+    # "silva" no nome e no email pesa mais que só no nome
+    assert first["items"][0]["nome"] == "Maria Silva"
+    assert second["items"][0]["nome"] == "João Silva"
+    assert second["next_cursor"] is None
+
+def test_search_follows_updates_and_deletes(client):
+    seed(client)
+    user_id = client.get("/api/users/search", params={"q": "joana"}).json()["items"][0]["id"]
+    
+    client.put(f"/api/users/{user_id}", json={"nome": "Joana Pereira"})
+    assert names(client.get("/api/users/search", params={"q": "pereira"})) == ["Joana Pereira"]
+    
+    client.delete(f"/api/users/{user_id}")
+    assert names(client.get("/api/users/search", params={"q": "pereira"})) == []
+
+def test_search_without_words_returns_400(client):
+    assert client.get("/api/users/search", params={"q": '"*'}).status_code == 400
+
+def test_rank_cursor_round_trips_the_exact_score():
+    for score in (-1.2345678901234567e-06, -0.1 - 0.2, -7.000000000000001):
+        assert decode_rank_cursor(encode_rank_cursor(score, 42)) == (score, 42)
+
+def test_rank_cursor_rejects_non_finite_scores(client):
+    for bad in ('["nan",1]', '["inf",1]', '["x",1]'):
+        cursor = base64.urlsafe_b64encode(bad.encode()).decode().rstrip("=")
+        assert client.get("/api/users/search", params={"q": "ana", "cursor": cursor}).status_code == 400
@@ -0,0 +1,79 @@
+"""Garante que cada mutação de usuário seja uma única instrução + commit"""
+
+def create(client, email="ana@email.com", nome="Ana"):
+    response = client.post("/api/users/", json={"nome": nome, "email": email})
+    assert response.status_code == 201
+    return response.json()
+
+def test_create_is_single_statement(client, queries):
+    response = client.post("/api/users/", json={"nome": "Ana", "email": "ana@email.com"})
+    
+    assert response.status_code == 201
+    assert response.json()["email"] == "ana@email.com"
+    assert queries.count == 1
+    assert queries.statements[0].lstrip().startswith("INSERT")
+
+def test_create_duplicate_email_relies_on_unique_constraint(client, queries):
+    create(client)
+    queries.reset()
+    
+    response = client.post("/api/users/", json={"nome": "Outra", "email": "ana@email.com"})
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email já está em uso"
+    assert queries.count == 1
+
+def test_update_is_single_statement(client, queries):
+    user = create(client)
+    queries.reset()
+    
+    response = client.put(f"/api/users/{user['id']}", json={"nome": " Ana Maria ", "email": "ANA@novo.com"})
+    
+    assert response.status_code == 200
+    assert response.json()["nome"] == "Ana Maria"
+    assert response.json()["email"] == "ana@novo.com"
+    assert queries.count == 1
+    assert queries.statements[0].lstrip().startswith("UPDATE")
+
+def test_update_missing_user_is_single_statement(client, queries):
+    response = client.put("/api/users/999", json={"nome": "Ninguém"})
+    
+    assert response.status_code == 404
+    assert queries.count == 1
+
+def test_update_duplicate_email_returns_400(client, queries):
+    create(client, email="ana@email.com")
+    other = create(client, email="bia@email.com", nome="Bia")
+    queries.reset()
+    
+    response = client.put(f"/api/users/{other['id']}", json={"email": "ana@email.com"})
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email já está em uso"
+    assert queries.count == 1
+
+def test_update_invalid_field_emits_no_statement(client, queries):
+    user = create(client)
+    queries.reset()
+    
+    response = client.put(f"/api/users/{user['id']}", json={"nome": "   "})
+    
+    assert response.status_code == 400
+    assert queries.count == 0
+
+def test_delete_is_single_statement(client, queries):
+    user = create(client)
+    queries.reset()
+    
+    response = client.delete(f"/api/users/{user['id']}")
+    
+    assert response.status_code == 204
+    assert queries.count == 1
+    assert queries.statements[0].lstrip().startswith("DELETE")
+    assert client.get(f"/api/users/{user['id']}").status_code == 404
+
+def test_delete_missing_user_returns_404(client, queries):
+    response = client.delete("/api/users/999")
+    
+    assert response.status_code == 404
+    assert queries.count == 1
@@ -0,0 +1 @@
+# Catálogo colunar (snapshot memory-mapped do livros.csv)
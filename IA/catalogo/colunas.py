@@ -0,0 +1,20 @@
+# Parsers das colunas do livros.csv (gravado por dataset/banco_de_dados.py)
+#
+# Usado pelo snapshot e pela recomendação por conteúdo. A carga do catálogo no Backend
+# (infra/loaders/catalog_loader.py) tem a sua cópia: o Backend não importa o IA/.
+import ast
+
+
+def parse_categories(raw):
+    """Converte a coluna categories (lista Python em texto) em lista"""
+    if isinstance(raw, list):
+        return raw
+    raw = (raw or "").strip()
+    if not raw:
+        return []
+    if raw.startswith("["):
+        try:
+            return [str(categoria) for categoria in ast.literal_eval(raw)]
+        except (ValueError, SyntaxError):
+            return []
+    return [raw]
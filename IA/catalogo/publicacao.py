@@ -0,0 +1,52 @@
+# Publicação atômica de artefatos em diretório (snapshot do catálogo, tabela de similares)
+#
+# Cada construção grava um diretório versionado ao lado da saída (<saida>.v<ns>) e a
+# saída vira um symlink para ele. A troca do symlink é um rename atômico: o caminho
+# publicado nunca some nem mistura arquivos de duas versões. A versão anterior é
+# mantida para quem ainda está lendo dela; as mais antigas são removidas.
+import os
+import shutil
+import time
+from pathlib import Path
+
+
+def nova_versao(saida):
+    """Cria o diretório versionado onde a próxima construção será gravada"""
+    saida = Path(saida)
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    versao = saida.with_name(f"{saida.name}.v{time.time_ns()}")
+    versao.mkdir()
+    return versao
+
+
+def versoes(saida):
+    """Diretórios versionados da saída, do mais antigo ao mais novo"""
+    saida = Path(saida)
+    prefixo = saida.name + ".v"
+    encontradas = [
+        caminho for caminho in saida.parent.glob(prefixo + "*")
+        if caminho.name[len(prefixo):].isdigit() and caminho.is_dir() and not caminho.is_symlink()
+    ]
+    return sorted(encontradas, key=lambda caminho: int(caminho.name[len(prefixo):]))
+
+
+def publicar(saida, versao):
+    """Aponta a saída para a versão nova com uma troca atômica de symlink"""
+    saida, versao = Path(saida), Path(versao)
+    anterior = saida.resolve() if saida.is_symlink() else None
+    if saida.exists() and not saida.is_symlink():
+        # Layout antigo (diretório comum): migra uma única vez para o esquema versionado
+        anterior = saida.with_name(f"{saida.name}.v0")
+        os.replace(saida, anterior)
+        anterior = anterior.resolve()
+
+    link = saida.with_name(f".{saida.name}.link")
+    if link.is_symlink() or link.exists():
+        link.unlink()
+    # Alvo relativo: o par saída/versões pode ser movido junto
+    link.symlink_to(versao.name, target_is_directory=True)
+    os.replace(link, saida)
+
+    for antiga in versoes(saida):
+        if antiga.resolve() not in (versao.resolve(), anterior):
+            shutil.rmtree(antiga, ignore_errors=True)
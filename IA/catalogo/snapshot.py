@@ -0,0 +1,285 @@
+# Snapshot colunar do catálogo: NumPy memmap + heap de strings
+#
+# Uso (a partir de IA/):
+#     python -m catalogo.snapshot dataset/livros.csv --saida dataset/livros.snapshot
+#
+# A saída é um symlink para o diretório versionado da última construção (catalogo.publicacao).
+# Layout do diretório (um arquivo por coluna, todos abertos sob demanda):
+#     manifest.json                 linhas, colunas e tipos
+#     <texto>.heap / .offsets.npy   bytes UTF-8 concatenados + offsets int64 (n + 1); vazio = None
+#     <categoria>.codes.npy         int32 por linha (-1 = vazio) + valores no manifest
+#     <lista>.codes.npy / .offsets.npy / valores no manifest   listas codificadas por dicionário
+#     <bool>.npy                    int8 (1, 0, -1 = vazio)
+#     <inteiro>.npy                 int32 (-1 = vazio)
+#
+# Os arquivos só são mapeados (mmap) no primeiro acesso à coluna: abrir o catálogo
+# lê apenas o manifest, e vários processos compartilham as mesmas páginas do cache do SO.
+import argparse
+import csv
+import json
+import sys
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+from catalogo.colunas import parse_categories
+from catalogo.publicacao import nova_versao, publicar
+
+FORMATO = 1
+
+COLUNAS_TEXTO = ["id", "title", "publisher", "published_date", "description", "image_links", "preview_link"]
+COLUNAS_CATEGORIA = ["reading_modes", "language", "maturity_rating"]
+COLUNAS_LISTA = ["authors", "categories"]
+COLUNAS_BOOL = ["is_ebook", "epub_is_available", "pdf_is_available", "public_domain"]
+COLUNAS_INTEIRO = ["page_count"]
+
+csv.field_size_limit(sys.maxsize)
+
+
+def parse_authors(raw):
+    """Autores separados por vírgula, como gravados pelo banco_de_dados.py"""
+    return [autor.strip() for autor in (raw or "").split(",") if autor.strip()]
+
+
+def parse_bool(raw):
+    raw = (raw or "").strip().lower()
+    return 1 if raw == "true" else 0 if raw == "false" else -1
+
+
+def parse_int(raw):
+    try:
+        return int(float(raw))
+    except (TypeError, ValueError):
+        return -1
+
+
+class _Dicionario:
+    """Codificação por dicionário: valor -> código, na ordem de aparição"""
+
+    def __init__(self):
+        self.codigos = {}
+
+    def codigo(self, valor):
+        return self.codigos.setdefault(valor, len(self.codigos))
+
+    @property
+    def valores(self):
+        return list(self.codigos)
+
+
+def construir_snapshot(csv_path, saida):
+    """Converte o CSV em snapshot colunar, em streaming, e publica de forma atômica"""
+    versao = nova_versao(saida)
+
+    heaps = {coluna: open(versao / f"{coluna}.heap", "wb") for coluna in COLUNAS_TEXTO}
+    offsets = {coluna: array("q", [0]) for coluna in COLUNAS_TEXTO}
+    categorias = {coluna: (_Dicionario(), array("i")) for coluna in COLUNAS_CATEGORIA}
+    listas = {coluna: (_Dicionario(), array("i"), array("q", [0])) for coluna in COLUNAS_LISTA}
+    bools = {coluna: array("b") for coluna in COLUNAS_BOOL}
+    inteiros = {coluna: array("i") for coluna in COLUNAS_INTEIRO}
+    parsers = {"authors": parse_authors, "categories": parse_categories}
+
+    linhas = 0
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                for coluna in COLUNAS_TEXTO:
+                    dados = (row.get(coluna) or "").encode("utf-8")
+                    heaps[coluna].write(dados)
+                    offsets[coluna].append(offsets[coluna][-1] + len(dados))
+                for coluna in COLUNAS_CATEGORIA:
+                    dicionario, codigos = categorias[coluna]
+                    valor = (row.get(coluna) or "").strip()
+                    codigos.append(dicionario.codigo(valor) if valor else -1)
+                for coluna in COLUNAS_LISTA:
+                    dicionario, codigos, limites = listas[coluna]
+                    codigos.extend(dicionario.codigo(valor) for valor in parsers[coluna](row.get(coluna)))
+                    limites.append(len(codigos))
+                for coluna in COLUNAS_BOOL:
+                    bools[coluna].append(parse_bool(row.get(coluna)))
+                for coluna in COLUNAS_INTEIRO:
+                    inteiros[coluna].append(parse_int(row.get(coluna)))
+                linhas += 1
+    finally:
+        for heap in heaps.values():
+            heap.close()
+
+    colunas = {}
+    for coluna in COLUNAS_TEXTO:
+        np.save(versao / f"{coluna}.offsets.npy", np.frombuffer(offsets[coluna], dtype=np.int64))
+        colunas[coluna] = {"tipo": "texto"}
+    for coluna in COLUNAS_CATEGORIA:
+        dicionario, codigos = categorias[coluna]
+        np.save(versao / f"{coluna}.codes.npy", np.frombuffer(codigos, dtype=np.int32))
+        colunas[coluna] = {"tipo": "categoria", "valores": dicionario.valores}
+    for coluna in COLUNAS_LISTA:
+        dicionario, codigos, limites = listas[coluna]
+        np.save(versao / f"{coluna}.codes.npy", np.frombuffer(codigos, dtype=np.int32))
+        np.save(versao / f"{coluna}.offsets.npy", np.frombuffer(limites, dtype=np.int64))
+        colunas[coluna] = {"tipo": "lista", "valores": dicionario.valores}
+    for coluna in COLUNAS_BOOL:
+        np.save(versao / f"{coluna}.npy", np.frombuffer(bools[coluna], dtype=np.int8))
+        colunas[coluna] = {"tipo": "bool"}
+    for coluna in COLUNAS_INTEIRO:
+        np.save(versao / f"{coluna}.npy", np.frombuffer(inteiros[coluna], dtype=np.int32))
+        colunas[coluna] = {"tipo": "inteiro"}
+
+    manifest = {"formato": FORMATO, "linhas": linhas, "colunas": colunas}
+    (versao / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False))
+
+    # Troca o symlink da saída: o caminho publicado nunca fica sem snapshot
+    publicar(saida, versao)
+    return manifest
+
+
+def _posicao(i, n):
+    """Normaliza o índice de linha; negativo conta do fim, como em lista.
+
+    As colunas com offsets têm n + 1 posições: sem isso offsets[-1] seria o fim
+    do heap e a linha -1 viraria um trecho vazio ou errado.
+    """
+    i = int(i)
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError(f"linha fora do catálogo: {i}")
+    return i
+
+
+class ColunaTexto:
+    """Strings lidas do heap sob demanda; vazio vira None"""
+
+    def __init__(self, heap, offsets):
+        self.heap = heap
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        i = _posicao(i, len(self))
+        inicio, fim = int(self.offsets[i]), int(self.offsets[i + 1])
+        return bytes(self.heap[inicio:fim]).decode("utf-8") if fim > inicio else None
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class ColunaCategoria:
+    """Códigos int32 por linha + valores distintos"""
+
+    def __init__(self, codes, valores):
+        self.codes = codes
+        self.valores = valores
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        codigo = int(self.codes[i])
+        return self.valores[codigo] if codigo >= 0 else None
+
+    def mascara(self, valor):
+        """Linhas com o valor, sem decodificar strings"""
+        if valor not in self.valores:
+            return np.zeros(len(self), dtype=bool)
+        return np.asarray(self.codes) == self.valores.index(valor)
+
+
+class ColunaLista:
+    """Listas codificadas por dicionário (códigos planos + offsets por linha)"""
+
+    def __init__(self, codes, offsets, valores):
+        self.codes = codes
+        self.offsets = offsets
+        self.valores = valores
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        i = _posicao(i, len(self))
+        return [self.valores[c] for c in self.codes[int(self.offsets[i]):int(self.offsets[i + 1])].tolist()]
+
+    def mascara(self, valor):
+        """Linhas cuja lista contém o valor, vetorizado sobre os códigos"""
+        mascara = np.zeros(len(self), dtype=bool)
+        if valor in self.valores:
+            posicoes = np.flatnonzero(np.asarray(self.codes) == self.valores.index(valor))
+            mascara[np.searchsorted(self.offsets, posicoes, side="right") - 1] = True
+        return mascara
+
+
+class Catalogo:
+    """Snapshot colunar aberto de forma preguiçosa (só o manifest na abertura)"""
+
+    def __init__(self, caminho):
+        # Resolve o symlink da publicação: colunas abertas depois vêm da mesma versão
+        self.caminho = Path(caminho).resolve()
+        self.manifest = json.loads((self.caminho / "manifest.json").read_text(encoding="utf-8"))
+        if self.manifest.get("formato") != FORMATO:
+            raise ValueError(f"Formato de snapshot não suportado: {self.manifest.get('formato')}")
+        self._colunas = {}
+        self._indice = None
+
+    def __len__(self):
+        return self.manifest["linhas"]
+
+    @property
+    def colunas(self):
+        return list(self.manifest["colunas"])
+
+    def _npy(self, nome):
+        return np.load(self.caminho / nome, mmap_mode="r")
+
+    def __getitem__(self, coluna):
+        """Coluna mapeada em memória (aberta no primeiro acesso)"""
+        if coluna not in self._colunas:
+            tipo = self.manifest["colunas"][coluna]["tipo"]
+            if tipo == "texto":
+                heap_path = self.caminho / f"{coluna}.heap"
+                # mmap de arquivo vazio falha; heap vazio vira array vazio
+                heap = np.memmap(heap_path, dtype=np.uint8, mode="r") if heap_path.stat().st_size else np.empty(0, np.uint8)
+                valor = ColunaTexto(heap, self._npy(f"{coluna}.offsets.npy"))
+            elif tipo == "categoria":
+                valor = ColunaCategoria(self._npy(f"{coluna}.codes.npy"), self.manifest["colunas"][coluna]["valores"])
+            elif tipo == "lista":
+                valor = ColunaLista(self._npy(f"{coluna}.codes.npy"), self._npy(f"{coluna}.offsets.npy"),
+                                    self.manifest["colunas"][coluna]["valores"])
+            else:
+                valor = self._npy(f"{coluna}.npy")
+            self._colunas[coluna] = valor
+        return self._colunas[coluna]
+
+    def linha(self, i):
+        """Uma linha completa como dicionário (listas decodificadas, vazios como None)"""
+        row = {}
+        for coluna, info in self.manifest["colunas"].items():
+            valor = self[coluna][i]
+            if info["tipo"] == "bool":
+                valor = None if valor < 0 else bool(valor)
+            elif info["tipo"] == "inteiro":
+                valor = None if valor < 0 else int(valor)
+            row[coluna] = valor
+        return row
+
+    def posicao(self, volume_id):
+        """Linha de um volume_id (o índice é montado no primeiro uso)"""
+        if self._indice is None:
+            self._indice = {volume_id: i for i, volume_id in enumerate(self["id"])}
+        return self._indice.get(volume_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o snapshot colunar do catálogo a partir do CSV")
+    parser.add_argument("csv", help="Caminho do livros.csv")
+    parser.add_argument("--saida", default="dataset/livros.snapshot")
+    args = parser.parse_args()
+
+    manifest = construir_snapshot(args.csv, args.saida)
+    print(f"✅ Snapshot com {manifest['linhas']} livros em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
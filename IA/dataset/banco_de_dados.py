@@ -1,74 +1,268 @@
 # Bibliotecas importadas
-import requests
-import pandas as pd
-
-# Função para montar o banco de dados
-def get_books(genero, total_books=1000):
-    livros = []
-    # É possível retornar apenas 40 livros por requisição na API 
-    for start in range(0, total_books, 40):
-        # Link da API
-        url = f"https://www.googleapis.com/books/v1/volumes?q=subject:{genero}&maxResults=40&startIndex={start}"
-        r = requests.get(url)
-        data = r.json()
-
-        if "items" not in data:
-            break
-        
-    
-        
-        for item in data["items"]:
-            # Acessando as principais "páginas" do JSON
-            volume_info = item.get("volumeInfo", {})
-            sale_info = item.get("saleInfo", {})
-            access_info = item.get("accessInfo", {})
-
-            # Acessando os componentes da leitura dos livros (imagem e texto) 
-            reading_modes = volume_info.get("readingModes", {})
-            active_modes = [k for k, v in reading_modes.items() if v is True or str(v).lower() == 'true']
-            reading_modes_str = ", ".join(active_modes) if active_modes else None
-            
-
-            # Criando as linhas/colunas do database
-            livros.append({
-                "id": item.get("id"),
-                "title": volume_info.get("title"),
-                "authors": ", ".join(volume_info.get("authors", [])),
-                "publisher": volume_info.get("publisher"),
-                "published_date": volume_info.get("publishedDate"),
-                "description": volume_info.get("description"),
-                "reading_modes": reading_modes_str,
-                "page_count": volume_info.get("pageCount"),
-                "categories": volume_info.get("categories"),
-                "language": volume_info.get("language"),
-                "is_ebook": sale_info.get("isEbook"),
-                "epub_is_available": access_info.get("epub", {}).get("isAvailable"),
-                "pdf_is_available": access_info.get("pdf", {}).get("isAvailable"),
-                "maturity_rating": volume_info.get("maturityRating"),
-                "public_domain": access_info.get("publicDomain"),
-                "image_links": volume_info.get("imageLinks", {}).get("thumbnail"),
-                "preview_link": volume_info.get("previewLink")
-            })
-    
-    return livros
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 
+import httpx
+
+# Link da API
+API_URL = "https://www.googleapis.com/books/v1/volumes"
+
+# É possível retornar apenas 40 livros por requisição na API
+PAGE_SIZE = 40
 
 # Principais gêneros do aplicativo
-generos = ["romance", "science fiction", "fantasy", "horror", "action", "history", "theater", "poetry", "biography & autobiography", "thriller", "self-help", "science"]
+GENEROS = ["romance", "science fiction", "fantasy", "horror", "action", "history", "theater", "poetry", "biography & autobiography", "thriller", "self-help", "science"]
+
+# Colunas do livros.csv, na mesma ordem de sempre
+COLUNAS = [
+    "id", "title", "authors", "publisher", "published_date", "description",
+    "reading_modes", "page_count", "categories", "language", "is_ebook",
+    "epub_is_available", "pdf_is_available", "maturity_rating", "public_domain",
+    "image_links", "preview_link",
+]
+
+# Status que valem nova tentativa (limite de taxa e falhas temporárias do servidor)
+STATUS_RETENTAVEIS = {429, 500, 502, 503, 504}
+
+# Teto da espera pedida pelo servidor em Retry-After (segundos)
+ESPERA_MAXIMA = 60.0
+
+
+def espera_retry_after(valor, agora=None):
+    """Segundos pedidos no Retry-After (número ou data HTTP), limitados a [0, ESPERA_MAXIMA]"""
+    if not valor:
+        return 0.0
+    try:
+        espera = float(valor)
+    except ValueError:
+        try:
+            data = parsedate_to_datetime(valor)
+        except (TypeError, ValueError):
+            return 0.0
+        espera = data.timestamp() - (time.time() if agora is None else agora)
+    if espera != espera:  # NaN
+        return 0.0
+    return min(max(espera, 0.0), ESPERA_MAXIMA)
+
+
+def parse_item(item):
+    """Converte um volume da API em uma linha do dataset"""
+    # Acessando as principais "páginas" do JSON
+    volume_info = item.get("volumeInfo", {})
+    sale_info = item.get("saleInfo", {})
+    access_info = item.get("accessInfo", {})
+
+    # Acessando os componentes da leitura dos livros (imagem e texto)
+    reading_modes = volume_info.get("readingModes", {})
+    active_modes = [k for k, v in reading_modes.items() if v is True or str(v).lower() == 'true']
+    reading_modes_str = ", ".join(active_modes) if active_modes else None
+
+    # Criando as linhas/colunas do database
+    return {
+        "id": item.get("id"),
+        "title": volume_info.get("title"),
+        "authors": ", ".join(volume_info.get("authors", [])),
+        "publisher": volume_info.get("publisher"),
+        "published_date": volume_info.get("publishedDate"),
+        "description": volume_info.get("description"),
+        "reading_modes": reading_modes_str,
+        "page_count": volume_info.get("pageCount"),
+        "categories": volume_info.get("categories"),
+        "language": volume_info.get("language"),
+        "is_ebook": sale_info.get("isEbook"),
+        "epub_is_available": access_info.get("epub", {}).get("isAvailable"),
+        "pdf_is_available": access_info.get("pdf", {}).get("isAvailable"),
+        "maturity_rating": volume_info.get("maturityRating"),
+        "public_domain": access_info.get("publicDomain"),
+        "image_links": volume_info.get("imageLinks", {}).get("thumbnail"),
+        "preview_link": volume_info.get("previewLink"),
+    }
+
+
+class RateLimiter:
+    """Limita as requisições por segundo de cada host (token bucket)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._buckets = {}
+
+    async def acquire(self, host):
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                self._buckets[host] = (tokens - 1, now)
+                return
+            self._buckets[host] = (tokens, now)
+            await asyncio.sleep((1 - tokens) / self.rate)
+
+
+class Checkpoint:
+    """Progresso por gênero (próximo startIndex), gravado de forma atômica"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.state = json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def proximo(self, genero):
+        return self.state.get(genero, {}).get("proximo", 0)
+
+    def concluido(self, genero):
+        return self.state.get(genero, {}).get("concluido", False)
+
+    def salvar(self, genero, proximo, concluido=False):
+        self.state[genero] = {"proximo": proximo, "concluido": concluido}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state, ensure_ascii=False, indent=2))
+        os.replace(tmp, self.path)
+
+
+class RecordWriter:
+    """Acrescenta livros em NDJSON assim que cada página chega, ignorando ids já gravados"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.ids = set()
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self.ids.add(json.loads(line)["id"])
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, livros):
+        novos = [livro for livro in livros if livro["id"] not in self.ids]
+        for livro in novos:
+            self.ids.add(livro["id"])
+            self.file.write(json.dumps(livro, ensure_ascii=False) + "\n")
+        # Garante os dados no disco antes de o checkpoint avançar
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return len(novos)
+
+    def close(self):
+        self.file.close()
+
+
+class Harvester:
+    """Coleta concorrente e retomável da Google Books API"""
+
+    def __init__(self, client, limiter, writer, checkpoint, api_url=API_URL,
+                 concorrencia=8, janela=4, tentativas=5, backoff=0.5):
+        self.client = client
+        self.limiter = limiter
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.api_url = api_url
+        self.host = urlsplit(api_url).netloc
+        self.semaforo = asyncio.Semaphore(concorrencia)
+        self.janela = janela
+        self.tentativas = tentativas
+        self.backoff = backoff
+
+    async def fetch_page(self, genero, start):
+        """Busca uma página, com nova tentativa e backoff exponencial em falhas temporárias"""
+        params = {"q": f"subject:{genero}", "maxResults": PAGE_SIZE, "startIndex": start}
+        for tentativa in range(self.tentativas):
+            await self.limiter.acquire(self.host)
+            try:
+                async with self.semaforo:
+                    r = await self.client.get(self.api_url, params=params)
+                if r.status_code not in STATUS_RETENTAVEIS:
+                    r.raise_for_status()
+                    return r.json()
+                espera = espera_retry_after(r.headers.get("Retry-After"))
+            except httpx.TransportError:
+                espera = 0
+            if tentativa == self.tentativas - 1:
+                break
+            await asyncio.sleep(max(espera, self.backoff * 2 ** tentativa * (1 + random.random())))
+        raise RuntimeError(f"Falha ao buscar {genero} (startIndex={start}) após {self.tentativas} tentativas")
+
+    async def harvest_genre(self, genero, total_books):
+        """Busca as páginas de um gênero em janelas concorrentes, gravando cada uma ao chegar"""
+        if self.checkpoint.concluido(genero):
+            return
+        start = self.checkpoint.proximo(genero)
+        while start < total_books:
+            starts = list(range(start, total_books, PAGE_SIZE))[:self.janela]
+            paginas = await asyncio.gather(*(self.fetch_page(genero, s) for s in starts))
+            for s, data in zip(starts, paginas):
+                if "items" not in data:
+                    self.checkpoint.salvar(genero, s, concluido=True)
+                    return
+                self.writer.write([parse_item(item) for item in data["items"]])
+                self.checkpoint.salvar(genero, s + PAGE_SIZE)
+            start = starts[-1] + PAGE_SIZE
+        self.checkpoint.salvar(genero, start, concluido=True)
+
+    async def run(self, generos, total_books):
+        await asyncio.gather(*(self.harvest_genre(genero, total_books) for genero in generos))
+
+
+async def harvest(saida_ndjson, checkpoint_path, generos=GENEROS, total_books=200,
+                  api_url=API_URL, concorrencia=8, rps=10.0, janela=4, tentativas=5, backoff=0.5):
+    """Executa a coleta, retomando do checkpoint se ele existir"""
+    writer = RecordWriter(saida_ndjson)
+    limits = httpx.Limits(max_connections=concorrencia, max_keepalive_connections=concorrencia)
+    try:
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            harvester = Harvester(client, RateLimiter(rps), writer, Checkpoint(checkpoint_path),
+                                  api_url, concorrencia, janela, tentativas, backoff)
+            await harvester.run(generos, total_books)
+    finally:
+        writer.close()
 
 
-livros = []
+def ndjson_to_csv(saida_ndjson, saida_csv, limite=None):
+    """Converte o NDJSON coletado no livros.csv (mesmas colunas do dataset)"""
+    with open(saida_ndjson, encoding="utf-8") as origem, \
+            open(saida_csv, "w", newline="", encoding="utf-8") as destino:
+        writer = csv.DictWriter(destino, fieldnames=COLUNAS)
+        writer.writeheader()
+        total = 0
+        for line in origem:
+            if not line.strip():
+                continue
+            if limite is not None and total >= limite:
+                break
+            writer.writerow(json.loads(line))
+            total += 1
+    return total
 
-# Serão escolhidos cerca de 200 livros de cada gênero
-for genero in generos:
-    livros.extend(get_books(genero, 200))
 
+def main():
+    parser = argparse.ArgumentParser(description="Coleta livros da Google Books API para o livros.csv")
+    parser.add_argument("--saida", default="livros.csv")
+    parser.add_argument("--por-genero", type=int, default=200, help="Livros buscados por gênero")
+    parser.add_argument("--limite", type=int, default=1000, help="Total de livros no CSV final")
+    parser.add_argument("--concorrencia", type=int, default=8)
+    parser.add_argument("--rps", type=float, default=10.0, help="Requisições por segundo por host")
+    parser.add_argument("--api-url", default=API_URL)
+    args = parser.parse_args()
 
-livros = livros[:1000]
+    saida = Path(args.saida)
+    ndjson = saida.with_suffix(".ndjson")
+    checkpoint = saida.with_suffix(".checkpoint.json")
 
+    # Serão escolhidos cerca de 200 livros de cada gênero
+    asyncio.run(harvest(ndjson, checkpoint, GENEROS, args.por_genero, args.api_url,
+                        args.concorrencia, args.rps))
+    total = ndjson_to_csv(ndjson, saida, args.limite)
 
-df = pd.DataFrame(livros)
-df.to_csv("livros.csv", index=False, encoding="utf-8")
+    print(f"✅ Arquivo {saida} criado com sucesso! ({total} livros)")
 
 
-print("✅ Arquivo livros.csv criado com sucesso!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
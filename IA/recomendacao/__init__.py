@@ -0,0 +1 @@
+# Recomendação de livros (modelos treinados a partir do dataset e do banco)
@@ -0,0 +1,378 @@
+# Filtragem colaborativa: ALS implícito sobre a tabela notas (usuário × livro)
+#
+# Uso (a partir de IA/):
+#     python -m recomendacao.colaborativo treinar   --db ../Backend/infra/database/bookshelf.db
+#     python -m recomendacao.colaborativo atualizar --db ../Backend/infra/database/bookshelf.db
+#
+# `treinar` refaz a fatoração inteira; `atualizar` só dobra (fold-in) os usuários cujas
+# notas mudaram e os livros novos, com os demais fatores fixos. Nos dois casos os
+# candidatos de cada usuário afetado são gravados em recomendacao_usuario, que a API
+# lê diretamente (nenhuma conta de matriz por requisição).
+#
+# Artefatos em --saida (padrão modelos/colaborativo):
+#     fatores_usuarios.npy, fatores_livros.npy  float32 (n, fatores)
+#     usuario_ids.npy, livro_ids.npy            ids do banco na ordem das linhas
+#     assinaturas.npy                           uint64 (quantidade, hash dos pares livro/nota) de cada usuário
+#     manifest.json                             parâmetros (gravado por último)
+import argparse
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+# recomendacao_usuario vem da migração 1 do Backend (infra/database/migrations)
+VERSAO_ESQUEMA = 1
+
+ARTEFATOS = ("fatores_usuarios.npy", "fatores_livros.npy", "usuario_ids.npy", "livro_ids.npy", "assinaturas.npy")
+
+
+def conectar(db_path):
+    """Conexão com o banco já migrado pelo Backend, com as chaves estrangeiras ligadas"""
+    conn = sqlite3.connect(db_path)
+    versao = conn.execute("PRAGMA user_version").fetchone()[0]
+    if versao < VERSAO_ESQUEMA:
+        conn.close()
+        raise RuntimeError(
+            f"Banco {db_path} sem as migrações do Backend (user_version {versao}); "
+            "suba a API uma vez para aplicá-las"
+        )
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def ler_notas(db_path):
+    """Lê as notas como arrays (usuario_id, livro_id, nota)"""
+    with conectar(db_path) as conn:
+        # Ordem do índice único (usuario_id, livro_id): leitura sem ordenação extra
+        rows = conn.execute("SELECT usuario_id, livro_id, nota FROM notas ORDER BY usuario_id, livro_id").fetchall()
+    if not rows:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float32)
+    dados = np.array(rows, dtype=np.float64)
+    return dados[:, 0].astype(np.int64), dados[:, 1].astype(np.int64), dados[:, 2].astype(np.float32)
+
+
+def matriz_confianca(usuarios, livros, notas, usuario_ids, livro_ids, alpha):
+    """Matriz esparsa usuário × livro de confiança c = 1 + alpha * nota (CSR)"""
+    linhas = np.searchsorted(usuario_ids, usuarios)
+    colunas = np.searchsorted(livro_ids, livros)
+    confianca = (1.0 + alpha * notas).astype(np.float32)
+    return sp.csr_matrix((confianca, (linhas, colunas)), shape=(len(usuario_ids), len(livro_ids)))
+
+
+def lotes_por_nnz(indptr, max_nnz):
+    """Divide as linhas em lotes com no máximo ~max_nnz entradas cada"""
+    limites = np.searchsorted(indptr, np.arange(0, indptr[-1], max_nnz), side="right") - 1
+    limites = np.unique(np.concatenate([limites, [len(indptr) - 1]]))
+    if limites[0] != 0:
+        limites = np.concatenate([[0], limites])
+    return list(zip(limites[:-1], limites[1:]))
+
+
+def resolver_lote(confianca, fixos, gram, regularizacao, inicio, fim):
+    """Resolve os fatores das linhas [inicio, fim) com os fatores do outro lado fixos.
+
+    Para cada linha u: (YᵀY + Yᵀ(Cu − I)Y + λI) x_u = Yᵀ Cu p_u, com p_u = 1 nas
+    entradas avaliadas. Os termos por entrada são somados com reduceat e os
+    sistemas f × f do lote são resolvidos de uma vez.
+    """
+    fatores = fixos.shape[1]
+    resultado = np.zeros((fim - inicio, fatores), dtype=np.float32)
+    indptr = confianca.indptr[inicio:fim + 1]
+    a, b = indptr[0], indptr[-1]
+    if a == b:
+        return inicio, resultado
+    colunas = confianca.indices[a:b]
+    c = confianca.data[a:b]
+    y = fixos[colunas]
+    tamanhos = np.diff(indptr)
+    com_notas = np.flatnonzero(tamanhos)
+    inicios = (indptr[:-1] - a)[com_notas]
+
+    A = np.add.reduceat(np.einsum("n,ni,nj->nij", c - 1.0, y, y), inicios, axis=0)
+    A += gram + regularizacao * np.eye(fatores, dtype=np.float32)
+    rhs = np.add.reduceat(c[:, None] * y, inicios, axis=0)
+    resultado[com_notas] = np.linalg.solve(A, rhs[:, :, None])[:, :, 0]
+    return inicio, resultado
+
+
+def resolver_lote_cg(confianca, fixos, gram, regularizacao, iniciais, passos, inicio, fim):
+    """Mesmo sistema de `resolver_lote`, aproximado com alguns passos de gradiente conjugado.
+
+    Parte dos fatores da iteração anterior e nunca monta as matrizes f × f por linha:
+    cada passo custa O(nnz · f), com os escalares do CG vetorizados por linha.
+    """
+    indptr = confianca.indptr[inicio:fim + 1] - confianca.indptr[inicio]
+    a, b = confianca.indptr[inicio], confianca.indptr[fim]
+    colunas = confianca.indices[a:b]
+    c = confianca.data[a:b]
+    linhas = np.repeat(np.arange(fim - inicio), np.diff(indptr))
+    y = fixos[colunas]
+    gram = gram + regularizacao * np.eye(fixos.shape[1], dtype=np.float32)
+
+    def aplicar(v):
+        # (YᵀY + λI) v + Yᵀ (C − I) Y v, linha a linha
+        pesos = (c - 1.0) * np.einsum("nf,nf->n", y, v[linhas])
+        return v @ gram + sp.csr_matrix((pesos, colunas, indptr), shape=(fim - inicio, fixos.shape[0])) @ fixos
+
+    rhs = sp.csr_matrix((c, colunas, indptr), shape=(fim - inicio, fixos.shape[0])) @ fixos
+    x = iniciais[inicio:fim].copy()
+    r = rhs - aplicar(x)
+    p = r.copy()
+    rs = np.einsum("uf,uf->u", r, r)
+    for _ in range(passos):
+        ap = aplicar(p)
+        denominador = np.einsum("uf,uf->u", p, ap)
+        alpha = np.divide(rs, denominador, out=np.zeros_like(rs), where=denominador > 0)
+        x += alpha[:, None] * p
+        r -= alpha[:, None] * ap
+        rs_novo = np.einsum("uf,uf->u", r, r)
+        beta = np.divide(rs_novo, rs, out=np.zeros_like(rs), where=rs > 0)
+        p = r + beta[:, None] * p
+        rs = rs_novo
+    return inicio, x.astype(np.float32)
+
+
+def resolver(confianca, fixos, regularizacao, threads=1, max_nnz=8192, linhas=None,
+             iniciais=None, passos_cg=0):
+    """Fatores de todas as linhas (ou só de `linhas`), em lotes distribuídos entre threads.
+
+    Com `passos_cg` e `iniciais`, usa gradiente conjugado a partir dos fatores atuais
+    (treino); sem eles, resolve cada sistema exatamente (fold-in e lotes pequenos).
+    """
+    if linhas is not None:
+        confianca = confianca[linhas]
+    gram = (fixos.T @ fixos).astype(np.float32)
+    saida = np.zeros((confianca.shape[0], fixos.shape[1]), dtype=np.float32)
+    if passos_cg and iniciais is not None:
+        lotes = lotes_por_nnz(confianca.indptr, max_nnz * fixos.shape[1])
+        resolver_um = lambda lote: resolver_lote_cg(confianca, fixos, gram, regularizacao, iniciais, passos_cg, *lote)
+    else:
+        lotes = lotes_por_nnz(confianca.indptr, max_nnz)
+        resolver_um = lambda lote: resolver_lote(confianca, fixos, gram, regularizacao, *lote)
+    # NumPy/LAPACK liberam o GIL nas contas pesadas; threads dividem os lotes entre núcleos
+    with ThreadPoolExecutor(max(1, threads)) as executor:
+        for inicio, fatores in executor.map(resolver_um, lotes):
+            saida[inicio:inicio + len(fatores)] = fatores
+    return saida
+
+
+def treinar_als(confianca, fatores=32, regularizacao=0.1, iteracoes=10, threads=1, semente=0, passos_cg=3):
+    """ALS implícito alternando usuários e livros (gradiente conjugado com `passos_cg` > 0)"""
+    rng = np.random.default_rng(semente)
+    n_usuarios, n_livros = confianca.shape
+    X = (rng.standard_normal((n_usuarios, fatores)) * 0.01).astype(np.float32)
+    Y = (rng.standard_normal((n_livros, fatores)) * 0.01).astype(np.float32)
+    transposta = confianca.T.tocsr()
+    for _ in range(iteracoes):
+        X = resolver(confianca, Y, regularizacao, threads, iniciais=X, passos_cg=passos_cg)
+        Y = resolver(transposta, X, regularizacao, threads, iniciais=Y, passos_cg=passos_cg)
+    return X, Y
+
+
+def candidatos(X, Y, confianca, linhas, n, memoria=1 << 26):
+    """Top-n livros não avaliados para as linhas pedidas, em blocos densos de scores"""
+    n = min(n, Y.shape[0])
+    bloco = max(1, memoria // max(1, 4 * Y.shape[0]))
+    for inicio in range(0, len(linhas), bloco):
+        selecao = linhas[inicio:inicio + bloco]
+        scores = X[selecao] @ Y.T
+        avaliados = confianca[selecao].tocoo()
+        scores[avaliados.row, avaliados.col] = -np.inf
+        melhores = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+        ordem = np.argsort(-np.take_along_axis(scores, melhores, axis=1), axis=1)
+        melhores = np.take_along_axis(melhores, ordem, axis=1)
+        yield selecao, melhores, np.take_along_axis(scores, melhores, axis=1)
+
+
+def gravar_candidatos(db_path, X, Y, confianca, usuario_ids, livro_ids, linhas, n):
+    """Substitui os candidatos dos usuários das `linhas` em recomendacao_usuario"""
+    with conectar(db_path) as conn:
+        for selecao, melhores, scores in candidatos(X, Y, confianca, linhas, n):
+            usuarios = usuario_ids[selecao]
+            conn.executemany(
+                "DELETE FROM recomendacao_usuario WHERE usuario_id = ?", [(int(u),) for u in usuarios]
+            )
+            validos = np.isfinite(scores)
+            linha, posicao = np.nonzero(validos)
+            conn.executemany(
+                "INSERT INTO recomendacao_usuario (usuario_id, posicao, livro_id, score) VALUES (?, ?, ?, ?)",
+                zip(
+                    usuarios[linha].tolist(),
+                    posicao.tolist(),
+                    livro_ids[melhores[linha, posicao]].tolist(),
+                    scores[linha, posicao].astype(float).tolist(),
+                ),
+            )
+            conn.commit()
+
+
+def remover_candidatos(db_path, usuario_ids):
+    """Apaga os candidatos de usuários que saíram do modelo (sem notas ou removidos)"""
+    with conectar(db_path) as conn:
+        conn.executemany(
+            "DELETE FROM recomendacao_usuario WHERE usuario_id = ?", [(int(u),) for u in usuario_ids]
+        )
+
+
+def ler_livros(db_path):
+    """Ids de todos os livros do catálogo"""
+    with conectar(db_path) as conn:
+        return np.array([row[0] for row in conn.execute("SELECT id FROM livro ORDER BY id")], dtype=np.int64)
+
+
+def assinaturas(usuarios, livros, notas, usuario_ids):
+    """(quantidade, hash) das notas de cada usuário: detecta quem mudou desde o treino.
+
+    O hash é a soma (mod 2⁶⁴) de um hash de cada par (livro_id, nota), então não
+    depende da ordem das linhas e muda quando uma nota passa de um livro a outro,
+    quando dois valores são trocados ou quando +x em um livro compensa −x em outro.
+    """
+    with np.errstate(over="ignore"):
+        x = livros.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        x += np.round(notas * 1000).astype(np.int64).astype(np.uint64)
+        # Finalizador do splitmix64: espalha cada par em 64 bits
+        x ^= x >> np.uint64(30)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(31)
+        linhas = np.searchsorted(usuario_ids, usuarios)
+        resultado = np.zeros((len(usuario_ids), 2), dtype=np.uint64)
+        resultado[:, 0] = np.bincount(linhas, minlength=len(usuario_ids))
+        np.add.at(resultado[:, 1], linhas, x)
+    return resultado
+
+
+def salvar(saida, manifest, **arrays):
+    """Grava os artefatos em um diretório temporário e publica com os.replace"""
+    saida = Path(saida)
+    saida.mkdir(parents=True, exist_ok=True)
+    for nome, valor in arrays.items():
+        tmp = saida / f"{nome}.tmp.npy"
+        np.save(tmp, valor)
+        os.replace(tmp, saida / f"{nome}.npy")
+    tmp = saida / "manifest.json.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, saida / "manifest.json")
+
+
+def carregar(saida):
+    """Lê o modelo salvo por `treinar`/`atualizar`"""
+    saida = Path(saida)
+    manifest = json.loads((saida / "manifest.json").read_text())
+    arrays = {nome.removesuffix(".npy"): np.load(saida / nome) for nome in ARTEFATOS}
+    return manifest, arrays
+
+
+def treinar(db_path, saida, fatores=32, regularizacao=0.1, alpha=2.0, iteracoes=10,
+            threads=None, candidatos_por_usuario=50):
+    """Treino completo: fatora a matriz inteira e regrava os candidatos de todos"""
+    inicio = time.perf_counter()
+    threads = threads or os.cpu_count() or 1
+    usuarios, livros, notas = ler_notas(db_path)
+    usuario_ids, livro_ids = np.unique(usuarios), np.unique(livros)
+    confianca = matriz_confianca(usuarios, livros, notas, usuario_ids, livro_ids, alpha)
+
+    X, Y = treinar_als(confianca, fatores, regularizacao, iteracoes, threads)
+    gravar_candidatos(db_path, X, Y, confianca, usuario_ids, livro_ids,
+                      np.arange(len(usuario_ids)), candidatos_por_usuario)
+
+    manifest = {
+        "usuarios": len(usuario_ids),
+        "livros": len(livro_ids),
+        "notas": len(notas),
+        "fatores": fatores,
+        "regularizacao": regularizacao,
+        "alpha": alpha,
+        "candidatos": candidatos_por_usuario,
+        "segundos": round(time.perf_counter() - inicio, 2),
+        "treinado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    salvar(saida, manifest, fatores_usuarios=X, fatores_livros=Y, usuario_ids=usuario_ids,
+           livro_ids=livro_ids, assinaturas=assinaturas(usuarios, livros, notas, usuario_ids))
+    return manifest
+
+
+def atualizar(db_path, saida, threads=None):
+    """Fold-in: recalcula só usuários com notas novas/alteradas e livros novos.
+
+    Os fatores dos livros já conhecidos ficam fixos; livros novos recebem fatores
+    resolvidos a partir dos usuários do modelo e usuários alterados são resolvidos
+    contra todos os livros, como em meia iteração do ALS.
+    """
+    threads = threads or os.cpu_count() or 1
+    manifest, modelo = carregar(saida)
+    X, Y = modelo["fatores_usuarios"], modelo["fatores_livros"]
+    usuarios, livros, notas = ler_notas(db_path)
+    # Usuários sem nenhuma nota (todas apagadas ou o usuário removido) saem do modelo;
+    # livros removidos do catálogo também, para nunca virarem candidatos
+    usuario_ids = np.unique(usuarios)
+    removidos = np.setdiff1d(modelo["usuario_ids"], usuario_ids)
+    livro_ids = np.union1d(np.intersect1d(modelo["livro_ids"], ler_livros(db_path)), livros)
+
+    # Reindexa os fatores salvos para os ids atuais (novos começam em zero)
+    mantidos = np.isin(modelo["usuario_ids"], usuario_ids)
+    posicoes_usuarios = np.searchsorted(usuario_ids, modelo["usuario_ids"][mantidos])
+    X_novo = np.zeros((len(usuario_ids), X.shape[1]), dtype=np.float32)
+    X_novo[posicoes_usuarios] = X[mantidos]
+    mantidos_livros = np.isin(modelo["livro_ids"], livro_ids)
+    Y_novo = np.zeros((len(livro_ids), Y.shape[1]), dtype=np.float32)
+    Y_novo[np.searchsorted(livro_ids, modelo["livro_ids"][mantidos_livros])] = Y[mantidos_livros]
+    conhecidos_livros = np.isin(livro_ids, modelo["livro_ids"])
+
+    confianca = matriz_confianca(usuarios, livros, notas, usuario_ids, livro_ids, manifest["alpha"])
+    novos_livros = np.flatnonzero(~conhecidos_livros)
+    if len(novos_livros):
+        Y_novo[novos_livros] = resolver(confianca.T.tocsr(), X_novo, manifest["regularizacao"],
+                                        threads, linhas=novos_livros)
+
+    atuais = assinaturas(usuarios, livros, notas, usuario_ids)
+    anteriores = np.zeros_like(atuais)
+    anteriores[posicoes_usuarios] = modelo["assinaturas"][mantidos]
+    alterados = np.flatnonzero(np.any(atuais != anteriores, axis=1))
+    if len(removidos):
+        remover_candidatos(db_path, removidos)
+    if len(alterados):
+        X_novo[alterados] = resolver(confianca, Y_novo, manifest["regularizacao"], threads, linhas=alterados)
+        gravar_candidatos(db_path, X_novo, Y_novo, confianca, usuario_ids, livro_ids,
+                          alterados, manifest["candidatos"])
+
+    manifest = {**manifest, "usuarios": len(usuario_ids), "livros": len(livro_ids), "notas": len(notas),
+                "atualizado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "usuarios_atualizados": int(len(alterados)), "usuarios_removidos": int(len(removidos)),
+                "livros_novos": int(len(novos_livros))}
+    salvar(saida, manifest, fatores_usuarios=X_novo, fatores_livros=Y_novo, usuario_ids=usuario_ids,
+           livro_ids=livro_ids, assinaturas=atuais)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recomendações por filtragem colaborativa (ALS implícito)")
+    parser.add_argument("comando", choices=["treinar", "atualizar"])
+    parser.add_argument("--db", default="../Backend/infra/database/bookshelf.db")
+    parser.add_argument("--saida", default="modelos/colaborativo")
+    parser.add_argument("--fatores", type=int, default=32)
+    parser.add_argument("--regularizacao", type=float, default=0.1)
+    parser.add_argument("--alpha", type=float, default=2.0, help="Peso da nota na confiança")
+    parser.add_argument("--iteracoes", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--candidatos", type=int, default=50, help="Livros pré-calculados por usuário")
+    args = parser.parse_args()
+
+    if args.comando == "treinar":
+        manifest = treinar(args.db, args.saida, args.fatores, args.regularizacao, args.alpha,
+                           args.iteracoes, args.threads, args.candidatos)
+        print(f"✅ {manifest['usuarios']} usuários × {manifest['livros']} livros em {manifest['segundos']}s")
+    else:
+        manifest = atualizar(args.db, args.saida, args.threads)
+        print(f"✅ {manifest['usuarios_atualizados']} usuários e {manifest['livros_novos']} livros novos atualizados, "
+              f"{manifest['usuarios_removidos']} usuários sem notas removidos")
+
+
+if __name__ == "__main__":
+    main()
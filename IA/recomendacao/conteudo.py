@@ -0,0 +1,225 @@
+# Recomendação por conteúdo: livros parecidos pelo texto (título, autores, categorias e descrição)
+#
+# Uso (a partir de IA/):
+#     python -m recomendacao.conteudo dataset/livros.csv --saida modelos/conteudo --k 20
+#
+# Saída (lida pelo Backend em /api/books/{id}/similar):
+#     vizinhos.npy       int32 (n_livros, k) com o índice dos vizinhos (-1 = vazio)
+#     similaridades.npy  float32 (n_livros, k) com o cosseno de cada vizinho
+#     volume_ids.txt     volume_id de cada linha, na ordem das matrizes
+#     manifest.json      parâmetros da construção
+#
+# A saída é um symlink para o diretório versionado da construção (catalogo.publicacao).
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+from catalogo.colunas import parse_categories
+from catalogo.publicacao import nova_versao, publicar
+
+# Peso de cada campo no vetor do livro
+PESOS = {"t": 3.0, "a": 4.0, "c": 2.0, "d": 1.0}
+
+_PALAVRA = re.compile(r"[^\W\d_]{2,}", re.UNICODE)
+
+csv.field_size_limit(sys.maxsize)
+
+
+def tokens_livro(row):
+    """Termos ponderados de um livro; cada campo tem seu prefixo para não se misturar"""
+    termos = Counter()
+    for palavra in _PALAVRA.findall((row.get("title") or "").lower()):
+        termos["t:" + palavra] += PESOS["t"]
+    # Autores e categorias entram como nomes inteiros
+    for autor in (row.get("authors") or "").split(","):
+        autor = autor.strip().lower()
+        if autor:
+            termos["a:" + autor] += PESOS["a"]
+    for categoria in parse_categories(row.get("categories")):
+        termos["c:" + categoria.strip().lower()] += PESOS["c"]
+    for palavra in _PALAVRA.findall((row.get("description") or "").lower()):
+        termos["d:" + palavra] += PESOS["d"]
+    return termos
+
+
+def linhas_csv(caminho):
+    with open(caminho, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def linhas_snapshot(caminho):
+    """Linhas do snapshot colunar, só com as colunas usadas no vetor"""
+    from catalogo.snapshot import Catalogo
+    catalogo = Catalogo(caminho)
+    colunas = {coluna: catalogo[coluna] for coluna in ("id", "title", "authors", "categories", "description")}
+    for i in range(len(catalogo)):
+        row = {coluna: valores[i] for coluna, valores in colunas.items()}
+        row["authors"] = ", ".join(row["authors"])
+        yield row
+
+
+def ler_livros(caminho):
+    """Lê o CSV (ou o snapshot colunar, se for um diretório) em streaming, ignorando volume_ids repetidos"""
+    vistos = set()
+    linhas = linhas_snapshot(caminho) if Path(caminho).is_dir() else linhas_csv(caminho)
+    for row in linhas:
+        volume_id = row.get("id")
+        if volume_id and volume_id not in vistos:
+            vistos.add(volume_id)
+            yield volume_id, row
+
+
+def vetorizar(livros, min_df=2, max_df=0.1):
+    """Monta a matriz TF-IDF (CSR, linhas normalizadas) dos livros.
+
+    Retorna (matriz, volume_ids). Termos em menos de `min_df` livros ou em mais de
+    `max_df` do catálogo são descartados: não ajudam a separar livros e os muito
+    comuns deixam o produto esparso denso.
+    """
+    vocabulario = {}
+    indptr = array("q", [0])
+    indices = array("i")
+    dados = array("f")
+    volume_ids = []
+    for volume_id, row in livros:
+        volume_ids.append(volume_id)
+        termos = tokens_livro(row)
+        indices.extend(vocabulario.setdefault(termo, len(vocabulario)) for termo in termos)
+        dados.extend(termos.values())
+        indptr.append(len(indices))
+
+    n = len(volume_ids)
+    matriz = sp.csr_matrix(
+        (np.frombuffer(dados, dtype=np.float32), np.frombuffer(indices, dtype=np.int32), np.frombuffer(indptr, dtype=np.int64)),
+        shape=(n, len(vocabulario)),
+    )
+    df = np.bincount(matriz.indices, minlength=matriz.shape[1])
+    manter = (df >= min_df) & (df <= max(min_df, max_df * n))
+    matriz = matriz[:, np.flatnonzero(manter)].tocsr()
+    df = df[manter]
+
+    # tf sublinear × idf suavizado, depois normalização L2 (produto escalar = cosseno)
+    matriz.data = (1.0 + np.log(matriz.data)).astype(np.float32)
+    idf = (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+    matriz = matriz @ sp.diags(idf, format="csr")
+    normas = np.sqrt(np.asarray(matriz.multiply(matriz).sum(axis=1)).ravel())
+    normas[normas == 0] = 1.0
+    matriz = sp.diags((1.0 / normas).astype(np.float32), format="csr") @ matriz
+    return matriz.astype(np.float32).tocsr(), volume_ids
+
+
+def topk_bloco(matriz, transposta, inicio, fim, k):
+    """Top-k vizinhos das linhas [inicio, fim) com um produto esparso por bloco.
+
+    A seleção é vetorizada: ordena as entradas por (linha, -similaridade) e fica
+    com as k primeiras de cada linha.
+    """
+    produto = (matriz[inicio:fim] @ transposta).tocoo()
+    linhas, colunas, valores = produto.row, produto.col, produto.data
+    manter = (colunas != linhas + inicio) & (valores > 0)
+    linhas, colunas, valores = linhas[manter], colunas[manter], valores[manter]
+
+    ordem = np.lexsort((colunas, -valores, linhas))
+    linhas, colunas, valores = linhas[ordem], colunas[ordem], valores[ordem]
+    contagens = np.bincount(linhas, minlength=fim - inicio)
+    posicao = np.arange(len(linhas)) - np.repeat(np.cumsum(contagens) - contagens, contagens)
+    manter = posicao < k
+
+    vizinhos = np.full((fim - inicio, k), -1, dtype=np.int32)
+    similaridades = np.zeros((fim - inicio, k), dtype=np.float32)
+    vizinhos[linhas[manter], posicao[manter]] = colunas[manter]
+    similaridades[linhas[manter], posicao[manter]] = valores[manter]
+    return inicio, vizinhos, similaridades
+
+
+# Matrizes herdadas pelos processos filhos (fork), sem serialização por bloco
+_MATRIZ = _TRANSPOSTA = None
+
+
+def _topk_processo(args):
+    inicio, fim, k = args
+    return topk_bloco(_MATRIZ, _TRANSPOSTA, inicio, fim, k)
+
+
+def vizinhos_mais_proximos(matriz, saida, k=20, bloco=512, processos=1):
+    """Calcula o top-k de todas as linhas, gravando em memmaps bloco a bloco"""
+    global _MATRIZ, _TRANSPOSTA
+    n = matriz.shape[0]
+    vizinhos = np.lib.format.open_memmap(saida / "vizinhos.npy", mode="w+", dtype=np.int32, shape=(n, k))
+    similaridades = np.lib.format.open_memmap(saida / "similaridades.npy", mode="w+", dtype=np.float32, shape=(n, k))
+    transposta = matriz.T.tocsr()
+    blocos = [(inicio, min(inicio + bloco, n), k) for inicio in range(0, n, bloco)]
+
+    if processos > 1 and "fork" in multiprocessing.get_all_start_methods():
+        _MATRIZ, _TRANSPOSTA = matriz, transposta
+        try:
+            contexto = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(processos, mp_context=contexto) as executor:
+                resultados = executor.map(_topk_processo, blocos)
+                for inicio, viz, sim in resultados:
+                    vizinhos[inicio:inicio + len(viz)] = viz
+                    similaridades[inicio:inicio + len(sim)] = sim
+        finally:
+            _MATRIZ = _TRANSPOSTA = None
+    else:
+        for inicio, fim, _ in blocos:
+            _, viz, sim = topk_bloco(matriz, transposta, inicio, fim, k)
+            vizinhos[inicio:fim] = viz
+            similaridades[inicio:fim] = sim
+
+    vizinhos.flush()
+    similaridades.flush()
+    del vizinhos, similaridades
+
+
+def construir(csv_path, saida, k=20, bloco=512, processos=1, min_df=2, max_df=0.1):
+    """Constrói e publica os artefatos; a troca é atômica para quem está lendo"""
+    versao = nova_versao(saida)
+
+    inicio = time.perf_counter()
+    matriz, volume_ids = vetorizar(ler_livros(csv_path), min_df, max_df)
+    vizinhos_mais_proximos(matriz, versao, k, bloco, processos)
+    (versao / "volume_ids.txt").write_text("\n".join(volume_ids) + "\n", encoding="utf-8")
+    manifest = {
+        "livros": len(volume_ids),
+        "termos": matriz.shape[1],
+        "k": k,
+        "segundos": round(time.perf_counter() - inicio, 2),
+        "criado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    (versao / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+    # Os quatro arquivos trocam juntos: a API nunca lê vizinhos de uma versão e ids de outra
+    publicar(saida, versao)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera a tabela de livros similares (TF-IDF + top-k)")
+    parser.add_argument("csv", help="Caminho do livros.csv ou do snapshot colunar (catalogo.snapshot)")
+    parser.add_argument("--saida", default="modelos/conteudo")
+    parser.add_argument("--k", type=int, default=20, help="Vizinhos por livro")
+    parser.add_argument("--bloco", type=int, default=512, help="Linhas por produto esparso")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--min-df", type=int, default=2)
+    parser.add_argument("--max-df", type=float, default=0.1)
+    args = parser.parse_args()
+
+    manifest = construir(args.csv, args.saida, args.k, args.bloco, args.processos, args.min_df, args.max_df)
+    print(f"✅ {manifest['livros']} livros, {manifest['termos']} termos em {manifest['segundos']}s -> {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dataset"))
+
+PAGINAS = json.loads((Path(__file__).parent / "fixtures" / "books_pages.json").read_text())
+
+
+class StubBooksAPI(ThreadingHTTPServer):
+    """Servidor local que reproduz páginas gravadas da Books API"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requisicoes = []
+        self.falhas = []  # status devolvidos em ordem (200 = resposta normal)
+        self.retry_after = None  # cabeçalho Retry-After enviado nas falhas
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/books/v1/volumes"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        genero = query["q"][0].removeprefix("subject:")
+        start = int(query["startIndex"][0])
+        with self.server.lock:
+            self.server.requisicoes.append((genero, start))
+            falha = self.server.falhas.pop(0) if self.server.falhas else None
+        if falha not in (None, 200):
+            self.send_response(falha)
+            if self.server.retry_after is not None:
+                self.send_header("Retry-After", self.server.retry_after)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        corpo = json.dumps(PAGINAS.get(f"{genero}|{start}", {"totalItems": 0})).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api():
+    server = StubBooksAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
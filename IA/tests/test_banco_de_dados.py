@@ -0,0 +1,127 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+import banco_de_dados as bd
+
+GENEROS = ["romance", "horror"]
+
+
+def run_harvest(stub_api, tmp_path, **kwargs):
+    opcoes = dict(generos=GENEROS, total_books=200, api_url=stub_api.url,
+                  concorrencia=4, rps=1000, backoff=0.01)
+    opcoes.update(kwargs)
+    asyncio.run(bd.harvest(tmp_path / "livros.ndjson", tmp_path / "checkpoint.json", **opcoes))
+
+
+def read_ndjson(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_harvest_writes_every_page_and_csv(stub_api, tmp_path):
+    run_harvest(stub_api, tmp_path)
+
+    livros = read_ndjson(tmp_path / "livros.ndjson")
+    assert len(livros) == 130
+    assert len({livro["id"] for livro in livros}) == 130
+
+    total = bd.ndjson_to_csv(tmp_path / "livros.ndjson", tmp_path / "livros.csv", limite=100)
+    assert total == 100
+    with open(tmp_path / "livros.csv", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == bd.COLUNAS
+    assert len(rows) == 100
+    romance = next(row for row in rows if row["id"] == "rom0002")
+    assert romance["reading_modes"] == "text, image"
+    assert romance["categories"] == "['Romance']"
+
+
+def test_harvest_stops_at_first_empty_page(stub_api, tmp_path):
+    run_harvest(stub_api, tmp_path, janela=1)
+
+    # romance: 3 páginas (40, 40, 10) + a vazia; horror: 1 página + a vazia
+    assert sorted(stub_api.requisicoes) == sorted([
+        ("romance", 0), ("romance", 40), ("romance", 80), ("romance", 120),
+        ("horror", 0), ("horror", 40),
+    ])
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert checkpoint["romance"] == {"proximo": 120, "concluido": True}
+    assert checkpoint["horror"] == {"proximo": 40, "concluido": True}
+
+
+def test_harvest_retries_transient_errors(stub_api, tmp_path):
+    stub_api.falhas = [503, 429, 500]
+    run_harvest(stub_api, tmp_path, concorrencia=1, janela=1)
+
+    assert len(read_ndjson(tmp_path / "livros.ndjson")) == 130
+
+
+def test_harvest_accepts_retry_after_as_http_date(stub_api, tmp_path):
+    # Data HTTP já passada: não espera além do backoff
+    stub_api.retry_after = "Wed, 21 Oct 2015 07:28:00 GMT"
+    stub_api.falhas = [503, 429]
+    run_harvest(stub_api, tmp_path, concorrencia=1, janela=1)
+
+    assert len(read_ndjson(tmp_path / "livros.ndjson")) == 130
+
+
+@pytest.mark.parametrize("valor, esperado", [
+    (None, 0.0),
+    ("3", 3.0),
+    ("1.5", 1.5),
+    ("-4", 0.0),
+    ("86400", bd.ESPERA_MAXIMA),
+    ("Wed, 21 Oct 2015 07:28:10 GMT", 10.0),
+    ("Wed, 21 Oct 2015 07:27:00 GMT", 0.0),
+    ("Wed, 21 Oct 2015 09:00:00 GMT", bd.ESPERA_MAXIMA),
+    ("amanhã", 0.0),
+    ("nan", 0.0),
+])
+def test_espera_retry_after(valor, esperado):
+    agora = 1445412480.0  # Wed, 21 Oct 2015 07:28:00 GMT
+    assert bd.espera_retry_after(valor, agora) == esperado
+
+
+def test_harvest_gives_up_after_retries(stub_api, tmp_path):
+    stub_api.falhas = [503] * 10
+    with pytest.raises(RuntimeError):
+        run_harvest(stub_api, tmp_path, generos=["romance"], tentativas=3)
+
+
+def test_harvest_resumes_from_checkpoint(stub_api, tmp_path):
+    # Primeira execução interrompida após a primeira página de romance
+    stub_api.falhas = [200, 503, 503]
+    with pytest.raises(RuntimeError):
+        run_harvest(stub_api, tmp_path, generos=["romance"], concorrencia=1, janela=1, tentativas=2)
+
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert checkpoint["romance"] == {"proximo": 40, "concluido": False}
+    assert len(read_ndjson(tmp_path / "livros.ndjson")) == 40
+
+    stub_api.requisicoes.clear()
+    run_harvest(stub_api, tmp_path, janela=1)
+
+    assert ("romance", 0) not in stub_api.requisicoes
+    livros = read_ndjson(tmp_path / "livros.ndjson")
+    assert len(livros) == 130
+    assert len({livro["id"] for livro in livros}) == 130
+
+    # Gêneros concluídos não são buscados de novo
+    stub_api.requisicoes.clear()
+    run_harvest(stub_api, tmp_path)
+    assert stub_api.requisicoes == []
+
+
+def test_rate_limiter_spaces_requests():
+    async def medir():
+        limiter = bd.RateLimiter(rate=50, burst=1)
+        loop = asyncio.get_running_loop()
+        inicio = loop.time()
+        for _ in range(6):
+            await limiter.acquire("host")
+        return loop.time() - inicio
+
+    assert asyncio.run(medir()) >= 0.09
@@ -0,0 +1,176 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from recomendacao import colaborativo
+
+# Dois grupos de leitores: 1..20 leem fantasia (livros 1..10), 21..40 leem romance (11..20);
+# com dois fatores o modelo separa os grupos sem sobreajustar a amostra pequena
+FANTASIA = range(1, 11)
+ROMANCE = range(11, 21)
+
+
+def notas_iniciais():
+    rng = np.random.default_rng(42)
+    notas = []
+    for usuario in range(1, 41):
+        livros = FANTASIA if usuario <= 20 else ROMANCE
+        for livro in rng.choice(list(livros), size=6, replace=False):
+            notas.append((usuario, int(livro), float(rng.integers(3, 6))))
+    return notas
+
+
+@pytest.fixture
+def db(tmp_path):
+    # Só as tabelas que o módulo usa, com as chaves estrangeiras do esquema migrado
+    caminho = tmp_path / "bookshelf.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.executescript(
+            "CREATE TABLE usuario (id INTEGER PRIMARY KEY);"
+            "CREATE TABLE livro (id INTEGER PRIMARY KEY);"
+            "CREATE TABLE notas (id INTEGER PRIMARY KEY, "
+            "usuario_id INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE, "
+            "livro_id INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE, "
+            "nota REAL NOT NULL, UNIQUE (usuario_id, livro_id));"
+            "CREATE TABLE recomendacao_usuario ("
+            "usuario_id INTEGER NOT NULL REFERENCES usuario(id) ON DELETE CASCADE, posicao INTEGER NOT NULL, "
+            "livro_id INTEGER NOT NULL REFERENCES livro(id) ON DELETE CASCADE, score REAL NOT NULL, "
+            "PRIMARY KEY (usuario_id, posicao)) WITHOUT ROWID;"
+            f"PRAGMA user_version = {colaborativo.VERSAO_ESQUEMA};"
+        )
+        conn.executemany("INSERT INTO usuario (id) VALUES (?)", [(i,) for i in range(1, 101)])
+        conn.executemany("INSERT INTO livro (id) VALUES (?)", [(i,) for i in range(1, 61)])
+        conn.executemany("INSERT INTO notas (usuario_id, livro_id, nota) VALUES (?, ?, ?)", notas_iniciais())
+    return caminho
+
+
+def recomendacoes(db, usuario_id):
+    with sqlite3.connect(db) as conn:
+        return [row[0] for row in conn.execute(
+            "SELECT livro_id FROM recomendacao_usuario WHERE usuario_id = ? ORDER BY posicao", (usuario_id,)
+        )]
+
+
+def test_treinar_recomenda_livros_do_mesmo_grupo(db, tmp_path):
+    manifest = colaborativo.treinar(db, tmp_path / "modelo", fatores=2, iteracoes=10, threads=2,
+                                    candidatos_por_usuario=3)
+
+    assert manifest["usuarios"] == 40 and manifest["livros"] == 20
+    with sqlite3.connect(db) as conn:
+        avaliados = {(u, l) for u, l in conn.execute("SELECT usuario_id, livro_id FROM notas")}
+    for usuario in (1, 5, 25, 40):
+        livros = recomendacoes(db, usuario)
+        grupo = FANTASIA if usuario <= 20 else ROMANCE
+        assert len(livros) == 3
+        assert all(livro in grupo for livro in livros)
+        assert not any((usuario, livro) in avaliados for livro in livros)
+
+
+def test_resolver_em_lotes_e_threads_igual_a_um_lote(db):
+    usuarios, livros, notas = colaborativo.ler_notas(db)
+    confianca = colaborativo.matriz_confianca(usuarios, livros, notas, np.unique(usuarios), np.unique(livros), 2.0)
+    Y = np.random.default_rng(0).standard_normal((confianca.shape[1], 4)).astype(np.float32)
+
+    um_lote = colaborativo.resolver(confianca, Y, 0.1, threads=1, max_nnz=10**6)
+    varios = colaborativo.resolver(confianca, Y, 0.1, threads=3, max_nnz=7)
+    np.testing.assert_allclose(um_lote, varios, rtol=1e-4, atol=1e-6)
+
+    # Referência direta para um usuário: (YᵀCuY + λI) x = YᵀCu p
+    linha = confianca[0].toarray().ravel()
+    c = np.where(linha > 0, linha, 1.0)
+    p = (linha > 0).astype(np.float32)
+    A = Y.T @ (c[:, None] * Y) + 0.1 * np.eye(4)
+    np.testing.assert_allclose(um_lote[0], np.linalg.solve(A, Y.T @ (c * p)), rtol=1e-3, atol=1e-5)
+
+    # Gradiente conjugado (treino) converge para a solução exata
+    iniciais = np.zeros_like(um_lote)
+    cg = colaborativo.resolver(confianca, Y, 0.1, threads=2, max_nnz=7, iniciais=iniciais, passos_cg=8)
+    np.testing.assert_allclose(cg, um_lote, rtol=1e-2, atol=1e-3)
+
+
+def test_atualizar_dobra_apenas_usuarios_alterados(db, tmp_path):
+    modelo = tmp_path / "modelo"
+    colaborativo.treinar(db, modelo, fatores=2, iteracoes=10, candidatos_por_usuario=3)
+    antes = np.load(modelo / "fatores_usuarios.npy")
+    recomendacoes_usuario_2 = recomendacoes(db, 2)
+
+    # Usuário novo que lê fantasia e um livro novo lido pelo grupo de romance
+    with sqlite3.connect(db) as conn:
+        conn.executemany("INSERT INTO notas (usuario_id, livro_id, nota) VALUES (?, ?, ?)",
+                         [(99, 1, 5.0), (99, 2, 5.0), (99, 3, 4.0), (21, 50, 5.0), (22, 50, 4.0)])
+
+    manifest = colaborativo.atualizar(db, modelo)
+
+    assert manifest["usuarios_atualizados"] == 3
+    assert manifest["livros_novos"] == 1
+    assert all(livro in FANTASIA for livro in recomendacoes(db, 99))
+    # Quem não mudou mantém fatores e candidatos
+    depois = np.load(modelo / "fatores_usuarios.npy")
+    usuario_ids = np.load(modelo / "usuario_ids.npy")
+    np.testing.assert_array_equal(depois[np.searchsorted(usuario_ids, 2)], antes[1])
+    assert recomendacoes(db, 2) == recomendacoes_usuario_2
+
+    # Sem mudanças, nada é recalculado
+    assert colaborativo.atualizar(db, modelo)["usuarios_atualizados"] == 0
+
+
+@pytest.mark.parametrize("mudanca", [
+    # Troca de valores entre dois livros do usuário 3: quantidade e soma continuam iguais
+    ["UPDATE notas SET nota = CASE WHEN livro_id = :a THEN :nb ELSE :na END "
+     "WHERE usuario_id = 3 AND livro_id IN (:a, :b)"],
+    # A nota passa do livro a para um livro que o usuário ainda não tinha avaliado, com o mesmo valor
+    ["UPDATE notas SET livro_id = :novo WHERE usuario_id = 3 AND livro_id = :a"],
+    # +1 em um livro e −1 em outro
+    ["UPDATE notas SET nota = nota + 1 WHERE usuario_id = 3 AND livro_id = :a",
+     "UPDATE notas SET nota = nota - 1 WHERE usuario_id = 3 AND livro_id = :b"],
+])
+def test_atualizar_detecta_mudancas_com_mesma_quantidade_e_soma(db, tmp_path, mudanca):
+    modelo = tmp_path / "modelo"
+    colaborativo.treinar(db, modelo, fatores=2, iteracoes=10, candidatos_por_usuario=3)
+    with sqlite3.connect(db) as conn:
+        # Dois livros do usuário 3 com notas diferentes e um de fantasia que ele não avaliou
+        linhas = conn.execute("SELECT livro_id, nota FROM notas WHERE usuario_id = 3 ORDER BY nota").fetchall()
+        (a, na), (b, nb) = linhas[0], linhas[-1]
+        assert na != nb
+        novo = next(livro for livro in FANTASIA if livro not in {livro for livro, _ in linhas})
+        for sql in mudanca:
+            conn.execute(sql, {"a": a, "b": b, "na": na, "nb": nb, "novo": novo})
+
+    manifest = colaborativo.atualizar(db, modelo)
+
+    assert manifest["usuarios_atualizados"] == 1
+    assert colaborativo.atualizar(db, modelo)["usuarios_atualizados"] == 0
+
+
+def test_atualizar_remove_usuarios_sem_notas_e_livros_removidos(db, tmp_path):
+    modelo = tmp_path / "modelo"
+    colaborativo.treinar(db, modelo, fatores=2, iteracoes=10, candidatos_por_usuario=3)
+    with sqlite3.connect(db) as conn:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("DELETE FROM notas WHERE usuario_id = 5")
+        conn.execute("DELETE FROM usuario WHERE id = 6")
+        conn.execute("DELETE FROM livro WHERE id = 3")
+
+    manifest = colaborativo.atualizar(db, modelo)
+
+    assert manifest["usuarios_removidos"] == 2
+    assert recomendacoes(db, 5) == [] and recomendacoes(db, 6) == []
+    assert not np.isin([5, 6], np.load(modelo / "usuario_ids.npy")).any()
+    assert 3 not in np.load(modelo / "livro_ids.npy")
+    with sqlite3.connect(db) as conn:
+        orfaos = conn.execute(
+            "SELECT count(*) FROM recomendacao_usuario WHERE usuario_id NOT IN (SELECT id FROM usuario) "
+            "OR livro_id NOT IN (SELECT id FROM livro)"
+        ).fetchone()[0]
+        zerados = conn.execute("SELECT count(*) FROM recomendacao_usuario WHERE score = 0").fetchone()[0]
+    assert orfaos == 0 and zerados == 0
+    assert colaborativo.atualizar(db, modelo)["usuarios_removidos"] == 0
+
+
+def test_banco_sem_migracoes_e_recusado(tmp_path):
+    caminho = tmp_path / "vazio.db"
+    sqlite3.connect(caminho).close()
+
+    with pytest.raises(RuntimeError, match="migrações"):
+        colaborativo.treinar(caminho, tmp_path / "modelo")
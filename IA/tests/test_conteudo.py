@@ -0,0 +1,75 @@
+import csv
+
+import numpy as np
+import pytest
+
+from catalogo.publicacao import versoes
+from recomendacao import conteudo
+
+LIVROS = [
+    ("a1", "Dragon Magic", "Ana Souza", "['Fantasy']", "A young wizard learns dragon magic in a hidden school."),
+    ("a2", "Dragon Fire", "Ana Souza", "['Fantasy']", "The wizard returns to fight a dragon with fire magic."),
+    ("a3", "Space War", "Carlos Lima", "['Science Fiction']", "A fleet fights a war in deep space near a dying star."),
+    ("a4", "Star Fleet", "Carlos Lima", "['Science Fiction']", "Captains of the star fleet fight for space."),
+    ("a5", "Love Letters", "Beatriz Reis", "['Romance']", "Two lovers exchange letters across the ocean."),
+    ("a6", "Ocean Love", "Beatriz Reis", "['Romance']", "A love story by the ocean with letters and secrets."),
+    ("a1", "Dragon Magic (duplicado)", "", "", ""),
+]
+
+
+@pytest.fixture
+def livros_csv(tmp_path):
+    caminho = tmp_path / "livros.csv"
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "title", "authors", "categories", "description"])
+        writer.writerows(LIVROS)
+    return caminho
+
+
+def test_vetorizar_normaliza_linhas_e_ignora_duplicados(livros_csv):
+    matriz, volume_ids = conteudo.vetorizar(conteudo.ler_livros(livros_csv), min_df=1, max_df=1.0)
+
+    assert volume_ids == ["a1", "a2", "a3", "a4", "a5", "a6"]
+    normas = np.sqrt(np.asarray(matriz.multiply(matriz).sum(axis=1)).ravel())
+    np.testing.assert_allclose(normas, 1.0, rtol=1e-5)
+
+
+def test_topk_em_blocos_igual_ao_calculo_denso(livros_csv):
+    matriz, _ = conteudo.vetorizar(conteudo.ler_livros(livros_csv), min_df=1, max_df=1.0)
+    transposta = matriz.T.tocsr()
+    densa = (matriz @ transposta).toarray()
+    np.fill_diagonal(densa, -1)
+
+    # Blocos de 4 linhas: o segundo bloco começa no meio da matriz
+    for inicio in (0, 4):
+        _, vizinhos, similaridades = conteudo.topk_bloco(matriz, transposta, inicio, min(inicio + 4, 6), 2)
+        for i, linha in enumerate(range(inicio, min(inicio + 4, 6))):
+            esperado = np.sort(densa[linha])[::-1][:2]
+            np.testing.assert_allclose(similaridades[i], esperado, rtol=1e-5)
+            assert linha not in vizinhos[i]
+
+
+def test_construir_publica_artefatos(livros_csv, tmp_path):
+    saida = tmp_path / "modelos" / "conteudo"
+    manifest = conteudo.construir(livros_csv, saida, k=3, bloco=2, min_df=1, max_df=1.0)
+
+    assert manifest["livros"] == 6
+    vizinhos = np.load(saida / "vizinhos.npy", mmap_mode="r")
+    similaridades = np.load(saida / "similaridades.npy", mmap_mode="r")
+    volume_ids = (saida / "volume_ids.txt").read_text().split()
+    assert vizinhos.shape == similaridades.shape == (6, 3)
+
+    # O vizinho mais próximo é o livro do mesmo autor e gênero
+    pares = {volume_ids[i]: volume_ids[vizinhos[i, 0]] for i in range(6)}
+    assert pares == {"a1": "a2", "a2": "a1", "a3": "a4", "a4": "a3", "a5": "a6", "a6": "a5"}
+    assert np.all(np.diff(similaridades, axis=1) <= 0)
+    assert saida.is_symlink() and len(versoes(saida)) == 1
+
+
+def test_construir_em_processos_da_o_mesmo_resultado(livros_csv, tmp_path):
+    conteudo.construir(livros_csv, tmp_path / "um", k=3, bloco=2, processos=1, min_df=1, max_df=1.0)
+    conteudo.construir(livros_csv, tmp_path / "varios", k=3, bloco=2, processos=2, min_df=1, max_df=1.0)
+
+    for nome in ("vizinhos.npy", "similaridades.npy"):
+        np.testing.assert_array_equal(np.load(tmp_path / "um" / nome), np.load(tmp_path / "varios" / nome))
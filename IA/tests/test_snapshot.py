@@ -0,0 +1,155 @@
+import csv
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from catalogo import publicacao
+from catalogo.colunas import parse_categories
+from catalogo.publicacao import nova_versao, publicar, versoes
+from catalogo.snapshot import Catalogo, construir_snapshot
+from recomendacao import conteudo
+
+COLUNAS = ["id", "title", "authors", "publisher", "published_date", "description", "reading_modes",
+           "page_count", "categories", "language", "is_ebook", "epub_is_available", "pdf_is_available",
+           "maturity_rating", "public_domain", "image_links", "preview_link"]
+
+LINHAS = [
+    ["v1", "Dragão de Fogo", "Ana Souza, Bruno Lima", "Editora", "2010", "Um dragão ✨ aprende magia.",
+     "text, image", "320.0", "['Fantasy', 'Fiction']", "pt", "True", "False", "True", "NOT_MATURE", "False",
+     "http://img/1", "http://preview/1"],
+    ["v2", "Amor no Mar", "Carla Reis", "", "2001-05-02", "", "", "", "['Romance']", "en", "False", "", "False",
+     "MATURE", "True", "", ""],
+    ["v3", "Fogo Frio", "Ana Souza", "Outra", "1999", "Mais fantasia e magia com dragão.", "text", "120",
+     "['Fantasy']", "pt", "", "True", "False", "NOT_MATURE", "False", "http://img/3", ""],
+]
+
+
+@pytest.fixture
+def livros_csv(tmp_path):
+    caminho = tmp_path / "livros.csv"
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUNAS)
+        writer.writerows(LINHAS)
+    return caminho
+
+
+def test_snapshot_preserva_as_linhas(livros_csv, tmp_path):
+    manifest = construir_snapshot(livros_csv, tmp_path / "livros.snapshot")
+    catalogo = Catalogo(tmp_path / "livros.snapshot")
+
+    assert manifest["linhas"] == len(catalogo) == 3
+    assert catalogo.linha(0) == {
+        "id": "v1", "title": "Dragão de Fogo", "publisher": "Editora", "published_date": "2010",
+        "description": "Um dragão ✨ aprende magia.", "image_links": "http://img/1", "preview_link": "http://preview/1",
+        "reading_modes": "text, image", "language": "pt", "maturity_rating": "NOT_MATURE",
+        "authors": ["Ana Souza", "Bruno Lima"], "categories": ["Fantasy", "Fiction"],
+        "is_ebook": True, "epub_is_available": False, "pdf_is_available": True, "public_domain": False,
+        "page_count": 320,
+    }
+    vazia = catalogo.linha(1)
+    assert vazia["publisher"] is None and vazia["page_count"] is None and vazia["epub_is_available"] is None
+    assert catalogo.posicao("v3") == 2 and catalogo.posicao("nao-existe") is None
+
+
+def test_colunas_sao_tipadas_e_codificadas(livros_csv, tmp_path):
+    construir_snapshot(livros_csv, tmp_path / "snap")
+    catalogo = Catalogo(tmp_path / "snap")
+
+    assert isinstance(catalogo["page_count"], np.memmap)
+    assert catalogo["page_count"].dtype == np.int32
+    assert catalogo["public_domain"].dtype == np.int8
+    # Autores e categorias repetidos viram o mesmo código
+    assert catalogo.manifest["colunas"]["authors"]["valores"] == ["Ana Souza", "Bruno Lima", "Carla Reis"]
+    assert catalogo["authors"].mascara("Ana Souza").tolist() == [True, False, True]
+    assert catalogo["categories"].mascara("Fantasy").tolist() == [True, False, True]
+    assert catalogo["categories"].mascara("Terror").tolist() == [False, False, False]
+    assert catalogo["language"].mascara("pt").tolist() == [True, False, True]
+
+
+def test_abertura_preguicosa(livros_csv, tmp_path):
+    construir_snapshot(livros_csv, tmp_path / "snap")
+    catalogo = Catalogo(tmp_path / "snap")
+
+    assert catalogo._colunas == {}
+    assert catalogo["title"][2] == "Fogo Frio"
+    assert list(catalogo._colunas) == ["title"]
+
+
+def test_reconstrucao_troca_o_diretorio(livros_csv, tmp_path):
+    construir_snapshot(livros_csv, tmp_path / "snap")
+    antigo = Catalogo(tmp_path / "snap")
+    titulo = antigo["title"]
+
+    with open(livros_csv, "a", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(["v4", "Novo"] + [""] * (len(COLUNAS) - 2))
+    construir_snapshot(livros_csv, tmp_path / "snap")
+
+    assert (tmp_path / "snap").is_symlink()
+    assert len(Catalogo(tmp_path / "snap")) == 4
+    # O mapeamento aberto antes continua válido e colunas abertas depois vêm da mesma versão
+    assert titulo[0] == "Dragão de Fogo"
+    assert len(antigo["publisher"]) == 3
+
+    construir_snapshot(livros_csv, tmp_path / "snap")
+    # Só a versão atual e a anterior ficam no disco
+    assert len(versoes(tmp_path / "snap")) == 2
+
+
+def test_publicacao_nunca_deixa_a_saida_sem_diretorio(tmp_path, monkeypatch):
+    saida = tmp_path / "snap"
+    saida.mkdir()
+    (saida / "manifest.json").write_text("antigo")
+    trocas = []
+    os_replace = os.replace
+
+    def replace(origem, destino):
+        os_replace(origem, destino)
+        trocas.append((Path(destino).name, (saida / "manifest.json").exists()))
+    monkeypatch.setattr(publicacao.os, "replace", replace)
+
+    for conteudo_manifest in ("v1", "v2"):
+        versao = nova_versao(saida)
+        (versao / "manifest.json").write_text(conteudo_manifest)
+        publicar(saida, versao)
+        assert (saida / "manifest.json").read_text() == conteudo_manifest
+
+    # Depois da migração do diretório antigo, cada publicação é uma única troca atômica
+    assert trocas[1:] == [("snap", True), ("snap", True)]
+
+
+def test_indice_negativo_conta_do_fim(livros_csv, tmp_path):
+    construir_snapshot(livros_csv, tmp_path / "snap")
+    catalogo = Catalogo(tmp_path / "snap")
+
+    assert catalogo["title"][-1] == "Fogo Frio"
+    assert catalogo["categories"][-1] == ["Fantasy"]
+    assert catalogo["title"][-3] == "Dragão de Fogo"
+    with pytest.raises(IndexError):
+        catalogo["title"][3]
+    with pytest.raises(IndexError):
+        catalogo["authors"][-4]
+
+
+def test_recomendacao_le_o_snapshot(livros_csv, tmp_path):
+    construir_snapshot(livros_csv, tmp_path / "snap")
+
+    do_csv, ids_csv = conteudo.vetorizar(conteudo.ler_livros(livros_csv), min_df=1, max_df=1.0)
+    do_snapshot, ids_snapshot = conteudo.vetorizar(conteudo.ler_livros(tmp_path / "snap"), min_df=1, max_df=1.0)
+
+    assert ids_csv == ids_snapshot
+    assert (do_csv != do_snapshot).nnz == 0
+
+
+@pytest.mark.parametrize("raw, esperado", [
+    ("['Fantasy', 'Fiction']", ["Fantasy", "Fiction"]),
+    ("Romance", ["Romance"]),
+    ("['quebrado", []),
+    ("", []),
+    (None, []),
+    (["Já", "lista"], ["Já", "lista"]),
+])
+def test_parse_categories(raw, esperado):
+    assert parse_categories(raw) == esperado